@@ -1,5 +1,20 @@
 from charex.numpy import stringdtype as _stringdtype
 from charex.numpy.overloads import char as _char
 from charex.numpy.overloads import strings as _strings
+from charex.core import set_parallel
+from charex.functions import (
+    argsort, classify, compress, concatenate, contains_any, count_any,
+    encoded, factorize, factorize_index, find_any, indexed, isascii, isin,
+    isnull, lookup, masked, max_len, narrowed, searchsorted, shrink, sort,
+    take,
+)
+from charex.numpy.overloads._shared import (
+    EncodedStrings, IndexedStrings, MaskedStrings, NarrowedStrings,
+)
 
-__all__ = []
+__all__ = ['EncodedStrings', 'IndexedStrings', 'MaskedStrings',
+           'NarrowedStrings', 'argsort', 'classify', 'compress',
+           'concatenate', 'contains_any', 'count_any', 'encoded', 'factorize',
+           'factorize_index', 'find_any', 'indexed', 'isascii', 'isin',
+           'isnull', 'lookup', 'masked', 'max_len', 'narrowed',
+           'searchsorted', 'set_parallel', 'shrink', 'sort', 'take']
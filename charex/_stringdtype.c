@@ -73,6 +73,52 @@ charex_stringdtype_release_two_allocators(void **allocators)
 }
 
 
+PyObject *
+charex_stringdtype_empty_like(PyObject *like, npy_intp size)
+{
+    /* The caller holds the GIL and no allocator: a thread holding the GIL
+       may be waiting for one. NumPy locks a descriptor's allocator when a
+       new array adopts it, so the array gets a fresh descriptor with the
+       same options. */
+    PyObject *dtype = (PyObject *)PyArray_DESCR((PyArrayObject *)like);
+    PyObject *args = NULL, *kwargs = NULL, *option = NULL, *descr = NULL;
+
+    args = PyTuple_New(0);
+    kwargs = PyDict_New();
+    if (args == NULL || kwargs == NULL) {
+        goto fail;
+    }
+    option = PyObject_GetAttrString(dtype, "coerce");
+    if (option == NULL || PyDict_SetItemString(kwargs, "coerce", option)) {
+        goto fail;
+    }
+    Py_DECREF(option);
+    option = NULL;
+    if (PyObject_HasAttrString(dtype, "na_object")) {
+        option = PyObject_GetAttrString(dtype, "na_object");
+        if (option == NULL
+                || PyDict_SetItemString(kwargs, "na_object", option)) {
+            goto fail;
+        }
+        Py_DECREF(option);
+        option = NULL;
+    }
+    descr = PyObject_Call((PyObject *)Py_TYPE(dtype), args, kwargs);
+    Py_DECREF(args);
+    Py_DECREF(kwargs);
+    if (descr == NULL) {
+        return NULL;
+    }
+    return PyArray_Zeros(1, &size, (PyArray_Descr *)descr, 0);
+
+fail:
+    Py_XDECREF(option);
+    Py_XDECREF(args);
+    Py_XDECREF(kwargs);
+    return NULL;
+}
+
+
 static PyObject *
 has_stringdtype_api(PyObject *self, PyObject *args)
 {
@@ -5,7 +5,8 @@ from platform import python_version
 from time import perf_counter
 import gc
 
-import charex  # noqa: F401
+import charex
+from charex.core import PARALLEL_OPTIONS
 import llvmlite
 import numba
 import numpy as np
@@ -222,6 +223,54 @@ def jit_strings_isnumeric(values):
     return np.strings.isnumeric(values)
 
 
+@njit(nogil=True, cache=True)
+def jit_argsort(values):
+    return charex.argsort(values)
+
+
+def numpy_argsort(values):
+    return np.argsort(values, kind='stable')
+
+
+@njit(nogil=True, cache=True)
+def jit_searchsorted(sorted_values, probes):
+    return charex.searchsorted(sorted_values, probes)
+
+
+def numpy_searchsorted(sorted_values, probes):
+    return np.searchsorted(sorted_values, probes)
+
+
+@njit(nogil=True, cache=True)
+def jit_isin(values, candidates):
+    return charex.isin(values, candidates)
+
+
+@njit(nogil=True, cache=True)
+def jit_factorize(values):
+    return charex.factorize(values, True)[0]
+
+
+def numpy_factorize(values):
+    return np.unique(values, return_inverse=True)[1].ravel()
+
+
+VALIDATION_KINDS = ('isalpha', 'isdigit', 'isspace', 'isupper', 'islower',
+                    'istitle')
+
+
+@njit(nogil=True, cache=True)
+def jit_classify(values):
+    return charex.classify(values, VALIDATION_KINDS)
+
+
+def numpy_classify(values):
+    mask = np.zeros(values.shape, np.uint16)
+    for bit, kind in enumerate(VALIDATION_KINDS):
+        mask |= getattr(np.char, kind)(values).astype(np.uint16) << bit
+    return mask
+
+
 COMPARISON_FUNCS = [
     ('equal', jit_equal, np.char.equal),
     ('not_equal', jit_not_equal, np.char.not_equal),
@@ -248,6 +297,7 @@ PROPERTY_FUNCS = [
     ('isspace', jit_isspace, np.char.isspace),
     ('istitle', jit_istitle, np.char.istitle),
     ('isupper', jit_isupper, np.char.isupper),
+    ('classify', jit_classify, numpy_classify),
 ]
 
 NUMERIC_STRING_FUNCS = [
@@ -292,6 +342,7 @@ else:
         ('isspace', jit_strings_isspace, _STRINGS.isspace),
         ('istitle', jit_strings_istitle, _STRINGS.istitle),
         ('isupper', jit_strings_isupper, _STRINGS.isupper),
+        ('classify', jit_classify, numpy_classify),
     ]
 
     STRINGS_NUMERIC_FUNCS = [
@@ -352,6 +403,19 @@ def bench(group, kind, method, case, jit_func, numpy_func, args, repeat):
     }
 
 
+LOG_LINE_NEEDLE = 'upstream_response_time'
+
+
+def _log_lines(size):
+    """Synthetic ~240 character log rows for long-row occurrence cases."""
+    return [
+        ('2024-01-01T00:00:%02d host-%03d GET /api/v1/items/%06d?' % (
+            i % 60, i % 997, i)).ljust(200, 'q')
+        + ' status=200 %s=0.%03d' % (LOG_LINE_NEEDLE, i % 1000)
+        for i in range(size)
+    ]
+
+
 def string_values(size):
     base16 = np.array(['item%012d' % i for i in range(size)], dtype='U16')
     same16 = base16.copy()
@@ -365,6 +429,7 @@ def string_values(size):
 
     occurrence = np.array(['alpha beta alpha %06d' % i
                            for i in range(size)], dtype='U32')
+    occurrence_long = np.array(_log_lines(size), dtype='U256')
     properties = np.resize(
         np.array(['Alpha', 'alpha', 'abc123', 'Title Case', 'UPPER',
                   'lower', ' ', '', 'αβγ', '١٢٣', 'Ⅷ', '一二'],
@@ -384,6 +449,7 @@ def string_values(size):
             ('last64', base64, last64),
         ],
         'occurrence': occurrence,
+        'occurrence_long': occurrence_long,
         'properties': properties,
         'numerics': numerics,
     }
@@ -403,6 +469,8 @@ def byte_values(size):
 
     occurrence = np.array([('alpha beta alpha %06d' % i).encode()
                            for i in range(size)], dtype='S32')
+    occurrence_long = np.array([line.encode() for line in _log_lines(size)],
+                               dtype='S256')
     properties = np.resize(
         np.array([b'Alpha', b'alpha', b'abc123', b'Title Case', b'UPPER',
                   b'lower', b' ', b'', b'123'], dtype='S10'),
@@ -417,6 +485,7 @@ def byte_values(size):
             ('last64', base64, last64),
         ],
         'occurrence': occurrence,
+        'occurrence_long': occurrence_long,
         'properties': properties,
     }
 
@@ -436,6 +505,7 @@ def stringdtype_values(size):
 
     occurrence = np.array(['alpha beta alpha %06d' % i
                            for i in range(size)], dtype=dtype)
+    occurrence_long = np.array(_log_lines(size), dtype=dtype)
     properties = np.resize(
         np.array(['Alpha', 'alpha', 'abc123', 'Title Case', 'UPPER',
                   'lower', ' ', '', 'αβγ', '١٢٣', 'Ⅷ', '一二'],
@@ -456,11 +526,204 @@ def stringdtype_values(size):
             ('last64', base64, last64),
         ],
         'occurrence': occurrence,
+        'occurrence_long': occurrence_long,
         'properties': properties,
         'numerics': numerics,
     }
 
 
+def layout_values(size):
+    """Access-log records whose string fields are read as strided views."""
+    records = np.zeros(size, dtype=[('host', 'S32'), ('path', 'U128'),
+                                    ('status', 'i4')])
+    records['host'] = [('host-%03d.example.com' % (i % 997)).encode()
+                       for i in range(size)]
+    records['path'] = ['/api/v1/items/%06d' % i if i % 3 else
+                       '/static/app-%06d.js' % i for i in range(size)]
+    records['status'] = 200
+    paths = np.ascontiguousarray(records['path'])
+    return {
+        'strings': [
+            ('field', records['path']),
+            ('reversed', paths[::-1]),
+            ('step2', paths[::2]),
+            ('grid-step2', paths[:size // 2 * 2].reshape(-1, 2)[:, ::2]),
+        ],
+        'bytes': [
+            ('field', records['host']),
+            ('reversed', np.ascontiguousarray(records['host'])[::-1]),
+        ],
+    }
+
+
+def layout_records(values, repeat):
+    records = []
+    for kind, sub in (('strings', '/api'), ('bytes', b'host-1')):
+        for case, view in values[kind]:
+            for method, jit_func, numpy_func in (
+                    ('startswith', jit_startswith, np.char.startswith),
+                    ('find', jit_find, np.char.find)):
+                records.append(bench('layout', kind, method, case,
+                                     jit_func, numpy_func, (view, sub),
+                                     repeat))
+            records.append(bench('layout', kind, 'equal', case,
+                                 jit_equal, np.char.equal,
+                                 (view, view[::-1]), repeat))
+    return records
+
+
+def broadcast_values(size, catalog=32):
+    """A small (catalog, 1) key table against a large (1, size) column."""
+    column = np.array(['item%012d' % i for i in range(size)], dtype='U16')
+    keys = column[::max(size // catalog, 1)][:catalog].reshape(-1, 1)
+    return {
+        'strings': (keys, column.reshape(1, -1)),
+        'bytes': (np.char.encode(keys), np.char.encode(column.reshape(1, -1))),
+    }
+
+
+def broadcast_records(values, repeat):
+    """Outer-product cases, and the same work on materialised operands.
+
+    The ``flat`` case runs the contiguous same-shape path over copies made
+    with ``np.broadcast_to``, so its time is what broadcasting must match.
+    """
+    records = []
+    for kind, (keys, column) in values.items():
+        sub = keys.astype(keys.dtype.str[:2] + '12')
+        for method, jit_func, numpy_func, args in (
+                ('equal', jit_equal, np.char.equal, (keys, column)),
+                ('less', jit_less, np.char.less, (keys, column)),
+                ('startswith', jit_startswith, np.char.startswith,
+                 (column, sub)),
+                ('count', jit_count, np.char.count, (column, sub))):
+            shape = np.broadcast_shapes(*(arg.shape for arg in args))
+            flat = tuple(np.ascontiguousarray(np.broadcast_to(arg, shape))
+                         for arg in args)
+            for case, case_args in (('outer', args), ('flat', flat)):
+                records.append(bench('broadcast', kind, method, case,
+                                     jit_func, numpy_func, case_args,
+                                     repeat))
+    return records
+
+
+def sort_values(size):
+    """Sort keys: random hex, shared-prefix ids and a low-cardinality column."""
+    rng = np.random.default_rng(0)
+    cases = [
+        ('random', np.array(['%024x' % value for value in
+                             rng.integers(0, 1 << 62, size)], dtype='U24')),
+        ('prefixed', np.array(['customer-%010d' % value for value in
+                               rng.integers(0, 10 ** 9, size)], dtype='U24')),
+        ('low_card', np.array(['status-%d' % value for value in
+                               rng.integers(0, 50, size)], dtype='U24')),
+    ]
+    return {
+        'strings': cases,
+        'bytes': [(case, np.char.encode(values)) for case, values in cases],
+    }
+
+
+def sort_records(values, repeat):
+    records = []
+    for kind, cases in values.items():
+        for case, keys in cases:
+            records.append(bench('sort', kind, 'argsort', case, jit_argsort,
+                                 numpy_argsort, (keys,), repeat))
+            records.append(bench('sort', kind, 'searchsorted', case,
+                                 jit_searchsorted, numpy_searchsorted,
+                                 (np.sort(keys), keys[::-1]), repeat))
+    return records
+
+
+def lookup_records(values, repeat):
+    """Allow-list membership and sorted dictionary encoding of the keys."""
+    records = []
+    for kind, cases in values.items():
+        for case, keys in cases:
+            candidates = keys[::-10]
+            records.append(bench('lookup', kind, 'isin', case, jit_isin,
+                                 np.isin, (keys, candidates), repeat))
+            records.append(bench('lookup', kind, 'factorize', case,
+                                 jit_factorize, numpy_factorize, (keys,),
+                                 repeat))
+    return records
+
+
+def _parallel_stringdtype_funcs():
+    """StringDType cases compiled after parallel mode is switched on.
+
+    The mode is read when an overload is typed, so these are compiled
+    afresh rather than reusing the cached serial ``jit_strings_*``.
+    """
+    @njit(nogil=True, cache=False)
+    def equal(left, right):
+        return np.strings.equal(left, right)
+
+    @njit(nogil=True, cache=False)
+    def less(left, right):
+        return np.strings.less(left, right)
+
+    @njit(nogil=True, cache=False)
+    def find(values, sub):
+        return np.strings.find(values, sub)
+
+    @njit(nogil=True, cache=False)
+    def startswith(values, sub):
+        return np.strings.startswith(values, sub)
+
+    @njit(nogil=True, cache=False)
+    def str_len(values):
+        return np.strings.str_len(values)
+
+    @njit(nogil=True, cache=False)
+    def isalpha(values):
+        return np.strings.isalpha(values)
+
+    return equal, less, find, startswith, str_len, isalpha
+
+
+def thread_counts():
+    """1, 2, 4, ... threads up to Numba's thread pool size."""
+    counts = [1]
+    while counts[-1] * 2 < numba.config.NUMBA_NUM_THREADS:
+        counts.append(counts[-1] * 2)
+    if counts[-1] < numba.config.NUMBA_NUM_THREADS:
+        counts.append(numba.config.NUMBA_NUM_THREADS)
+    return counts
+
+
+def thread_scaling_records(values, repeat):
+    """Parallel StringDType kernels at 1, 2, 4, ... threads vs NumPy."""
+    saved = dict(PARALLEL_OPTIONS)
+    charex.set_parallel(True, min_bytes=0)
+    try:
+        equal, less, find, startswith, str_len, isalpha = \
+            _parallel_stringdtype_funcs()
+        _, left, right = values['comparison'][0]
+        occurrence = values['occurrence']
+        cases = [
+            ('equal', equal, _STRINGS.equal, (left, right)),
+            ('less', less, _STRINGS.less, (left, right)),
+            ('find', find, _STRINGS.find, (occurrence, 'alpha')),
+            ('startswith', startswith, _STRINGS.startswith,
+             (occurrence, 'alpha')),
+            ('str_len', str_len, _STRINGS.str_len, (occurrence,)),
+            ('isalpha', isalpha, _STRINGS.isalpha, (values['properties'],)),
+        ]
+        records = []
+        for threads in thread_counts():
+            numba.set_num_threads(threads)
+            for method, jit_func, numpy_func, args in cases:
+                records.append(bench('threads', 'stringdtype', method,
+                                     f'{threads}t', jit_func, numpy_func,
+                                     args, repeat))
+    finally:
+        numba.set_num_threads(numba.config.NUMBA_NUM_THREADS)
+        PARALLEL_OPTIONS.update(saved)
+    return records
+
+
 def comparison_records(kind, values, repeat, funcs=COMPARISON_FUNCS):
     records = []
     for method, jit_func, numpy_func in funcs:
@@ -473,11 +736,15 @@ def comparison_records(kind, values, repeat, funcs=COMPARISON_FUNCS):
 def occurrence_records(kind, values, repeat, funcs=OCCURRENCE_FUNCS, sub=None):
     if sub is None:
         sub = 'alpha' if kind != 'bytes' else b'alpha'
+    long_sub = LOG_LINE_NEEDLE if kind != 'bytes' else LOG_LINE_NEEDLE.encode()
     records = []
     for method, jit_func, numpy_func in funcs:
         records.append(bench('occurrence', kind, method, 'hit',
                              jit_func, numpy_func,
                              (values['occurrence'], sub), repeat))
+        records.append(bench('occurrence', kind, method, 'long',
+                             jit_func, numpy_func,
+                             (values['occurrence_long'], long_sub), repeat))
     return records
 
 
@@ -667,6 +934,51 @@ def write_plots(records, output_dir, size, repeat):
                 f'charex StringDType {group} ({title_suffix})',
             ))
 
+    for kind in ('bytes', 'strings'):
+        layout = [
+            record for record in records
+            if record['group'] == 'layout' and record['kind'] == kind
+        ]
+        if layout:
+            written.append(write_plot(
+                layout, output_dir, f'char-layouts-{kind}.png',
+                f'charex record-field and strided {kind} ({title_suffix})',
+            ))
+
+    for kind in ('bytes', 'strings'):
+        broadcast = [
+            record for record in records
+            if record['group'] == 'broadcast' and record['kind'] == kind
+        ]
+        if broadcast:
+            written.append(write_plot(
+                broadcast, output_dir, f'char-broadcast-{kind}.png',
+                f'charex outer-product {kind} ({title_suffix})',
+            ))
+
+    for kind in ('bytes', 'strings'):
+        sort = [
+            record for record in records
+            if record['group'] == 'sort' and record['kind'] == kind
+        ]
+        if sort:
+            written.append(write_plot(
+                sort, output_dir, f'char-sort-{kind}.png',
+                f'charex {kind} argsort/searchsorted vs NumPy '
+                f'({title_suffix})',
+            ))
+
+    for kind in ('bytes', 'strings'):
+        lookup = [
+            record for record in records
+            if record['group'] == 'lookup' and record['kind'] == kind
+        ]
+        if lookup:
+            written.append(write_plot(
+                lookup, output_dir, f'char-lookup-{kind}.png',
+                f'charex {kind} isin/factorize vs NumPy ({title_suffix})',
+            ))
+
     numerics = [
         record for record in records
         if record['group'] == 'numerics' and record['kind'] == 'strings'
@@ -685,6 +997,12 @@ def write_plots(records, output_dir, size, repeat):
             stringdtype_numerics, output_dir, 'stringdtype-numerics.png',
             f'charex StringDType numeric predicates ({title_suffix})',
         ))
+    threads = [record for record in records if record['group'] == 'threads']
+    if threads:
+        written.append(write_plot(
+            threads, output_dir, 'stringdtype-threads.png',
+            f'charex parallel StringDType by thread count ({title_suffix})',
+        ))
     return written
 
 
@@ -739,6 +1057,11 @@ def main():
     records.extend(property_records('strings', strings, args.repeat))
     records.extend(property_records('bytes', bytes_, args.repeat))
     records.extend(numeric_records(strings, args.repeat))
+    records.extend(layout_records(layout_values(args.size), args.repeat))
+    records.extend(broadcast_records(broadcast_values(args.size // 32),
+                                     args.repeat))
+    records.extend(sort_records(sort_values(args.size), args.repeat))
+    records.extend(lookup_records(sort_values(args.size), args.repeat))
     if _STRINGS is not None and _STRING_DTYPE is not None:
         stringdtype = stringdtype_values(args.size)
         records.extend(comparison_records(
@@ -749,6 +1072,7 @@ def main():
             'stringdtype', stringdtype, args.repeat, STRINGS_PROPERTY_FUNCS))
         records.extend(numeric_records(
             stringdtype, args.repeat, 'stringdtype', STRINGS_NUMERIC_FUNCS))
+        records.extend(thread_scaling_records(stringdtype, args.repeat))
 
     print(f'wrote {write_csv(records, args.output_dir, args.size, args.repeat)}')
     for path in write_plots(records, args.output_dir, args.size, args.repeat):
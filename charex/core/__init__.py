@@ -13,3 +13,23 @@ OPTIONS = dict(
     prefer_literal=True,
     strict=False,
 )
+
+PARALLEL_OPTIONS = dict(
+    enabled=False,
+    min_bytes=1 << 20,
+)
+
+
+def set_parallel(enabled=True, min_bytes=None):
+    """Enable or disable multi-threaded fixed-width and StringDType kernels.
+
+    The mode is read when an overload is first typed for a signature, so
+    enable it before compiling the functions that should use it. Parallel
+    kernels split rows into chunks of at least ``min_bytes`` input bytes
+    and fall back to the serial loop below that size.
+    """
+    PARALLEL_OPTIONS['enabled'] = bool(enabled)
+    if min_bytes is not None:
+        if min_bytes < 0:
+            raise ValueError('min_bytes must be non-negative')
+        PARALLEL_OPTIONS['min_bytes'] = int(min_bytes)
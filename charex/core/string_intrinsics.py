@@ -1,10 +1,18 @@
 from charex.core import JIT_OPTIONS
-from numba.extending import register_jitable
-from numpy import ascontiguousarray, dtype, empty, frombuffer
+from numba.core import cgutils, types
+from numba.core.imputils import impl_ret_borrowed
+from numba.extending import intrinsic, register_jitable
+from numpy import dtype, empty, frombuffer
 
 
 # -----------------------------------------------------------------------------
 # Support Functions
+#
+# Array registrations never copy: with ``rstrip`` the records keep their
+# trailing whitespace, and kernels taking an ``rstrip`` argument trim each
+# record lazily. Scalars are copied into a fresh buffer anyway, so they are
+# trimmed eagerly. Strided arrays are exposed as a (records, units) view of
+# the original buffer that the kernels walk by its byte stride.
 
 
 @register_jitable(**JIT_OPTIONS)
@@ -13,28 +21,13 @@ def register_array_bytes(b, rstrip=True):
     len_chr = b.size
     size_chr = b.itemsize
     chr_array = frombuffer(b, 'uint8') if b.ndim == 0 else b.view(dtype('uint8'))
-    if rstrip:
-        return (
-            _rstrip_inner(chr_array.copy(), size_chr),
-            len_chr,
-            size_chr
-        )
     return chr_array, len_chr, size_chr
 
 
 @register_jitable(**JIT_OPTIONS)
 def register_array_bytes_strided(b, rstrip=True):
-    """Expose a compact ordinal representation of strided ASCII bytes."""
-    len_chr = b.size
-    size_chr = b.itemsize
-    chr_array = ascontiguousarray(b).view(dtype('uint8'))
-    if rstrip:
-        return (
-            _rstrip_inner(chr_array.copy(), size_chr),
-            len_chr,
-            size_chr
-        )
-    return chr_array, len_chr, size_chr
+    """Expose strided ASCII bytes as a (records, units) ordinal view."""
+    return record_units(b), b.size, b.itemsize
 
 
 @register_jitable(**JIT_OPTIONS)
@@ -60,20 +53,13 @@ def register_array_strings(s, rstrip=True):
     len_chr = s.size
     size_chr = s.itemsize // 4
     chr_array = frombuffer(s, 'int32') if s.ndim == 0 else s.view(dtype('int32'))
-    if rstrip:
-        return _rstrip_inner(chr_array.copy(), size_chr), len_chr, size_chr
     return chr_array, len_chr, size_chr
 
 
 @register_jitable(**JIT_OPTIONS)
 def register_array_strings_strided(s, rstrip=True):
-    """Expose a compact ordinal representation of strided UTF-32 strings."""
-    len_chr = s.size
-    size_chr = s.itemsize // 4
-    chr_array = ascontiguousarray(s).view(dtype('int32'))
-    if rstrip:
-        return _rstrip_inner(chr_array.copy(), size_chr), len_chr, size_chr
-    return chr_array, len_chr, size_chr
+    """Expose strided UTF-32 strings as a (records, units) ordinal view."""
+    return record_units(s), s.size, s.itemsize // 4
 
 
 @register_jitable(**JIT_OPTIONS)
@@ -89,6 +75,61 @@ def register_scalar_strings(s, rstrip=True):
     return chr_array, len_chr, size_chr
 
 
+@intrinsic
+def record_units(typingctx, chr_array):
+    """View a 1-D fixed-width string array as a 2-D array of code units.
+
+    Rows keep the array's byte stride (which may be negative or zero), so
+    no layout is copied: a record field view is read at its offset inside
+    each record.
+    """
+    if not isinstance(chr_array, types.Array) or chr_array.ndim != 1 \
+            or not isinstance(chr_array.dtype, (types.CharSeq,
+                                                types.UnicodeCharSeq)):
+        raise TypeError('record_units expects a 1-D fixed-width string array')
+    is_bytes = isinstance(chr_array.dtype, types.CharSeq)
+    unit = types.uint8 if is_bytes else types.int32
+    unit_size = 1 if is_bytes else 4
+    units_type = types.Array(unit, 2, 'A', readonly=not chr_array.mutable,
+                             aligned=chr_array.aligned)
+
+    def codegen(context, builder, signature, args):
+        src = context.make_array(chr_array)(context, builder, args[0])
+        dst = context.make_array(units_type)(context, builder)
+        intp = context.get_value_type(types.intp)
+        shape = cgutils.pack_array(builder, [
+            builder.extract_value(src.shape, 0),
+            intp(chr_array.dtype.count),
+        ])
+        strides = cgutils.pack_array(builder, [
+            builder.extract_value(src.strides, 0),
+            intp(unit_size),
+        ])
+        context.populate_array(
+            dst,
+            data=builder.bitcast(src.data, dst.data.type),
+            shape=shape,
+            strides=strides,
+            itemsize=intp(unit_size),
+            meminfo=src.meminfo,
+            parent=src.parent,
+        )
+        return impl_ret_borrowed(context, builder, units_type,
+                                 dst._getvalue())
+
+    return units_type(chr_array), codegen
+
+
+# Bit i is set when code point i is trimmed by np.char: NUL, \t-\r, space.
+RSTRIP_MASK = 1 | 0x3e00 | 1 << 32
+
+
+@register_jitable(**JIT_OPTIONS)
+def is_rstrip_ord(chr_ord):
+    """Branch-free test for a code point trimmed by np.char comparisons."""
+    return ((chr_ord & -64) == 0) & (((RSTRIP_MASK >> (chr_ord & 63)) & 1) == 1)
+
+
 @register_jitable(**JIT_OPTIONS)
 def bisect_null(a, j, k):
     """Bisect null right-padded strings with the form '\x00'."""
@@ -104,26 +145,25 @@ def bisect_null(a, j, k):
 @register_jitable(**JIT_OPTIONS)
 def _rstrip_inner(chr_array, size_chr, is_scalar=False):
     r"""
-    Removes trailing whitespace (\t\n\r\f\v\s) characters.
+    Removes trailing whitespace (\t\n\r\f\v\s) characters in place.
     """
 
-    whitespace = {0, 9, 10, 11, 12, 13, 32}
     size_stride = size_chr - 1
 
     if is_scalar or size_chr < 9:
         # Direct iteration for scalars or small arrays
         for i in range(size_stride, chr_array.size, size_chr):
             for p in range(i, i - size_stride - 1, -1):
-                if chr_array[p] not in whitespace:
+                if not is_rstrip_ord(chr_array[p]):
                     break
                 chr_array[p] = 0
     else:
         # Use binary search for larger arrays
         for i in range(size_stride, chr_array.size, size_chr):
-            if chr_array[i] in whitespace:
+            if is_rstrip_ord(chr_array[i]):
                 o = i - size_stride
                 p = bisect_null(chr_array, o, i - 1)
-                while p >= o and chr_array[p] in whitespace:
+                while p >= o and is_rstrip_ord(chr_array[p]):
                     p -= 1
                 chr_array[p + 1: i + 1] = 0
     return chr_array
@@ -0,0 +1,85 @@
+from charex.core import OPTIONS
+from functools import lru_cache
+from numba.extending import overload
+import numpy as np
+
+
+# -----------------------------------------------------------------------------
+# Unicode Property Tables
+#
+# Character properties of every code point, taken from the running
+# interpreter's Unicode database through NumPy's string predicates and
+# stored as one byte of flags. The flags are split into blocks of 256 code
+# points; identical blocks are stored once, so a lookup is two loads from
+# constant arrays that the kernels inline instead of calling out to the
+# ``_PyUnicode_Is*`` type records. Scanning every code point takes a few
+# hundred milliseconds, so the tables are built when a kernel using them is
+# first compiled rather than at import.
+
+
+UNICODE_ALPHA = 0x01
+UNICODE_DECIMAL = 0x02
+UNICODE_DIGIT = 0x04
+UNICODE_NUMERIC = 0x08
+UNICODE_SPACE = 0x10
+UNICODE_LOWER = 0x20
+UNICODE_UPPER = 0x40
+UNICODE_TITLE = 0x80
+
+UNICODE_BLOCK_BITS = 8
+UNICODE_CODE_POINTS = 0x110000
+
+
+def unicode_property_flags():
+    """Return the property flags of every code point as a uint8 array."""
+    chars = np.arange(UNICODE_CODE_POINTS, dtype=np.uint32).view('U1')
+    flags = np.zeros(UNICODE_CODE_POINTS, np.uint8)
+    for flag, predicate in ((UNICODE_ALPHA, np.char.isalpha),
+                            (UNICODE_DECIMAL, np.char.isdecimal),
+                            (UNICODE_DIGIT, np.char.isdigit),
+                            (UNICODE_NUMERIC, np.char.isnumeric),
+                            (UNICODE_SPACE, np.char.isspace),
+                            (UNICODE_LOWER, np.char.islower),
+                            (UNICODE_UPPER, np.char.isupper)):
+        flags[predicate(chars)] |= flag
+    # A single character is title-cased when it is uppercase or titlecase.
+    title = np.char.istitle(chars) & (flags & UNICODE_UPPER == 0)
+    flags[title] |= UNICODE_TITLE
+    return flags
+
+
+def unicode_property_tables(flags):
+    """Split per-code-point flags into a block index and unique blocks."""
+    rows = flags.reshape(-1, 1 << UNICODE_BLOCK_BITS)
+    index = np.empty(rows.shape[0], np.uint16)
+    unique = {}
+    for i, row in enumerate(rows):
+        index[i] = unique.setdefault(row.tobytes(), len(unique))
+    blocks = np.frombuffer(b''.join(unique), np.uint8).reshape(
+        len(unique), 1 << UNICODE_BLOCK_BITS)
+    return index, blocks
+
+
+@lru_cache(maxsize=None)
+def unicode_tables():
+    """Return the block index and unique blocks, built on first use."""
+    return unicode_property_tables(unicode_property_flags())
+
+
+def unicode_flags(chr_ord):
+    """Property flags of a code point; out-of-range values have none."""
+    if chr_ord < 0 or chr_ord >= UNICODE_CODE_POINTS:
+        return np.uint8(0)
+    index, blocks = unicode_tables()
+    return blocks[index[chr_ord >> UNICODE_BLOCK_BITS], chr_ord & 0xff]
+
+
+@overload(unicode_flags, **OPTIONS)
+def ov_unicode_flags(chr_ord):
+    index, blocks = unicode_tables()
+
+    def impl(chr_ord):
+        if chr_ord < 0 or chr_ord >= UNICODE_CODE_POINTS:
+            return np.uint8(0)
+        return blocks[index[chr_ord >> UNICODE_BLOCK_BITS], chr_ord & 0xff]
+    return impl
@@ -0,0 +1,17 @@
+from charex.functions.ascii import isascii
+from charex.functions.classify import classify
+from charex.functions.encoded import encoded
+from charex.functions.factorize import factorize, factorize_index
+from charex.functions.gather import compress, concatenate, take
+from charex.functions.indexed import indexed
+from charex.functions.lookup import isin, lookup
+from charex.functions.narrowed import narrowed
+from charex.functions.nulls import isnull, masked
+from charex.functions.search import contains_any, count_any, find_any
+from charex.functions.shrink import max_len, shrink
+from charex.functions.sort import argsort, searchsorted, sort
+
+__all__ = ['argsort', 'classify', 'compress', 'concatenate', 'contains_any',
+           'count_any', 'encoded', 'factorize', 'factorize_index', 'find_any',
+           'indexed', 'isascii', 'isin', 'isnull', 'lookup', 'masked',
+           'max_len', 'narrowed', 'searchsorted', 'shrink', 'sort', 'take']
@@ -0,0 +1,137 @@
+"""
+Whole-array ASCII detection
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.functions.lookup import stringdtype_span
+from charex.numpy.overloads._shared import register_single as _register_single
+from charex.numpy.overloads.definitions import record_layout
+from charex.numpy.overloads.strings import _stringdtype_step
+from charex.numpy.stringdtype import (
+    is_stringdtype_array_type, stringdtype_acquire_allocator,
+    stringdtype_data_ptr, stringdtype_na_name, stringdtype_release_allocator,
+)
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import njit
+import numpy as np
+
+
+def isascii(values):
+    """Return whether every string of a 1-D array is pure ASCII.
+
+    Fixed-width records are checked eight bytes at a time; padding NULs
+    count as ASCII. Nothing is cached: a caller that does not write to a
+    column can keep the answer itself.
+    """
+    return _isascii(values)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+# Words are checked in blocks, so the inner loop stays branch-free.
+ASCII_BLOCK_WORDS = 256
+
+
+@register_jitable(**JIT_OPTIONS)
+def _ascii_word_mask(itemsize):
+    """Bits of a 64-bit word that are clear when its code units are ASCII."""
+    if itemsize == 1:
+        return np.uint64(0x8080808080808080)
+    if itemsize == 2:
+        return np.uint64(0xff80ff80ff80ff80)
+    return np.uint64(0xffffff80ffffff80)
+
+
+@register_jitable(**JIT_OPTIONS)
+def ascii_words(units):
+    """Return whether a contiguous run of code units is all ASCII.
+
+    The run is OR-ed together as 64-bit words, one block at a time, and
+    the accumulated high bits are tested once per block.
+    """
+    head = units.size * units.itemsize // 8 * 8 // units.itemsize
+    words = units[:head].view(np.uint64)
+    mask = _ascii_word_mask(units.itemsize)
+    for block in range(0, words.size, ASCII_BLOCK_WORDS):
+        high = np.uint64(0)
+        for w in range(block, min(block + ASCII_BLOCK_WORDS, words.size)):
+            high |= words[w]
+        if high & mask:
+            return False
+    for k in range(head, units.size):
+        if not 0 <= units[k] < 128:
+            return False
+    return True
+
+
+@register_jitable(**JIT_OPTIONS)
+def ascii_records(chr_array, len_chr, size_chr):
+    """Return whether strided ordinal records are all ASCII."""
+    units, stride, pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        high = 0
+        for c in range(stride, stride + size_chr):
+            high |= units[c]
+        if not 0 <= high < 128:
+            return False
+        stride += pitch
+    return True
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_ascii(values, na_kind, na_name):
+    """Return whether every string of a StringDType array is ASCII."""
+    if values.size == 0:
+        return True
+    allocator = stringdtype_acquire_allocator(values)
+    data = stringdtype_data_ptr(values)
+    step = _stringdtype_step(values)
+    result = True
+    for i in range(values.size):
+        chunk = stringdtype_span(data, i * step, allocator, na_kind,
+                                 na_name)[0]
+        high = 0
+        for p in range(chunk.size):
+            high |= chunk[p]
+        if high >= 128:
+            result = False
+            break
+    stringdtype_release_allocator(allocator)
+    return result
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+@overload(isascii, **OPTIONS)
+def ov_isascii(values):
+    if is_stringdtype_array_type(values):
+        if values.ndim != 1:
+            raise NumbaTypeError('StringDType values must be a '
+                                 'one-dimensional array')
+        na_kind = values.dtype.na_kind
+
+        def impl(values):
+            return stringdtype_ascii(values, na_kind,
+                                     stringdtype_na_name(values))
+        return impl
+
+    register_values, _, _ = _register_single(values)
+    if isinstance(values, types.Array) and values.layout != 'C':
+        def impl(values):
+            return ascii_records(*register_values(values, False))
+        return impl
+
+    def impl(values):
+        return ascii_words(register_values(values, False)[0])
+    return impl
+
+
+@njit(nogil=True)
+def _isascii(values):
+    return isascii(values)
@@ -0,0 +1,366 @@
+"""
+Multi-property classification of strings in one pass
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS, OVERLOAD_JIT_OPTIONS
+from charex.core.unicode_tables import (
+    UNICODE_ALPHA, UNICODE_DECIMAL, UNICODE_DIGIT, UNICODE_LOWER,
+    UNICODE_NUMERIC, UNICODE_SPACE, UNICODE_TITLE, UNICODE_UPPER,
+    unicode_flags,
+)
+from charex.functions.lookup import stringdtype_span
+from charex.numpy.overloads._shared import (
+    ensure_out as _ensure_out,
+    register_single as _register_single,
+)
+from charex.numpy.overloads.definitions import (
+    _ensure_out_shape, _record_last_nonzero, record_layout,
+)
+from charex.numpy.overloads.parallel import row_kernel as _row_kernel
+from charex.numpy.overloads.strings import _stringdtype_step
+from charex.numpy.stringdtype import (
+    _NA_NAN, is_stringdtype_array_type, stringdtype_acquire_allocator,
+    stringdtype_data_ptr, stringdtype_na_name, stringdtype_release_allocator,
+)
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import njit
+import numpy as np
+
+
+# Properties ``classify`` evaluates, in the order of its default bits.
+KINDS = ('isalpha', 'isalnum', 'isdecimal', 'isdigit', 'isnumeric',
+         'isspace', 'isupper', 'islower', 'istitle')
+# The default for bytes values, which have no isdecimal or isnumeric.
+BYTES_KINDS = ('isalpha', 'isalnum', 'isdigit', 'isspace', 'isupper',
+               'islower', 'istitle')
+
+
+def classify(values, kinds=None, out=None):
+    """Return a ``uint16`` bitmask of string properties per row.
+
+    Bit ``k`` is set where ``np.char`` would report ``kinds[k]`` true; the
+    kinds default to ``KINDS``, or ``BYTES_KINDS`` for bytes values. All
+    requested properties come from one scan of each string, which stops
+    once none of them can still hold. As in ``np.char``, ``isdecimal`` and
+    ``isnumeric`` are only available for ``str`` values.
+    """
+    return _classify(values, None if kinds is None else tuple(kinds), out)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+# Internal property bits: the first six follow the kind numbers of
+# ``_is_simple_property_ord``. As character classes, ``_TITLE`` marks a
+# titlecase letter rather than a title-cased string.
+_SIMPLE = 0x3f
+_UPPER = 0x40
+_LOWER = 0x80
+_TITLE = 0x100
+_CASED = _UPPER | _LOWER | _TITLE
+
+
+def _ascii_classes(as_bytes):
+    classes = np.zeros(256 if as_bytes else 128, np.uint16)
+    for chr_ord in range(classes.size):
+        value = bytes([chr_ord]) if as_bytes else chr(chr_ord)
+        digit = value.isdigit()
+        flags = (value.isalpha(), value.isalnum(), digit, digit, digit,
+                 value.isspace(), value.isupper(), value.islower())
+        for bit, flag in enumerate(flags):
+            classes[chr_ord] |= flag << bit
+    return classes
+
+
+def _unicode_classes():
+    """Map each byte of Unicode property flags to its classes."""
+    classes = np.zeros(256, np.uint16)
+    for flags in range(256):
+        for bit, mask in enumerate((
+                UNICODE_ALPHA, UNICODE_ALPHA | UNICODE_NUMERIC,
+                UNICODE_DECIMAL, UNICODE_DIGIT, UNICODE_NUMERIC,
+                UNICODE_SPACE, UNICODE_UPPER, UNICODE_LOWER, UNICODE_TITLE)):
+            if flags & mask:
+                classes[flags] |= 1 << bit
+    return classes
+
+
+_BYTES_CLASSES = _ascii_classes(True)
+_STRINGS_CLASSES = _ascii_classes(False)
+_UNICODE_CLASSES = _unicode_classes()
+
+
+@register_jitable(**JIT_OPTIONS)
+def _kind_bit(kind):
+    if kind == 'isalpha':
+        return 0
+    if kind == 'isalnum':
+        return 1
+    if kind == 'isdecimal':
+        return 2
+    if kind == 'isdigit':
+        return 3
+    if kind == 'isnumeric':
+        return 4
+    if kind == 'isspace':
+        return 5
+    if kind == 'isupper':
+        return 6
+    if kind == 'islower':
+        return 7
+    if kind == 'istitle':
+        return 8
+    raise ValueError('classify kinds must be names of string predicates')
+
+
+@register_jitable(**JIT_OPTIONS)
+def _kind_bits(kinds):
+    """Return the internal bit of each requested kind."""
+    if len(kinds) > 16:
+        raise ValueError('classify supports at most 16 kinds')
+    bits = np.empty(len(kinds), np.int64)
+    for k in range(len(kinds)):
+        bits[k] = _kind_bit(kinds[k])
+    return bits
+
+
+@register_jitable(**JIT_OPTIONS)
+def _bytes_kind_bits(kinds):
+    """Return the internal bit of each requested kind of bytes values."""
+    bits = _kind_bits(kinds)
+    for bit in bits:
+        if bit == 2 or bit == 4:
+            raise TypeError('isdecimal and isnumeric are only available for '
+                            'Unicode strings and arrays')
+    return bits
+
+
+@register_jitable(**JIT_OPTIONS)
+def _char_classes(chr_ord, as_bytes):
+    """Return the classes of one character."""
+    if as_bytes:
+        return _BYTES_CLASSES[chr_ord]
+    if 0 <= chr_ord < 128:
+        return _STRINGS_CLASSES[chr_ord]
+    return _UNICODE_CLASSES[unicode_flags(chr_ord)]
+
+
+@register_jitable(**JIT_OPTIONS)
+def _classify_step(classes, live, held, cased):
+    """Advance a row's live and held properties past one character.
+
+    Follows ``isupper``, ``islower`` and the ``istitle`` state machine of
+    the single-property kernels.
+    """
+    live &= classes | _CASED
+    if live & _UPPER:
+        if classes & (_LOWER | _TITLE):
+            live &= ~_UPPER
+        held |= classes & _UPPER
+    if live & _LOWER:
+        if classes & (_UPPER | _TITLE):
+            live &= ~_LOWER
+        held |= classes & _LOWER
+    if live & _TITLE:
+        start = classes & (_UPPER | _TITLE) != 0
+        lower = classes & _LOWER != 0
+        if cased:
+            if start:
+                live &= ~_TITLE
+            cased = lower
+        else:
+            if lower:
+                live &= ~_TITLE
+            cased = start
+            if start:
+                held |= _TITLE
+    return live, held, cased
+
+
+@register_jitable(**JIT_OPTIONS)
+def _row_bits(live, held, bits):
+    """Pack the properties that hold for a row into its output bits."""
+    holds = live & (_SIMPLE | held)
+    mask = 0
+    for k in range(bits.size):
+        mask |= ((holds >> bits[k]) & 1) << k
+    return mask
+
+
+@register_jitable(**JIT_OPTIONS)
+def _requested(bits):
+    requested = 0
+    for k in range(bits.size):
+        requested |= 1 << bits[k]
+    return requested
+
+
+@register_jitable(**JIT_OPTIONS)
+def _mask_result(out, len_cast):
+    if out is None:
+        return np.empty(len_cast, np.uint16)
+    _ensure_out_shape(out, len_cast)
+    return out
+
+
+@register_jitable(**JIT_OPTIONS)
+def classify_kernel(chr_array, len_chr, size_chr, as_bytes, bits, out=None):
+    """Return the property bitmask of ordinal records in one scan.
+
+    Embedded NULs belong to no class, which fails the ``_simple_property``
+    kinds just as the single-property kernels do.
+    """
+    result = _mask_result(out, len_chr)
+    requested = _requested(bits)
+    units, stride, pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        length = _record_last_nonzero(units, stride, size_chr) - stride + 1
+        live = requested if length else 0
+        held = 0
+        cased = False
+        for c in range(length):
+            live, held, cased = _classify_step(
+                _char_classes(units[stride + c], as_bytes),
+                live, held, cased)
+            if not live:
+                break
+        result[i] = _row_bits(live, held, bits)
+        stride += pitch
+    return result
+
+
+@register_jitable(**JIT_OPTIONS)
+def _utf8_code(chunk, p):
+    """Return the code point at byte ``p`` of UTF-8 bytes and its width."""
+    c = chunk[p]
+    if c < 0x80:
+        return np.int64(c), 1
+    if c < 0xe0:
+        code, n = c & 0x1f, 2
+    elif c < 0xf0:
+        code, n = c & 0x0f, 3
+    else:
+        code, n = c & 0x07, 4
+    for q in range(1, n):
+        code = (code << 6) | (chunk[p + q] & 0x3f)
+    return np.int64(code), n
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_classify(values, na_kind, na_name, bits, out):
+    """Return the property bitmask of a StringDType array in one scan.
+
+    NaN-like nulls have no properties and string nulls are classified by
+    name; other nulls raise, like the single-property functions.
+    """
+    result = _mask_result(out, values.size)
+    if values.size == 0:
+        return result
+    requested = _requested(bits)
+    allocator = stringdtype_acquire_allocator(values)
+    data = stringdtype_data_ptr(values)
+    step = _stringdtype_step(values)
+    null_string = False
+    for i in range(values.size):
+        chunk, status = stringdtype_span(data, i * step, allocator, na_kind,
+                                         na_name)
+        live = requested if chunk.size and status == 0 else 0
+        null_string |= status != 0 and na_kind != _NA_NAN
+        held = 0
+        cased = False
+        p = 0
+        while live and p < chunk.size:
+            chr_ord, n = _utf8_code(chunk, p)
+            live, held, cased = _classify_step(
+                _char_classes(chr_ord, False), live, held, cased)
+            p += n
+        result[i] = _row_bits(live, held, bits)
+    stringdtype_release_allocator(allocator)
+    if null_string:
+        raise ValueError('Cannot use the classify function with a null that '
+                         'is not a nan-like value')
+    return result
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _register_kinds(kinds, as_bytes):
+    """Return a function giving the internal bit of each requested kind.
+
+    Literal and default kinds are resolved while typing; kinds passed in
+    from Python are looked up at run time. Bytes values reject the
+    Unicode-only kinds, like ``np.char``, and default to ``BYTES_KINDS``.
+    """
+    if kinds is None or isinstance(kinds, types.NoneType) \
+            or isinstance(kinds, types.Omitted) and kinds.value is None:
+        names = BYTES_KINDS if as_bytes else KINDS
+    elif isinstance(kinds, tuple):
+        names = kinds
+    elif isinstance(kinds, types.Omitted):
+        names = kinds.value
+    elif isinstance(kinds, types.BaseTuple) and all(
+            isinstance(kind, types.StringLiteral) for kind in kinds):
+        names = tuple(kind.literal_value for kind in kinds)
+    elif isinstance(kinds, types.UniTuple) \
+            and isinstance(kinds.dtype, types.UnicodeType):
+        return _bytes_kind_bits if as_bytes else _kind_bits
+    elif isinstance(kinds, types.BaseTuple) and not len(kinds):
+        names = ()
+    else:
+        raise NumbaTypeError('kinds must be a tuple of property names')
+    if any(name not in KINDS for name in names):
+        raise NumbaTypeError('classify kinds must be names of string '
+                             'predicates')
+    if len(names) > 16:
+        raise NumbaTypeError('classify supports at most 16 kinds')
+    if as_bytes and ('isdecimal' in names or 'isnumeric' in names):
+        raise NumbaTypeError('isdecimal and isnumeric are only available for '
+                             'Unicode strings and arrays')
+    bits = np.array([KINDS.index(name) for name in names], np.int64)
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def kind_bits(kinds):
+        return bits
+    return kind_bits
+
+
+@overload(classify, **OPTIONS)
+def ov_classify(values, kinds=None, out=None):
+    _ensure_out(out, types.uint16, values)
+
+    if is_stringdtype_array_type(values):
+        if values.ndim != 1:
+            raise NumbaTypeError('StringDType values must be a '
+                                 'one-dimensional array')
+        na_kind = values.dtype.na_kind
+        kind_bits = _register_kinds(kinds, False)
+
+        def impl(values, kinds=None, out=None):
+            return stringdtype_classify(values, na_kind,
+                                        stringdtype_na_name(values),
+                                        kind_bits(kinds), out)
+        return impl
+
+    register_values, values_dim, as_bytes = _register_single(values)
+    kind_bits = _register_kinds(kinds, as_bytes)
+    classify_rows = _row_kernel(classify_kernel)
+
+    if values_dim > 0:
+        def impl(values, kinds=None, out=None):
+            return classify_rows(*register_values(values, False), as_bytes,
+                                 kind_bits(kinds), out)
+    else:
+        def impl(values, kinds=None, out=None):
+            return classify_rows(*register_values(values, False), as_bytes,
+                                 kind_bits(kinds), None)[0]
+    return impl
+
+
+@njit(nogil=True)
+def _classify(values, kinds, out):
+    return classify(values, kinds, out)
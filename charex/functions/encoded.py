@@ -0,0 +1,74 @@
+"""
+Dictionary-encoded string columns
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.functions.factorize import factorize, factorize_index
+from charex.functions.gather import take
+from charex.numpy.overloads._shared import EncodedStrings
+from charex.numpy.stringdtype import is_stringdtype_array_type
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import njit
+import numpy as np
+
+
+def encoded(values):
+    """Return a 1-D string array as codes into its unique values.
+
+    The result is an ``EncodedStrings`` that ``np.char`` and ``np.strings``
+    operations accept in place of ``values``. With a scalar other operand
+    they run once per distinct string and gather the results by code, so
+    a low-cardinality column costs one pass over its uniques plus one over
+    its codes. StringDType nulls become one more unique.
+    """
+    return _encoded(values)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+@register_jitable(**JIT_OPTIONS)
+def null_unique(codes, first):
+    """Give null rows (code -1) one more unique, read from the first of them."""
+    n_uniques = first.size
+    null = -1
+    for i in range(codes.size):
+        if codes[i] < 0:
+            if null < 0:
+                null = i
+            codes[i] = n_uniques
+    if null < 0:
+        return codes, first
+    grown = np.empty(n_uniques + 1, first.dtype)
+    grown[:n_uniques] = first
+    grown[n_uniques] = null
+    return codes, grown
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+@overload(encoded, **OPTIONS)
+def ov_encoded(values):
+    if not isinstance(values, types.Array) or values.ndim != 1:
+        raise NumbaTypeError('encoded expects a one-dimensional string array')
+
+    if is_stringdtype_array_type(values):
+        def impl(values):
+            codes, first = null_unique(*factorize_index(values))
+            return EncodedStrings(codes, take(values, first))
+        return impl
+
+    def impl(values):
+        codes, uniques = factorize(values)
+        return EncodedStrings(codes, uniques)
+    return impl
+
+
+@njit(nogil=True)
+def _encoded(values):
+    return encoded(values)
@@ -0,0 +1,301 @@
+"""
+Dictionary encoding of string arrays into integer codes
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.functions.gather import take
+from charex.functions.lookup import (
+    _hash_units, _units_equal, stringdtype_span,
+)
+from charex.functions.sort import argsort
+from charex.numpy.overloads._shared import register_single as _register_single
+from charex.numpy.overloads.definitions import (
+    _record_last_nonzero, record_layout,
+)
+from charex.numpy.overloads.strings import _stringdtype_step
+from charex.numpy.stringdtype import (
+    is_stringdtype_array_type, stringdtype_acquire_allocator,
+    stringdtype_data_ptr, stringdtype_na_name, stringdtype_release_allocator,
+)
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import njit
+import numpy as np
+
+
+def factorize(values, sort=False):
+    """Encode a 1-D string array as ``int32`` codes and its unique strings.
+
+    ``uniques[codes]`` reproduces ``values``. Uniques appear in first-seen
+    order, or ascending like ``np.unique`` with ``sort``. StringDType nulls
+    get code -1 and StringDType uniques are gathered with ``take``.
+    """
+    return _factorize(values, sort)
+
+
+def factorize_index(values, sort=False):
+    """Return ``int32`` codes and the index of each unique's first row."""
+    return _factorize_index(values, sort)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+# Initial slot count of the growing hash table.
+TABLE_CAPACITY = 1024
+
+
+@register_jitable(**JIT_OPTIONS)
+def _grow(array, size):
+    grown = np.empty(2 * array.size, array.dtype)
+    grown[:size] = array[:size]
+    return grown
+
+
+@register_jitable(**JIT_OPTIONS)
+def _rehash(unique_hashes, n_uniques, capacity):
+    """Return a table of ``capacity`` slots over the first unique hashes."""
+    mask = capacity - 1
+    slots = np.full(capacity, -1, 'int32')
+    for k in range(n_uniques):
+        slot = unique_hashes[k] & mask
+        while slots[slot] >= 0:
+            slot = (slot + 1) & mask
+        slots[slot] = k
+    return slots
+
+
+@register_jitable(**JIT_OPTIONS)
+def record_hashes(chr_array, len_chr, size_chr):
+    """Hash and measure every record in one pass over the array."""
+    hashes = np.empty(len_chr, 'int64')
+    lengths = np.empty(len_chr, 'int64')
+    units, stride, pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        length = _record_last_nonzero(units, stride, size_chr) - stride + 1
+        lengths[i] = length
+        hashes[i] = _hash_units(units, stride, stride + length)
+        stride += pitch
+    return hashes, lengths
+
+
+@register_jitable(**JIT_OPTIONS)
+def factorize_kernel(chr_array, len_chr, size_chr):
+    """Return first-seen codes of ordinal records and each unique's first row.
+
+    Records are hashed in a separate pass, then looked up in an int32 slot
+    table sized to the uniques rather than the rows, which keeps it in
+    cache for low-cardinality columns. Slots are compared by the uniques'
+    packed hashes and lengths before their records are touched.
+    """
+    hashes, lengths = record_hashes(chr_array, len_chr, size_chr)
+    units, start, pitch = record_layout(chr_array, size_chr)
+    codes = np.empty(len_chr, 'int32')
+    first = np.empty(16, 'int64')
+    unique_hashes = np.empty(16, 'int64')
+    capacity = TABLE_CAPACITY
+    slots = np.full(capacity, -1, 'int32')
+    n_uniques = 0
+    for i in range(len_chr):
+        h = hashes[i]
+        length = lengths[i]
+        stride = start + i * pitch
+        mask = capacity - 1
+        slot = h & mask
+        k = slots[slot]
+        while k >= 0:
+            j = first[k]
+            if unique_hashes[k] == h and lengths[j] == length \
+                    and _units_equal(units, stride, units, start + j * pitch,
+                                     length):
+                break
+            slot = (slot + 1) & mask
+            k = slots[slot]
+        if k < 0:
+            k = n_uniques
+            if k == first.size:
+                first = _grow(first, k)
+                unique_hashes = _grow(unique_hashes, k)
+            first[k] = i
+            unique_hashes[k] = h
+            slots[slot] = k
+            n_uniques += 1
+            if 2 * n_uniques > capacity:
+                capacity *= 2
+                slots = _rehash(unique_hashes, n_uniques, capacity)
+        codes[i] = k
+    return codes, first[:n_uniques]
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_factorize(values, na_kind, na_name):
+    """Return first-seen codes of a StringDType array, its first rows and keys.
+
+    Unique strings are copied into a growing UTF-8 key buffer, so each row
+    is loaded once and compared against compact keys. Nulls get code -1.
+    """
+    n_values = values.size
+    codes = np.empty(n_values, 'int32')
+    first = np.empty(16, 'int64')
+    unique_hashes = np.empty(16, 'int64')
+    offsets = np.zeros(17, 'int64')
+    keys = np.empty(256, 'uint8')
+    capacity = TABLE_CAPACITY
+    slots = np.full(capacity, -1, 'int32')
+    n_uniques = 0
+    if n_values == 0:
+        return codes, first[:0], keys[:0], offsets[:1]
+    allocator = stringdtype_acquire_allocator(values)
+    data = stringdtype_data_ptr(values)
+    step = _stringdtype_step(values)
+    for i in range(n_values):
+        chunk, status = stringdtype_span(data, i * step, allocator, na_kind,
+                                         na_name)
+        if status != 0:
+            codes[i] = -1
+            continue
+        length = chunk.size
+        h = _hash_units(chunk, 0, length)
+        mask = capacity - 1
+        slot = h & mask
+        k = slots[slot]
+        while k >= 0:
+            if unique_hashes[k] == h \
+                    and offsets[k + 1] - offsets[k] == length \
+                    and _units_equal(chunk, 0, keys, offsets[k], length):
+                break
+            slot = (slot + 1) & mask
+            k = slots[slot]
+        if k < 0:
+            k = n_uniques
+            if k == first.size:
+                first = _grow(first, k)
+                unique_hashes = _grow(unique_hashes, k)
+                offsets = _grow(offsets, k + 1)
+            end = offsets[k] + length
+            while end > keys.size:
+                keys = _grow(keys, offsets[k])
+            keys[offsets[k]:end] = chunk
+            offsets[k + 1] = end
+            first[k] = i
+            unique_hashes[k] = h
+            slots[slot] = k
+            n_uniques += 1
+            if 2 * n_uniques > capacity:
+                capacity *= 2
+                slots = _rehash(unique_hashes, n_uniques, capacity)
+        codes[i] = k
+    stringdtype_release_allocator(allocator)
+    return codes, first[:n_uniques], keys, offsets[:n_uniques + 1]
+
+
+@register_jitable(**JIT_OPTIONS)
+def _key_less(keys, offsets, a, b):
+    a_start = offsets[a]
+    b_start = offsets[b]
+    a_size = offsets[a + 1] - a_start
+    b_size = offsets[b + 1] - b_start
+    for p in range(min(a_size, b_size)):
+        if keys[a_start + p] != keys[b_start + p]:
+            return keys[a_start + p] < keys[b_start + p]
+    return a_size < b_size
+
+
+@register_jitable(**JIT_OPTIONS)
+def key_argsort(keys, offsets):
+    """Bottom-up merge argsort of UTF-8 keys, which is code point order."""
+    n_keys = offsets.size - 1
+    order = np.arange(n_keys)
+    merged = np.empty(n_keys, 'int64')
+    width = 1
+    while width < n_keys:
+        for lo in range(0, n_keys, 2 * width):
+            mid = min(lo + width, n_keys)
+            hi = min(lo + 2 * width, n_keys)
+            a = lo
+            b = mid
+            for k in range(lo, hi):
+                if a < mid and (b >= hi or not _key_less(
+                        keys, offsets, order[b], order[a])):
+                    merged[k] = order[a]
+                    a += 1
+                else:
+                    merged[k] = order[b]
+                    b += 1
+        order, merged = merged, order
+        width *= 2
+    return order
+
+
+@register_jitable(**JIT_OPTIONS)
+def sorted_codes(codes, first, order):
+    """Renumber codes so that code ``k`` is the ``k``-th unique of ``order``."""
+    rank = np.empty(order.size, 'int32')
+    for k in range(order.size):
+        rank[order[k]] = k
+    for i in range(codes.size):
+        if codes[i] >= 0:
+            codes[i] = rank[codes[i]]
+    return codes, first[order]
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _register_factorize(values):
+    if not isinstance(values, types.Array) or values.ndim != 1:
+        raise NumbaTypeError('expected a one-dimensional string array')
+    if is_stringdtype_array_type(values):
+        return None
+    register_values, _, _ = _register_single(values)
+    return register_values
+
+
+@overload(factorize_index, **OPTIONS)
+def ov_factorize_index(values, sort=False):
+    register_values = _register_factorize(values)
+
+    if register_values is None:
+        na_kind = values.dtype.na_kind
+
+        def impl(values, sort=False):
+            codes, first, keys, offsets = stringdtype_factorize(
+                values, na_kind, stringdtype_na_name(values))
+            if sort:
+                return sorted_codes(codes, first, key_argsort(keys, offsets))
+            return codes, first
+        return impl
+
+    def impl(values, sort=False):
+        codes, first = factorize_kernel(*register_values(values, False))
+        if sort:
+            return sorted_codes(codes, first, argsort(values[first]))
+        return codes, first
+    return impl
+
+
+@overload(factorize, **OPTIONS)
+def ov_factorize(values, sort=False):
+    if _register_factorize(values) is None:
+        def impl(values, sort=False):
+            codes, first = factorize_index(values, sort)
+            return codes, take(values, first)
+        return impl
+
+    def impl(values, sort=False):
+        codes, first = factorize_index(values, sort)
+        return codes, values[first]
+    return impl
+
+
+@njit(nogil=True)
+def _factorize(values, sort):
+    return factorize(values, sort)
+
+
+@njit(nogil=True)
+def _factorize_index(values, sort):
+    return factorize_index(values, sort)
@@ -0,0 +1,191 @@
+"""
+Gathering, filtering and concatenating StringDType arrays
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.numpy.overloads.strings import _stringdtype_step
+from charex.numpy.stringdtype import (
+    is_stringdtype_array_type, stringdtype_acquire_allocators,
+    stringdtype_copy_data, stringdtype_data_ptr, stringdtype_empty_like,
+    stringdtype_release_allocators,
+)
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import literal_unroll, njit
+import numpy as np
+
+
+def take(values, indices):
+    """Return the strings of a 1-D StringDType array at ``indices``.
+
+    Matches ``np.take(values, indices)`` for a 1-D integer ``indices``:
+    negative indices count from the end and out-of-range ones raise
+    ``IndexError``.
+    """
+    return _take(values, np.asarray(indices))
+
+
+def compress(condition, values):
+    """Return the strings of a 1-D StringDType array where ``condition`` holds.
+
+    Matches ``np.compress(condition, values)``: a shorter ``condition``
+    selects from the leading strings only, a longer one raises
+    ``ValueError``.
+    """
+    return _compress(np.asarray(condition), values)
+
+
+def concatenate(arrays):
+    """Join a sequence of 1-D StringDType arrays of one dtype.
+
+    Matches ``np.concatenate(arrays)``. In nopython mode ``arrays`` must be
+    a tuple.
+    """
+    if not len(arrays):
+        raise ValueError('need at least one array to concatenate')
+    return _concatenate(tuple(arrays))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_copy_rows(values, rows, result, start):
+    """Copy ``values[rows]`` into a new array from row ``start`` on.
+
+    Both allocators are held for the whole copy. Inline strings move as
+    their 16-byte packets; only arena and heap strings are loaded and
+    packed again.
+    """
+    if rows.size == 0:
+        return
+    allocators = stringdtype_acquire_allocators(values, result)
+    data = stringdtype_data_ptr(values)
+    step = _stringdtype_step(values)
+    result_data = stringdtype_data_ptr(result)
+    status = 0
+    for k in range(rows.size):
+        status |= stringdtype_copy_data(result_data, start + k, allocators[1],
+                                        data, rows[k] * step, allocators[0])
+    stringdtype_release_allocators(allocators)
+    if status:
+        raise MemoryError('could not pack the StringDType strings')
+
+
+@register_jitable(**JIT_OPTIONS)
+def take_rows(n_values, indices):
+    """Return ``indices`` as rows in ``[0, n_values)``."""
+    rows = np.empty(indices.size, np.intp)
+    for k in range(indices.size):
+        row = indices[k]
+        if row < 0:
+            row += n_values
+        if not 0 <= row < n_values:
+            raise IndexError('index out of bounds for the StringDType array')
+        rows[k] = row
+    return rows
+
+
+@register_jitable(**JIT_OPTIONS)
+def compress_rows(condition, n_values):
+    """Return the rows whose ``condition`` is set."""
+    if condition.size > n_values:
+        raise ValueError('condition is longer than the StringDType array')
+    n_rows = 0
+    for k in range(condition.size):
+        if condition[k]:
+            n_rows += 1
+    rows = np.empty(n_rows, np.intp)
+    n_rows = 0
+    for k in range(condition.size):
+        if condition[k]:
+            rows[n_rows] = k
+            n_rows += 1
+    return rows
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _ensure_stringdtype(values, name):
+    if not is_stringdtype_array_type(values) or values.ndim != 1:
+        raise NumbaTypeError(f'{name} expects a one-dimensional StringDType '
+                             'array')
+
+
+def _ensure_vector(value, kind, message):
+    if not isinstance(value, types.Array) or value.ndim != 1 \
+            or not isinstance(value.dtype, kind):
+        raise NumbaTypeError(message)
+
+
+@overload(take, **OPTIONS)
+def ov_take(values, indices):
+    _ensure_stringdtype(values, 'take')
+    _ensure_vector(indices, types.Integer,
+                   'take indices must be a one-dimensional integer array')
+
+    def impl(values, indices):
+        rows = take_rows(values.size, indices)
+        result = stringdtype_empty_like(values, rows.size)
+        stringdtype_copy_rows(values, rows, result, 0)
+        return result
+    return impl
+
+
+@overload(compress, **OPTIONS)
+def ov_compress(condition, values):
+    _ensure_stringdtype(values, 'compress')
+    _ensure_vector(condition, types.Boolean,
+                   'compress condition must be a one-dimensional boolean '
+                   'array')
+
+    def impl(condition, values):
+        rows = compress_rows(condition, values.size)
+        result = stringdtype_empty_like(values, rows.size)
+        stringdtype_copy_rows(values, rows, result, 0)
+        return result
+    return impl
+
+
+@overload(concatenate, **OPTIONS)
+def ov_concatenate(arrays):
+    if not isinstance(arrays, types.BaseTuple) or not len(arrays):
+        raise NumbaTypeError('concatenate expects a non-empty tuple of '
+                             'StringDType arrays')
+    for values in arrays:
+        _ensure_stringdtype(values, 'concatenate')
+    if len({values.dtype for values in arrays}) > 1:
+        raise NumbaTypeError('concatenate expects StringDType arrays with '
+                             'one na_object')
+
+    def impl(arrays):
+        n_values = 0
+        for values in literal_unroll(arrays):
+            n_values += values.size
+        result = stringdtype_empty_like(arrays[0], n_values)
+        start = 0
+        for values in literal_unroll(arrays):
+            stringdtype_copy_rows(values, np.arange(values.size), result,
+                                  start)
+            start += values.size
+        return result
+    return impl
+
+
+@njit(nogil=True)
+def _take(values, indices):
+    return take(values, indices)
+
+
+@njit(nogil=True)
+def _compress(condition, values):
+    return compress(condition, values)
+
+
+@njit(nogil=True)
+def _concatenate(arrays):
+    return concatenate(arrays)
@@ -0,0 +1,45 @@
+"""
+Prebuilt length index for fixed-width string arrays
+"""
+
+from charex.core import OPTIONS
+from charex.numpy.overloads._shared import (
+    IndexedStrings, register_single as _register_single,
+)
+from charex.numpy.overloads.definitions import str_len, str_len_bytes
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload
+from numba import njit
+
+
+def indexed(values):
+    """Return ``values`` paired with its string lengths, computed once.
+
+    The result is an ``IndexedStrings`` that ``np.char`` and ``np.strings``
+    operations accept in place of ``values``. Searches (``count``, ``find``,
+    ``rfind``, ``index``, ``rindex``, ``startswith``, ``endswith``) and
+    ``str_len`` read the prebuilt lengths instead of rescanning every
+    record, so pipelines running many searches over one column pay for the
+    length pass once. The index must be rebuilt if ``values`` changes.
+    """
+    return _indexed(values)
+
+
+@overload(indexed, **OPTIONS)
+def ov_indexed(values):
+    if not isinstance(values, types.Array) or values.ndim != 1:
+        raise NumbaTypeError('indexed expects a one-dimensional fixed-width '
+                             'string array')
+    register_values, _, as_bytes = _register_single(values)
+    lengths = str_len_bytes if as_bytes else str_len
+
+    def impl(values):
+        return IndexedStrings(values,
+                              lengths(*register_values(values, False)))
+    return impl
+
+
+@njit(nogil=True)
+def _indexed(values):
+    return indexed(values)
@@ -0,0 +1,461 @@
+"""
+Hash-table membership and lookup over string arrays
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS, OVERLOAD_JIT_OPTIONS
+from charex.numpy.overloads._shared import (
+    ensure_out as _ensure_out,
+    register_single as _register_single,
+)
+from charex.numpy.overloads.definitions import (
+    _record_last_nonzero, bool_result, int_result, record_layout,
+)
+from charex.numpy.overloads.parallel import row_kernel as _row_kernel
+from charex.numpy.overloads.strings import (
+    _compatible_stringdtype_na, _stringdtype_step,
+)
+from charex.numpy.stringdtype import (
+    _NA_NONE, is_stringdtype_array_type, stringdtype_acquire_allocator,
+    stringdtype_data_ptr, stringdtype_na_name, stringdtype_release_allocator,
+    stringdtype_span_na_data,
+)
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import carray, njit
+import numpy as np
+
+
+def isin(values, candidates, out=None):
+    """Return whether each string occurs in ``candidates``.
+
+    Matches ``np.isin(values, candidates)``. Results are written to ``out``
+    when it is given.
+    """
+    return _isin(values, candidates, out)
+
+
+def lookup(values, vocabulary, out=None):
+    """Return the index of each string's first occurrence in ``vocabulary``.
+
+    Strings missing from ``vocabulary`` map to -1. Results are written to
+    ``out`` when it is given.
+    """
+    return _lookup(values, vocabulary, out)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Hash Table
+
+
+# 64-bit FNV-1a parameters, as signed integers so arithmetic wraps in int64.
+HASH_SEED = -3750763034362895579
+HASH_PRIME = 1099511628211
+
+
+@register_jitable(**JIT_OPTIONS)
+def _hash_units(units, start, stop):
+    h = HASH_SEED
+    for p in range(start, stop):
+        h = (h ^ units[p]) * HASH_PRIME
+    return h ^ (h >> 29)
+
+
+@register_jitable(**JIT_OPTIONS)
+def _units_equal(units, start, keys, key_start, length):
+    for p in range(length):
+        if units[start + p] != keys[key_start + p]:
+            return False
+    return True
+
+
+@register_jitable(**JIT_OPTIONS)
+def build_table(keys, offsets, ids, null_id):
+    """Build an open-addressing hash table over flattened keys.
+
+    Key ``k`` is ``keys[offsets[k]:offsets[k + 1]]`` and reports ``ids[k]``.
+    Slots hold key numbers with linear probing at a load factor of at most
+    one half, next to each key's full hash so most mismatches are rejected
+    without touching the keys. Repeated keys keep their first id.
+    """
+    n_keys = ids.size
+    capacity = 16
+    while capacity < 2 * n_keys:
+        capacity *= 2
+    mask = capacity - 1
+    slots = np.full(capacity, -1, 'int64')
+    hashes = np.empty(capacity, 'int64')
+    for k in range(n_keys):
+        start = offsets[k]
+        length = offsets[k + 1] - start
+        h = _hash_units(keys, start, start + length)
+        slot = h & mask
+        j = slots[slot]
+        while j >= 0:
+            if hashes[slot] == h and offsets[j + 1] - offsets[j] == length \
+                    and _units_equal(keys, start, keys, offsets[j], length):
+                break
+            slot = (slot + 1) & mask
+            j = slots[slot]
+        if j < 0:
+            slots[slot] = k
+            hashes[slot] = h
+    return slots, hashes, keys, offsets, ids, null_id
+
+
+@register_jitable(**JIT_OPTIONS)
+def probe_table(table, units, start, length):
+    """Return the id of ``units[start:start + length]`` in ``table``, or -1."""
+    slots, hashes, keys, offsets, ids = table[:5]
+    mask = slots.size - 1
+    h = _hash_units(units, start, start + length)
+    slot = h & mask
+    k = slots[slot]
+    while k >= 0:
+        if hashes[slot] == h and offsets[k + 1] - offsets[k] == length \
+                and _units_equal(units, start, keys, offsets[k], length):
+            return ids[k]
+        slot = (slot + 1) & mask
+        k = slots[slot]
+    return -1
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Keys
+
+
+@register_jitable(**JIT_OPTIONS)
+def _record_lengths(chr_array, len_chr, size_chr):
+    units, stride, pitch = record_layout(chr_array, size_chr)
+    offsets = np.empty(len_chr + 1, 'int64')
+    offsets[0] = 0
+    for i in range(len_chr):
+        offsets[i + 1] = offsets[i] \
+            + _record_last_nonzero(units, stride, size_chr) - stride + 1
+        stride += pitch
+    return offsets
+
+
+@register_jitable(**JIT_OPTIONS)
+def record_keys(chr_array, len_chr, size_chr):
+    """Flatten ordinal records into table keys of the same code units."""
+    offsets = _record_lengths(chr_array, len_chr, size_chr)
+    units, stride, pitch = record_layout(chr_array, size_chr)
+    keys = np.empty(offsets[len_chr], units.dtype)
+    for i in range(len_chr):
+        start = offsets[i]
+        for p in range(offsets[i + 1] - start):
+            keys[start + p] = units[stride + p]
+        stride += pitch
+    return keys, offsets, np.arange(len_chr), -1
+
+
+@register_jitable(**JIT_OPTIONS)
+def _encode_utf8(units, start, stop, keys, k):
+    for p in range(start, stop):
+        c = units[p]
+        if c < 0x80:
+            keys[k] = c
+            k += 1
+        elif c < 0x800:
+            keys[k] = 0xc0 | (c >> 6)
+            keys[k + 1] = 0x80 | (c & 0x3f)
+            k += 2
+        elif c < 0x10000:
+            keys[k] = 0xe0 | (c >> 12)
+            keys[k + 1] = 0x80 | ((c >> 6) & 0x3f)
+            keys[k + 2] = 0x80 | (c & 0x3f)
+            k += 3
+        else:
+            keys[k] = 0xf0 | (c >> 18)
+            keys[k + 1] = 0x80 | ((c >> 12) & 0x3f)
+            keys[k + 2] = 0x80 | ((c >> 6) & 0x3f)
+            keys[k + 3] = 0x80 | (c & 0x3f)
+            k += 4
+    return k
+
+
+@register_jitable(**JIT_OPTIONS)
+def record_utf8_keys(chr_array, len_chr, size_chr):
+    """Flatten UTF-32 records into UTF-8 table keys for StringDType probes."""
+    lengths = _record_lengths(chr_array, len_chr, size_chr)
+    units, stride, pitch = record_layout(chr_array, size_chr)
+    keys = np.empty(4 * lengths[len_chr], 'uint8')
+    offsets = np.empty(len_chr + 1, 'int64')
+    offsets[0] = 0
+    for i in range(len_chr):
+        length = lengths[i + 1] - lengths[i]
+        offsets[i + 1] = _encode_utf8(units, stride, stride + length, keys,
+                                      offsets[i])
+        stride += pitch
+    return keys, offsets, np.arange(len_chr), -1
+
+
+@register_jitable(**JIT_OPTIONS)
+def _decode_utf8(chunk, keys, k):
+    p = 0
+    while p < chunk.size:
+        c = chunk[p]
+        if c < 0x80:
+            code = np.int64(c)
+            n = 1
+        elif c < 0xe0:
+            code = c & 0x1f
+            n = 2
+        elif c < 0xf0:
+            code = c & 0x0f
+            n = 3
+        else:
+            code = c & 0x07
+            n = 4
+        for q in range(1, n):
+            code = (code << 6) | (chunk[p + q] & 0x3f)
+        keys[k] = code
+        k += 1
+        p += n
+    return k
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_span(data, index, allocator, na_kind, na_name):
+    """Return one packed string as a byte array and its load status."""
+    buffer, size, status = stringdtype_span_na_data(
+        data, index, allocator, na_kind, na_name[0], na_name[1])
+    return carray(buffer, size, np.uint8), status
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_keys(values, na_kind, na_name, key_type):
+    """Flatten a StringDType array into table keys of ``key_type``.
+
+    Keys are the UTF-8 bytes, or code points for a wider ``key_type`` when
+    probing ``U`` records. Nulls are left out of the table; with a ``None``
+    ``na_object`` the first one's index is kept so null probes can match it.
+    """
+    n_values = values.size
+    ids = np.empty(n_values, 'int64')
+    offsets = np.zeros(n_values + 1, 'int64')
+    null_id = -1
+    if n_values == 0:
+        return np.empty(0, key_type), offsets, ids, null_id
+    allocator = stringdtype_acquire_allocator(values)
+    data = stringdtype_data_ptr(values)
+    step = _stringdtype_step(values)
+    total = 0
+    for i in range(n_values):
+        total += stringdtype_span(data, i * step, allocator, na_kind,
+                                  na_name)[0].size
+    keys = np.empty(total, key_type)
+    decode = keys.itemsize > 1
+    n_keys = 0
+    for i in range(n_values):
+        chunk, status = stringdtype_span(data, i * step, allocator, na_kind,
+                                         na_name)
+        if status != 0:
+            if null_id < 0 and status == 1 and na_kind == _NA_NONE:
+                null_id = i
+            continue
+        start = offsets[n_keys]
+        if decode:
+            offsets[n_keys + 1] = _decode_utf8(chunk, keys, start)
+        else:
+            keys[start:start + chunk.size] = chunk
+            offsets[n_keys + 1] = start + chunk.size
+        ids[n_keys] = i
+        n_keys += 1
+    stringdtype_release_allocator(allocator)
+    return keys, offsets[:n_keys + 1], ids[:n_keys], null_id
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+# Row kernels take the table's arrays as separate arguments: the parallel
+# drivers cannot hand nested tuples of arrays to their threads.
+
+
+@register_jitable(**JIT_OPTIONS)
+def isin_kernel(chr_array, len_chr, size_chr, slots, hashes, keys, offsets,
+                ids, out=None):
+    table = (slots, hashes, keys, offsets, ids)
+    found = bool_result(out, len_chr)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        length = _record_last_nonzero(chr_array, stride, size_chr) - stride + 1
+        found[i] = probe_table(table, chr_array, stride, length) >= 0
+        stride += chr_pitch
+    return found
+
+
+@register_jitable(**JIT_OPTIONS)
+def lookup_kernel(chr_array, len_chr, size_chr, slots, hashes, keys, offsets,
+                  ids, out=None):
+    table = (slots, hashes, keys, offsets, ids)
+    found = int_result(out, len_chr)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        length = _record_last_nonzero(chr_array, stride, size_chr) - stride + 1
+        found[i] = probe_table(table, chr_array, stride, length)
+        stride += chr_pitch
+    return found
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_probe(data, index, allocator, na_kind, na_name, table):
+    chunk, status = stringdtype_span(data, index, allocator, na_kind, na_name)
+    if status == 0:
+        return probe_table(table, chunk, 0, chunk.size)
+    if status == 1 and na_kind == _NA_NONE:
+        return table[5]
+    return -1
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _register_table(values, candidates):
+    """Return a function building the hash table over ``candidates``.
+
+    Keys are stored in the code units ``values`` are probed with: bytes for
+    ``S`` and StringDType values, code points for ``U`` values.
+    """
+    if not _compatible_stringdtype_na(values, candidates):
+        raise NumbaTypeError('values and candidates must share a StringDType '
+                             'na_object')
+    values_string = is_stringdtype_array_type(values)
+    if is_stringdtype_array_type(candidates):
+        if candidates.ndim != 1:
+            raise NumbaTypeError('StringDType candidates must be a '
+                                 'one-dimensional array')
+        key_type = np.uint8
+        if not values_string:
+            if _register_single(values)[2]:
+                raise NumbaTypeError('values and candidates must both be '
+                                     'bytes or both be str')
+            key_type = np.uint32
+        na_kind = candidates.dtype.na_kind
+
+        @register_jitable(**OVERLOAD_JIT_OPTIONS)
+        def build(candidates):
+            na_name = stringdtype_na_name(candidates)
+            return build_table(*stringdtype_keys(candidates, na_kind,
+                                                 na_name, key_type))
+        return build
+
+    register_candidates, _, candidates_bytes = _register_single(candidates)
+    if values_string:
+        if candidates_bytes:
+            raise NumbaTypeError('values and candidates must both be bytes '
+                                 'or both be str')
+
+        @register_jitable(**OVERLOAD_JIT_OPTIONS)
+        def build(candidates):
+            return build_table(*record_utf8_keys(
+                *register_candidates(candidates, False)))
+        return build
+
+    _, _, values_bytes = _register_single(values)
+    if values_bytes != candidates_bytes:
+        raise NumbaTypeError('values and candidates must both be bytes '
+                             'or both be str')
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def build(candidates):
+        return build_table(*record_keys(
+            *register_candidates(candidates, False)))
+    return build
+
+
+def _stringdtype_values(values):
+    if values.ndim != 1:
+        raise NumbaTypeError('StringDType values must be a one-dimensional '
+                             'array')
+    return values.dtype.na_kind
+
+
+@overload(isin, **OPTIONS)
+def ov_isin(values, candidates, out=None):
+    build = _register_table(values, candidates)
+    _ensure_out(out, types.boolean, values)
+
+    if is_stringdtype_array_type(values):
+        na_kind = _stringdtype_values(values)
+
+        def impl(values, candidates, out=None):
+            table = build(candidates)
+            found = bool_result(out, values.size)
+            if values.size == 0:
+                return found
+            allocator = stringdtype_acquire_allocator(values)
+            data = stringdtype_data_ptr(values)
+            step = _stringdtype_step(values)
+            na_name = stringdtype_na_name(values)
+            for i in range(values.size):
+                found[i] = stringdtype_probe(data, i * step, allocator,
+                                             na_kind, na_name, table) >= 0
+            stringdtype_release_allocator(allocator)
+            return found
+        return impl
+
+    register_values, values_dim, _ = _register_single(values)
+    isin_rows = _row_kernel(isin_kernel)
+
+    if values_dim > 0:
+        def impl(values, candidates, out=None):
+            return isin_rows(*register_values(values, False),
+                             *build(candidates)[:5], out)
+    else:
+        def impl(values, candidates, out=None):
+            return isin_rows(*register_values(values, False),
+                             *build(candidates)[:5], None)[0]
+    return impl
+
+
+@overload(lookup, **OPTIONS)
+def ov_lookup(values, vocabulary, out=None):
+    build = _register_table(values, vocabulary)
+    _ensure_out(out, types.int64, values)
+
+    if is_stringdtype_array_type(values):
+        na_kind = _stringdtype_values(values)
+
+        def impl(values, vocabulary, out=None):
+            table = build(vocabulary)
+            found = int_result(out, values.size)
+            if values.size == 0:
+                return found
+            allocator = stringdtype_acquire_allocator(values)
+            data = stringdtype_data_ptr(values)
+            step = _stringdtype_step(values)
+            na_name = stringdtype_na_name(values)
+            for i in range(values.size):
+                found[i] = stringdtype_probe(data, i * step, allocator,
+                                             na_kind, na_name, table)
+            stringdtype_release_allocator(allocator)
+            return found
+        return impl
+
+    register_values, values_dim, _ = _register_single(values)
+    lookup_rows = _row_kernel(lookup_kernel)
+
+    if values_dim > 0:
+        def impl(values, vocabulary, out=None):
+            return lookup_rows(*register_values(values, False),
+                               *build(vocabulary)[:5], out)
+    else:
+        def impl(values, vocabulary, out=None):
+            return lookup_rows(*register_values(values, False),
+                               *build(vocabulary)[:5], None)[0]
+    return impl
+
+
+@njit(nogil=True)
+def _isin(values, candidates, out):
+    return isin(values, candidates, out)
+
+
+@njit(nogil=True)
+def _lookup(values, vocabulary, out):
+    return lookup(values, vocabulary, out)
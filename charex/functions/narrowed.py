@@ -0,0 +1,131 @@
+"""
+Narrow code unit copies of fixed-width unicode arrays
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.numpy.overloads._shared import (
+    NarrowedStrings, register_single as _register_single,
+)
+from charex.numpy.overloads.definitions import record_layout
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import njit
+import numpy as np
+
+
+# Code units a column can be narrowed to, with the first code point each
+# cannot hold. The largest value of the narrow widths is never stored, so
+# operands can map wider code points onto it without creating a match.
+NARROW_LIMITS = {types.uint8: 0xff, types.uint16: 0xffff,
+                 types.uint32: 1 << 32}
+
+
+def narrowed(values, dtype=None):
+    """Return a 1-D ``U`` array paired with a narrow copy of its code units.
+
+    The result is a ``NarrowedStrings`` that ``np.char`` and ``np.strings``
+    operations accept in place of ``values``. Code points are stored as
+    ``uint8`` or ``uint16`` when they all fit, like CPython's compact
+    strings, so comparisons and searches against scalars or columns of the
+    same width scan two to four times fewer bytes. ``dtype`` defaults to the
+    narrowest width that fits and is required in nopython mode; ``uint8``
+    holds up to U+00FE and ``uint16`` up to U+FFFE. The copy must be
+    rebuilt if ``values`` changes.
+    """
+    if dtype is None:
+        top = _code_point_max(values)
+        dtype = np.uint8 if top < 0xff else np.uint16 if top < 0xffff \
+            else np.uint32
+    return _narrowed(values, np.dtype(dtype).type)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+@register_jitable(**JIT_OPTIONS)
+def max_code_point(chr_array, len_chr, size_chr):
+    """Return the largest code unit of ordinal records, read as unsigned."""
+    records, stride, pitch = record_layout(chr_array, size_chr)
+    top = np.uint32(0)
+    for i in range(len_chr):
+        for c in range(stride, stride + size_chr):
+            top = max(top, np.uint32(records[c]))
+        stride += pitch
+    return top
+
+
+@register_jitable(**JIT_OPTIONS)
+def narrow_records(chr_array, len_chr, size_chr, units, limit):
+    """Copy ordinal records into the rows of ``units``."""
+    records, stride, pitch = record_layout(chr_array, size_chr)
+    top = np.uint32(0)
+    for i in range(len_chr):
+        for c in range(size_chr):
+            code = np.uint32(records[stride + c])
+            top = max(top, code)
+            units[i, c] = code
+        stride += pitch
+    if top >= limit:
+        raise ValueError('code points do not fit in the narrowed dtype')
+    return units
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _ensure_unicode_array(values):
+    if not isinstance(values, types.Array) or values.ndim != 1 \
+            or not isinstance(values.dtype, types.UnicodeCharSeq):
+        raise NumbaTypeError('narrowed expects a one-dimensional unicode '
+                             'string array')
+
+
+def code_point_max(values):
+    """Return the largest code point of a 1-D ``U`` array."""
+
+
+@overload(code_point_max, **OPTIONS)
+def ov_code_point_max(values):
+    _ensure_unicode_array(values)
+    register_values, _, _ = _register_single(values)
+
+    def impl(values):
+        return max_code_point(*register_values(values, False))
+    return impl
+
+
+@overload(narrowed, **OPTIONS)
+def ov_narrowed(values, dtype=None):
+    _ensure_unicode_array(values)
+    if isinstance(dtype, types.NumberClass):
+        unit = dtype.instance_type
+    elif isinstance(dtype, types.DType):
+        unit = dtype.dtype
+    elif dtype is None or isinstance(dtype, (types.NoneType, types.Omitted)):
+        raise NumbaTypeError('narrowed needs a dtype in nopython mode')
+    else:
+        unit = None
+    if unit not in NARROW_LIMITS:
+        raise NumbaTypeError('narrowed dtype must be uint8, uint16 or uint32')
+    limit = NARROW_LIMITS[unit]
+    register_values, _, _ = _register_single(values)
+
+    def impl(values, dtype=None):
+        chr_array, len_chr, size_chr = register_values(values, False)
+        units = np.empty((len_chr, size_chr), dtype)
+        return NarrowedStrings(values, narrow_records(
+            chr_array, len_chr, size_chr, units, limit))
+    return impl
+
+
+@njit(nogil=True)
+def _code_point_max(values):
+    return code_point_max(values)
+
+
+@njit(nogil=True)
+def _narrowed(values, dtype):
+    return narrowed(values, dtype)
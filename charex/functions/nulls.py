@@ -0,0 +1,125 @@
+"""
+Null masks of StringDType arrays from the packet flags
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.numpy.overloads._shared import MaskedStrings
+from charex.numpy.overloads.strings import _stringdtype_step
+from charex.numpy.stringdtype import (
+    is_stringdtype_array_type, stringdtype_data_ptr, stringdtype_isnull_data,
+)
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import literally, njit
+import numpy as np
+
+
+def isnull(values, packed=False):
+    """Return which strings of a 1-D StringDType array are null.
+
+    Only the flags byte of each 16-byte packet is read, so no string is
+    loaded and the allocator is never locked. The result is a ``bool`` array,
+    or with ``packed=True`` the same mask bit-packed into ``uint8`` as by
+    ``np.packbits(mask, bitorder='little')``. In nopython mode ``packed`` is
+    compiled as a constant, since it determines the result dtype.
+    """
+    return _isnull(values, bool(packed))
+
+
+def masked(values):
+    """Return ``values`` with the bitmap of its non-null strings.
+
+    The result is a ``MaskedStrings`` whose ``valid`` bitmap is built in the
+    same flag-only pass as ``isnull(values, packed=True)``. In nopython mode
+    ``np.strings`` comparisons, searches, predicates and ``str_len`` accept
+    it: they load only the valid strings, without resolving the null value
+    per row, and return ``(result, valid)``.
+    """
+    return MaskedStrings(values, _valid_bits(values))
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_nulls(values):
+    """Return the null mask of a StringDType array as booleans."""
+    data = stringdtype_data_ptr(values)
+    step = _stringdtype_step(values)
+    result = np.empty(values.size, np.bool_)
+    for i in range(values.size):
+        result[i] = stringdtype_isnull_data(data, i * step)
+    return result
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_null_bits(values, valid):
+    """Return the null bitmap of a StringDType array, or its complement.
+
+    Eight packets fill each byte, lowest bit first; bits past the last
+    packet stay clear.
+    """
+    n_values = values.size
+    data = stringdtype_data_ptr(values)
+    step = _stringdtype_step(values)
+    result = np.zeros((n_values + 7) // 8, np.uint8)
+    for block in range(0, n_values, 8):
+        bits = 0
+        for k in range(min(8, n_values - block)):
+            if stringdtype_isnull_data(data, (block + k) * step) != valid:
+                bits |= 1 << k
+        result[block // 8] = bits
+    return result
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _ensure_stringdtype(values, name):
+    if not is_stringdtype_array_type(values) or values.ndim != 1:
+        raise NumbaTypeError(f'{name} expects a one-dimensional StringDType '
+                             'array')
+
+
+@overload(isnull, **OPTIONS)
+def ov_isnull(values, packed=False):
+    _ensure_stringdtype(values, 'isnull')
+    if isinstance(packed, (types.Omitted, bool)):
+        as_bits = bool(getattr(packed, 'value', packed))
+    elif not isinstance(packed, types.Boolean):
+        raise NumbaTypeError('isnull packed must be a boolean')
+    elif not isinstance(packed, types.BooleanLiteral):
+        return lambda values, packed=False: literally(packed)
+    else:
+        as_bits = packed.literal_value
+
+    if as_bits:
+        def impl(values, packed=False):
+            return stringdtype_null_bits(values, False)
+        return impl
+
+    def impl(values, packed=False):
+        return stringdtype_nulls(values)
+    return impl
+
+
+@overload(masked, **OPTIONS)
+def ov_masked(values):
+    _ensure_stringdtype(values, 'masked')
+
+    def impl(values):
+        return MaskedStrings(values, stringdtype_null_bits(values, True))
+    return impl
+
+
+@njit(nogil=True)
+def _isnull(values, packed):
+    return isnull(values, packed)
+
+
+@njit(nogil=True)
+def _valid_bits(values):
+    return masked(values).valid
@@ -0,0 +1,317 @@
+"""
+Multi-pattern search over fixed-width string arrays
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.numpy.overloads._shared import (
+    ensure_out as _ensure_out,
+    register_single as _register_single,
+)
+from charex.numpy.overloads.definitions import (
+    _record_last_nonzero, int_result, record_layout,
+)
+from charex.numpy.overloads.parallel import row_kernel as _row_kernel
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import njit
+import numpy as np
+
+
+def find_any(values, patterns, out=None):
+    """Return the id of the first pattern found in each string, or -1.
+
+    Rows are scanned left to right; the reported pattern is the one whose
+    match ends first, preferring the lowest pattern id on ties. Results
+    are written to ``out`` when it is given.
+    """
+    return _find_any(values, patterns, out)
+
+
+def count_any(values, patterns, out=None):
+    """Return the number of (overlapping) pattern matches in each string."""
+    return _count_any(values, patterns, out)
+
+
+def contains_any(values, patterns):
+    """Return a rows x patterns boolean matrix of pattern hits."""
+    return _contains_any(values, patterns)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Automaton
+
+
+@register_jitable(**JIT_OPTIONS)
+def _unit_class(unit, low, alphabet):
+    """Map a code unit to its automaton input class (0 for unused units)."""
+    if unit < 256:
+        return low[unit]
+    j = np.searchsorted(alphabet, unit)
+    if j < alphabet.size and alphabet[j] == unit:
+        return j + 1
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _pattern_alphabet(pat_array, stride, pat_pitch, len_pat, pat_lens):
+    units = np.empty(pat_lens.sum(), 'int64')
+    k = 0
+    for i in range(len_pat):
+        for p in range(pat_lens[i]):
+            units[k] = pat_array[stride + p]
+            k += 1
+        stride += pat_pitch
+    alphabet = np.unique(units)
+    low = np.zeros(256, 'int64')
+    for j in range(alphabet.size):
+        if alphabet[j] < 256:
+            low[alphabet[j]] = j + 1
+    return low, alphabet
+
+
+@register_jitable(**JIT_OPTIONS)
+def build_automaton(pat_array, len_pat, size_pat):
+    """Build an Aho-Corasick automaton over ordinal pattern records.
+
+    The goto function is completed into a dense DFA over the classes of
+    code units used by the patterns, so scanning costs one table lookup
+    per code unit. Pattern ids sharing a node are chained in ascending
+    order through ``pat_next``.
+    """
+    pat_array, pat_start, pat_pitch = record_layout(pat_array, size_pat)
+    pat_lens = np.empty(len_pat, 'int64')
+    stride = pat_start
+    for i in range(len_pat):
+        pat_lens[i] = _record_last_nonzero(pat_array, stride, size_pat) \
+            - stride + 1
+        stride += pat_pitch
+    low, alphabet = _pattern_alphabet(pat_array, pat_start, pat_pitch,
+                                      len_pat, pat_lens)
+
+    n_class = alphabet.size + 1
+    delta = np.zeros((pat_lens.sum() + 1, n_class), 'int32')
+    node_head = -np.ones(delta.shape[0], 'int64')
+    pat_next = -np.ones(len_pat, 'int64')
+    n_nodes = 1
+    for pid in range(len_pat - 1, -1, -1):
+        v = 0
+        stride = pat_start + pid * pat_pitch
+        for p in range(pat_lens[pid]):
+            c = _unit_class(pat_array[stride + p], low, alphabet)
+            if not delta[v, c]:
+                delta[v, c] = n_nodes
+                n_nodes += 1
+            v = delta[v, c]
+        pat_next[pid] = node_head[v]
+        node_head[v] = pid
+
+    fail = np.zeros(n_nodes, 'int32')
+    queue = np.empty(n_nodes, 'int32')
+    head = tail = 0
+    for c in range(n_class):
+        if delta[0, c]:
+            queue[tail] = delta[0, c]
+            tail += 1
+    while head < tail:
+        v = queue[head]
+        head += 1
+        f = fail[v]
+        for c in range(n_class):
+            u = delta[v, c]
+            if u:
+                fail[u] = delta[f, c]
+                queue[tail] = u
+                tail += 1
+            else:
+                delta[v, c] = delta[f, c]
+
+    out_first = np.empty(n_nodes, 'int64')
+    out_count = np.empty(n_nodes, 'int64')
+    dict_link = np.empty(n_nodes, 'int64')
+    out_first[0] = node_head[0]
+    out_count[0] = 0
+    pid = node_head[0]
+    while pid >= 0:
+        out_count[0] += 1
+        pid = pat_next[pid]
+    dict_link[0] = -1
+    for j in range(tail):
+        v = queue[j]
+        f = fail[v]
+        own = node_head[v]
+        out_count[v] = out_count[f]
+        pid = own
+        while pid >= 0:
+            out_count[v] += 1
+            pid = pat_next[pid]
+        inherited = out_first[f]
+        if own >= 0 and (inherited < 0 or own < inherited):
+            out_first[v] = own
+        else:
+            out_first[v] = inherited
+        dict_link[v] = f if node_head[f] >= 0 else dict_link[f]
+    return (delta[:n_nodes], low, alphabet, out_first, out_count,
+            dict_link, node_head, pat_next)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+# Row kernels take the automaton's arrays as separate arguments: the
+# parallel drivers cannot hand nested tuples of arrays to their threads.
+
+
+@register_jitable(**JIT_OPTIONS)
+def find_any_kernel(chr_array, len_chr, size_chr, delta, low, alphabet,
+                    out_first, out=None):
+    find_pat = int_result(out, len_chr)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        found = out_first[0]
+        state = 0
+        end = _record_last_nonzero(chr_array, stride, size_chr) + 1
+        p = stride
+        while found < 0 and p < end:
+            state = delta[state, _unit_class(chr_array[p], low, alphabet)]
+            found = out_first[state]
+            p += 1
+        find_pat[i] = found
+        stride += chr_pitch
+    return find_pat
+
+
+@register_jitable(**JIT_OPTIONS)
+def count_any_kernel(chr_array, len_chr, size_chr, delta, low, alphabet,
+                     out_count, out=None):
+    count_pat = int_result(out, len_chr)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        total = out_count[0]
+        state = 0
+        end = _record_last_nonzero(chr_array, stride, size_chr) + 1
+        for p in range(stride, end):
+            state = delta[state, _unit_class(chr_array[p], low, alphabet)]
+            total += out_count[state]
+        count_pat[i] = total
+        stride += chr_pitch
+    return count_pat
+
+
+@register_jitable(**JIT_OPTIONS)
+def _mark_outputs(hits, i, state, dict_link, node_head, pat_next):
+    node = state if node_head[state] >= 0 else dict_link[state]
+    while node >= 0:
+        pid = node_head[node]
+        while pid >= 0:
+            hits[i, pid] = True
+            pid = pat_next[pid]
+        node = dict_link[node]
+
+
+@register_jitable(**JIT_OPTIONS)
+def contains_any_kernel(chr_array, len_chr, size_chr, len_pat, automaton):
+    delta, low, alphabet, _, out_count, dict_link, node_head, pat_next = \
+        automaton
+    hits = np.zeros((len_chr, len_pat), 'bool')
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        state = 0
+        if out_count[0]:
+            _mark_outputs(hits, i, 0, dict_link, node_head, pat_next)
+        end = _record_last_nonzero(chr_array, stride, size_chr) + 1
+        for p in range(stride, end):
+            state = delta[state, _unit_class(chr_array[p], low, alphabet)]
+            if out_count[state]:
+                _mark_outputs(hits, i, state, dict_link, node_head, pat_next)
+        stride += chr_pitch
+    return hits
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _register_patterns(values, patterns):
+    register_values, values_dim, values_bytes = _register_single(values)
+    register_patterns, _, patterns_bytes = _register_single(patterns)
+    if values_bytes != patterns_bytes:
+        raise NumbaTypeError('values and patterns must both be bytes '
+                             'or both be str')
+    return register_values, register_patterns, values_dim
+
+
+@overload(find_any, **OPTIONS)
+def ov_find_any(values, patterns, out=None):
+    register_values, register_patterns, values_dim = \
+        _register_patterns(values, patterns)
+    _ensure_out(out, types.int64, values)
+    find_rows = _row_kernel(find_any_kernel)
+
+    if values_dim > 0:
+        def impl(values, patterns, out=None):
+            automaton = build_automaton(*register_patterns(patterns, False))
+            return find_rows(*register_values(values, False),
+                             *automaton[:4], out)
+    else:
+        def impl(values, patterns, out=None):
+            automaton = build_automaton(*register_patterns(patterns, False))
+            return find_rows(*register_values(values, False),
+                             *automaton[:4], None)[0]
+    return impl
+
+
+@overload(count_any, **OPTIONS)
+def ov_count_any(values, patterns, out=None):
+    register_values, register_patterns, values_dim = \
+        _register_patterns(values, patterns)
+    _ensure_out(out, types.int64, values)
+    count_rows = _row_kernel(count_any_kernel)
+
+    if values_dim > 0:
+        def impl(values, patterns, out=None):
+            automaton = build_automaton(*register_patterns(patterns, False))
+            return count_rows(*register_values(values, False),
+                              *automaton[:3], automaton[4], out)
+    else:
+        def impl(values, patterns, out=None):
+            automaton = build_automaton(*register_patterns(patterns, False))
+            return count_rows(*register_values(values, False),
+                              *automaton[:3], automaton[4], None)[0]
+    return impl
+
+
+@overload(contains_any, **OPTIONS)
+def ov_contains_any(values, patterns):
+    register_values, register_patterns, values_dim = \
+        _register_patterns(values, patterns)
+
+    if values_dim > 0:
+        def impl(values, patterns):
+            pat_array, len_pat, size_pat = register_patterns(patterns, False)
+            automaton = build_automaton(pat_array, len_pat, size_pat)
+            return contains_any_kernel(*register_values(values, False),
+                                       len_pat, automaton)
+    else:
+        def impl(values, patterns):
+            pat_array, len_pat, size_pat = register_patterns(patterns, False)
+            automaton = build_automaton(pat_array, len_pat, size_pat)
+            return contains_any_kernel(*register_values(values, False),
+                                       len_pat, automaton)[0]
+    return impl
+
+
+@njit(nogil=True)
+def _find_any(values, patterns, out):
+    return find_any(values, patterns, out)
+
+
+@njit(nogil=True)
+def _count_any(values, patterns, out):
+    return count_any(values, patterns, out)
+
+
+@njit(nogil=True)
+def _contains_any(values, patterns):
+    return contains_any(values, patterns)
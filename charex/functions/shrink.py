@@ -0,0 +1,132 @@
+"""
+Longest string lengths and width-shrinking copies
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.numpy.overloads._shared import register_single as _register_single
+from charex.numpy.overloads.definitions import (
+    _record_last_nonzero, record_layout,
+)
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import literally, njit
+import numpy as np
+
+
+def max_len(values):
+    """Return the length of the longest string in a 1-D ``S``/``U`` array.
+
+    Equal to ``np.char.str_len(values).max(initial=0)``, but each record is
+    only scanned past the longest length found so far, and the scan stops
+    once a record fills the full width.
+    """
+    return _max_len(values)
+
+
+def shrink(values, width=None):
+    """Return a contiguous copy of a 1-D ``S``/``U`` array at a new width.
+
+    Equal to ``values.astype(f'{values.dtype.kind}{width}')``: longer strings
+    are truncated and shorter ones padded with NULs. ``width`` defaults to
+    ``max(max_len(values), 1)``, the narrowest width that keeps every
+    string. In nopython mode ``width`` must be given and is compiled as a
+    constant, since it determines the result dtype.
+    """
+    if width is None:
+        width = max(int(_max_len(values)), 1)
+    elif width < 1:
+        raise ValueError('shrink width must be positive')
+    return _shrink(values, width)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+@register_jitable(**JIT_OPTIONS)
+def max_len_records(chr_array, len_chr, size_chr):
+    """Return the longest length of ordinal records.
+
+    Only the units past the longest length so far can lengthen it, so each
+    record's trailing NULs are scanned from that offset on.
+    """
+    records, stride, pitch = record_layout(chr_array, size_chr)
+    longest = 0
+    for i in range(len_chr):
+        if longest == size_chr:
+            break
+        last = _record_last_nonzero(records, stride + longest,
+                                    size_chr - longest)
+        longest = max(longest, last - stride + 1)
+        stride += pitch
+    return longest
+
+
+@register_jitable(**JIT_OPTIONS)
+def shrink_records(chr_array, len_chr, size_chr, units, width):
+    """Copy ordinal records into rows of ``width`` code units."""
+    records, stride, pitch = record_layout(chr_array, size_chr)
+    kept = min(width, size_chr)
+    row = 0
+    for i in range(len_chr):
+        for c in range(kept):
+            units[row + c] = records[stride + c]
+        for c in range(kept, width):
+            units[row + c] = 0
+        row += width
+        stride += pitch
+    return units
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _ensure_array(values, name):
+    if not isinstance(values, types.Array) or values.ndim != 1:
+        raise NumbaTypeError(f'{name} expects a one-dimensional fixed-width '
+                             'string array')
+    return _register_single(values)
+
+
+@overload(max_len, **OPTIONS)
+def ov_max_len(values):
+    register_values, _, _ = _ensure_array(values, 'max_len')
+
+    def impl(values):
+        return max_len_records(*register_values(values, False))
+    return impl
+
+
+@overload(shrink, **OPTIONS)
+def ov_shrink(values, width=None):
+    register_values, _, as_bytes = _ensure_array(values, 'shrink')
+    if width is None or isinstance(width, (types.NoneType, types.Omitted)):
+        raise NumbaTypeError('shrink needs a width in nopython mode')
+    if not isinstance(width, types.Integer):
+        raise NumbaTypeError('shrink width must be an integer')
+    if not isinstance(width, types.IntegerLiteral):
+        return lambda values, width=None: literally(width)
+    if width.literal_value < 1:
+        raise NumbaTypeError('shrink width must be positive')
+    dtype = np.dtype(f'{"S" if as_bytes else "U"}{width.literal_value}')
+    unit = np.uint8 if as_bytes else np.int32
+
+    def impl(values, width=None):
+        chr_array, len_chr, size_chr = register_values(values, False)
+        result = np.empty(len_chr, dtype)
+        shrink_records(chr_array, len_chr, size_chr, result.view(unit),
+                       width)
+        return result
+    return impl
+
+
+@njit(nogil=True)
+def _max_len(values):
+    return max_len(values)
+
+
+@njit(nogil=True)
+def _shrink(values, width):
+    return shrink(values, width)
@@ -0,0 +1,431 @@
+"""
+Sorting and binary search over fixed-width string arrays
+"""
+
+from charex.core import JIT_OPTIONS, OPTIONS, OVERLOAD_JIT_OPTIONS
+from charex.numpy.overloads._shared import (
+    ensure_out as _ensure_out,
+    register_pair as _register_pair,
+    register_single as _register_single,
+)
+from charex.numpy.overloads.definitions import (
+    _comparison_record_len, _compare_records_trimmed, int_result,
+    record_layout,
+)
+from numba.core import types
+from numba.core.errors import NumbaTypeError
+from numba.extending import overload, register_jitable
+from numba import njit
+import numpy as np
+
+
+def argsort(values, rstrip=False):
+    """Return the indices that stably sort a fixed-width string array.
+
+    Strings order by code unit like ``np.argsort(values, kind='stable')``.
+    With ``rstrip`` trailing whitespace is ignored, matching the
+    ``np.char`` comparison operators.
+    """
+    return _argsort(values, rstrip)
+
+
+def sort(values, rstrip=False):
+    """Return a stably sorted copy of a fixed-width string array."""
+    return _sort(values, rstrip)
+
+
+def searchsorted(sorted_values, probes, side='left', sorter=None, out=None):
+    """Return where ``probes`` insert into a sorted fixed-width string array.
+
+    Matches ``np.searchsorted``: ``sorted_values`` is ascending in code unit
+    order, or ordered by the indices in ``sorter`` (such as those from
+    ``charex.argsort``). Results are written to ``out`` when it is given.
+    """
+    return _searchsorted(sorted_values, probes, side, sorter, out)
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Kernels
+
+
+# Buckets this small are finished by insertion sort; a counting pass over
+# 257 buckets does not pay for itself below a few dozen records.
+RADIX_INSERTION_MAX = 32
+
+
+@register_jitable(**JIT_OPTIONS)
+def _unit_digits(chr_array, start, pitch, lens, len_chr):
+    """Number of radix bytes needed to cover every code unit in use.
+
+    Byte records take one pass per unit; UTF-32 records take one, two or
+    three depending on the widest code point, so ASCII text sorts in as
+    many passes as bytes would.
+    """
+    if chr_array.itemsize == 1:
+        return 1
+    top = 0
+    stride = start
+    for i in range(len_chr):
+        for p in range(stride, stride + lens[i]):
+            top |= chr_array[p]
+        stride += pitch
+    if top < 256:
+        return 1
+    if top < 65536:
+        return 2
+    return 3
+
+
+@register_jitable(**JIT_OPTIONS)
+def _radix_bucket(chr_array, offset, length, depth, unit_digits):
+    """Radix bucket of a record at ``depth``; 0 once the record has ended."""
+    unit = depth // unit_digits
+    if unit >= length:
+        return 0
+    shift = (unit_digits - 1 - depth % unit_digits) * 8
+    return ((chr_array[offset + unit] >> shift) & 255) + 1
+
+
+@register_jitable(**JIT_OPTIONS)
+def _insertion_sort(order, lo, hi, chr_array, start, pitch, size_chr,
+                    unit, rstrip):
+    """Stable insertion sort of records sharing their first ``unit`` units."""
+    size = size_chr - unit
+    for k in range(lo + 1, hi):
+        i = order[k]
+        offset = start + i * pitch + unit
+        j = k - 1
+        while j >= lo and _compare_records_trimmed(
+                chr_array, start + order[j] * pitch + unit, size,
+                chr_array, offset, size, rstrip) > 0:
+            order[j + 1] = order[j]
+            j -= 1
+        order[j + 1] = i
+
+
+@register_jitable(**JIT_OPTIONS)
+def radix_argsort(chr_array, len_chr, size_chr, rstrip):
+    """Stable MSD radix argsort of ordinal records.
+
+    Each pass distributes a range of the order into 257 buckets by one
+    byte of the records' code units, bucket 0 holding records that have
+    already ended; those are final, the rest are pushed one byte deeper.
+    A range that falls into a single bucket moves on without being copied.
+    """
+    chr_array, start, pitch = record_layout(chr_array, size_chr)
+    lens = np.empty(len_chr, 'int64')
+    stride = start
+    for i in range(len_chr):
+        lens[i] = _comparison_record_len(chr_array, stride, size_chr, rstrip)
+        stride += pitch
+    unit_digits = _unit_digits(chr_array, start, pitch, lens, len_chr)
+    max_depth = size_chr * unit_digits
+
+    order = np.arange(len_chr)
+    scratch = np.empty(len_chr, 'int64')
+    buckets = np.empty(len_chr, 'int16')
+    counts = np.empty(258, 'int64')
+    stack = [(0, len_chr, 0)]
+    while len(stack):
+        lo, hi, depth = stack.pop()
+        if hi - lo <= RADIX_INSERTION_MAX:
+            _insertion_sort(order, lo, hi, chr_array, start, pitch, size_chr,
+                            depth // unit_digits, rstrip)
+            continue
+        if depth >= max_depth:
+            continue
+        counts[:] = 0
+        for k in range(lo, hi):
+            i = order[k]
+            b = _radix_bucket(chr_array, start + i * pitch, lens[i],
+                              depth, unit_digits)
+            buckets[k] = b
+            counts[b + 1] += 1
+        full = -1
+        for b in range(257):
+            if counts[b + 1] == hi - lo:
+                full = b
+                break
+        if full >= 0:
+            if full:
+                stack.append((lo, hi, depth + 1))
+            continue
+        for b in range(257):
+            counts[b + 1] += counts[b]
+        for k in range(lo, hi):
+            b = buckets[k]
+            scratch[lo + counts[b]] = order[k]
+            counts[b] += 1
+        order[lo:hi] = scratch[lo:hi]
+        for b in range(1, 257):
+            if counts[b] - counts[b - 1] > 1:
+                stack.append((lo + counts[b - 1], lo + counts[b], depth + 1))
+    return order
+
+
+# Prefix keys pack up to seven code units after the prefix every sorted
+# record shares into one int64, so most binary search steps compare
+# integers. Records with equal keys are told apart by a full comparison.
+PREFIX_UNITS = 7
+
+# Prefix keys cost one pass over the sorted records; probe batches smaller
+# than this fraction of the table search the records directly.
+PREFIX_MIN_PROBE_RATIO = 8
+
+
+def sorted_position(sorter, i):
+    """Return the record at sorted position ``i``: ``sorter[i]``, or ``i``."""
+
+
+@overload(sorted_position, **OPTIONS)
+def ov_sorted_position(sorter, i):
+    if isinstance(sorter, (types.NoneType, types.Omitted)):
+        return lambda sorter, i: i
+    return lambda sorter, i: sorter[i]
+
+
+def check_sorter(sorter, len_chr):
+    """Ensure an optional sorter holds one index per sorted record."""
+
+
+@overload(check_sorter, **OPTIONS)
+def ov_check_sorter(sorter, len_chr):
+    if isinstance(sorter, (types.NoneType, types.Omitted)):
+        return lambda sorter, len_chr: None
+
+    def impl(sorter, len_chr):
+        if sorter.size != len_chr:
+            raise ValueError('sorter.size must equal a.size')
+    return impl
+
+
+@register_jitable(**JIT_OPTIONS)
+def _prefix_bits(chr_array, start, pitch, len_chr, size_chr, sorter, shared):
+    """Bits per code unit for prefix keys, from the widest unit they cover.
+
+    Bytes and Latin-1 text fit seven units per key, other text three.
+    """
+    if chr_array.itemsize == 1:
+        return 8
+    top = 0
+    end = min(size_chr, shared + PREFIX_UNITS)
+    for k in range(len_chr):
+        offset = start + sorted_position(sorter, k) * pitch
+        for p in range(offset + shared, offset + end):
+            top |= chr_array[p]
+    if top < 256:
+        return 8
+    if top < 65536:
+        return 16
+    return 21
+
+
+@register_jitable(**JIT_OPTIONS)
+def _prefix_key(chr_array, start, size_chr, bits):
+    """Pack the leading units of a record, most significant first.
+
+    A unit too wide for ``bits`` saturates the rest of the key, which
+    still orders the record after every key it cannot equal.
+    """
+    width = min(63 // bits, PREFIX_UNITS)
+    top = (1 << bits) - 1
+    key = 0
+    saturated = False
+    for p in range(width):
+        key <<= bits
+        if saturated:
+            key |= top
+        elif p < size_chr:
+            unit = chr_array[start + p]
+            saturated = unit > top
+            key |= min(unit, top)
+    return key
+
+
+@register_jitable(**JIT_OPTIONS)
+def _key_bound(keys, lo, hi, key, right):
+    """First position in keys[lo:hi] above ``key`` (or at it, unless right).
+
+    The halving loop keeps a fixed trip count and selects the next base
+    without a data-dependent branch.
+    """
+    base = lo
+    length = hi - lo
+    if length <= 0:
+        return lo
+    while length > 1:
+        half = length >> 1
+        ahead = keys[base + half] < key or (right and keys[base + half] == key)
+        base += half * ahead
+        length -= half
+    return base + (keys[base] < key or (right and keys[base] == key))
+
+
+@register_jitable(**JIT_OPTIONS)
+def _record_bound(chr_array, start, pitch, size_chr, sorter, lo, hi,
+                  sub_array, sub_start, size_sub, right):
+    """First sorted position in [lo, hi) whose record is above the probe."""
+    base = lo
+    length = hi - lo
+    if length <= 0:
+        return lo
+    while length > 1:
+        half = length >> 1
+        i = sorted_position(sorter, base + half)
+        cmp = _compare_records_trimmed(chr_array, start + i * pitch, size_chr,
+                                       sub_array, sub_start, size_sub, False)
+        base += half * (cmp < 0 or (right and cmp == 0))
+        length -= half
+    i = sorted_position(sorter, base)
+    cmp = _compare_records_trimmed(chr_array, start + i * pitch, size_chr,
+                                   sub_array, sub_start, size_sub, False)
+    return base + (cmp < 0 or (right and cmp == 0))
+
+
+@register_jitable(**JIT_OPTIONS)
+def _shared_prefix(chr_array, first, last, size_chr):
+    """Units shared by the first and last sorted record, hence by all."""
+    p = 0
+    while p < size_chr and chr_array[first + p] == chr_array[last + p]:
+        p += 1
+    return p
+
+
+@register_jitable(**JIT_OPTIONS)
+def _prefix_order(chr_array, first, shared, sub_array, sub_start, size_sub):
+    """Sign of the probe's first ``shared`` units against the shared prefix."""
+    for p in range(shared):
+        sub_ord = sub_array[sub_start + p] if p < size_sub else 0
+        if sub_ord != chr_array[first + p]:
+            return 1 if sub_ord > chr_array[first + p] else -1
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def searchsorted_kernel(chr_array, len_chr, size_chr,
+                        sub_array, len_sub, size_sub, right, sorter,
+                        out=None):
+    """Insertion points of probe records into sorted ordinal records.
+
+    Large probe batches first bound each probe among prefix keys of the
+    sorted records, taken after the prefix every record shares, then
+    finish with full record comparisons inside the (usually tiny) run of
+    records sharing its key. A probe outside the shared prefix lands at
+    either end without a search.
+    """
+    chr_array, start, pitch = record_layout(chr_array, size_chr)
+    sub_array, stride_sub, sub_pitch = record_layout(sub_array, size_sub)
+    found = int_result(out, len_sub)
+    if not len_chr or len_sub * PREFIX_MIN_PROBE_RATIO < len_chr:
+        for j in range(len_sub):
+            found[j] = _record_bound(chr_array, start, pitch, size_chr,
+                                     sorter, 0, len_chr, sub_array,
+                                     stride_sub, size_sub, right)
+            stride_sub += sub_pitch
+        return found
+
+    first = start + sorted_position(sorter, 0) * pitch
+    shared = _shared_prefix(chr_array, first,
+                            start + sorted_position(sorter, len_chr - 1)
+                            * pitch, size_chr)
+    bits = _prefix_bits(chr_array, start, pitch, len_chr, size_chr, sorter,
+                        shared)
+    keys = np.empty(len_chr, 'int64')
+    for k in range(len_chr):
+        keys[k] = _prefix_key(chr_array,
+                              start + sorted_position(sorter, k) * pitch
+                              + shared, size_chr - shared, bits)
+    for j in range(len_sub):
+        order = _prefix_order(chr_array, first, shared,
+                              sub_array, stride_sub, size_sub)
+        if order:
+            found[j] = 0 if order < 0 else len_chr
+        else:
+            key = _prefix_key(sub_array, stride_sub + shared,
+                              size_sub - shared, bits)
+            lo = _key_bound(keys, 0, len_chr, key, False)
+            hi = _key_bound(keys, lo, len_chr, key, True)
+            found[j] = _record_bound(chr_array, start, pitch, size_chr,
+                                     sorter, lo, hi, sub_array, stride_sub,
+                                     size_sub, right)
+        stride_sub += sub_pitch
+    return found
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Overloads
+
+
+def _register_sort(values):
+    if not isinstance(values, types.Array) or values.ndim != 1:
+        raise NumbaTypeError('expected a one-dimensional fixed-width string '
+                             'array')
+    register_values, _, _ = _register_single(values)
+    return register_values
+
+
+@overload(argsort, **OPTIONS)
+def ov_argsort(values, rstrip=False):
+    register_values = _register_sort(values)
+
+    def impl(values, rstrip=False):
+        return radix_argsort(*register_values(values, False), rstrip)
+    return impl
+
+
+@overload(sort, **OPTIONS)
+def ov_sort(values, rstrip=False):
+    register_values = _register_sort(values)
+
+    def impl(values, rstrip=False):
+        return values[radix_argsort(*register_values(values, False), rstrip)]
+    return impl
+
+
+@overload(searchsorted, **OPTIONS)
+def ov_searchsorted(sorted_values, probes, side='left', sorter=None,
+                    out=None):
+    _register_sort(sorted_values)
+    register_values, register_probes, _, probes_dim = \
+        _register_pair(sorted_values, probes, 1)
+    _ensure_out(out, types.int64, probes)
+    if not isinstance(side, (str, types.UnicodeType, types.StringLiteral,
+                             types.Omitted)):
+        raise NumbaTypeError('side must be a str')
+    if sorter is not None and not isinstance(
+            sorter, (types.NoneType, types.Omitted)) and not (
+            isinstance(sorter, types.Array) and sorter.ndim == 1
+            and isinstance(sorter.dtype, types.Integer)):
+        raise NumbaTypeError('sorter must be a 1-D integer array')
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def search(sorted_values, probes, side, sorter, out):
+        if side != 'left' and side != 'right':
+            raise ValueError("side must be 'left' or 'right'")
+        check_sorter(sorter, sorted_values.size)
+        return searchsorted_kernel(*register_values(sorted_values, False),
+                                   *register_probes(probes, False),
+                                   side == 'right', sorter, out)
+
+    if probes_dim > 0:
+        def impl(sorted_values, probes, side='left', sorter=None, out=None):
+            return search(sorted_values, probes, side, sorter, out)
+    else:
+        def impl(sorted_values, probes, side='left', sorter=None, out=None):
+            return search(sorted_values, probes, side, sorter, None)[0]
+    return impl
+
+
+@njit(nogil=True)
+def _argsort(values, rstrip):
+    return argsort(values, rstrip)
+
+
+@njit(nogil=True)
+def _sort(values, rstrip):
+    return sort(values, rstrip)
+
+
+@njit(nogil=True)
+def _searchsorted(sorted_values, probes, side, sorter, out):
+    return searchsorted(sorted_values, probes, side, sorter, out)
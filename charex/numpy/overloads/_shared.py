@@ -1,14 +1,26 @@
 """Shared helpers for NumPy string overload registration."""
 
+from charex.core import JIT_OPTIONS, OPTIONS, OVERLOAD_JIT_OPTIONS
 from charex.core.string_intrinsics import (
     register_array_bytes, register_array_bytes_strided,
     register_scalar_bytes, register_array_strings,
     register_array_strings_strided, register_scalar_strings,
 )
+from charex.numpy.overloads.definitions import (
+    bool_result, int_result, nd_axes, nd_broadcast, nd_flat, nd_result,
+    nd_rows, nd_same_shape, nd_shape, nd_transpose,
+)
+from charex.numpy.overloads.parallel import row_kernel
+from charex.numpy.stringdtype import is_stringdtype_array_type
+from collections import namedtuple
+from functools import wraps
+from inspect import signature
 from numba.core import types
 from numba.core.errors import (
     NumbaError, NumbaNotImplementedError, NumbaTypeError, NumbaValueError,
 )
+from numba.extending import overload, register_jitable
+from numba.np.numpy_support import as_dtype
 import numpy as np
 
 
@@ -31,6 +43,28 @@ def ensure_slice(start, end):
     return 0, np.iinfo(np.int64).max
 
 
+def has_out(out):
+    """Return whether an out argument was given (and is not None)."""
+    return not (out is None or isinstance(out, (types.NoneType,
+                                                types.Omitted)))
+
+
+def ensure_out(out, dtype, *operands):
+    """Ensure an optional out buffer can hold the array result."""
+    if not has_out(out):
+        return
+    operands = [narrowed_type(value) for value in operands]
+    ndim = max([value.ndim for value in operands
+                if isinstance(value, types.Array)], default=0)
+    if not ndim:
+        raise NumbaTypeError('out is only supported for array results')
+    if not isinstance(out, types.Array) or out.ndim != ndim \
+            or not out.mutable:
+        raise NumbaTypeError(f'out must be a writeable {ndim}-D array')
+    if out.dtype != dtype:
+        raise NumbaTypeError(f'out must have dtype {dtype}, not {out.dtype}')
+
+
 def ensure_type(value, exception: NumbaError = None):
     """Ensure argument is a character type with appropriate layout and shape."""
     ndim = -1
@@ -52,6 +86,498 @@ def ensure_type(value, exception: NumbaError = None):
     return value, ndim
 
 
+def _is_string_array(value):
+    return isinstance(value, types.Array) \
+        and (is_stringdtype_array_type(value)
+             or isinstance(value.dtype, (types.CharSeq,
+                                         types.UnicodeCharSeq)))
+
+
+def _nd_layout(operands, out):
+    """Return the layout to iterate N-D string operands in, or None.
+
+    ``'C'`` and ``'F'`` mean every N-D array (``out`` included) shares that
+    contiguous layout, so same-shape operands run as one flat call; ``'A'``
+    means rows are walked one at a time. None means the operation is not
+    an N-D string operation.
+    """
+    if any(is_narrowed(value) for value in operands):
+        return None
+    arrays = [value for value in operands
+              if isinstance(value, types.Array) and value.ndim > 0]
+    if not any(value.ndim > 1 for value in arrays) \
+            or not all(_is_string_array(value) for value in arrays):
+        return None
+    if len({value.ndim for value in arrays}) > 1:
+        return 'A'
+    layouts = {value.layout for value in arrays}
+    if has_out(out):
+        layouts.add(out.layout)
+    if layouts == {'C'} or layouts == {'F'}:
+        return layouts.pop()
+    return 'A'
+
+
+@register_jitable(**JIT_OPTIONS)
+def _nd_same(value):
+    return value
+
+
+def _nd_walk(function, extra, result_dtype):
+    """Build the row walk of a binary operation over broadcast operands.
+
+    Operands are viewed at the broadcast shape with zero strides on the
+    broadcast axes, so neither side is expanded in memory. ``nd_axes`` then
+    merges the axes all arrays step through evenly and walks the longest
+    one, so the 1-D form runs once per remaining row.
+    """
+    if extra:
+        @register_jitable(**JIT_OPTIONS)
+        def walk(x1, x2, start, end, out):
+            shape = nd_shape(x1, x2)
+            result = nd_result(out, shape, result_dtype)
+            rows, x1, x2 = nd_axes(result, nd_broadcast(x1, shape),
+                                   nd_broadcast(x2, shape))
+            for index in np.ndindex(rows.shape[:-1]):
+                row1, row2 = nd_rows(x1, x2, index)
+                function(row1, row2, start, end, rows[index])
+            return result
+    else:
+        @register_jitable(**JIT_OPTIONS)
+        def walk(x1, x2, out):
+            shape = nd_shape(x1, x2)
+            result = nd_result(out, shape, result_dtype)
+            rows, x1, x2 = nd_axes(result, nd_broadcast(x1, shape),
+                                   nd_broadcast(x2, shape))
+            for index in np.ndindex(rows.shape[:-1]):
+                row1, row2 = nd_rows(x1, x2, index)
+                function(row1, row2, rows[index])
+            return result
+    return walk
+
+
+def _nd_impl(function, operands, extra, out, dtype):
+    """Build the N-D implementation of an overload from its 1-D form."""
+    ensure_out(out, dtype, *operands)
+    layout = _nd_layout(operands, out)
+    result_dtype = as_dtype(dtype)
+
+    if len(operands) == 1:
+        if layout == 'A':
+            def impl(a, out=None):
+                result = nd_result(out, a.shape, result_dtype)
+                rows, a, _ = nd_axes(result, a, None)
+                for index in np.ndindex(rows.shape[:-1]):
+                    function(a[index], rows[index])
+                return result
+        else:
+            # F-contiguous operands are the C-contiguous transposes of the
+            # result.
+            orient = nd_transpose if layout == 'F' else _nd_same
+
+            def impl(a, out=None):
+                a = orient(a)
+                result = nd_result(orient(out), a.shape, result_dtype)
+                function(nd_flat(a), nd_flat(result))
+                return orient(result)
+        return impl
+
+    walk = _nd_walk(function, extra, result_dtype)
+    if layout == 'A':
+        if extra:
+            def impl(x1, x2, start=0, end=None, out=None):
+                return walk(x1, x2, start, end, out)
+        else:
+            def impl(x1, x2, out=None):
+                return walk(x1, x2, out)
+        return impl
+
+    orient = nd_transpose if layout == 'F' else _nd_same
+    if extra:
+        def impl(x1, x2, start=0, end=None, out=None):
+            x1 = orient(x1)
+            x2 = orient(x2)
+            if not nd_same_shape(x1, x2):
+                return orient(walk(x1, x2, start, end, orient(out)))
+            result = nd_result(orient(out), nd_shape(x1, x2), result_dtype)
+            function(nd_flat(x1), nd_flat(x2), start, end, nd_flat(result))
+            return orient(result)
+    else:
+        def impl(x1, x2, out=None):
+            x1 = orient(x1)
+            x2 = orient(x2)
+            if not nd_same_shape(x1, x2):
+                return orient(walk(x1, x2, orient(out)))
+            result = nd_result(orient(out), nd_shape(x1, x2), result_dtype)
+            function(nd_flat(x1), nd_flat(x2), nd_flat(result))
+            return orient(result)
+    return impl
+
+
+def nd_overload(function, dtype):
+    """Route N-D string operands of an overload through its 1-D form.
+
+    ``function`` is the 1-D entry point the overload is registered for. Same
+    shape C- or F-contiguous operands run as one flat call of it; other
+    layouts, and operands that broadcast against each other, call it once
+    per row view along the longest axis left after merging evenly strided
+    ones, so nothing is copied. Scalar operands are passed through to every
+    call.
+    """
+    def decorate(overload_function):
+        parameters = signature(overload_function)
+        n_operands = 1 if len(parameters.parameters) == 2 else 2
+
+        @wraps(overload_function)
+        def wrapper(*args, **kwargs):
+            bound = parameters.bind(*args, **kwargs)
+            bound.apply_defaults()
+            values = list(bound.arguments.values())
+            operands, out = values[:n_operands], values[-1]
+            if _nd_layout(operands, out) is not None:
+                return _nd_impl(function, operands, len(values) > 3, out,
+                                dtype)
+            return overload_function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+IndexedStrings = namedtuple('IndexedStrings', ['values', 'lengths'])
+IndexedStrings.__doc__ = """A 1-D fixed-width string array with its prebuilt str_len.
+
+Built by ``charex.indexed``. Search overloads read ``lengths`` instead of
+rescanning every record; it is only valid while ``values`` is unchanged.
+"""
+
+
+def is_indexed(value):
+    """Return whether a Numba type is an ``IndexedStrings`` instance."""
+    return isinstance(value, types.BaseNamedTuple) \
+        and value.instance_class is IndexedStrings
+
+
+def indexed_type(value):
+    """Return the string array type behind an indexed operand type."""
+    return value.types[0] if is_indexed(value) else value
+
+
+def indexed_values(value):
+    """Return the string values of an indexed operand, else the operand."""
+
+
+@overload(indexed_values, **OPTIONS)
+def ov_indexed_values(value):
+    if is_indexed(value):
+        return lambda value: value.values
+    return lambda value: value
+
+
+def indexed_lengths(value):
+    """Return the prebuilt lengths of an indexed operand, else None."""
+
+
+@overload(indexed_lengths, **OPTIONS)
+def ov_indexed_lengths(value):
+    if is_indexed(value):
+        return lambda value: value.lengths
+    return lambda value: None
+
+
+def _indexed_search(kernel, operands, start, end, out, dtype):
+    a, sub = (indexed_type(value) for value in operands)
+    register_a, register_sub, _, _ = register_pair(a, sub, 1)
+    ensure_out(out, dtype, a, sub)
+    s, e = ensure_slice(start, end)
+
+    def impl(a, sub, start=0, end=None, out=None):
+        start = start or s
+        end = e if end is None else end
+        return kernel(*register_a(indexed_values(a), False),
+                      indexed_lengths(a),
+                      *register_sub(indexed_values(sub), False),
+                      indexed_lengths(sub), start, end, out)
+    return impl
+
+
+def _indexed_impl(function, kernel, values, dtype):
+    """Build the implementation of an overload for indexed operands."""
+    if len(values) == 2:
+        if kernel is not None:
+            ensure_out(values[1], dtype, indexed_type(values[0]))
+
+            def impl(a, out=None):
+                return kernel(indexed_lengths(a), out)
+        else:
+            def impl(a, out=None):
+                return function(indexed_values(a), out)
+    elif len(values) == 3:
+        def impl(x1, x2, out=None):
+            return function(indexed_values(x1), indexed_values(x2), out)
+    elif kernel is not None:
+        impl = _indexed_search(kernel, values[:2], *values[2:], dtype)
+    else:
+        def impl(x1, x2, start=0, end=None, out=None):
+            return function(indexed_values(x1), indexed_values(x2),
+                            start, end, out)
+    return impl
+
+
+def indexed_overload(function, kernel=None, dtype=None):
+    """Accept ``IndexedStrings`` operands in an overload.
+
+    Search and length operations pass ``kernel``, the form of their row
+    kernel that takes prebuilt lengths (``count_indexed`` and friends), so
+    the per-call ``str_len`` pass is skipped. Other operations call
+    ``function`` on the unwrapped values.
+    """
+    def decorate(overload_function):
+        parameters = signature(overload_function)
+        n_operands = 1 if len(parameters.parameters) == 2 else 2
+
+        @wraps(overload_function)
+        def wrapper(*args, **kwargs):
+            bound = parameters.bind(*args, **kwargs)
+            bound.apply_defaults()
+            values = list(bound.arguments.values())
+            if any(is_indexed(value) for value in values[:n_operands]):
+                return _indexed_impl(function, kernel, values, dtype)
+            return overload_function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+EncodedStrings = namedtuple('EncodedStrings', ['codes', 'uniques'])
+EncodedStrings.__doc__ = """A 1-D string column stored as codes into its unique values.
+
+Built by ``charex.encoded``. ``uniques[codes]`` is the column, and every
+unique is expected to occur in it. Operations whose other operand is a
+scalar run once per unique and gather the results by code.
+"""
+
+
+def is_encoded(value):
+    """Return whether a Numba type is an ``EncodedStrings`` instance."""
+    return isinstance(value, types.BaseNamedTuple) \
+        and value.instance_class is EncodedStrings
+
+
+def _is_uniform(value):
+    """Return whether an operand type is the same for every row."""
+    return not is_encoded(value) and not is_indexed(value) \
+        and not is_narrowed(value) and not is_masked(value) \
+        and (not isinstance(value, types.Array) or value.ndim == 0)
+
+
+def decoded(value):
+    """Return the column of an encoded operand, else the operand."""
+
+
+@overload(decoded, **OPTIONS)
+def ov_decoded(value):
+    if is_encoded(value):
+        return lambda value: value.uniques[value.codes]
+    return lambda value: value
+
+
+@register_jitable(**JIT_OPTIONS)
+def gather_codes(table, codes, result):
+    """Write ``table[codes]`` into ``result``."""
+    for i in range(codes.size):
+        result[i] = table[codes[i]]
+    return result
+
+
+def _encoded_impl(function, values, dtype):
+    """Build the implementation of an overload for encoded operands."""
+    result = bool_result if dtype == types.boolean else int_result
+    if len(values) == 2:
+        a, out = values
+        ensure_out(out, dtype, a.types[0])
+
+        def impl(a, out=None):
+            return gather_codes(function(a.uniques), a.codes,
+                                result(out, a.codes.size))
+        return impl
+
+    x1, x2, out = values[0], values[1], values[-1]
+    if is_encoded(x1) and _is_uniform(x2):
+        encoded, left = x1, True
+    elif _is_uniform(x1) and is_encoded(x2):
+        encoded, left = x2, False
+    else:
+        for value in (x1, x2):
+            if is_encoded(value) \
+                    and is_stringdtype_array_type(value.types[1]):
+                raise NumbaTypeError('encoded StringDType operands need a '
+                                     'scalar other operand')
+        if len(values) == 3:
+            def impl(x1, x2, out=None):
+                return function(decoded(x1), decoded(x2), out)
+        else:
+            def impl(x1, x2, arg2=0, arg3=None, out=None):
+                return function(decoded(x1), decoded(x2), arg2, arg3, out)
+        return impl
+
+    ensure_out(out, dtype, encoded.types[0])
+    if len(values) == 3:
+        if left:
+            def impl(x1, x2, out=None):
+                return gather_codes(function(x1.uniques, x2), x1.codes,
+                                    result(out, x1.codes.size))
+        else:
+            def impl(x1, x2, out=None):
+                return gather_codes(function(x1, x2.uniques), x2.codes,
+                                    result(out, x2.codes.size))
+    elif left:
+        def impl(x1, x2, arg2=0, arg3=None, out=None):
+            return gather_codes(function(x1.uniques, x2, arg2, arg3),
+                                x1.codes, result(out, x1.codes.size))
+    else:
+        def impl(x1, x2, arg2=0, arg3=None, out=None):
+            return gather_codes(function(x1, x2.uniques, arg2, arg3),
+                                x2.codes, result(out, x2.codes.size))
+    return impl
+
+
+def encoded_overload(function, dtype):
+    """Accept ``EncodedStrings`` operands in an overload.
+
+    When the other operand is a scalar, ``function`` runs on the uniques
+    and its results are gathered by code, so the string work is
+    proportional to the distinct values rather than the rows. Other
+    combinations decode the column first.
+    """
+    def decorate(overload_function):
+        parameters = signature(overload_function)
+        n_operands = 1 if len(parameters.parameters) == 2 else 2
+
+        @wraps(overload_function)
+        def wrapper(*args, **kwargs):
+            bound = parameters.bind(*args, **kwargs)
+            bound.apply_defaults()
+            values = list(bound.arguments.values())
+            if any(is_encoded(value) for value in values[:n_operands]):
+                return _encoded_impl(function, values, dtype)
+            return overload_function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+NarrowedStrings = namedtuple('NarrowedStrings', ['values', 'units'])
+NarrowedStrings.__doc__ = """A 1-D ``U`` array with a copy of its code points in narrow code units.
+
+Built by ``charex.narrowed``. ``units`` holds one C-contiguous row of
+``uint8``, ``uint16`` or ``uint32`` code units per string. Comparisons and
+searches against scalars, or against columns narrowed to the same width,
+scan ``units``; other operands are paired with ``values``.
+"""
+
+
+def is_narrowed(value):
+    """Return whether a Numba type is a ``NarrowedStrings`` instance."""
+    return isinstance(value, types.BaseNamedTuple) \
+        and value.instance_class is NarrowedStrings
+
+
+def narrowed_type(value):
+    """Return the string array type behind a narrowed operand type."""
+    return value.types[0] if is_narrowed(value) else value
+
+
+@register_jitable(**JIT_OPTIONS)
+def register_narrowed(s, rstrip=True):
+    """Expose the narrow code units of a ``NarrowedStrings`` as records."""
+    units = s.units
+    return units.reshape(units.size), units.shape[0], units.shape[1]
+
+
+def _narrowed_units(value):
+    units = value.types[1]
+    if not isinstance(units, types.Array) or units.ndim != 2 \
+            or units.layout != 'C' \
+            or units.dtype not in (types.uint8, types.uint16, types.uint32):
+        raise NumbaTypeError('NarrowedStrings units must be a C-contiguous '
+                             '2-D uint8, uint16 or uint32 array')
+    return units.dtype
+
+
+def _register_narrowed_values(value):
+    """Return a registration reading the original array of a narrowed value."""
+    register = _array_register(value.types[0], 1, register_array_strings,
+                               register_array_strings_strided, None)
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def register_values(s, rstrip=True):
+        return register(s.values, rstrip)
+    return register_values
+
+
+def _register_narrowing(register, unit):
+    """Wrap a unicode registration to produce ``unit`` code units.
+
+    Code points that do not fit become the largest ``unit`` value, which a
+    narrowed column never holds, so they compare above every stored code
+    point and never match one.
+    """
+    dtype = as_dtype(unit)
+    limit = np.iinfo(dtype).max
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def register_narrow(s, rstrip=True):
+        chr_array, len_chr, size_chr = register(s, rstrip)
+        units = np.empty(chr_array.size, dtype)
+        for i in range(chr_array.size):
+            units[i] = min(np.uint32(chr_array[i]), limit)
+        return units, len_chr, size_chr
+    return register_narrow
+
+
+def _register_narrowed_pair(left, right, registered):
+    """Adapt the registration of a pair's arrays to narrowed operands.
+
+    A narrowed operand is read through its units when the other operand is
+    a scalar, which is narrowed to match, or is narrowed to the same width.
+    Against other arrays it falls back to its original values.
+    """
+    if registered is None:
+        return None
+    register_left, register_right, left_dim, right_dim = registered
+    left_unit = _narrowed_units(left) if is_narrowed(left) else None
+    right_unit = _narrowed_units(right) if is_narrowed(right) else None
+    if left_unit is not None and right_unit is not None:
+        if left_unit == right_unit:
+            return register_narrowed, register_narrowed, 1, 1
+        return _register_narrowed_values(left), \
+            _register_narrowed_values(right), 1, 1
+    if left_unit is not None:
+        if right_dim > 0:
+            return _register_narrowed_values(left), register_right, 1, \
+                right_dim
+        return register_narrowed, _register_narrowing(register_right,
+                                                      left_unit), 1, right_dim
+    if left_dim > 0:
+        return register_left, _register_narrowed_values(right), left_dim, 1
+    return _register_narrowing(register_left, right_unit), register_narrowed, \
+        left_dim, 1
+
+
+MaskedStrings = namedtuple('MaskedStrings', ['values', 'valid'])
+MaskedStrings.__doc__ = """A 1-D StringDType array with its validity bitmap.
+
+Built by ``charex.masked``. Bit ``i % 8`` of ``valid[i // 8]`` is set when
+``values[i]`` is not null, the bit order of ``np.packbits(...,
+bitorder='little')``; it is only valid while ``values`` is unchanged.
+``np.strings`` comparisons, searches, predicates and ``str_len`` load only
+the valid strings and return their results with ``valid``.
+"""
+
+
+def is_masked(value):
+    """Return whether a Numba type is a ``MaskedStrings`` instance."""
+    return isinstance(value, types.BaseNamedTuple) \
+        and value.instance_class is MaskedStrings
+
+
 def str_type(value, as_np=True):
     """Infer string-type of an objects Numba instance."""
     if isinstance(value, types.Array):
@@ -78,6 +604,9 @@ def _array_register(value, ndim, contiguous, strided, scalar):
 
 def register_pair(left, right, exception: (NumbaError, int) = None):
     """Choose ordinal registration functions for a pair of string operands."""
+    if is_narrowed(left) or is_narrowed(right):
+        return _register_narrowed_pair(left, right, register_pair(
+            narrowed_type(left), narrowed_type(right), exception))
     error = exception or NumbaTypeError("comparison of non-string arrays")
     left_type, left_dim = ensure_type(left, error)
     right_type, right_dim = ensure_type(right, error)
@@ -136,6 +665,9 @@ def _string_type(value):
 
 def try_register_pair(left, right):
     """Choose ordinal registration for string operands, else return None."""
+    if is_narrowed(left) or is_narrowed(right):
+        return _register_narrowed_pair(left, right, try_register_pair(
+            narrowed_type(left), narrowed_type(right)))
     left_type, left_dim = _string_type(left)
     right_type, right_dim = _string_type(right)
 
@@ -168,6 +700,9 @@ def try_register_pair(left, right):
 
 def register_single(value, exception: NumbaError = None):
     """Choose ordinal registration function for one string operand."""
+    if is_narrowed(value):
+        _narrowed_units(value)
+        return register_narrowed, 1, False
     error = exception or NumbaTypeError("string operation on non-string array")
     value_type, value_dim = ensure_type(value, error)
 
@@ -219,20 +754,21 @@ def equal_kernel(left, right, generic, bytes_sub32, unicode_sub32):
 def equal_dispatch(register_left, register_right, left_dim, right_dim,
                    kernel, rstrip, scalar_as_array=False):
     left_scalar_like = left_dim <= 0 < right_dim
+    kernel = row_kernel(kernel, 2)
 
     if left_dim > 0 or right_dim > 0:
-        def impl(left, right):
+        def impl(left, right, out=None):
             if left_scalar_like:
                 result = kernel(*register_right(right, False),
-                                *register_left(left, False), rstrip)
+                                *register_left(left, False), rstrip, out)
             else:
                 result = kernel(*register_left(left, False),
-                                *register_right(right, False), rstrip)
+                                *register_right(right, False), rstrip, out)
             return result
     else:
-        def impl(left, right):
+        def impl(left, right, out=None):
             result = kernel(*register_left(left, False),
-                            *register_right(right, False), rstrip)[0]
+                            *register_right(right, False), rstrip, None)[0]
             return np.array(result) if scalar_as_array else result
     return impl
 
@@ -254,22 +790,23 @@ def order_dispatch(register_left, register_right, left_dim, right_dim,
     else:
         kernel = greater_equal_impl
         reverse_compare = True
+    kernel = row_kernel(kernel, 2)
 
     if left_dim > 0 or right_dim > 0:
-        def impl(left, right):
+        def impl(left, right, out=None):
             if left_scalar_like:
                 result = kernel(*register_right(right, False),
                                 *register_left(left, False),
-                                not reverse_compare, rstrip)
+                                not reverse_compare, rstrip, out)
             else:
                 result = kernel(*register_left(left, False),
                                 *register_right(right, False),
-                                reverse_compare, rstrip)
+                                reverse_compare, rstrip, out)
             return result
     else:
-        def impl(left, right):
+        def impl(left, right, out=None):
             result = kernel(*register_left(left, False),
                             *register_right(right, False),
-                            reverse_compare, rstrip)[0]
+                            reverse_compare, rstrip, None)[0]
             return np.array(result) if scalar_as_array else result
     return impl
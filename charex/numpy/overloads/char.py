@@ -4,7 +4,11 @@ Numba overloads for numpy.character routines
 
 from charex.core import OPTIONS
 from charex.numpy.overloads._shared import (
+    encoded_overload as _encoded_overload,
+    ensure_out as _ensure_out,
     ensure_slice as _ensure_slice,
+    indexed_overload as _indexed_overload,
+    nd_overload as _nd_overload,
     equal_dispatch as _equal_dispatch,
     equal_kernel as _equal_kernel,
     order_dispatch as _order_dispatch,
@@ -18,6 +22,8 @@ from charex.numpy.overloads.definitions import (
     compare_chararrays,
     count, endswith, startswith, find, rfind, index, rindex, str_len,
     str_len_bytes, _str_len_loop,
+    count_indexed, endswith_indexed, startswith_indexed, find_indexed,
+    rfind_indexed, index_indexed, rindex_indexed, str_len_indexed,
     isalpha, isalnum, isdecimal, isdigit, islower, isnumeric, isspace,
     istitle, isupper, scalar_bytes_len, scalar_strings_len,
     scalar_bytes_isalpha, scalar_strings_isalpha,
@@ -28,6 +34,10 @@ from charex.numpy.overloads.definitions import (
     scalar_bytes_isupper, scalar_strings_isupper,
     scalar_bytes_islower, scalar_strings_islower
 )
+from charex.numpy.overloads.parallel import (
+    found_kernel as _found_kernel,
+    row_kernel as _row_kernel,
+)
 from numba.core import types
 from numba.core.errors import NumbaTypeError
 from numba.core.typing.templates import AttributeTemplate
@@ -39,71 +49,71 @@ import numpy as np
 _CHAR_INFO_SCALARS_AS_ARRAY = not isinstance(np.char.str_len, np.ufunc)
 
 
-def _char_count(a, sub, start=0, end=None):
+def _char_count(a, sub, start=0, end=None, out=None):
     return np.char.count(a, sub, start, end)
 
 
-def _char_endswith(a, suffix, start=0, end=None):
+def _char_endswith(a, suffix, start=0, end=None, out=None):
     return np.char.endswith(a, suffix, start, end)
 
 
-def _char_startswith(a, prefix, start=0, end=None):
+def _char_startswith(a, prefix, start=0, end=None, out=None):
     return np.char.startswith(a, prefix, start, end)
 
 
-def _char_find(a, sub, start=0, end=None):
+def _char_find(a, sub, start=0, end=None, out=None):
     return np.char.find(a, sub, start, end)
 
 
-def _char_rfind(a, sub, start=0, end=None):
+def _char_rfind(a, sub, start=0, end=None, out=None):
     return np.char.rfind(a, sub, start, end)
 
 
-def _char_index(a, sub, start=0, end=None):
+def _char_index(a, sub, start=0, end=None, out=None):
     return np.char.index(a, sub, start, end)
 
 
-def _char_rindex(a, sub, start=0, end=None):
+def _char_rindex(a, sub, start=0, end=None, out=None):
     return np.char.rindex(a, sub, start, end)
 
 
-def _char_str_len(a):
+def _char_str_len(a, out=None):
     return np.char.str_len(a)
 
 
-def _char_isalpha(a):
+def _char_isalpha(a, out=None):
     return np.char.isalpha(a)
 
 
-def _char_isalnum(a):
+def _char_isalnum(a, out=None):
     return np.char.isalnum(a)
 
 
-def _char_isdecimal(a):
+def _char_isdecimal(a, out=None):
     return np.char.isdecimal(a)
 
 
-def _char_isdigit(a):
+def _char_isdigit(a, out=None):
     return np.char.isdigit(a)
 
 
-def _char_islower(a):
+def _char_islower(a, out=None):
     return np.char.islower(a)
 
 
-def _char_isnumeric(a):
+def _char_isnumeric(a, out=None):
     return np.char.isnumeric(a)
 
 
-def _char_isspace(a):
+def _char_isspace(a, out=None):
     return np.char.isspace(a)
 
 
-def _char_istitle(a):
+def _char_istitle(a, out=None):
     return np.char.istitle(a)
 
 
-def _char_isupper(a):
+def _char_isupper(a, out=None):
     return np.char.isupper(a)
 
 
@@ -162,8 +172,12 @@ def _char_info_scalar_result(value):
 
 
 @overload(np.char.equal, **OPTIONS)
-def ov_char_equal(x1, x2):
+@_encoded_overload(np.char.equal, types.boolean)
+@_indexed_overload(np.char.equal)
+@_nd_overload(np.char.equal, types.boolean)
+def ov_char_equal(x1, x2, out=None):
     register_x1, register_x2, x1_dim, x2_dim = _register_pair(x1, x2)
+    _ensure_out(out, types.boolean, x1, x2)
     return _equal_dispatch(register_x1, register_x2, x1_dim, x2_dim,
                            _equal_kernel(x1, x2, equal, equal_sub32_bytes,
                                          equal_sub32_unicode), True,
@@ -171,8 +185,12 @@ def ov_char_equal(x1, x2):
 
 
 @overload(np.char.not_equal, **OPTIONS)
-def ov_char_not_equal(x1, x2):
+@_encoded_overload(np.char.not_equal, types.boolean)
+@_indexed_overload(np.char.not_equal)
+@_nd_overload(np.char.not_equal, types.boolean)
+def ov_char_not_equal(x1, x2, out=None):
     register_x1, register_x2, x1_dim, x2_dim = _register_pair(x1, x2)
+    _ensure_out(out, types.boolean, x1, x2)
     return _equal_dispatch(register_x1, register_x2, x1_dim, x2_dim,
                            _equal_kernel(
                                x1, x2, not_equal, not_equal_sub32_bytes,
@@ -182,56 +200,77 @@ def ov_char_not_equal(x1, x2):
 
 
 @overload(np.char.greater_equal, **OPTIONS)
-def ov_char_greater_equal(x1, x2):
+@_encoded_overload(np.char.greater_equal, types.boolean)
+@_indexed_overload(np.char.greater_equal)
+@_nd_overload(np.char.greater_equal, types.boolean)
+def ov_char_greater_equal(x1, x2, out=None):
     register_x1, register_x2, x1_dim, x2_dim = _register_pair(x1, x2)
+    _ensure_out(out, types.boolean, x1, x2)
     return _order_dispatch(register_x1, register_x2, x1_dim, x2_dim,
                            greater, greater_equal, 'greater_equal', True,
                            scalar_as_array=True)
 
 
 @overload(np.char.greater, **OPTIONS)
-def ov_char_greater(x1, x2):
+@_encoded_overload(np.char.greater, types.boolean)
+@_indexed_overload(np.char.greater)
+@_nd_overload(np.char.greater, types.boolean)
+def ov_char_greater(x1, x2, out=None):
     register_x1, register_x2, x1_dim, x2_dim = _register_pair(x1, x2)
+    _ensure_out(out, types.boolean, x1, x2)
     return _order_dispatch(register_x1, register_x2, x1_dim, x2_dim,
                            greater, greater_equal, 'greater', True,
                            scalar_as_array=True)
 
 
 @overload(np.char.less, **OPTIONS)
-def ov_char_less(x1, x2):
+@_encoded_overload(np.char.less, types.boolean)
+@_indexed_overload(np.char.less)
+@_nd_overload(np.char.less, types.boolean)
+def ov_char_less(x1, x2, out=None):
     register_x1, register_x2, x1_dim, x2_dim = _register_pair(x1, x2)
+    _ensure_out(out, types.boolean, x1, x2)
     return _order_dispatch(register_x1, register_x2, x1_dim, x2_dim,
                            greater, greater_equal, 'less', True,
                            scalar_as_array=True)
 
 
 @overload(np.char.less_equal, **OPTIONS)
-def ov_char_less_equal(x1, x2):
+@_encoded_overload(np.char.less_equal, types.boolean)
+@_indexed_overload(np.char.less_equal)
+@_nd_overload(np.char.less_equal, types.boolean)
+def ov_char_less_equal(x1, x2, out=None):
     register_x1, register_x2, x1_dim, x2_dim = _register_pair(x1, x2)
+    _ensure_out(out, types.boolean, x1, x2)
     return _order_dispatch(register_x1, register_x2, x1_dim, x2_dim,
                            greater, greater_equal, 'less_equal', True,
                            scalar_as_array=True)
 
 
 @overload(np.char.compare_chararrays, **OPTIONS)
-def ov_char_compare_chararrays(a1, a2, cmp, rstrip):
+@_encoded_overload(np.char.compare_chararrays, types.boolean)
+@_indexed_overload(np.char.compare_chararrays)
+@_nd_overload(np.char.compare_chararrays, types.boolean)
+def ov_char_compare_chararrays(a1, a2, cmp, rstrip, out=None):
     if not isinstance(cmp, (types.Bytes, types.UnicodeType)):
         raise NumbaTypeError(f'a bytes-like object is required, not {cmp.name}')
 
     register_a1, register_a2, a1_dim, a2_dim = _register_pair(a1, a2)
+    _ensure_out(out, types.boolean, a1, a2)
     left_scalar_like = a1_dim <= 0 < a2_dim
+    compare_rows = _row_kernel(compare_chararrays, 2)
 
     if a1_dim > 0 or a2_dim > 0:
-        def impl(a1, a2, cmp, rstrip):
+        def impl(a1, a2, cmp, rstrip, out=None):
             if left_scalar_like:
-                return compare_chararrays(*register_a2(a2, False),
-                                          *register_a1(a1, False),
-                                          True, cmp, rstrip)
-            return compare_chararrays(*register_a1(a1, False),
-                                      *register_a2(a2, False),
-                                      False, cmp, rstrip)
+                return compare_rows(*register_a2(a2, False),
+                                    *register_a1(a1, False),
+                                    True, cmp, rstrip, out)
+            return compare_rows(*register_a1(a1, False),
+                                *register_a2(a2, False),
+                                False, cmp, rstrip, out)
     else:
-        def impl(a1, a2, cmp, rstrip):
+        def impl(a1, a2, cmp, rstrip, out=None):
             return np.array(compare_chararrays(*register_a1(a1, False),
                                                *register_a2(a2, False),
                                                False, cmp, rstrip)[0])
@@ -243,386 +282,473 @@ def ov_char_compare_chararrays(a1, a2, cmp, rstrip):
 
 
 @_overload_char_function(np.char.count, _char_count)
-def ov_char_count(a, sub, start=0, end=None):
+@_encoded_overload(_char_count, types.int64)
+@_indexed_overload(_char_count, count_indexed, types.int64)
+@_nd_overload(_char_count, types.int64)
+def ov_char_count(a, sub, start=0, end=None, out=None):
     register_a, register_sub, a_dim, sub_dim = _register_pair(a, sub, 1)
+    _ensure_out(out, types.int64, a, sub)
+    count_rows = _row_kernel(count, 2)
     s, e = _ensure_slice(start, end)
 
     if a_dim > 0 or sub_dim > 0:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            return count(*register_a(a, False),
-                         *register_sub(sub, False),
-                         start, end)
+            return count_rows(*register_a(a, False),
+                              *register_sub(sub, False),
+                              start, end, out)
     else:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
             return _char_info_scalar_result(
-                count(*register_a(a, False),
-                      *register_sub(sub, False),
-                      start, end)[0])
+                count_rows(*register_a(a, False),
+                           *register_sub(sub, False),
+                           start, end, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.endswith, _char_endswith)
-def ov_char_endswith(a, suffix, start=0, end=None):
+@_encoded_overload(_char_endswith, types.boolean)
+@_indexed_overload(_char_endswith, endswith_indexed, types.boolean)
+@_nd_overload(_char_endswith, types.boolean)
+def ov_char_endswith(a, suffix, start=0, end=None, out=None):
     register_a, register_sub, a_dim, sub_dim = _register_pair(a, suffix, 1)
+    _ensure_out(out, types.boolean, a, suffix)
+    endswith_rows = _row_kernel(endswith, 2)
     s, e = _ensure_slice(start, end)
 
     if a_dim > 0 or sub_dim > 0:
-        def impl(a, suffix, start=0, end=None):
+        def impl(a, suffix, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            return endswith(*register_a(a, False),
-                            *register_sub(suffix, False),
-                            start, end)
+            return endswith_rows(*register_a(a, False),
+                                 *register_sub(suffix, False),
+                                 start, end, out)
     else:
-        def impl(a, suffix, start=0, end=None):
+        def impl(a, suffix, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
             return _char_info_scalar_result(
-                endswith(*register_a(a, False),
-                         *register_sub(suffix, False),
-                         start, end)[0])
+                endswith_rows(*register_a(a, False),
+                              *register_sub(suffix, False),
+                              start, end, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.startswith, _char_startswith)
-def ov_char_startswith(a, prefix, start=0, end=None):
+@_encoded_overload(_char_startswith, types.boolean)
+@_indexed_overload(_char_startswith, startswith_indexed, types.boolean)
+@_nd_overload(_char_startswith, types.boolean)
+def ov_char_startswith(a, prefix, start=0, end=None, out=None):
     register_a, register_sub, a_dim, sub_dim = _register_pair(a, prefix, 1)
+    _ensure_out(out, types.boolean, a, prefix)
+    startswith_rows = _row_kernel(startswith, 2)
     s, e = _ensure_slice(start, end)
 
     if a_dim > 0 or sub_dim > 0:
-        def impl(a, prefix, start=0, end=None):
+        def impl(a, prefix, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            return startswith(*register_a(a, False),
-                              *register_sub(prefix, False),
-                              start, end)
+            return startswith_rows(*register_a(a, False),
+                                   *register_sub(prefix, False),
+                                   start, end, out)
     else:
-        def impl(a, prefix, start=0, end=None):
+        def impl(a, prefix, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
             return _char_info_scalar_result(
-                startswith(*register_a(a, False),
-                           *register_sub(prefix, False),
-                           start, end)[0])
+                startswith_rows(*register_a(a, False),
+                                *register_sub(prefix, False),
+                                start, end, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.find, _char_find)
-def ov_char_find(a, sub, start=0, end=None):
+@_encoded_overload(_char_find, types.int64)
+@_indexed_overload(_char_find, find_indexed, types.int64)
+@_nd_overload(_char_find, types.int64)
+def ov_char_find(a, sub, start=0, end=None, out=None):
     register_a, register_sub, a_dim, sub_dim = _register_pair(a, sub, 1)
+    _ensure_out(out, types.int64, a, sub)
+    find_rows = _row_kernel(find, 2)
     s, e = _ensure_slice(start, end)
 
     if a_dim > 0 or sub_dim > 0:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            return find(*register_a(a, False),
-                        *register_sub(sub, False),
-                        start, end)
+            return find_rows(*register_a(a, False),
+                             *register_sub(sub, False),
+                             start, end, out)
     else:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
             return _char_info_scalar_result(
-                find(*register_a(a, False),
-                     *register_sub(sub, False),
-                     start, end)[0])
+                find_rows(*register_a(a, False),
+                          *register_sub(sub, False),
+                          start, end, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.rfind, _char_rfind)
-def ov_char_rfind(a, sub, start=0, end=None):
+@_encoded_overload(_char_rfind, types.int64)
+@_indexed_overload(_char_rfind, rfind_indexed, types.int64)
+@_nd_overload(_char_rfind, types.int64)
+def ov_char_rfind(a, sub, start=0, end=None, out=None):
     register_a, register_sub, a_dim, sub_dim = _register_pair(a, sub, 1)
+    _ensure_out(out, types.int64, a, sub)
+    rfind_rows = _row_kernel(rfind, 2)
     s, e = _ensure_slice(start, end)
 
     if a_dim > 0 or sub_dim > 0:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            return rfind(*register_a(a, False),
-                         *register_sub(sub, False),
-                         start, end)
+            return rfind_rows(*register_a(a, False),
+                              *register_sub(sub, False),
+                              start, end, out)
     else:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
             return _char_info_scalar_result(
-                rfind(*register_a(a, False),
-                      *register_sub(sub, False),
-                      start, end)[0])
+                rfind_rows(*register_a(a, False),
+                           *register_sub(sub, False),
+                           start, end, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.index, _char_index)
-def ov_char_index(a, sub, start=0, end=None):
+@_encoded_overload(_char_index, types.int64)
+@_indexed_overload(_char_index, index_indexed, types.int64)
+@_nd_overload(_char_index, types.int64)
+def ov_char_index(a, sub, start=0, end=None, out=None):
     register_a, register_sub, a_dim, sub_dim = _register_pair(a, sub, 1)
+    _ensure_out(out, types.int64, a, sub)
+    index_rows = _found_kernel(index, find)
     s, e = _ensure_slice(start, end)
 
     if a_dim > 0 or sub_dim > 0:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            return index(*register_a(a, False),
-                         *register_sub(sub, False),
-                         start, end)
+            return index_rows(*register_a(a, False),
+                              *register_sub(sub, False),
+                              start, end, out)
     else:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
             return _char_info_scalar_result(
-                index(*register_a(a, False),
-                      *register_sub(sub, False),
-                      start, end)[0])
+                index_rows(*register_a(a, False),
+                           *register_sub(sub, False),
+                           start, end, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.rindex, _char_rindex)
-def ov_char_rindex(a, sub, start=0, end=None):
+@_encoded_overload(_char_rindex, types.int64)
+@_indexed_overload(_char_rindex, rindex_indexed, types.int64)
+@_nd_overload(_char_rindex, types.int64)
+def ov_char_rindex(a, sub, start=0, end=None, out=None):
     register_a, register_sub, a_dim, sub_dim = _register_pair(a, sub, 1)
+    _ensure_out(out, types.int64, a, sub)
+    rindex_rows = _found_kernel(rindex, rfind)
     s, e = _ensure_slice(start, end)
 
     if a_dim > 0 or sub_dim > 0:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            return rindex(*register_a(a, False),
-                          *register_sub(sub, False),
-                          start, end)
+            return rindex_rows(*register_a(a, False),
+                               *register_sub(sub, False),
+                               start, end, out)
     else:
-        def impl(a, sub, start=0, end=None):
+        def impl(a, sub, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
             return _char_info_scalar_result(
-                rindex(*register_a(a, False),
-                       *register_sub(sub, False),
-                       start, end)[0])
+                rindex_rows(*register_a(a, False),
+                            *register_sub(sub, False),
+                            start, end, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.str_len, _char_str_len)
-def ov_char_str_len(a):
+@_encoded_overload(_char_str_len, types.int64)
+@_indexed_overload(_char_str_len, str_len_indexed, types.int64)
+@_nd_overload(_char_str_len, types.int64)
+def ov_char_str_len(a, out=None):
     register_a, a_dim, as_bytes = _register_single(a)
-    array_len = str_len_bytes if as_bytes else str_len
+    _ensure_out(out, types.int64, a)
+    array_len = _row_kernel(str_len_bytes if as_bytes else str_len)
     width = a.dtype.count if isinstance(a, types.Array) else 0
 
     if a_dim > 0 and width and a.layout == 'C':
         if as_bytes:
-            direct_len = _str_len_loop if width <= 8 else str_len_bytes
+            direct_len = _row_kernel(
+                _str_len_loop if width <= 8 else str_len_bytes)
 
-            def impl(a):
-                return direct_len(a.view(np.uint8), a.size, literally(width))
+            def impl(a, out=None):
+                return direct_len(a.view(np.uint8), a.size, literally(width),
+                                  out)
         else:
-            direct_len = _str_len_loop if width <= 16 else str_len
+            direct_len = _row_kernel(
+                _str_len_loop if width <= 16 else str_len)
 
-            def impl(a):
-                return direct_len(a.view(np.int32), a.size, width)
+            def impl(a, out=None):
+                return direct_len(a.view(np.int32), a.size, width, out)
     elif a_dim > 0:
-        def impl(a):
-            return array_len(*register_a(a, False))
+        def impl(a, out=None):
+            return array_len(*register_a(a, False), out)
     elif a_dim == -2:
         if as_bytes:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_bytes_len(a))
         else:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_strings_len(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                array_len(*register_a(a, False))[0])
+                array_len(*register_a(a, False), None)[0])
     return impl
 
 
 @_overload_char_function(np.char.isalpha, _char_isalpha)
-def ov_char_isalpha(a):
+@_encoded_overload(_char_isalpha, types.boolean)
+@_indexed_overload(_char_isalpha)
+@_nd_overload(_char_isalpha, types.boolean)
+def ov_char_isalpha(a, out=None):
     register_a, a_dim, as_bytes = _register_single(a)
+    _ensure_out(out, types.boolean, a)
+    isalpha_rows = _row_kernel(isalpha)
 
     if a_dim > 0:
-        def impl(a):
-            return isalpha(*register_a(a, False), as_bytes)
+        def impl(a, out=None):
+            return isalpha_rows(*register_a(a, False), as_bytes, out)
     elif a_dim == -2:
         if as_bytes:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_bytes_isalpha(a))
         else:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_strings_isalpha(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                isalpha(*register_a(a, False), as_bytes)[0])
+                isalpha_rows(*register_a(a, False), as_bytes, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.isalnum, _char_isalnum)
-def ov_char_isalnum(a):
+@_encoded_overload(_char_isalnum, types.boolean)
+@_indexed_overload(_char_isalnum)
+@_nd_overload(_char_isalnum, types.boolean)
+def ov_char_isalnum(a, out=None):
     register_a, a_dim, as_bytes = _register_single(a)
+    _ensure_out(out, types.boolean, a)
+    isalnum_rows = _row_kernel(isalnum)
 
     if a_dim > 0:
-        def impl(a):
-            return isalnum(*register_a(a, False), as_bytes)
+        def impl(a, out=None):
+            return isalnum_rows(*register_a(a, False), as_bytes, out)
     elif a_dim == -2:
         if as_bytes:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_bytes_isalnum(a))
         else:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_strings_isalnum(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                isalnum(*register_a(a, False), as_bytes)[0])
+                isalnum_rows(*register_a(a, False), as_bytes, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.isspace, _char_isspace)
-def ov_char_isspace(a):
+@_encoded_overload(_char_isspace, types.boolean)
+@_indexed_overload(_char_isspace)
+@_nd_overload(_char_isspace, types.boolean)
+def ov_char_isspace(a, out=None):
     register_a, a_dim, as_bytes = _register_single(a)
+    _ensure_out(out, types.boolean, a)
+    isspace_rows = _row_kernel(isspace)
 
     if a_dim > 0:
-        def impl(a):
-            return isspace(*register_a(a, False), as_bytes)
+        def impl(a, out=None):
+            return isspace_rows(*register_a(a, False), as_bytes, out)
     elif a_dim == -2:
         if as_bytes:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_bytes_isspace(a))
         else:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_strings_isspace(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                isspace(*register_a(a, False), as_bytes)[0])
+                isspace_rows(*register_a(a, False), as_bytes, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.isdecimal, _char_isdecimal)
-def ov_char_isdecimal(a):
+@_encoded_overload(_char_isdecimal, types.boolean)
+@_indexed_overload(_char_isdecimal)
+@_nd_overload(_char_isdecimal, types.boolean)
+def ov_char_isdecimal(a, out=None):
+    _ensure_out(out, types.boolean, a)
     catch_incompatible = NumbaTypeError("isnumeric is only available for "
                                         "Unicode strings and arrays")
     register_a, a_dim, as_bytes = _register_single(a, catch_incompatible)
+    isdecimal_rows = _row_kernel(isdecimal)
     if as_bytes:
         raise catch_incompatible
 
     if a_dim > 0:
-        def impl(a):
-            return isdecimal(*register_a(a, False))
+        def impl(a, out=None):
+            return isdecimal_rows(*register_a(a, False), out)
     elif a_dim == -2:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(scalar_strings_isdecimal(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                isdecimal(*register_a(a, False))[0])
+                isdecimal_rows(*register_a(a, False), None)[0])
     return impl
 
 
 @_overload_char_function(np.char.isdigit, _char_isdigit)
-def ov_char_isdigit(a):
+@_encoded_overload(_char_isdigit, types.boolean)
+@_indexed_overload(_char_isdigit)
+@_nd_overload(_char_isdigit, types.boolean)
+def ov_char_isdigit(a, out=None):
     register_a, a_dim, as_bytes = _register_single(a)
+    _ensure_out(out, types.boolean, a)
+    isdigit_rows = _row_kernel(isdigit)
 
     if a_dim > 0:
-        def impl(a):
-            return isdigit(*register_a(a, False), as_bytes)
+        def impl(a, out=None):
+            return isdigit_rows(*register_a(a, False), as_bytes, out)
     elif a_dim == -2:
         if as_bytes:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_bytes_isdigit(a))
         else:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_strings_isdigit(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                isdigit(*register_a(a, False), as_bytes)[0])
+                isdigit_rows(*register_a(a, False), as_bytes, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.isnumeric, _char_isnumeric)
-def ov_char_isnumeric(a):
+@_encoded_overload(_char_isnumeric, types.boolean)
+@_indexed_overload(_char_isnumeric)
+@_nd_overload(_char_isnumeric, types.boolean)
+def ov_char_isnumeric(a, out=None):
+    _ensure_out(out, types.boolean, a)
     catch_incompatible = NumbaTypeError("isnumeric is only available for "
                                         "Unicode strings and arrays")
     register_a, a_dim, as_bytes = _register_single(a, catch_incompatible)
+    isnumeric_rows = _row_kernel(isnumeric)
     if as_bytes:
         raise catch_incompatible
 
     if a_dim > 0:
-        def impl(a):
-            return isnumeric(*register_a(a, False))
+        def impl(a, out=None):
+            return isnumeric_rows(*register_a(a, False), out)
     elif a_dim == -2:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(scalar_strings_isnumeric(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                isnumeric(*register_a(a, False))[0])
+                isnumeric_rows(*register_a(a, False), None)[0])
     return impl
 
 
 @_overload_char_function(np.char.istitle, _char_istitle)
-def ov_char_istitle(a):
+@_encoded_overload(_char_istitle, types.boolean)
+@_indexed_overload(_char_istitle)
+@_nd_overload(_char_istitle, types.boolean)
+def ov_char_istitle(a, out=None):
     register_a, a_dim, as_bytes = _register_single(a)
+    _ensure_out(out, types.boolean, a)
+    istitle_rows = _row_kernel(istitle)
 
     if a_dim > 0:
-        def impl(a):
-            return istitle(*register_a(a, False), as_bytes)
+        def impl(a, out=None):
+            return istitle_rows(*register_a(a, False), as_bytes, out)
     elif a_dim == -2:
         if as_bytes:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_bytes_istitle(a))
         else:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_strings_istitle(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                istitle(*register_a(a, False), as_bytes)[0])
+                istitle_rows(*register_a(a, False), as_bytes, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.isupper, _char_isupper)
-def ov_char_isupper(a):
+@_encoded_overload(_char_isupper, types.boolean)
+@_indexed_overload(_char_isupper)
+@_nd_overload(_char_isupper, types.boolean)
+def ov_char_isupper(a, out=None):
     register_a, a_dim, as_bytes = _register_single(a)
+    _ensure_out(out, types.boolean, a)
+    isupper_rows = _row_kernel(isupper)
 
     if a_dim > 0:
-        def impl(a):
-            return isupper(*register_a(a, False), as_bytes)
+        def impl(a, out=None):
+            return isupper_rows(*register_a(a, False), as_bytes, out)
     elif a_dim == -2:
         if as_bytes:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_bytes_isupper(a))
         else:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_strings_isupper(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                isupper(*register_a(a, False), as_bytes)[0])
+                isupper_rows(*register_a(a, False), as_bytes, None)[0])
     return impl
 
 
 @_overload_char_function(np.char.islower, _char_islower)
-def ov_char_islower(a):
+@_encoded_overload(_char_islower, types.boolean)
+@_indexed_overload(_char_islower)
+@_nd_overload(_char_islower, types.boolean)
+def ov_char_islower(a, out=None):
     register_a, a_dim, as_bytes = _register_single(a)
+    _ensure_out(out, types.boolean, a)
+    islower_rows = _row_kernel(islower)
 
     if a_dim > 0:
-        def impl(a):
-            return islower(*register_a(a, False), as_bytes)
+        def impl(a, out=None):
+            return islower_rows(*register_a(a, False), as_bytes, out)
     elif a_dim == -2:
         if as_bytes:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_bytes_islower(a))
         else:
-            def impl(a):
+            def impl(a, out=None):
                 return _char_info_scalar_result(scalar_strings_islower(a))
     else:
-        def impl(a):
+        def impl(a, out=None):
             return _char_info_scalar_result(
-                islower(*register_a(a, False), as_bytes)[0])
+                islower_rows(*register_a(a, False), as_bytes, None)[0])
     return impl
 
 # ----------------------------------------------------------------------------------------------------------------------
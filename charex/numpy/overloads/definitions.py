@@ -3,17 +3,20 @@ Numba overloads for numpy.character routines
 Copyright (c) 2022-present, Nima Mehrani
 """
 
-from charex.core import JIT_OPTIONS
+from charex.core import JIT_OPTIONS, OPTIONS
+from charex.core.string_intrinsics import is_rstrip_ord
+from charex.core.unicode_tables import (
+    UNICODE_ALPHA, UNICODE_DECIMAL, UNICODE_DIGIT, UNICODE_LOWER,
+    UNICODE_NUMERIC, UNICODE_SPACE, UNICODE_TITLE, UNICODE_UPPER,
+    unicode_flags,
+)
 from llvmlite import ir
 from numba.core import cgutils
+from numba.core.imputils import impl_ret_borrowed
 from numba.cpython.charseq import charseq_get_code, unicode_charseq_get_code
-from numba.cpython.unicode_support import (
-    _PyUnicode_IsAlpha, _PyUnicode_IsDecimalDigit, _PyUnicode_IsDigit,
-    _PyUnicode_IsLowercase, _PyUnicode_IsNumeric, _PyUnicode_IsSpace,
-    _PyUnicode_IsTitlecase, _PyUnicode_IsUppercase
-)
-from numba.extending import intrinsic, register_jitable
+from numba.extending import intrinsic, overload, register_jitable
 from numba import types
+from numpy.lib.stride_tricks import as_strided
 import numpy as np
 
 
@@ -21,15 +24,406 @@ COLD_JIT_OPTIONS = dict(JIT_OPTIONS, forceinline=False)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
-# Comparison Operators
+# Result Buffers
 
 
 @register_jitable(**JIT_OPTIONS)
-def _ensure_comparison_shape(len_chr, len_cmp):
-    """Ensure operands can broadcast to the existing comparison shape."""
-    if len_cmp > 1 and len_cmp != len_chr:
-        raise ValueError('shape mismatch: objects cannot be broadcast to a '
-                         'single shape.  Mismatch is between arg 0 and arg 1.')
+def _ensure_out_shape(out, len_cast):
+    if out.shape[0] != len_cast:
+        raise ValueError('out has the wrong shape for the result of this '
+                         'operation')
+
+
+@register_jitable(**JIT_OPTIONS)
+def bool_result(out, len_cast):
+    """Return ``out`` checked against ``len_cast`` rows, or a new bool array."""
+    if out is None:
+        return np.empty(len_cast, 'bool')
+    _ensure_out_shape(out, len_cast)
+    return out
+
+
+@register_jitable(**JIT_OPTIONS)
+def int_result(out, len_cast):
+    """Return ``out`` checked against ``len_cast`` rows, or a new int64 array."""
+    if out is None:
+        return np.empty(len_cast, 'int64')
+    _ensure_out_shape(out, len_cast)
+    return out
+
+
+@register_jitable(**JIT_OPTIONS)
+def bool_filled(out, len_cast, value):
+    result = bool_result(out, len_cast)
+    result[:] = value
+    return result
+
+
+@register_jitable(**JIT_OPTIONS)
+def int_filled(out, len_cast, value):
+    result = int_result(out, len_cast)
+    result[:] = value
+    return result
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Record Layout
+
+
+def record_layout(chr_array, size_chr):
+    """Return ``(units, start, pitch)`` for registered ordinal records.
+
+    Record ``i`` starts at ``units[start + i * pitch]``. Flat registrations
+    come back unchanged with a pitch of ``size_chr``; strided (records,
+    units) views become a flat view over the original buffer, walked by
+    its stride: backwards for negative strides, in place for zero strides.
+    """
+
+
+@overload(record_layout, **OPTIONS)
+def ov_record_layout(chr_array, size_chr):
+    if chr_array.ndim == 1:
+        def impl(chr_array, size_chr):
+            return chr_array, 0, size_chr
+        return impl
+
+    def impl(chr_array, size_chr):
+        len_chr = chr_array.shape[0]
+        itemsize = chr_array.itemsize
+        if chr_array.strides[0] % itemsize:
+            # Records at odd byte offsets do not share a code unit grid.
+            units = np.ascontiguousarray(chr_array)
+            return as_strided(units, (len_chr * size_chr,), (itemsize,)), \
+                0, size_chr
+        pitch = chr_array.strides[0] // itemsize
+        last = max(len_chr - 1, 0)
+        span = last * abs(pitch) + size_chr if len_chr else 0
+        if pitch < 0:
+            return as_strided(chr_array[::-1], (span,), (itemsize,)), \
+                last * -pitch, pitch
+        return as_strided(chr_array, (span,), (itemsize,)), 0, pitch
+    return impl
+
+
+def unit_column(chr_array, start, pitch, len_chr):
+    """Return one-unit records as a 1-D array view, for ufunc fast paths."""
+
+
+@overload(unit_column, **OPTIONS)
+def ov_unit_column(chr_array, start, pitch, len_chr):
+    if chr_array.layout == 'C':
+        def impl(chr_array, start, pitch, len_chr):
+            return chr_array
+        return impl
+
+    def impl(chr_array, start, pitch, len_chr):
+        if len_chr == 1:
+            return chr_array[start:start + 1]
+        return chr_array[start::pitch]
+    return impl
+
+
+@register_jitable(**JIT_OPTIONS)
+def _has_unit_column(pitch, len_chr):
+    return pitch != 0 or len_chr == 1
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# N-D Arrays
+
+
+def _is_nd(value):
+    return isinstance(value, types.Array) and value.ndim > 1
+
+
+def nd_flat(value):
+    """Return a C-contiguous N-D array as one flat row; others unchanged."""
+
+
+@overload(nd_flat, **OPTIONS)
+def ov_nd_flat(value):
+    if _is_nd(value):
+        def impl(value):
+            return value.reshape(value.size)
+    else:
+        def impl(value):
+            return value
+    return impl
+
+
+def nd_transpose(value):
+    """Return the transpose of an N-D array; others unchanged."""
+
+
+@overload(nd_transpose, **OPTIONS)
+def ov_nd_transpose(value):
+    if _is_nd(value):
+        def impl(value):
+            return value.T
+    else:
+        def impl(value):
+            return value
+    return impl
+
+
+def nd_shape(x1, x2):
+    """Return the broadcast shape of the operands of a binary operation."""
+
+
+@overload(nd_shape, **OPTIONS)
+def ov_nd_shape(x1, x2):
+    if isinstance(x1, types.Array) and isinstance(x2, types.Array):
+        def impl(x1, x2):
+            return np.broadcast_shapes(x1.shape, x2.shape)
+    elif isinstance(x1, types.Array):
+        def impl(x1, x2):
+            return x1.shape
+    else:
+        def impl(x1, x2):
+            return x2.shape
+    return impl
+
+
+def nd_same_shape(x1, x2):
+    """Return whether the operands need no broadcasting against each other."""
+
+
+@overload(nd_same_shape, **OPTIONS)
+def ov_nd_same_shape(x1, x2):
+    if _is_nd(x1) and _is_nd(x2):
+        def impl(x1, x2):
+            return x1.shape == x2.shape
+    else:
+        def impl(x1, x2):
+            return True
+    return impl
+
+
+@intrinsic
+def _broadcast_view(typingctx, array, shape):
+    """View an array at a broadcast ``shape`` without copying it.
+
+    Leading new axes and axes of length one get a zero stride, so every
+    index along them reads the same records of the original buffer.
+    """
+    ndim = len(shape)
+    view_type = types.Array(array.dtype, ndim, 'A', readonly=True,
+                            aligned=array.aligned)
+
+    def codegen(context, builder, signature, args):
+        src = context.make_array(array)(context, builder, args[0])
+        dst = context.make_array(view_type)(context, builder)
+        intp = context.get_value_type(types.intp)
+        src_shape = cgutils.unpack_tuple(builder, src.shape, array.ndim)
+        src_strides = cgutils.unpack_tuple(builder, src.strides, array.ndim)
+        lead = ndim - array.ndim
+        strides = [intp(0)] * lead
+        for extent, stride in zip(src_shape, src_strides):
+            single = builder.icmp_signed('==', extent, intp(1))
+            strides.append(builder.select(single, intp(0), stride))
+        context.populate_array(
+            dst,
+            data=src.data,
+            shape=args[1],
+            strides=cgutils.pack_array(builder, strides, intp),
+            itemsize=src.itemsize,
+            meminfo=src.meminfo,
+            parent=src.parent,
+        )
+        return impl_ret_borrowed(context, builder, view_type,
+                                 dst._getvalue())
+
+    return view_type(array, shape), codegen
+
+
+def nd_broadcast(value, shape):
+    """Return an array operand as a zero-copy view at ``shape``."""
+
+
+@overload(nd_broadcast, **OPTIONS)
+def ov_nd_broadcast(value, shape):
+    if isinstance(value, types.Array) and value.ndim > 0:
+        def impl(value, shape):
+            return _broadcast_view(value, shape)
+    else:
+        def impl(value, shape):
+            return value
+    return impl
+
+
+def nd_rows(x1, x2, index):
+    """Return the innermost-axis rows at ``index`` of broadcast operands.
+
+    A row repeated along a broadcast axis (zero stride) is cut down to its
+    single record, so the 1-D kernels treat it like a scalar operand.
+    """
+
+
+@overload(nd_rows, **OPTIONS)
+def ov_nd_rows(x1, x2, index):
+    if _is_nd(x1) and _is_nd(x2):
+        def impl(x1, x2, index):
+            row1 = x1[index]
+            row2 = x2[index]
+            if row1.size > 1 and row1.strides[0] == 0:
+                row1 = row1[:1]
+            elif row2.size > 1 and row2.strides[0] == 0:
+                row2 = row2[:1]
+            return row1, row2
+    elif _is_nd(x1):
+        def impl(x1, x2, index):
+            return x1[index], x2
+    else:
+        def impl(x1, x2, index):
+            return x1, x2[index]
+    return impl
+
+
+@intrinsic
+def _strided_view(typingctx, array, shape, strides):
+    """View an array with the extents and strides held in two intp arrays."""
+    view_type = types.Array(array.dtype, array.ndim, 'A',
+                            readonly=not array.mutable,
+                            aligned=array.aligned)
+
+    def codegen(context, builder, signature, args):
+        src = context.make_array(array)(context, builder, args[0])
+        dst = context.make_array(view_type)(context, builder)
+        shape_array = context.make_array(signature.args[1])(
+            context, builder, args[1])
+        strides_array = context.make_array(signature.args[2])(
+            context, builder, args[2])
+        intp = context.get_value_type(types.intp)
+        extents = []
+        steps = []
+        for axis in range(array.ndim):
+            extents.append(builder.load(builder.gep(shape_array.data,
+                                                    [intp(axis)])))
+            steps.append(builder.load(builder.gep(strides_array.data,
+                                                  [intp(axis)])))
+        context.populate_array(
+            dst,
+            data=src.data,
+            shape=cgutils.pack_array(builder, extents, intp),
+            strides=cgutils.pack_array(builder, steps, intp),
+            itemsize=src.itemsize,
+            meminfo=src.meminfo,
+            parent=src.parent,
+        )
+        return impl_ret_borrowed(context, builder, view_type,
+                                 dst._getvalue())
+
+    return view_type(array, shape, strides), codegen
+
+
+@register_jitable(**JIT_OPTIONS)
+def _nd_axes(shape, strides):
+    """Merge and reorder the axes of arrays walked together, in place.
+
+    ``strides`` holds one row per array. Adjacent axes that every array
+    steps through evenly are merged into the later one and the merged axes
+    are packed at the end, leaving length-one axes in front. The longest
+    axis then moves last, so the rows handed to the 1-D kernels are as
+    long, and as few, as the layout allows.
+    """
+    ndim = shape.size
+    last = ndim - 1
+    for axis in range(ndim - 2, -1, -1):
+        extent = shape[axis]
+        if extent == 1:
+            continue
+        shape[axis] = 1
+        if shape[last] == 1:
+            shape[last] = extent
+            strides[:, last] = strides[:, axis]
+            continue
+        merged = True
+        for k in range(strides.shape[0]):
+            if strides[k, axis] != strides[k, last] * shape[last]:
+                merged = False
+        if merged:
+            shape[last] *= extent
+            continue
+        last -= 1
+        shape[last] = extent
+        strides[:, last] = strides[:, axis]
+    longest = ndim - 1
+    for axis in range(ndim - 1):
+        if shape[axis] > shape[longest]:
+            longest = axis
+    shape[longest], shape[ndim - 1] = shape[ndim - 1], shape[longest]
+    for k in range(strides.shape[0]):
+        strides[k, longest], strides[k, ndim - 1] = \
+            strides[k, ndim - 1], strides[k, longest]
+
+
+@register_jitable(**JIT_OPTIONS)
+def _nd_stride_row(strides, k, value):
+    for axis in range(strides.shape[1]):
+        strides[k, axis] = value.strides[axis]
+
+
+@register_jitable(**JIT_OPTIONS)
+def _nd_plan(result, n_arrays):
+    shape = np.empty(result.ndim, np.intp)
+    for axis in range(result.ndim):
+        shape[axis] = result.shape[axis]
+    strides = np.empty((n_arrays, result.ndim), np.intp)
+    _nd_stride_row(strides, 0, result)
+    return shape, strides
+
+
+def nd_axes(result, x1, x2):
+    """Return the result and N-D operands viewed for the row walk.
+
+    The operands are already at the result's shape. Every returned array
+    indexes the same elements the same way, with as few rows as possible
+    along the last axis, so walking ``np.ndindex(result.shape[:-1])`` of
+    the views visits each element once. Other operands are unchanged.
+    """
+
+
+@overload(nd_axes, **OPTIONS)
+def ov_nd_axes(result, x1, x2):
+    if _is_nd(x1) and _is_nd(x2):
+        def impl(result, x1, x2):
+            shape, strides = _nd_plan(result, 3)
+            _nd_stride_row(strides, 1, x1)
+            _nd_stride_row(strides, 2, x2)
+            _nd_axes(shape, strides)
+            return _strided_view(result, shape, strides[0]), \
+                _strided_view(x1, shape, strides[1]), \
+                _strided_view(x2, shape, strides[2])
+    elif _is_nd(x1):
+        def impl(result, x1, x2):
+            shape, strides = _nd_plan(result, 2)
+            _nd_stride_row(strides, 1, x1)
+            _nd_axes(shape, strides)
+            return _strided_view(result, shape, strides[0]), \
+                _strided_view(x1, shape, strides[1]), x2
+    else:
+        def impl(result, x1, x2):
+            shape, strides = _nd_plan(result, 2)
+            _nd_stride_row(strides, 1, x2)
+            _nd_axes(shape, strides)
+            return _strided_view(result, shape, strides[0]), x1, \
+                _strided_view(x2, shape, strides[1])
+    return impl
+
+
+@register_jitable(**JIT_OPTIONS)
+def nd_result(out, shape, dtype):
+    """Return ``out`` checked against ``shape``, or a new result array."""
+    if out is None:
+        return np.empty(shape, dtype)
+    if out.shape != shape:
+        raise ValueError('out has the wrong shape for the result of this '
+                         'operation')
+    return out
+
+
+# ----------------------------------------------------------------------------------------------------------------------
+# Comparison Operators
 
 
 @register_jitable(**JIT_OPTIONS)
@@ -41,13 +435,21 @@ def _ensure_binary_shape(len_chr, len_sub):
 
 
 @register_jitable(**JIT_OPTIONS)
-def _rstrip_ord(chr_ord):
-    return chr_ord == 0 or 9 <= chr_ord <= 13 or chr_ord == 32
+def _broadcast_len(len_chr, len_sub):
+    """Return the result length of two broadcast-compatible operands."""
+    if len_chr == 0 or len_sub == 0:
+        return 0
+    return max(len_chr, len_sub)
+
+
+_rstrip_ord = is_rstrip_ord
 
 
 @register_jitable(**JIT_OPTIONS)
 def _trim_ord(chr_ord, rstrip):
-    return chr_ord == 0 or (rstrip and (9 <= chr_ord <= 13 or chr_ord == 32))
+    if rstrip:
+        return _rstrip_ord(chr_ord)
+    return chr_ord == 0
 
 
 @register_jitable(**JIT_OPTIONS)
@@ -69,7 +471,19 @@ def _record_len(chr_array, start, size_chr):
 
 @register_jitable(**JIT_OPTIONS)
 def _rstrip_record_len(chr_array, start, size_chr):
-    p = start + size_chr - 1
+    """Return the record length without trailing NUL/whitespace units.
+
+    Records are trimmed in place of an rstrip copy: eight-unit words are
+    tested at once from the end, so the scan stays branch-free until the
+    word holding the last kept unit.
+    """
+    end = start + size_chr
+    while end - 8 >= start:
+        offset = _last_nonspace_chunk8(chr_array, end - 8)
+        if offset >= 0:
+            return end - 8 + offset - start + 1
+        end -= 8
+    p = end - 1
     while p >= start and _rstrip_ord(chr_array[p]):
         p -= 1
     return p - start + 1
@@ -288,6 +702,55 @@ def _last_nonzero_chunk8(typingctx, chr_array, start):
     return sig, codegen
 
 
+@intrinsic
+def _last_nonspace_chunk8(typingctx, chr_array, start):
+    """Return the last non-NUL, non-whitespace offset in a chunk, else -1."""
+    if not isinstance(chr_array, types.Array):
+        raise TypeError('chunk operand must be an array')
+
+    def codegen(context, builder, signature, args):
+        chr_type, _ = signature.args
+        chr_value, start_value = args
+        chr_struct = context.make_array(chr_type)(context, builder, chr_value)
+
+        bitwidth = chr_type.dtype.bitwidth
+        itemsize = bitwidth // 8
+        start_bytes = builder.mul(start_value,
+                                  ir.Constant(start_value.type, itemsize))
+        ptr = cgutils.pointer_add(builder, chr_struct.data, start_bytes,
+                                  cgutils.voidptr_t)
+        unit_type = ir.IntType(bitwidth)
+        vector_type = ir.VectorType(unit_type, 8)
+        value = builder.load(builder.bitcast(ptr, vector_type.as_pointer()),
+                             align=1)
+
+        def splat(constant):
+            return ir.Constant(vector_type,
+                               [ir.Constant(unit_type, constant)] * 8)
+
+        # NUL, space and \t..\r (a single unsigned range test on ord - 9).
+        space = builder.or_(
+            builder.or_(builder.icmp_unsigned('==', value, splat(0)),
+                        builder.icmp_unsigned('==', value, splat(32))),
+            builder.icmp_unsigned('<', builder.sub(value, splat(9)),
+                                  splat(5)),
+        )
+        mask_type = ir.IntType(8)
+        kept = builder.xor(builder.bitcast(space, mask_type),
+                           ir.Constant(mask_type, 0xff))
+
+        empty = builder.icmp_unsigned('==', kept, ir.Constant(mask_type, 0))
+        leading = builder.ctlz(kept, ir.Constant(ir.IntType(1), 0))
+        unit_index = builder.sub(ir.Constant(mask_type, 7), leading)
+
+        return_type = context.get_value_type(types.intp)
+        unit_index = builder.zext(unit_index, return_type)
+        return builder.select(empty, ir.Constant(return_type, -1), unit_index)
+
+    sig = types.intp(chr_array, start)
+    return sig, codegen
+
+
 @intrinsic
 def _mismatch_chunk8(typingctx, chr_array, start, cmp_array, cmp_start):
     """Return the first mismatching offset in an 8-code-unit chunk, else 8."""
@@ -398,7 +861,10 @@ def _mismatch_chunk4(typingctx, chr_array, start, cmp_array, cmp_start):
 def _trim_suffix_zero8(chr_array, start, end, rstrip):
     p = end
     while p - 8 >= start:
-        if not _is_zero_chunk8(chr_array, p - 8):
+        if rstrip:
+            if _last_nonspace_chunk8(chr_array, p - 8) >= 0:
+                return False
+        elif not _is_zero_chunk8(chr_array, p - 8):
             break
         p -= 8
     if p - 4 >= start and _is_zero_chunk4(chr_array, p - 4):
@@ -581,21 +1047,24 @@ def _equal_sub32_unicode_record(chr_array, start,
 @register_jitable(**JIT_OPTIONS)
 def _equal_sub32(chr_array, len_chr, size_chr,
                  cmp_array, len_cmp, size_cmp, as_bytes, rstrip,
-                 invert=False):
+                 invert=False, out=None):
     """Native np.char.equal for same-width records below 32 code units."""
     if size_chr != size_cmp or size_chr >= 32:
         if invert:
             return not_equal(chr_array, len_chr, size_chr,
-                             cmp_array, len_cmp, size_cmp, rstrip)
+                             cmp_array, len_cmp, size_cmp, rstrip, out)
         else:
             return equal(chr_array, len_chr, size_chr,
-                         cmp_array, len_cmp, size_cmp, rstrip)
-
-    _ensure_comparison_shape(len_chr, len_cmp)
-    equal_to = np.empty(len_chr, 'bool')
-    stride = stride_cmp = 0
-    step_cmp = (len_cmp > 1 and size_chr) or 0
-    for i in range(len_chr):
+                         cmp_array, len_cmp, size_cmp, rstrip, out)
+
+    _ensure_binary_shape(len_chr, len_cmp)
+    len_cast = _broadcast_len(len_chr, len_cmp)
+    equal_to = bool_result(out, len_cast)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    cmp_array, stride_cmp, cmp_pitch = record_layout(cmp_array, size_cmp)
+    step_chr = (len_chr > 1 and chr_pitch) or 0
+    step_cmp = (len_cmp > 1 and cmp_pitch) or 0
+    for i in range(len_cast):
         if as_bytes:
             result = _equal_sub32_bytes_record(
                 chr_array, stride, cmp_array, stride_cmp, size_chr, rstrip,
@@ -605,130 +1074,163 @@ def _equal_sub32(chr_array, len_chr, size_chr,
                 chr_array, stride, cmp_array, stride_cmp, size_chr, rstrip,
             )
         equal_to[i] = not result if invert else result
-        stride += size_chr
+        stride += step_chr
         stride_cmp += step_cmp
     return equal_to
 
 
 @register_jitable(**JIT_OPTIONS)
 def equal_sub32_bytes(chr_array, len_chr, size_chr,
-                      cmp_array, len_cmp, size_cmp, rstrip=True):
+                      cmp_array, len_cmp, size_cmp, rstrip=True, out=None):
     return _equal_sub32(chr_array, len_chr, size_chr,
-                        cmp_array, len_cmp, size_cmp, True, rstrip)
+                        cmp_array, len_cmp, size_cmp, True, rstrip, False, out)
 
 
 @register_jitable(**JIT_OPTIONS)
 def equal_sub32_unicode(chr_array, len_chr, size_chr,
-                        cmp_array, len_cmp, size_cmp, rstrip=True):
+                        cmp_array, len_cmp, size_cmp, rstrip=True, out=None):
     return _equal_sub32(chr_array, len_chr, size_chr,
-                        cmp_array, len_cmp, size_cmp, False, rstrip)
+                        cmp_array, len_cmp, size_cmp, False, rstrip, False, out)
 
 
 @register_jitable(**JIT_OPTIONS)
 def not_equal_sub32_bytes(chr_array, len_chr, size_chr,
-                          cmp_array, len_cmp, size_cmp, rstrip=True):
+                          cmp_array, len_cmp, size_cmp, rstrip=True, out=None):
     return _equal_sub32(chr_array, len_chr, size_chr,
-                        cmp_array, len_cmp, size_cmp, True, rstrip, True)
+                        cmp_array, len_cmp, size_cmp, True, rstrip, True, out)
 
 
 @register_jitable(**JIT_OPTIONS)
 def not_equal_sub32_unicode(chr_array, len_chr, size_chr,
-                            cmp_array, len_cmp, size_cmp, rstrip=True):
+                            cmp_array, len_cmp, size_cmp, rstrip=True, out=None):
     return _equal_sub32(chr_array, len_chr, size_chr,
-                        cmp_array, len_cmp, size_cmp, False, rstrip, True)
+                        cmp_array, len_cmp, size_cmp, False, rstrip, True, out)
 
 
 @register_jitable(**JIT_OPTIONS, locals={'cmp_ord': types.int32})
 def greater_equal(chr_array, len_chr, size_chr,
-                  cmp_array, len_cmp, size_cmp, inv=False, rstrip=True):
+                  cmp_array, len_cmp, size_cmp, inv=False, rstrip=True,
+                  out=None):
     """Native Implementation of np.char.greater_equal"""
-    if 1 == size_chr == size_cmp and not rstrip:
-        return cmp_array >= chr_array if inv else chr_array >= cmp_array
-
-    _ensure_comparison_shape(len_chr, len_cmp)
-    greater_equal_than = np.empty(len_chr, 'bool')
-    stride = stride_cmp = 0
-    step_cmp = (len_cmp > 1 and size_cmp) or 0
-    for i in range(len_chr):
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    cmp_array, stride_cmp, cmp_pitch = record_layout(cmp_array, size_cmp)
+    if 1 == size_chr == size_cmp and not rstrip \
+            and _has_unit_column(chr_pitch, len_chr) \
+            and _has_unit_column(cmp_pitch, len_cmp):
+        greater_equal_than = bool_result(out, _broadcast_len(len_chr, len_cmp))
+        chr_units = unit_column(chr_array, stride, chr_pitch, len_chr)
+        cmp_units = unit_column(cmp_array, stride_cmp, cmp_pitch, len_cmp)
+        if inv:
+            return np.greater_equal(cmp_units, chr_units, greater_equal_than)
+        return np.greater_equal(chr_units, cmp_units, greater_equal_than)
+
+    _ensure_binary_shape(len_chr, len_cmp)
+    len_cast = _broadcast_len(len_chr, len_cmp)
+    greater_equal_than = bool_result(out, len_cast)
+    step_chr = (len_chr > 1 and chr_pitch) or 0
+    step_cmp = (len_cmp > 1 and cmp_pitch) or 0
+    for i in range(len_cast):
         cmp_ord = _compare_records_trimmed(chr_array, stride, size_chr,
                                            cmp_array, stride_cmp, size_cmp,
                                            rstrip)
         if inv:
             cmp_ord = -cmp_ord
         greater_equal_than[i] = cmp_ord >= 0
-        stride += size_chr
+        stride += step_chr
         stride_cmp += step_cmp
     return greater_equal_than
 
 
 @register_jitable(**JIT_OPTIONS, locals={'cmp_ord': types.int32})
 def greater(chr_array, len_chr, size_chr,
-            cmp_array, len_cmp, size_cmp, inv=False, rstrip=True):
+            cmp_array, len_cmp, size_cmp, inv=False, rstrip=True,
+            out=None):
     """Native Implementation of np.char.greater"""
-    if 1 == size_chr == size_cmp and not rstrip:
-        return cmp_array > chr_array if inv else chr_array > cmp_array
-
-    _ensure_comparison_shape(len_chr, len_cmp)
-    greater_than = np.empty(len_chr, 'bool')
-    stride = stride_cmp = 0
-    step_cmp = (len_cmp > 1 and size_cmp) or 0
-    for i in range(len_chr):
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    cmp_array, stride_cmp, cmp_pitch = record_layout(cmp_array, size_cmp)
+    if 1 == size_chr == size_cmp and not rstrip \
+            and _has_unit_column(chr_pitch, len_chr) \
+            and _has_unit_column(cmp_pitch, len_cmp):
+        greater_than = bool_result(out, _broadcast_len(len_chr, len_cmp))
+        chr_units = unit_column(chr_array, stride, chr_pitch, len_chr)
+        cmp_units = unit_column(cmp_array, stride_cmp, cmp_pitch, len_cmp)
+        if inv:
+            return np.greater(cmp_units, chr_units, greater_than)
+        return np.greater(chr_units, cmp_units, greater_than)
+
+    _ensure_binary_shape(len_chr, len_cmp)
+    len_cast = _broadcast_len(len_chr, len_cmp)
+    greater_than = bool_result(out, len_cast)
+    step_chr = (len_chr > 1 and chr_pitch) or 0
+    step_cmp = (len_cmp > 1 and cmp_pitch) or 0
+    for i in range(len_cast):
         cmp_ord = _compare_records_trimmed(chr_array, stride, size_chr,
                                            cmp_array, stride_cmp, size_cmp,
                                            rstrip)
         if inv:
             cmp_ord = -cmp_ord
         greater_than[i] = cmp_ord > 0
-        stride += size_chr
+        stride += step_chr
         stride_cmp += step_cmp
     return greater_than
 
 
 @register_jitable(**JIT_OPTIONS)
 def _equal(chr_array, len_chr, size_chr,
-           cmp_array, len_cmp, size_cmp, rstrip, invert):
-    if 1 == size_chr == size_cmp and not rstrip:
+           cmp_array, len_cmp, size_cmp, rstrip, invert, out=None):
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    cmp_array, stride_cmp, cmp_pitch = record_layout(cmp_array, size_cmp)
+    if 1 == size_chr == size_cmp and not rstrip \
+            and _has_unit_column(chr_pitch, len_chr) \
+            and _has_unit_column(cmp_pitch, len_cmp):
+        equal_to = bool_result(out, _broadcast_len(len_chr, len_cmp))
+        chr_units = unit_column(chr_array, stride, chr_pitch, len_chr)
+        cmp_units = unit_column(cmp_array, stride_cmp, cmp_pitch, len_cmp)
         if invert:
-            return chr_array != cmp_array
+            return np.not_equal(chr_units, cmp_units, equal_to)
         else:
-            return chr_array == cmp_array
+            return np.equal(chr_units, cmp_units, equal_to)
 
-    _ensure_comparison_shape(len_chr, len_cmp)
-    equal_to = np.empty(len_chr, 'bool')
-    stride = stride_cmp = 0
-    step_cmp = (len_cmp > 1 and size_cmp) or 0
+    _ensure_binary_shape(len_chr, len_cmp)
+    len_cast = _broadcast_len(len_chr, len_cmp)
+    equal_to = bool_result(out, len_cast)
+    step_chr = (len_chr > 1 and chr_pitch) or 0
+    step_cmp = (len_cmp > 1 and cmp_pitch) or 0
     cmp_len = -1
-    if len_cmp == 1:
-        cmp_len = _comparison_record_len(cmp_array, 0, size_cmp, rstrip)
-    for i in range(len_chr):
+    if len_cmp and not step_cmp:
+        # Scalar and zero-stride comparands trim their one record once.
+        cmp_len = _comparison_record_len(cmp_array, stride_cmp, size_cmp,
+                                         rstrip)
+    for i in range(len_cast):
         result = _equal_records(chr_array, stride, size_chr,
                                 cmp_array, stride_cmp, size_cmp,
                                 rstrip, cmp_len)
         equal_to[i] = not result if invert else result
-        stride += size_chr
+        stride += step_chr
         stride_cmp += step_cmp
     return equal_to
 
 
 @register_jitable(**JIT_OPTIONS)
 def equal(chr_array, len_chr, size_chr,
-          cmp_array, len_cmp, size_cmp, rstrip=True):
+          cmp_array, len_cmp, size_cmp, rstrip=True, out=None):
     """Native Implementation of np.char.equal"""
     return _equal(chr_array, len_chr, size_chr,
-                  cmp_array, len_cmp, size_cmp, rstrip, False)
+                  cmp_array, len_cmp, size_cmp, rstrip, False, out)
 
 
 @register_jitable(**JIT_OPTIONS)
 def not_equal(chr_array, len_chr, size_chr,
-              cmp_array, len_cmp, size_cmp, rstrip=True):
+              cmp_array, len_cmp, size_cmp, rstrip=True, out=None):
     """Native Implementation of np.char.not_equal"""
     return _equal(chr_array, len_chr, size_chr,
-                  cmp_array, len_cmp, size_cmp, rstrip, True)
+                  cmp_array, len_cmp, size_cmp, rstrip, True, out)
 
 
 @register_jitable(**JIT_OPTIONS)
 def compare_chararrays(chr_array, len_chr, size_chr,
-                       cmp_array, len_cmp, size_cmp, inv, cmp, rstrip):
+                       cmp_array, len_cmp, size_cmp, inv, cmp, rstrip,
+                       out=None):
     """Native Implementation of np.char.compare_chararrays"""
     # { “<”,    “<=”,     “==”,     “>=”,   “>”,     “!=”}
     # { (60,) (60, 61), (61, 61), (62, 61), (62,), (33, 61) }
@@ -737,24 +1239,26 @@ def compare_chararrays(chr_array, len_chr, size_chr,
         cmp_ord = ord(cmp)
         if cmp_ord == 60:
             return greater(chr_array, len_chr, size_chr,
-                           cmp_array, len_cmp, size_cmp, not inv, rstrip)
+                           cmp_array, len_cmp, size_cmp, not inv, rstrip, out)
         elif cmp_ord == 62:
             return greater(chr_array, len_chr, size_chr,
-                           cmp_array, len_cmp, size_cmp, inv, rstrip)
+                           cmp_array, len_cmp, size_cmp, inv, rstrip, out)
     elif len(cmp) == 2 and ord(cmp[1]) == 61:
         cmp_ord = ord(cmp[0])
         if cmp_ord == 60:
             return greater_equal(chr_array, len_chr, size_chr,
-                                 cmp_array, len_cmp, size_cmp, not inv, rstrip)
+                                 cmp_array, len_cmp, size_cmp, not inv, rstrip,
+                                 out)
         elif cmp_ord == 61:
             return equal(chr_array, len_chr, size_chr,
-                         cmp_array, len_cmp, size_cmp, rstrip)
+                         cmp_array, len_cmp, size_cmp, rstrip, out)
         elif cmp_ord == 62:
             return greater_equal(chr_array, len_chr, size_chr,
-                                 cmp_array, len_cmp, size_cmp, inv, rstrip)
+                                 cmp_array, len_cmp, size_cmp, inv, rstrip,
+                                 out)
         elif cmp_ord == 33:
             return not_equal(chr_array, len_chr, size_chr,
-                             cmp_array, len_cmp, size_cmp, rstrip)
+                             cmp_array, len_cmp, size_cmp, rstrip, out)
     raise ValueError("comparison must be '==', '!=', '<', '>', '<=', '>='")
 
 
@@ -784,29 +1288,142 @@ def _get_sub_indices(chr_lens, len_chr, sub_lens, len_sub, start, end, i):
     return n_chr, n_sub, o, n
 
 
+def length_index(lengths, chr_array, len_chr, size_chr):
+    """Return prebuilt record lengths, or compute them when ``lengths`` is None.
+
+    Lengths from ``charex.indexed`` arrive as an int64 array; kernels called
+    without one run the usual ``str_len`` pass.
+    """
+
+
+@overload(length_index, **OPTIONS)
+def ov_length_index(lengths, chr_array, len_chr, size_chr):
+    if isinstance(lengths, (types.NoneType, types.Omitted)):
+        def impl(lengths, chr_array, len_chr, size_chr):
+            return str_len(chr_array, len_chr, size_chr)
+        return impl
+
+    def impl(lengths, chr_array, len_chr, size_chr):
+        return lengths
+    return impl
+
+
+# Needles shorter than this keep the naive shift-by-one scan; preprocessing
+# does not pay for itself until the needle spans a few code units.
+SEARCH_SHIFT_MIN_NEEDLE = 4
+
+
+@register_jitable(**JIT_OPTIONS)
+def _search_shift_table(sub_array, start, n_sub):
+    """Horspool bad-character shifts for a forward scan.
+
+    Code units are keyed by their low byte; colliding units keep the
+    smallest shift, so wide (int32) needles remain exact.
+    """
+    shift = np.full(256, max(n_sub, 1), 'int64')
+    for p in range(n_sub - 1):
+        shift[sub_array[start + p] & 255] = n_sub - 1 - p
+    return shift
+
+
+@register_jitable(**JIT_OPTIONS)
+def _search_rshift_table(sub_array, start, n_sub):
+    """Horspool bad-character shifts for a reverse scan."""
+    shift = np.full(256, max(n_sub, 1), 'int64')
+    for p in range(n_sub - 1, 0, -1):
+        shift[sub_array[start + p] & 255] = p
+    return shift
+
+
+@register_jitable(**JIT_OPTIONS)
+def _search_forward(chr_array, o, n, sub_array, start, n_sub, shift):
+    """Offset of the first needle match within chr_array[o:n], or -1."""
+    last = n_sub - 1
+    last_sub = sub_array[start + last]
+    while o + n_sub <= n:
+        chr_ord = chr_array[o + last]
+        if chr_ord == last_sub and _memcmp_array(chr_array, o,
+                                                 sub_array, start,
+                                                 last) == 0:
+            return o
+        o += shift[chr_ord & 255]
+    return -1
+
+
+@register_jitable(**JIT_OPTIONS)
+def _search_reverse(chr_array, o, n, sub_array, start, n_sub, shift):
+    """Offset of the last needle match within chr_array[o:n], or -1."""
+    first_sub = sub_array[start]
+    s = n - n_sub
+    while s >= o:
+        chr_ord = chr_array[s]
+        if chr_ord == first_sub and _memcmp_array(chr_array, s + 1,
+                                                  sub_array, start + 1,
+                                                  n_sub - 1) == 0:
+            return s
+        s -= shift[chr_ord & 255]
+    return -1
+
+
+# Shift table of needles that are scanned naively, so they allocate none.
+_NO_SHIFT = np.zeros(0, 'int64')
+
+
+@register_jitable(**JIT_OPTIONS)
+def _search_preprocess(sub_array, len_sub, sub_lens, reverse):
+    """Build the shared shift table when a scalar needle is long enough."""
+    n_sub = 0
+    if len_sub == 1 and sub_lens[0] >= SEARCH_SHIFT_MIN_NEEDLE:
+        n_sub = sub_lens[0]
+    if n_sub == 0:
+        return False, _NO_SHIFT
+    if reverse:
+        return True, _search_rshift_table(sub_array, 0, n_sub)
+    return True, _search_shift_table(sub_array, 0, n_sub)
+
+
 @register_jitable(**JIT_OPTIONS)
 def count(chr_array, len_chr, size_chr,
-          sub_array, len_sub, size_sub, start, end):
+          sub_array, len_sub, size_sub, start, end, out=None):
     """Native Implementation of np.char.count"""
+    return count_indexed(chr_array, len_chr, size_chr, None,
+                         sub_array, len_sub, size_sub, None,
+                         start, end, out)
+
+
+@register_jitable(**JIT_OPTIONS)
+def count_indexed(chr_array, len_chr, size_chr, chr_index,
+                  sub_array, len_sub, size_sub, sub_index,
+                  start, end, out=None):
+    """np.char.count reusing any precomputed record lengths."""
     _ensure_binary_shape(len_chr, len_sub)
     start, end = _init_sub_indices(start, end, size_chr)
     if start > size_chr or start > end + size_chr:
-        return np.zeros(max(len_chr, len_sub), 'int64')
+        return int_filled(out, _broadcast_len(len_chr, len_sub), 0)
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    sub_lens = str_len(sub_array, len_sub, size_sub)
+    chr_lens = length_index(chr_index, chr_array, len_chr, size_chr)
+    sub_lens = length_index(sub_index, sub_array, len_sub, size_sub)
 
-    len_cast = max(len_chr, len_sub)
-    count_sub = np.zeros(len_cast, 'int64')
+    len_cast = _broadcast_len(len_chr, len_sub)
+    count_sub = int_filled(out, len_cast, 0)
 
-    size_chr = (len_chr > 1 and size_chr) or 0
-    size_sub = (len_sub > 1 and size_sub) or 0
-    stride = stride_sub = 0
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, stride_sub, sub_pitch = record_layout(sub_array, size_sub)
+    chr_pitch = (len_chr > 1 and chr_pitch) or 0
+    sub_pitch = (len_sub > 1 and sub_pitch) or 0
+    shifted, shift = _search_preprocess(sub_array, len_sub, sub_lens, False)
     for i in range(len_cast):
         n_chr, n_sub, o, n = _get_sub_indices(chr_lens, len_chr,
                                               sub_lens, len_sub,
                                               start, end, i)
-        if n_sub:
+        if n_sub and shifted:
+            o = _search_forward(chr_array, o + stride, n + stride,
+                                sub_array, 0, n_sub, shift)
+            while o >= 0:
+                count_sub[i] += 1
+                o = _search_forward(chr_array, o + n_sub, n + stride,
+                                    sub_array, 0, n_sub, shift)
+        elif n_sub:
             o += stride
             n += stride
             while o + n_sub <= n:
@@ -819,8 +1436,8 @@ def count(chr_array, len_chr, size_chr,
                     o += n_sub
         else:
             count_sub[i] = o <= n and max(1 + n - o, 1)
-        stride += size_chr
-        stride_sub += size_sub
+        stride += chr_pitch
+        stride_sub += sub_pitch
     return count_sub
 
 
@@ -860,41 +1477,51 @@ def _record_last_nonzero_bits(chr_array, start, size_chr):
 
 
 @register_jitable(**JIT_OPTIONS)
-def _str_len_loop(chr_array, len_chr, size_chr):
-    str_length = np.empty(len_chr, 'int64')
-    stride = 0
+def _str_len_loop(chr_array, len_chr, size_chr, out=None):
+    str_length = int_result(out, len_chr)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
     for i in range(len_chr):
         length = 0
         for p in range(size_chr):
             if chr_array[stride + p]:
                 length = p + 1
         str_length[i] = length
-        stride += size_chr
+        stride += chr_pitch
     return str_length
 
 
 @register_jitable(**JIT_OPTIONS)
 def endswith(chr_array, len_chr, size_chr,
-             sub_array, len_sub, size_sub,
-             start, end):
+             sub_array, len_sub, size_sub, start, end, out=None):
     """Native Implementation of np.char.endswith"""
+    return endswith_indexed(chr_array, len_chr, size_chr, None,
+                            sub_array, len_sub, size_sub, None,
+                            start, end, out)
+
+
+@register_jitable(**JIT_OPTIONS)
+def endswith_indexed(chr_array, len_chr, size_chr, chr_index,
+                     sub_array, len_sub, size_sub, sub_index,
+                     start, end, out=None):
+    """np.char.endswith reusing any precomputed record lengths."""
     _ensure_binary_shape(len_chr, len_sub)
     start, end = _init_sub_indices(start, end, size_chr)
     if start > size_chr or start > end + size_chr:
-        return np.zeros(max(len_chr, len_sub), 'bool')
+        return bool_filled(out, _broadcast_len(len_chr, len_sub), False)
     if len_sub == 1 and start == 0 and end >= size_chr:
         return _endswith_scalar_default(chr_array, len_chr, size_chr,
-                                        sub_array, size_sub)
+                                        sub_array, size_sub, out)
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    sub_lens = str_len(sub_array, len_sub, size_sub)
+    chr_lens = length_index(chr_index, chr_array, len_chr, size_chr)
+    sub_lens = length_index(sub_index, sub_array, len_sub, size_sub)
 
-    len_cast = max(len_chr, len_sub)
-    endswith_sub = np.ones(len_cast, 'bool')
+    len_cast = _broadcast_len(len_chr, len_sub)
+    endswith_sub = bool_filled(out, len_cast, True)
 
-    size_chr = (len_chr > 1 and size_chr) or 0
-    size_sub = (len_sub > 1 and size_sub) or 0
-    stride = stride_sub = 0
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, stride_sub, sub_pitch = record_layout(sub_array, size_sub)
+    chr_pitch = (len_chr > 1 and chr_pitch) or 0
+    sub_pitch = (len_sub > 1 and sub_pitch) or 0
     for i in range(len_cast):
         n_chr, n_sub, o, n = _get_sub_indices(chr_lens, len_chr,
                                               sub_lens, len_sub,
@@ -908,16 +1535,18 @@ def endswith(chr_array, len_chr, size_chr,
                     break
         else:
             endswith_sub[i] = not n_sub and o <= n
-        stride += size_chr
-        stride_sub += size_sub
+        stride += chr_pitch
+        stride_sub += sub_pitch
     return endswith_sub
 
 
 @register_jitable(**JIT_OPTIONS)
 def _endswith_scalar_default(chr_array, len_chr, size_chr,
-                             sub_array, size_sub):
+                             sub_array, size_sub, out=None):
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, _, _ = record_layout(sub_array, size_sub)
     sub_len = _record_len(sub_array, 0, size_sub)
-    endswith_sub = np.empty(len_chr, 'bool')
+    endswith_sub = bool_result(out, len_chr)
     if sub_len == 0:
         endswith_sub[:] = True
         return endswith_sub
@@ -925,7 +1554,6 @@ def _endswith_scalar_default(chr_array, len_chr, size_chr,
         endswith_sub[:] = False
         return endswith_sub
 
-    stride = 0
     last_sub = sub_array[sub_len - 1]
     for i in range(len_chr):
         p = _record_last_nonzero(chr_array, stride, size_chr)
@@ -942,32 +1570,42 @@ def _endswith_scalar_default(chr_array, len_chr, size_chr,
                 endswith_sub[i] = _memcmp_array(chr_array, start,
                                                 sub_array, 0,
                                                 sub_len - 1) == 0
-        stride += size_chr
+        stride += chr_pitch
     return endswith_sub
 
 
 @register_jitable(**JIT_OPTIONS)
 def startswith(chr_array, len_chr, size_chr,
-               sub_array, len_sub, size_sub,
-               start, end):
+               sub_array, len_sub, size_sub, start, end, out=None):
     """Native Implementation of np.char.startswith"""
+    return startswith_indexed(chr_array, len_chr, size_chr, None,
+                              sub_array, len_sub, size_sub, None,
+                              start, end, out)
+
+
+@register_jitable(**JIT_OPTIONS)
+def startswith_indexed(chr_array, len_chr, size_chr, chr_index,
+                       sub_array, len_sub, size_sub, sub_index,
+                       start, end, out=None):
+    """np.char.startswith reusing any precomputed record lengths."""
     _ensure_binary_shape(len_chr, len_sub)
     start, end = _init_sub_indices(start, end, size_chr)
     if start > size_chr or start > end + size_chr:
-        return np.zeros(max(len_chr, len_sub), 'bool')
+        return bool_filled(out, _broadcast_len(len_chr, len_sub), False)
     if len_sub == 1 and start == 0 and end >= size_chr:
         return _startswith_scalar_default(chr_array, len_chr, size_chr,
-                                          sub_array, size_sub)
+                                          sub_array, size_sub, out)
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    sub_lens = str_len(sub_array, len_sub, size_sub)
+    chr_lens = length_index(chr_index, chr_array, len_chr, size_chr)
+    sub_lens = length_index(sub_index, sub_array, len_sub, size_sub)
 
-    len_cast = max(len_chr, len_sub)
-    startswith_sub = np.ones(len_cast, 'bool')
+    len_cast = _broadcast_len(len_chr, len_sub)
+    startswith_sub = bool_filled(out, len_cast, True)
 
-    size_chr = (len_chr > 1 and size_chr) or 0
-    size_sub = (len_sub > 1 and size_sub) or 0
-    stride = stride_sub = 0
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, stride_sub, sub_pitch = record_layout(sub_array, size_sub)
+    chr_pitch = (len_chr > 1 and chr_pitch) or 0
+    sub_pitch = (len_sub > 1 and sub_pitch) or 0
     for i in range(len_cast):
         n_chr, n_sub, o, n = _get_sub_indices(chr_lens, len_chr,
                                               sub_lens, len_sub,
@@ -980,16 +1618,18 @@ def startswith(chr_array, len_chr, size_chr,
                     break
         else:
             startswith_sub[i] = not n_sub and o <= n
-        stride += size_chr
-        stride_sub += size_sub
+        stride += chr_pitch
+        stride_sub += sub_pitch
     return startswith_sub
 
 
 @register_jitable(**JIT_OPTIONS)
 def _startswith_scalar_default(chr_array, len_chr, size_chr,
-                               sub_array, size_sub):
+                               sub_array, size_sub, out=None):
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, _, _ = record_layout(sub_array, size_sub)
     sub_len = _record_len(sub_array, 0, size_sub)
-    startswith_sub = np.empty(len_chr, 'bool')
+    startswith_sub = bool_result(out, len_chr)
     if sub_len == 0:
         startswith_sub[:] = True
         return startswith_sub
@@ -997,7 +1637,6 @@ def _startswith_scalar_default(chr_array, len_chr, size_chr,
         startswith_sub[:] = False
         return startswith_sub
 
-    stride = 0
     for i in range(len_chr):
         if chr_array[stride] != sub_array[0]:
             startswith_sub[i] = False
@@ -1006,33 +1645,50 @@ def _startswith_scalar_default(chr_array, len_chr, size_chr,
         else:
             startswith_sub[i] = _memcmp_array(chr_array, stride + 1,
                                               sub_array, 1, sub_len - 1) == 0
-        stride += size_chr
+        stride += chr_pitch
     return startswith_sub
 
 
 @register_jitable(**JIT_OPTIONS)
 def find(chr_array, len_chr, size_chr,
-         sub_array, len_sub, size_sub, start, end):
+         sub_array, len_sub, size_sub, start, end, out=None):
     """Native Implementation of np.char.find"""
+    return find_indexed(chr_array, len_chr, size_chr, None,
+                        sub_array, len_sub, size_sub, None,
+                        start, end, out)
+
+
+@register_jitable(**JIT_OPTIONS)
+def find_indexed(chr_array, len_chr, size_chr, chr_index,
+                 sub_array, len_sub, size_sub, sub_index,
+                 start, end, out=None):
+    """np.char.find reusing any precomputed record lengths."""
     _ensure_binary_shape(len_chr, len_sub)
     start, end = _init_sub_indices(start, end, size_chr)
     if start > size_chr or start > end + size_chr:
-        return -np.ones(max(len_chr, len_sub), 'int64')
+        return int_filled(out, _broadcast_len(len_chr, len_sub), -1)
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    sub_lens = str_len(sub_array, len_sub, size_sub)
+    chr_lens = length_index(chr_index, chr_array, len_chr, size_chr)
+    sub_lens = length_index(sub_index, sub_array, len_sub, size_sub)
 
-    len_cast = max(len_chr, len_sub)
-    find_sub = -np.ones(len_cast, 'int64')
+    len_cast = _broadcast_len(len_chr, len_sub)
+    find_sub = int_filled(out, len_cast, -1)
 
-    size_chr = (len_chr > 1 and size_chr) or 0
-    size_sub = (len_sub > 1 and size_sub) or 0
-    stride = stride_sub = 0
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, stride_sub, sub_pitch = record_layout(sub_array, size_sub)
+    chr_pitch = (len_chr > 1 and chr_pitch) or 0
+    sub_pitch = (len_sub > 1 and sub_pitch) or 0
+    shifted, shift = _search_preprocess(sub_array, len_sub, sub_lens, False)
     for i in range(len_cast):
         n_chr, n_sub, o, n = _get_sub_indices(chr_lens, len_chr,
                                               sub_lens, len_sub,
                                               start, end, i)
-        if n_sub:
+        if n_sub and shifted:
+            o = _search_forward(chr_array, o + stride, n + stride,
+                                sub_array, 0, n_sub, shift)
+            if o >= 0:
+                find_sub[i] = o - stride
+        elif n_sub:
             o += stride
             n += stride
             while o + n_sub <= n:
@@ -1045,38 +1701,54 @@ def find(chr_array, len_chr, size_chr,
                     break
         else:
             find_sub[i] = (o <= n and o + 1) - 1
-        stride += size_chr
-        stride_sub += size_sub
+        stride += chr_pitch
+        stride_sub += sub_pitch
     return find_sub
 
 
 @register_jitable(**JIT_OPTIONS)
 def rfind(chr_array, len_chr, size_chr,
-          sub_array, len_sub, size_sub,
-          start, end):
+          sub_array, len_sub, size_sub, start, end, out=None):
     """Native Implementation of np.char.rfind"""
+    return rfind_indexed(chr_array, len_chr, size_chr, None,
+                         sub_array, len_sub, size_sub, None,
+                         start, end, out)
+
+
+@register_jitable(**JIT_OPTIONS)
+def rfind_indexed(chr_array, len_chr, size_chr, chr_index,
+                  sub_array, len_sub, size_sub, sub_index,
+                  start, end, out=None):
+    """np.char.rfind reusing any precomputed record lengths."""
     _ensure_binary_shape(len_chr, len_sub)
     start, end = _init_sub_indices(start, end, size_chr)
     if start > size_chr or start > end + size_chr:
-        return -np.ones(max(len_chr, len_sub), 'int64')
+        return int_filled(out, _broadcast_len(len_chr, len_sub), -1)
     if len_sub == 1 and start == 0 and end >= size_chr:
         return _rfind_scalar_default(chr_array, len_chr, size_chr,
-                                     sub_array, size_sub)
+                                     sub_array, size_sub, out)
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    sub_lens = str_len(sub_array, len_sub, size_sub)
+    chr_lens = length_index(chr_index, chr_array, len_chr, size_chr)
+    sub_lens = length_index(sub_index, sub_array, len_sub, size_sub)
 
-    len_cast = max(len_chr, len_sub)
-    rfind_sub = -np.ones(len_cast, 'int64')
+    len_cast = _broadcast_len(len_chr, len_sub)
+    rfind_sub = int_filled(out, len_cast, -1)
 
-    size_chr = (len_chr > 1 and size_chr) or 0
-    size_sub = (len_sub > 1 and size_sub) or 0
-    stride = stride_sub = 0
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, stride_sub, sub_pitch = record_layout(sub_array, size_sub)
+    chr_pitch = (len_chr > 1 and chr_pitch) or 0
+    sub_pitch = (len_sub > 1 and sub_pitch) or 0
+    shifted, shift = _search_preprocess(sub_array, len_sub, sub_lens, True)
     for i in range(len_cast):
         n_chr, n_sub, o, n = _get_sub_indices(chr_lens, len_chr,
                                               sub_lens, len_sub,
                                               start, end, i)
-        if n_sub:
+        if n_sub and shifted:
+            n = _search_reverse(chr_array, o + stride, n + stride,
+                                sub_array, 0, n_sub, shift)
+            if n >= 0:
+                rfind_sub[i] = n - stride
+        elif n_sub:
             o += stride - 1
             n += stride - 1
             r = stride_sub + n_sub - 1
@@ -1090,23 +1762,34 @@ def rfind(chr_array, len_chr, size_chr,
                     break
         else:
             rfind_sub[i] = (o <= n and n + 1) - 1
-        stride += size_chr
-        stride_sub += size_sub
+        stride += chr_pitch
+        stride_sub += sub_pitch
     return rfind_sub
 
 
 @register_jitable(**JIT_OPTIONS)
 def _rfind_scalar_default(chr_array, len_chr, size_chr,
-                          sub_array, size_sub):
+                          sub_array, size_sub, out=None):
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, _, _ = record_layout(sub_array, size_sub)
     sub_len = _record_len(sub_array, 0, size_sub)
-    rfind_sub = np.empty(len_chr, 'int64')
+    rfind_sub = int_result(out, len_chr)
 
-    stride = 0
     if sub_len == 0:
         for i in range(len_chr):
             rfind_sub[i] = _record_last_nonzero(chr_array, stride, size_chr) \
                 - stride + 1
-            stride += size_chr
+            stride += chr_pitch
+        return rfind_sub
+
+    if sub_len >= SEARCH_SHIFT_MIN_NEEDLE:
+        shift = _search_rshift_table(sub_array, 0, sub_len)
+        for i in range(len_chr):
+            p = _record_last_nonzero(chr_array, stride, size_chr)
+            p = _search_reverse(chr_array, stride, p + 1,
+                                sub_array, 0, sub_len, shift)
+            rfind_sub[i] = p - stride if p >= 0 else -1
+            stride += chr_pitch
         return rfind_sub
 
     last_sub = sub_array[sub_len - 1]
@@ -1128,34 +1811,51 @@ def _rfind_scalar_default(chr_array, len_chr, size_chr,
                     rfind_sub[i] = start - stride
                     break
             p -= 1
-        stride += size_chr
+        stride += chr_pitch
     return rfind_sub
 
 
 @register_jitable(**JIT_OPTIONS)
 def index(chr_array, len_chr, size_chr,
-          sub_array, len_sub, size_sub,
-          start, end):
+          sub_array, len_sub, size_sub, start, end, out=None):
     """Native Implementation of np.char.index"""
+    return index_indexed(chr_array, len_chr, size_chr, None,
+                         sub_array, len_sub, size_sub, None,
+                         start, end, out)
+
+
+@register_jitable(**JIT_OPTIONS)
+def index_indexed(chr_array, len_chr, size_chr, chr_index,
+                  sub_array, len_sub, size_sub, sub_index,
+                  start, end, out=None):
+    """np.char.index reusing any precomputed record lengths."""
     _ensure_binary_shape(len_chr, len_sub)
     start, end = _init_sub_indices(start, end, size_chr)
     if start > size_chr or start > end + size_chr:
         raise ValueError('substring not found')
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    sub_lens = str_len(sub_array, len_sub, size_sub)
+    chr_lens = length_index(chr_index, chr_array, len_chr, size_chr)
+    sub_lens = length_index(sub_index, sub_array, len_sub, size_sub)
 
-    len_cast = max(len_chr, len_sub)
-    index_sub = -np.ones(len_cast, 'int64')
+    len_cast = _broadcast_len(len_chr, len_sub)
+    index_sub = int_filled(out, len_cast, -1)
 
-    size_chr = (len_chr > 1 and size_chr) or 0
-    size_sub = (len_sub > 1 and size_sub) or 0
-    stride = stride_sub = 0
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, stride_sub, sub_pitch = record_layout(sub_array, size_sub)
+    chr_pitch = (len_chr > 1 and chr_pitch) or 0
+    sub_pitch = (len_sub > 1 and sub_pitch) or 0
+    shifted, shift = _search_preprocess(sub_array, len_sub, sub_lens, False)
     for i in range(len_cast):
         n_chr, n_sub, o, n = _get_sub_indices(chr_lens, len_chr,
                                               sub_lens, len_sub,
                                               start, end, i)
-        if n_sub:
+        if n_sub and shifted:
+            o = _search_forward(chr_array, o + stride, n + stride,
+                                sub_array, 0, n_sub, shift)
+            if o < 0:
+                raise ValueError('substring not found')
+            index_sub[i] = o - stride
+        elif n_sub:
             o += stride
             n += stride
             while o + n_sub <= n:
@@ -1172,35 +1872,52 @@ def index(chr_array, len_chr, size_chr,
             if o > n:
                 raise ValueError('substring not found')
             index_sub[i] = o
-        stride += size_chr
-        stride_sub += size_sub
+        stride += chr_pitch
+        stride_sub += sub_pitch
     return index_sub
 
 
 @register_jitable(**JIT_OPTIONS)
 def rindex(chr_array, len_chr, size_chr,
-           sub_array, len_sub, size_sub,
-           start, end):
+           sub_array, len_sub, size_sub, start, end, out=None):
     """Native Implementation of np.char.rindex"""
+    return rindex_indexed(chr_array, len_chr, size_chr, None,
+                          sub_array, len_sub, size_sub, None,
+                          start, end, out)
+
+
+@register_jitable(**JIT_OPTIONS)
+def rindex_indexed(chr_array, len_chr, size_chr, chr_index,
+                   sub_array, len_sub, size_sub, sub_index,
+                   start, end, out=None):
+    """np.char.rindex reusing any precomputed record lengths."""
     _ensure_binary_shape(len_chr, len_sub)
     start, end = _init_sub_indices(start, end, size_chr)
     if start > size_chr or start > end + size_chr:
         raise ValueError('substring not found')
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    sub_lens = str_len(sub_array, len_sub, size_sub)
+    chr_lens = length_index(chr_index, chr_array, len_chr, size_chr)
+    sub_lens = length_index(sub_index, sub_array, len_sub, size_sub)
 
-    len_cast = max(len_chr, len_sub)
-    rfind_sub = -np.ones(len_cast, 'int64')
+    len_cast = _broadcast_len(len_chr, len_sub)
+    rfind_sub = int_filled(out, len_cast, -1)
 
-    size_chr = (len_chr > 1 and size_chr) or 0
-    size_sub = (len_sub > 1 and size_sub) or 0
-    stride = stride_sub = 0
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    sub_array, stride_sub, sub_pitch = record_layout(sub_array, size_sub)
+    chr_pitch = (len_chr > 1 and chr_pitch) or 0
+    sub_pitch = (len_sub > 1 and sub_pitch) or 0
+    shifted, shift = _search_preprocess(sub_array, len_sub, sub_lens, True)
     for i in range(len_cast):
         n_chr, n_sub, o, n = _get_sub_indices(chr_lens, len_chr,
                                               sub_lens, len_sub,
                                               start, end, i)
-        if n_sub:
+        if n_sub and shifted:
+            n = _search_reverse(chr_array, o + stride, n + stride,
+                                sub_array, 0, n_sub, shift)
+            if n < 0:
+                raise ValueError('substring not found')
+            rfind_sub[i] = n - stride
+        elif n_sub:
             o += stride - 1
             n += stride - 1
             r = stride_sub + n_sub - 1
@@ -1218,40 +1935,49 @@ def rindex(chr_array, len_chr, size_chr,
             if o > n:
                 raise ValueError('substring not found')
             rfind_sub[i] = n
-        stride += size_chr
-        stride_sub += size_sub
+        stride += chr_pitch
+        stride_sub += sub_pitch
     return rfind_sub
 
 
 @register_jitable(**JIT_OPTIONS)
-def str_len(chr_array, len_chr, size_chr):
+def str_len(chr_array, len_chr, size_chr, out=None):
     """Native Implementation of np.char.str_len"""
     if not size_chr:
-        return np.zeros(len_chr, 'int64')
+        return int_filled(out, len_chr, 0)
     if size_chr <= 16:
-        return _str_len_loop(chr_array, len_chr, size_chr)
+        return _str_len_loop(chr_array, len_chr, size_chr, out)
 
-    str_length = np.empty(len_chr, 'int64')
-    j = 0
-    for i in range(0, chr_array.size, size_chr):
-        str_length[j] = _record_last_nonzero(chr_array, i, size_chr) - i + 1
-        j += 1
+    str_length = int_result(out, len_chr)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        str_length[i] = _record_last_nonzero(chr_array, stride, size_chr) \
+            - stride + 1
+        stride += chr_pitch
     return str_length
 
 
 @register_jitable(**JIT_OPTIONS)
-def str_len_bytes(chr_array, len_chr, size_chr):
+def str_len_indexed(lengths, out=None):
+    """np.char.str_len from prebuilt record lengths."""
+    str_length = int_result(out, lengths.size)
+    str_length[:] = lengths
+    return str_length
+
+
+@register_jitable(**JIT_OPTIONS)
+def str_len_bytes(chr_array, len_chr, size_chr, out=None):
     """Native Implementation of np.char.str_len for byte arrays."""
     if not size_chr:
-        return np.zeros(len_chr, 'int64')
+        return int_filled(out, len_chr, 0)
 
-    str_length = np.empty(len_chr, 'int64')
-    j = 0
-    for i in range(0, chr_array.size, size_chr):
-        str_length[j] = _record_last_nonzero_bits(
-            chr_array, i, size_chr
-        ) - i + 1
-        j += 1
+    str_length = int_result(out, len_chr)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
+    for i in range(len_chr):
+        str_length[i] = _record_last_nonzero_bits(
+            chr_array, stride, size_chr
+        ) - stride + 1
+        stride += chr_pitch
     return str_length
 
 
@@ -1312,36 +2038,35 @@ def _unicode_ascii_space(chr_ord):
 def _isalpha_ord(chr_ord, as_bytes):
     if as_bytes or chr_ord < 128:
         return _ascii_alpha(chr_ord)
-    return bool(_PyUnicode_IsAlpha(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_ALPHA)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _isalnum_ord(chr_ord, as_bytes):
     if as_bytes or chr_ord < 128:
         return _ascii_alpha(chr_ord) or _ascii_digit(chr_ord)
-    return bool(_PyUnicode_IsAlpha(chr_ord)) \
-        or bool(_PyUnicode_IsNumeric(chr_ord))
+    return bool(unicode_flags(chr_ord) & (UNICODE_ALPHA | UNICODE_NUMERIC))
 
 
 @register_jitable(**JIT_OPTIONS)
 def _isdecimal_ord(chr_ord):
     if chr_ord < 128:
         return _ascii_digit(chr_ord)
-    return bool(_PyUnicode_IsDecimalDigit(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_DECIMAL)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _isdigit_ord(chr_ord, as_bytes):
     if as_bytes or chr_ord < 128:
         return _ascii_digit(chr_ord)
-    return bool(_PyUnicode_IsDigit(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_DIGIT)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _isnumeric_ord(chr_ord):
     if chr_ord < 128:
         return _ascii_digit(chr_ord)
-    return bool(_PyUnicode_IsNumeric(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_NUMERIC)
 
 
 @register_jitable(**JIT_OPTIONS)
@@ -1350,28 +2075,104 @@ def _isspace_ord(chr_ord, as_bytes):
         return _ascii_space(chr_ord)
     if chr_ord < 128:
         return _unicode_ascii_space(chr_ord)
-    return bool(_PyUnicode_IsSpace(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_SPACE)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _islower_ord(chr_ord, as_bytes):
     if as_bytes or chr_ord < 128:
         return _ascii_lower(chr_ord)
-    return bool(_PyUnicode_IsLowercase(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_LOWER)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _isupper_ord(chr_ord, as_bytes):
     if as_bytes or chr_ord < 128:
         return _ascii_upper(chr_ord)
-    return bool(_PyUnicode_IsUppercase(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_UPPER)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _istitle_only_ord(chr_ord, as_bytes):
     if as_bytes or chr_ord < 128:
         return False
-    return bool(_PyUnicode_IsTitlecase(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_TITLE)
+
+
+# ASCII rows: records whose code units are all below 128 are classified by
+# counting over the whole record with branch-free range checks, which the
+# compiler vectorises. Each row helper also ORs the units together, so a U
+# record that turns out not to be ASCII is rescanned by the Unicode loop;
+# bytes records are always classified this way.
+
+
+@register_jitable(**JIT_OPTIONS)
+def _ascii_property(chr_ord, as_bytes, kind):
+    """``_is_simple_property_ord`` for ASCII code units, without branches."""
+    alpha = 97 <= (chr_ord | 32) <= 122
+    digit = 48 <= chr_ord <= 57
+    if kind == 0:
+        return alpha
+    if kind == 1:
+        return alpha | digit
+    if kind == 5:
+        if as_bytes:
+            return (9 <= chr_ord <= 13) | (chr_ord == 32)
+        return (9 <= chr_ord <= 13) | (28 <= chr_ord <= 32)
+    return digit
+
+
+@register_jitable(**JIT_OPTIONS)
+def _ascii_property_row(chr_array, start, stop, as_bytes, kind):
+    """Return ``(count, high)``: units with the property, and their OR."""
+    count = 0
+    high = 0
+    for c in range(start, stop):
+        chr_ord = chr_array[c]
+        high |= chr_ord
+        count += _ascii_property(chr_ord, as_bytes, kind)
+    return count, high
+
+
+@register_jitable(**JIT_OPTIONS)
+def _ascii_case_row(chr_array, start, stop):
+    """Return ``(upper, lower, high)``: cased unit counts and their OR."""
+    upper = 0
+    lower = 0
+    high = 0
+    for c in range(start, stop):
+        chr_ord = chr_array[c]
+        high |= chr_ord
+        upper += 65 <= chr_ord <= 90
+        lower += 97 <= chr_ord <= 122
+    return upper, lower, high
+
+
+@register_jitable(**JIT_OPTIONS)
+def _ascii_title_row(chr_array, start, stop):
+    """Return ``(broken, upper, high)`` for the ``istitle`` state machine.
+
+    ``broken`` counts uppercase units after a cased unit and lowercase
+    units after an uncased one, either of which fails ``istitle``.
+    """
+    broken = 0
+    upper = 0
+    high = 0
+    cased = False
+    for c in range(start, stop):
+        chr_ord = chr_array[c]
+        is_upper = 65 <= chr_ord <= 90
+        is_lower = 97 <= chr_ord <= 122
+        high |= chr_ord
+        upper += is_upper
+        broken += (is_upper & cased) | (is_lower & (not cased))
+        cased = is_upper | is_lower
+    return broken, upper, high
+
+
+@register_jitable(**JIT_OPTIONS)
+def _is_ascii_row(high, as_bytes):
+    return as_bytes or 0 <= high < 128
 
 
 @register_jitable(**JIT_OPTIONS)
@@ -1390,13 +2191,26 @@ def _is_simple_property_ord(chr_ord, as_bytes, kind):
 
 
 @register_jitable(**JIT_OPTIONS)
-def _simple_property(chr_array, len_chr, size_chr, as_bytes, kind):
+def _simple_property(chr_array, len_chr, size_chr, as_bytes, kind, out=None):
     if not size_chr:
-        return np.zeros(len_chr, 'bool')
+        return bool_filled(out, len_chr, False)
 
-    result = np.empty(len_chr, 'bool')
-    stride = 0
+    result = bool_result(out, len_chr)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
     for i in range(len_chr):
+        first = chr_array[stride]
+        if _is_ascii_row(first, as_bytes) \
+                and not _ascii_property(first, as_bytes, kind):
+            result[i] = False
+            stride += chr_pitch
+            continue
+        stop = _record_last_nonzero(chr_array, stride, size_chr) + 1
+        count, high = _ascii_property_row(chr_array, stride, stop, as_bytes,
+                                          kind)
+        if _is_ascii_row(high, as_bytes):
+            result[i] = count > 0 and count == stop - stride
+            stride += chr_pitch
+            continue
         seen = False
         valid = True
         for c in range(size_chr):
@@ -1413,7 +2227,7 @@ def _simple_property(chr_array, len_chr, size_chr, as_bytes, kind):
                     break
                 seen = True
         result[i] = valid and seen
-        stride += size_chr
+        stride += chr_pitch
     return result
 
 
@@ -1593,54 +2407,65 @@ def scalar_strings_islower(value):
 
 
 @register_jitable(**JIT_OPTIONS)
-def isalpha(chr_array, len_chr, size_chr, as_bytes):
+def isalpha(chr_array, len_chr, size_chr, as_bytes, out=None):
     """Native Implementation of np.char.isalpha"""
-    return _simple_property(chr_array, len_chr, size_chr, as_bytes, 0)
+    return _simple_property(chr_array, len_chr, size_chr, as_bytes, 0,
+                            out)
 
 
 @register_jitable(**JIT_OPTIONS)
-def isalnum(chr_array, len_chr, size_chr, as_bytes):
+def isalnum(chr_array, len_chr, size_chr, as_bytes, out=None):
     """Native Implementation of np.char.isalnum"""
-    return _simple_property(chr_array, len_chr, size_chr, as_bytes, 1)
+    return _simple_property(chr_array, len_chr, size_chr, as_bytes, 1,
+                            out)
 
 
 @register_jitable(**JIT_OPTIONS)
-def isdecimal(chr_array, len_chr, size_chr):
+def isdecimal(chr_array, len_chr, size_chr, out=None):
     """Native Implementation of np.char.isdecimal"""
-    return _simple_property(chr_array, len_chr, size_chr, False, 2)
+    return _simple_property(chr_array, len_chr, size_chr, False, 2,
+                            out)
 
 
 @register_jitable(**JIT_OPTIONS)
-def isdigit(chr_array, len_chr, size_chr, as_bytes):
+def isdigit(chr_array, len_chr, size_chr, as_bytes, out=None):
     """Native Implementation of np.char.isdigit"""
-    return _simple_property(chr_array, len_chr, size_chr, as_bytes, 3)
+    return _simple_property(chr_array, len_chr, size_chr, as_bytes, 3,
+                            out)
 
 
 @register_jitable(**JIT_OPTIONS)
-def isnumeric(chr_array, len_chr, size_chr):
+def isnumeric(chr_array, len_chr, size_chr, out=None):
     """Native Implementation of np.char.isnumeric"""
-    return _simple_property(chr_array, len_chr, size_chr, False, 4)
+    return _simple_property(chr_array, len_chr, size_chr, False, 4,
+                            out)
 
 
 @register_jitable(**JIT_OPTIONS)
-def isspace(chr_array, len_chr, size_chr, as_bytes):
+def isspace(chr_array, len_chr, size_chr, as_bytes, out=None):
     """Native Implementation of np.char.isspace"""
-    return _simple_property(chr_array, len_chr, size_chr, as_bytes, 5)
+    return _simple_property(chr_array, len_chr, size_chr, as_bytes, 5,
+                            out)
 
 
 @register_jitable(**JIT_OPTIONS)
-def istitle(chr_array, len_chr, size_chr, as_bytes):
+def istitle(chr_array, len_chr, size_chr, as_bytes, out=None):
     """Native Implementation of np.char.istitle"""
     if not size_chr:
-        return np.zeros(len_chr, 'bool')
+        return bool_filled(out, len_chr, False)
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    is_title = np.zeros(len_chr, 'bool')
-    stride = 0
+    is_title = bool_filled(out, len_chr, False)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
     for i in range(len_chr):
+        stop = _record_last_nonzero(chr_array, stride, size_chr) + 1
+        broken, upper, high = _ascii_title_row(chr_array, stride, stop)
+        if _is_ascii_row(high, as_bytes):
+            is_title[i] = broken == 0 and upper > 0
+            stride += chr_pitch
+            continue
         cased_state = False
-        for c in range(chr_lens[i]):
-            chr_ord = chr_array[stride + c]
+        for c in range(stride, stop):
+            chr_ord = chr_array[c]
             is_lower = _islower_ord(chr_ord, as_bytes)
             is_start = _isupper_ord(chr_ord, as_bytes) \
                 or _istitle_only_ord(chr_ord, as_bytes)
@@ -1655,47 +2480,57 @@ def istitle(chr_array, len_chr, size_chr, as_bytes):
                     break
                 cased_state = is_start
                 is_title[i] |= cased_state
-        stride += size_chr
+        stride += chr_pitch
     return is_title
 
 
 @register_jitable(**JIT_OPTIONS)
-def isupper(chr_array, len_chr, size_chr, as_bytes):
+def isupper(chr_array, len_chr, size_chr, as_bytes, out=None):
     """Native Implementation of np.char.isupper"""
     if not size_chr:
-        return np.zeros(len_chr, 'bool')
+        return bool_filled(out, len_chr, False)
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    is_upper = np.zeros(len_chr, 'bool')
-    stride = 0
+    is_upper = bool_filled(out, len_chr, False)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
     for i in range(len_chr):
-        for c in range(chr_lens[i]):
-            chr_ord = chr_array[stride + c]
+        stop = _record_last_nonzero(chr_array, stride, size_chr) + 1
+        upper, lower, high = _ascii_case_row(chr_array, stride, stop)
+        if _is_ascii_row(high, as_bytes):
+            is_upper[i] = lower == 0 and upper > 0
+            stride += chr_pitch
+            continue
+        for c in range(stride, stop):
+            chr_ord = chr_array[c]
             if _islower_ord(chr_ord, as_bytes) \
                     or _istitle_only_ord(chr_ord, as_bytes):
                 is_upper[i] = False
                 break
             is_upper[i] |= _isupper_ord(chr_ord, as_bytes)
-        stride += size_chr
+        stride += chr_pitch
     return is_upper
 
 
 @register_jitable(**JIT_OPTIONS)
-def islower(chr_array, len_chr, size_chr, as_bytes):
+def islower(chr_array, len_chr, size_chr, as_bytes, out=None):
     """Native Implementation of np.char.islower"""
     if not size_chr:
-        return np.zeros(len_chr, 'bool')
+        return bool_filled(out, len_chr, False)
 
-    chr_lens = str_len(chr_array, len_chr, size_chr)
-    is_lower = np.zeros(len_chr, 'bool')
-    stride = 0
+    is_lower = bool_filled(out, len_chr, False)
+    chr_array, stride, chr_pitch = record_layout(chr_array, size_chr)
     for i in range(len_chr):
-        for c in range(chr_lens[i]):
-            chr_ord = chr_array[stride + c]
+        stop = _record_last_nonzero(chr_array, stride, size_chr) + 1
+        upper, lower, high = _ascii_case_row(chr_array, stride, stop)
+        if _is_ascii_row(high, as_bytes):
+            is_lower[i] = upper == 0 and lower > 0
+            stride += chr_pitch
+            continue
+        for c in range(stride, stop):
+            chr_ord = chr_array[c]
             if _isupper_ord(chr_ord, as_bytes) \
                     or _istitle_only_ord(chr_ord, as_bytes):
                 is_lower[i] = False
                 break
             is_lower[i] |= _islower_ord(chr_ord, as_bytes)
-        stride += size_chr
+        stride += chr_pitch
     return is_lower
@@ -0,0 +1,258 @@
+"""Chunked multi-threaded drivers for fixed-width and StringDType rows."""
+
+from charex.core import OPTIONS, OVERLOAD_JIT_OPTIONS, PARALLEL_OPTIONS
+from charex.numpy.overloads.definitions import _ensure_out_shape
+from charex.numpy.stringdtype import _PACKED_STRING_SIZE
+from numba import get_num_threads, njit, prange
+from numba.extending import overload, register_jitable
+import inspect
+import numpy as np
+
+
+# Chunks per thread; a few extra chunks even out rows of uneven cost.
+CHUNKS_PER_THREAD = 4
+
+_DRIVERS = {}
+
+
+def row_kernel(kernel, operands=1):
+    """Return a row kernel, or its parallel driver when parallel mode is on.
+
+    Drivers split the rows of one or two ordinal operands into contiguous
+    chunks and run the unchanged serial kernel on each chunk, so results
+    are identical to the serial path. Length-one operands broadcast to
+    every chunk. When the kernel's trailing ``out`` buffer is passed, each
+    chunk writes straight into its slice of it.
+    """
+    if not PARALLEL_OPTIONS['enabled']:
+        return kernel
+    min_bytes = PARALLEL_OPTIONS['min_bytes']
+    key = (kernel, operands, min_bytes)
+    driver = _DRIVERS.get(key)
+    if driver is None:
+        if operands == 1:
+            driver = _unary_driver(kernel, min_bytes)
+        else:
+            driver = _binary_driver(kernel, min_bytes)
+        _DRIVERS[key] = driver
+    return driver
+
+
+def found_kernel(index_kernel, find_kernel):
+    """Return index_kernel, or a parallel find that raises once on a miss.
+
+    Exceptions cannot leave a threaded loop, so the parallel variant of
+    index/rindex runs the matching find kernel and checks its result.
+    """
+    if not PARALLEL_OPTIONS['enabled']:
+        return index_kernel
+    driver = row_kernel(find_kernel, 2)
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def checked(chr_array, len_chr, size_chr,
+                sub_array, len_sub, size_sub, start, end, out=None):
+        result = driver(chr_array, len_chr, size_chr,
+                        sub_array, len_sub, size_sub, start, end, out)
+        for i in range(result.size):
+            if result[i] < 0:
+                raise ValueError('substring not found')
+        return result
+
+    return checked
+
+
+def stringdtype_rows(kernel):
+    """Return a StringDType row kernel, or its parallel driver.
+
+    Row kernels take ``(result, lo, hi, *args)`` with flat scalar arguments,
+    fill ``result[lo:hi]`` and return 0, or the nonzero status of the first
+    row that must raise. The caller acquires the allocator once and shares
+    it with every chunk: kernels only load strings, which is safe for
+    concurrent readers while the caller holds the allocator lock. Drivers
+    return the status of the first failing chunk, so the error raised after
+    the loop is the one the serial kernel reports.
+    """
+    if not PARALLEL_OPTIONS['enabled']:
+        return kernel
+    min_bytes = PARALLEL_OPTIONS['min_bytes']
+    key = (kernel, 'stringdtype', min_bytes)
+    driver = _DRIVERS.get(key)
+    if driver is None:
+        driver = _stringdtype_driver(kernel, min_bytes)
+        _DRIVERS[key] = driver
+    return driver
+
+
+@register_jitable(**OVERLOAD_JIT_OPTIONS)
+def chunk_count(len_cast, row_bytes, min_bytes):
+    """Number of row chunks worth running in parallel."""
+    if len_cast < 2:
+        return 1
+    chunks = min(CHUNKS_PER_THREAD * get_num_threads(), len_cast,
+                 len_cast * row_bytes // max(min_bytes, 1))
+    return max(chunks, 1)
+
+
+@register_jitable(**OVERLOAD_JIT_OPTIONS)
+def _chunk(chr_array, len_chr, size_chr, lo, hi):
+    if len_chr > 1:
+        if chr_array.ndim == 2:
+            # Strided (records, units) registration: slice whole rows.
+            return chr_array[lo:hi], hi - lo, size_chr
+        return chr_array[lo * size_chr:hi * size_chr], hi - lo, size_chr
+    return chr_array[:], len_chr, size_chr
+
+
+def _out_position(kernel, operands):
+    """Number of trailing arguments after the operands, ``out`` included."""
+    return len(inspect.signature(kernel).parameters) - 3 * operands
+
+
+def _unary_driver(kernel, min_bytes):
+    @njit(parallel=True, nogil=True)
+    def run_chunks(chr_array, len_chr, size_chr, n_chunks, args, out):
+        rows = -(-len_chr // n_chunks)
+        n_chunks = -(-len_chr // rows)
+        if out is None:
+            first = kernel(*_chunk(chr_array, len_chr, size_chr, 0, rows),
+                           *args)
+            result = np.empty(len_chr, first.dtype)
+            result[:rows] = first
+        else:
+            _ensure_out_shape(out, len_chr)
+            result = out
+            kernel(*_chunk(chr_array, len_chr, size_chr, 0, rows), *args,
+                   result[:rows])
+        for c in prange(1, n_chunks):
+            lo = c * rows
+            hi = min(lo + rows, len_chr)
+            kernel(*_chunk(chr_array, len_chr, size_chr, lo, hi), *args,
+                   result[lo:hi])
+        return result
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def run_into(chr_array, len_chr, size_chr, n_chunks, args):
+        return run_chunks(chr_array, len_chr, size_chr, n_chunks,
+                          args[:-1], args[-1])
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def run_new(chr_array, len_chr, size_chr, n_chunks, args):
+        return run_chunks(chr_array, len_chr, size_chr, n_chunks, args, None)
+
+    out_position = _out_position(kernel, 1)
+
+    def driver(chr_array, len_chr, size_chr, *args):
+        pass
+
+    @overload(driver, **OPTIONS)
+    def ov_driver(chr_array, len_chr, size_chr, *args):
+        run = run_into if len(args) == out_position else run_new
+
+        def impl(chr_array, len_chr, size_chr, *args):
+            n_chunks = chunk_count(len_chr, size_chr * chr_array.itemsize,
+                                   min_bytes)
+            if n_chunks < 2:
+                return kernel(chr_array, len_chr, size_chr, *args)
+            return run(chr_array, len_chr, size_chr, n_chunks, args)
+        return impl
+
+    return driver
+
+
+def _binary_driver(kernel, min_bytes):
+    @njit(parallel=True, nogil=True)
+    def run_chunks(chr_array, len_chr, size_chr,
+                   cmp_array, len_cmp, size_cmp, n_chunks, args, out):
+        len_cast = max(len_chr, len_cmp)
+        rows = -(-len_cast // n_chunks)
+        n_chunks = -(-len_cast // rows)
+        if out is None:
+            first = kernel(*_chunk(chr_array, len_chr, size_chr, 0, rows),
+                           *_chunk(cmp_array, len_cmp, size_cmp, 0, rows),
+                           *args)
+            result = np.empty(len_cast, first.dtype)
+            result[:rows] = first
+        else:
+            _ensure_out_shape(out, len_cast)
+            result = out
+            kernel(*_chunk(chr_array, len_chr, size_chr, 0, rows),
+                   *_chunk(cmp_array, len_cmp, size_cmp, 0, rows), *args,
+                   result[:rows])
+        for c in prange(1, n_chunks):
+            lo = c * rows
+            hi = min(lo + rows, len_cast)
+            kernel(*_chunk(chr_array, len_chr, size_chr, lo, hi),
+                   *_chunk(cmp_array, len_cmp, size_cmp, lo, hi), *args,
+                   result[lo:hi])
+        return result
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def run_into(chr_array, len_chr, size_chr,
+                 cmp_array, len_cmp, size_cmp, n_chunks, args):
+        return run_chunks(chr_array, len_chr, size_chr,
+                          cmp_array, len_cmp, size_cmp, n_chunks,
+                          args[:-1], args[-1])
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def run_new(chr_array, len_chr, size_chr,
+                cmp_array, len_cmp, size_cmp, n_chunks, args):
+        return run_chunks(chr_array, len_chr, size_chr,
+                          cmp_array, len_cmp, size_cmp, n_chunks,
+                          args, None)
+
+    out_position = _out_position(kernel, 2)
+
+    def driver(chr_array, len_chr, size_chr,
+               cmp_array, len_cmp, size_cmp, *args):
+        pass
+
+    @overload(driver, **OPTIONS)
+    def ov_driver(chr_array, len_chr, size_chr,
+                  cmp_array, len_cmp, size_cmp, *args):
+        run = run_into if len(args) == out_position else run_new
+
+        def impl(chr_array, len_chr, size_chr,
+                 cmp_array, len_cmp, size_cmp, *args):
+            len_cast = max(len_chr, len_cmp)
+            row_bytes = size_chr * chr_array.itemsize \
+                + size_cmp * cmp_array.itemsize
+            n_chunks = chunk_count(len_cast, row_bytes, min_bytes)
+            if n_chunks < 2 or (len_chr > 1 and len_cmp > 1
+                                and len_chr != len_cmp):
+                return kernel(chr_array, len_chr, size_chr,
+                              cmp_array, len_cmp, size_cmp, *args)
+            return run(chr_array, len_chr, size_chr,
+                       cmp_array, len_cmp, size_cmp, n_chunks, args)
+        return impl
+
+    return driver
+
+
+def _stringdtype_driver(kernel, min_bytes):
+    @njit(parallel=True, nogil=True)
+    def run_chunks(result, lo, hi, n_chunks, args):
+        rows = -(-(hi - lo) // n_chunks)
+        n_chunks = -(-(hi - lo) // rows)
+        status = np.zeros(n_chunks, np.int64)
+        for c in prange(n_chunks):
+            start = lo + c * rows
+            status[c] = kernel(result, start, min(start + rows, hi), *args)
+        for c in range(n_chunks):
+            if status[c] != 0:
+                return status[c]
+        return 0
+
+    def driver(result, lo, hi, *args):
+        pass
+
+    @overload(driver, **OPTIONS)
+    def ov_driver(result, lo, hi, *args):
+        def impl(result, lo, hi, *args):
+            # String bodies live out of line; count the packed elements.
+            n_chunks = chunk_count(hi - lo, _PACKED_STRING_SIZE, min_bytes)
+            if n_chunks < 2:
+                return kernel(result, lo, hi, *args)
+            return run_chunks(result, lo, hi, n_chunks, args)
+        return impl
+
+    return driver
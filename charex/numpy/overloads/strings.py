@@ -1,9 +1,10 @@
 """Numba overloads for NumPy's np.strings routines."""
 
-from charex.core import JIT_OPTIONS, OPTIONS
+from charex.core import JIT_OPTIONS, OPTIONS, OVERLOAD_JIT_OPTIONS
 from charex.numpy.overloads._shared import (
-    ensure_slice, equal_dispatch, equal_kernel, order_dispatch,
-    try_register_pair,
+    encoded_overload, ensure_out, ensure_slice, equal_dispatch,
+    equal_kernel, has_out, indexed_overload, is_masked, nd_overload,
+    order_dispatch, try_register_pair,
 )
 from charex.numpy.stringdtype import (
     _PACKED_STRING_SIZE, is_stringdtype_array_type,
@@ -63,8 +64,9 @@ from charex.numpy.stringdtype import (
 from charex.numpy.overloads.definitions import (
     equal, not_equal, equal_sub32_bytes, equal_sub32_unicode,
     not_equal_sub32_bytes, not_equal_sub32_unicode,
-    greater, greater_equal,
+    greater, greater_equal, bool_result, int_result,
 )
+from charex.numpy.overloads.parallel import stringdtype_rows
 from charex.numpy.overloads.char import (
     _CHAR_INFO_FUNCTIONS, ov_char_count, ov_char_endswith, ov_char_find,
     ov_char_index, ov_char_isalnum, ov_char_isalpha, ov_char_isdecimal,
@@ -72,8 +74,10 @@ from charex.numpy.overloads.char import (
     ov_char_istitle, ov_char_isupper, ov_char_rfind, ov_char_rindex,
     ov_char_startswith, ov_char_str_len,
 )
+from functools import wraps
+from inspect import signature
 from numba.core import types
-from numba.core.errors import NumbaValueError
+from numba.core.errors import NumbaTypeError, NumbaValueError
 from numba.core.typing.templates import AttributeTemplate
 from numba.extending import infer_getattr, overload, register_jitable
 import numpy as np
@@ -85,7 +89,7 @@ _NUMPY_LT_2_1 = _NUMPY_VERSION < (2, 1)
 
 
 def _unsupported_stringdtype_loop(op):
-    def impl(value, pattern, start=0, end=None):
+    def impl(value, pattern, start=0, end=None, out=None):
         raise TypeError(
             f"ufunc '{op}' did not contain a loop with signature matching types")
 
@@ -203,49 +207,67 @@ def _has_string_operand(left, right):
     return False
 
 
-def _numpy_fallback(op):
-    if op == 'equal':
-        def impl(left, right):
-            return np.equal(left, right)
-    elif op == 'not_equal':
-        def impl(left, right):
-            return np.not_equal(left, right)
-    elif op == 'greater_equal':
-        def impl(left, right):
-            return np.greater_equal(left, right)
-    elif op == 'greater':
-        def impl(left, right):
-            return np.greater(left, right)
-    elif op == 'less':
-        def impl(left, right):
-            return np.less(left, right)
+_NUMPY_COMPARISONS = {
+    'equal': np.equal,
+    'not_equal': np.not_equal,
+    'greater_equal': np.greater_equal,
+    'greater': np.greater,
+    'less': np.less,
+    'less_equal': np.less_equal,
+}
+
+
+def _numpy_fallback(op, out):
+    ufunc = _NUMPY_COMPARISONS[op]
+    if has_out(out):
+        def impl(left, right, out=None):
+            return ufunc(left, right, out)
     else:
-        def impl(left, right):
-            return np.less_equal(left, right)
+        def impl(left, right, out=None):
+            return ufunc(left, right)
     return impl
 
 
 @register_jitable(**JIT_OPTIONS)
-def _bytes_equal_array_array(left, right, invert):
-    if left.size != right.size:
-        raise ValueError('shape mismatch: objects cannot be broadcast to a '
-                         'single shape.  Mismatch is between arg 0 and arg 1.')
-    result = np.empty(left.size, np.bool_)
-    for i in range(left.size):
-        result[i] = (left[i] == right[i]) != invert
+def _bytes_equal_array_array(left, right, invert, out=None):
+    size = _broadcast_size(left, right)
+    result = bool_result(out, size)
+    for i in range(size):
+        result[i] = (_broadcast_item(left, i)
+                     == _broadcast_item(right, i)) != invert
     return result
 
 
 @register_jitable(**JIT_OPTIONS)
-def _bytes_equal_array_scalar(values, value, invert):
-    result = np.empty(values.size, np.bool_)
+def _bytes_equal_array_scalar(values, value, invert, out=None):
+    result = bool_result(out, values.size)
     for i in range(values.size):
         result[i] = (values[i] == value) != invert
     return result
 
 
+@register_jitable(**JIT_OPTIONS)
+def _broadcast_size(left, right):
+    """Return the result length of two broadcast-compatible 0-D/1-D operands."""
+    if left.size != right.size and left.size != 1 and right.size != 1:
+        raise ValueError('shape mismatch: objects cannot be broadcast to a '
+                         'single shape.  Mismatch is between arg 0 and arg 1.')
+    if left.size == 0 or right.size == 0:
+        return 0
+    return max(left.size, right.size)
+
+
+@register_jitable(**JIT_OPTIONS)
+def _broadcast_item(values, i):
+    """Return row ``i`` of a 1-D operand, repeating a single row."""
+    return values[i if values.size > 1 else 0]
+
+
 @register_jitable(**JIT_OPTIONS)
 def _stringdtype_step(value):
+    # A single packet repeats across a broadcast result.
+    if value.size == 1:
+        return 0
     return value.strides[0] // _PACKED_STRING_SIZE
 
 
@@ -370,14 +392,403 @@ def _utf8_stringdtype_search(value_data, start_byte, end_byte, start_index,
         start_offset, pattern_data, pattern_index, allocator)
 
 
-def _overload_equal(left, right, invert):
+# StringDType row kernels fill result[lo:hi] from flat scalar arguments, so
+# stringdtype_rows can split the rows across threads. They return 0, or the
+# status of the first row that must raise once every chunk has finished.
+_ROW_BAD_NULL = 1
+_ROW_NOT_FOUND = 2
+_PREDICATE_CODES = {
+    'isalpha': 0, 'isalnum': 1, 'isdecimal': 2, 'isdigit': 3,
+    'isnumeric': 4, 'isspace': 5, 'islower': 6, 'isupper': 7, 'istitle': 8,
+}
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_equal_unicode_rows(result, lo, hi, data, step, allocator,
+                                    value, value_length, value_size, invert):
+    for i in range(lo, hi):
+        equal_result = stringdtype_equal_unicode_data(
+            data, i * step, allocator, value, value_length, value_size)
+        result[i] = not equal_result if invert else equal_result
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_equal_utf8_rows(result, lo, hi, data, step, allocator,
+                                 value_data, value_size, invert):
+    for i in range(lo, hi):
+        equal_result = stringdtype_equal_utf8_data(
+            data, i * step, allocator, value_data, value_size)
+        result[i] = not equal_result if invert else equal_result
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_equal_unicode_na_rows(result, lo, hi, data, step, allocator,
+                                       na_kind, na_size, na_name, value,
+                                       value_length, value_size, invert):
+    for i in range(lo, hi):
+        if invert:
+            result[i] = stringdtype_not_equal_unicode_na_data(
+                data, i * step, allocator, na_kind, na_size, na_name, value,
+                value_length, value_size, False)
+        else:
+            result[i] = stringdtype_equal_unicode_na_data(
+                data, i * step, allocator, na_kind, na_size, na_name, value,
+                value_length, value_size, False)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_equal_pair_rows(result, lo, hi, left_data, left_step,
+                                 left_allocator, right_data, right_step,
+                                 right_allocator, invert):
+    for i in range(lo, hi):
+        equal_result = stringdtype_equal_data(
+            left_data, i * left_step, left_allocator,
+            right_data, i * right_step, right_allocator)
+        result[i] = not equal_result if invert else equal_result
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_equal_na_pair_rows(result, lo, hi, left_data, left_step,
+                                    left_allocator, left_na_kind,
+                                    left_na_size, left_na_name, right_data,
+                                    right_step, right_allocator,
+                                    right_na_kind, right_na_size,
+                                    right_na_name, invert):
+    for i in range(lo, hi):
+        if invert:
+            result[i] = stringdtype_not_equal_na_data(
+                left_data, i * left_step, left_allocator, left_na_kind,
+                left_na_size, left_na_name, right_data, i * right_step,
+                right_allocator, right_na_kind, right_na_size, right_na_name)
+        else:
+            result[i] = stringdtype_equal_na_data(
+                left_data, i * left_step, left_allocator, left_na_kind,
+                left_na_size, left_na_name, right_data, i * right_step,
+                right_allocator, right_na_kind, right_na_size, right_na_name)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_order_unicode_rows(result, lo, hi, data, step, allocator,
+                                    value, value_length, value_size,
+                                    op_code):
+    for i in range(lo, hi):
+        cmp_result = stringdtype_compare_unicode_data(
+            data, i * step, allocator, value, value_length, value_size)
+        result[i] = _order_result(cmp_result, op_code)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_order_utf8_rows(result, lo, hi, data, step, allocator,
+                                 value_data, value_size, op_code):
+    for i in range(lo, hi):
+        cmp_result = stringdtype_compare_utf8_data(
+            data, i * step, allocator, value_data, value_size)
+        result[i] = _order_result(cmp_result, op_code)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_order_unicode_na_rows(result, lo, hi, data, step, allocator,
+                                       na_kind, na_size, na_name, value,
+                                       value_length, value_size, op_code):
+    for i in range(lo, hi):
+        cmp_result = stringdtype_compare_unicode_na_data(
+            data, i * step, allocator, na_kind, na_size, na_name, value,
+            value_length, value_size, False)
+        if cmp_result == STRINGDTYPE_ORDER_ERROR:
+            return _ROW_BAD_NULL
+        if cmp_result == STRINGDTYPE_ORDER_FALSE:
+            result[i] = False
+        else:
+            result[i] = _order_result(cmp_result, op_code)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_order_pair_rows(result, lo, hi, left_data, left_step,
+                                 left_allocator, right_data, right_step,
+                                 right_allocator, op_code):
+    for i in range(lo, hi):
+        cmp_result = stringdtype_compare_data(
+            left_data, i * left_step, left_allocator,
+            right_data, i * right_step, right_allocator)
+        result[i] = _order_result(cmp_result, op_code)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_order_na_pair_rows(result, lo, hi, left_data, left_step,
+                                    left_allocator, left_na_kind,
+                                    left_na_size, left_na_name, right_data,
+                                    right_step, right_allocator,
+                                    right_na_kind, right_na_size,
+                                    right_na_name, op_code):
+    for i in range(lo, hi):
+        cmp_result = stringdtype_compare_na_data(
+            left_data, i * left_step, left_allocator, left_na_kind,
+            left_na_size, left_na_name, right_data, i * right_step,
+            right_allocator, right_na_kind, right_na_size, right_na_name)
+        if cmp_result == STRINGDTYPE_ORDER_ERROR:
+            return _ROW_BAD_NULL
+        if cmp_result == STRINGDTYPE_ORDER_FALSE:
+            result[i] = False
+        else:
+            result[i] = _order_result(cmp_result, op_code)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_affix_unicode_rows(result, lo, hi, data, step, allocator,
+                                    pattern, pattern_length, pattern_size,
+                                    start, end, suffix):
+    for i in range(lo, hi):
+        result[i] = _stringdtype_unicode_affix(
+            data, i * step, allocator, pattern, pattern_length,
+            pattern_size, start, end, suffix)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_affix_utf8_rows(result, lo, hi, data, step, allocator,
+                                 pattern_data, pattern_size, start, end,
+                                 suffix):
+    for i in range(lo, hi):
+        result[i] = _stringdtype_utf8_affix(
+            data, i * step, allocator, pattern_data, pattern_size, start,
+            end, suffix)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_affix_unicode_na_rows(result, lo, hi, data, step, allocator,
+                                       na_kind, na_size, na_name, pattern,
+                                       pattern_length, pattern_size, start,
+                                       end, suffix):
+    for i in range(lo, hi):
+        if suffix:
+            found = stringdtype_endswith_unicode_na_data(
+                data, i * step, allocator, na_kind, na_size, na_name,
+                pattern, pattern_length, pattern_size, start, end)
+        else:
+            found = stringdtype_startswith_unicode_na_data(
+                data, i * step, allocator, na_kind, na_size, na_name,
+                pattern, pattern_length, pattern_size, start, end)
+        if found == STRINGDTYPE_BOOL_ERROR:
+            return _ROW_BAD_NULL
+        result[i] = found == STRINGDTYPE_BOOL_TRUE
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_search_unicode_rows(result, lo, hi, data, step, allocator,
+                                     pattern, pattern_length, pattern_size,
+                                     start, end, search_op, raise_not_found):
+    for i in range(lo, hi):
+        found = _stringdtype_unicode_search(
+            data, i * step, allocator, pattern, pattern_length,
+            pattern_size, start, end, search_op)
+        if raise_not_found and found < 0:
+            return _ROW_NOT_FOUND
+        result[i] = found
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_search_utf8_rows(result, lo, hi, data, step, allocator,
+                                  pattern_data, pattern_size, start, end,
+                                  search_op, raise_not_found):
+    for i in range(lo, hi):
+        found = _stringdtype_utf8_search(
+            data, i * step, allocator, pattern_data, pattern_size, start,
+            end, search_op)
+        if raise_not_found and found < 0:
+            return _ROW_NOT_FOUND
+        result[i] = found
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_search_unicode_na_rows(result, lo, hi, data, step,
+                                        allocator, na_kind, na_size, na_name,
+                                        pattern, pattern_length,
+                                        pattern_size, start, end, search_op,
+                                        raise_not_found):
+    for i in range(lo, hi):
+        index = i * step
+        if search_op == 0:
+            found = stringdtype_find_unicode_na_data(
+                data, index, allocator, na_kind, na_size, na_name, pattern,
+                pattern_length, pattern_size, start, end)
+        elif search_op == 1:
+            found = stringdtype_rfind_unicode_na_data(
+                data, index, allocator, na_kind, na_size, na_name, pattern,
+                pattern_length, pattern_size, start, end)
+        else:
+            found = stringdtype_count_unicode_na_data(
+                data, index, allocator, na_kind, na_size, na_name, pattern,
+                pattern_length, pattern_size, start, end)
+        if found == STRINGDTYPE_SEARCH_ERROR:
+            return _ROW_BAD_NULL
+        if raise_not_found and found < 0:
+            return _ROW_NOT_FOUND
+        result[i] = found
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_predicate_rows(result, lo, hi, data, step, allocator,
+                                op_code):
+    for i in range(lo, hi):
+        index = i * step
+        if op_code == 0:
+            result[i] = stringdtype_isalpha_data(data, index, allocator)
+        elif op_code == 1:
+            result[i] = stringdtype_isalnum_data(data, index, allocator)
+        elif op_code == 2:
+            result[i] = stringdtype_isdecimal_data(data, index, allocator)
+        elif op_code == 3:
+            result[i] = stringdtype_isdigit_data(data, index, allocator)
+        elif op_code == 4:
+            result[i] = stringdtype_isnumeric_data(data, index, allocator)
+        elif op_code == 5:
+            result[i] = stringdtype_isspace_data(data, index, allocator)
+        elif op_code == 6:
+            result[i] = stringdtype_islower_data(data, index, allocator)
+        elif op_code == 7:
+            result[i] = stringdtype_isupper_data(data, index, allocator)
+        else:
+            result[i] = stringdtype_istitle_data(data, index, allocator)
+    return 0
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_predicate_na_rows(result, lo, hi, data, step, allocator,
+                                   na_kind, na_size, na_name, op_code):
+    # A null that is not NaN-like fails the row but the loop finishes, as
+    # NumPy fills the whole result before raising.
+    status = 0
+    for i in range(lo, hi):
+        index = i * step
+        if op_code == 0:
+            predicate = stringdtype_isalpha_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        elif op_code == 1:
+            predicate = stringdtype_isalnum_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        elif op_code == 2:
+            predicate = stringdtype_isdecimal_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        elif op_code == 3:
+            predicate = stringdtype_isdigit_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        elif op_code == 4:
+            predicate = stringdtype_isnumeric_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        elif op_code == 5:
+            predicate = stringdtype_isspace_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        elif op_code == 6:
+            predicate = stringdtype_islower_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        elif op_code == 7:
+            predicate = stringdtype_isupper_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        else:
+            predicate = stringdtype_istitle_na_data(
+                data, index, allocator, na_kind, na_size, na_name)
+        if predicate < 0:
+            status = _ROW_BAD_NULL
+            predicate = 0
+        result[i] = bool(predicate)
+    return status
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_str_len_rows(result, lo, hi, data, step, allocator):
+    status = 0
+    for i in range(lo, hi):
+        length = stringdtype_codepoint_len_data(data, i * step, allocator)
+        if length < 0:
+            status = _ROW_BAD_NULL
+            length = 0
+        result[i] = length
+    return status
+
+
+@register_jitable(**JIT_OPTIONS)
+def _stringdtype_str_len_na_rows(result, lo, hi, data, step, allocator,
+                                 na_kind, na_size, na_name):
+    status = 0
+    for i in range(lo, hi):
+        length = stringdtype_codepoint_len_na_data(
+            data, i * step, allocator, na_kind, na_size, na_name)
+        if length < 0:
+            status = _ROW_BAD_NULL
+            length = 0
+        result[i] = length
+    return status
+
+
+# Row kernels restricted to the valid rows of a MaskedStrings, by kernel.
+_MASKED_ROWS = {}
+
+
+def masked_rows(kernel):
+    """Return a StringDType row kernel that skips the null rows.
+
+    The result takes ``(result, lo, hi, valid, *args)``: each run of rows
+    set in the ``valid`` bitmap is passed to ``kernel``, and null rows are
+    never loaded and get a zero result. Its status is that of the first
+    failing run, so it can be wrapped by ``stringdtype_rows`` in turn.
+    """
+    rows = _MASKED_ROWS.get(kernel)
+    if rows is not None:
+        return rows
+
+    def rows(result, lo, hi, valid, *args):
+        pass
+
+    @overload(rows, **OPTIONS)
+    def ov_rows(result, lo, hi, valid, *args):
+        def impl(result, lo, hi, valid, *args):
+            status = 0
+            i = lo
+            while i < hi:
+                run = i
+                while run < hi and valid[run >> 3] >> (run & 7) & 1:
+                    run += 1
+                if run > i:
+                    run_status = kernel(result, i, run, *args)
+                    if status == 0:
+                        status = run_status
+                    i = run
+                if i < hi:
+                    result[i] = 0
+                    i += 1
+            return status
+        return impl
+
+    _MASKED_ROWS[kernel] = rows
+    return rows
+
+
+def _overload_equal(left, right, invert, out):
     left_stringdtype = is_stringdtype_array_type(left)
     right_stringdtype = is_stringdtype_array_type(right)
+    if left_stringdtype or right_stringdtype \
+            or _has_string_operand(left, right):
+        ensure_out(out, types.boolean, left, right)
     if left_stringdtype or right_stringdtype:
         use_na = _has_stringdtype_na(left, right)
         if use_na and left_stringdtype and right_stringdtype:
             if not _compatible_stringdtype_na(left, right):
-                def impl(left, right):
+                def impl(left, right, out=None):
                     raise TypeError(
                         'Cannot find a compatible null string value')
 
@@ -387,7 +798,7 @@ def _overload_equal(left, right, invert):
             _validate_stringdtype_array(left)
             left_na_kind = _stringdtype_na_kind(left)
             if left.ndim == 0:
-                def impl(left, right):
+                def impl(left, right, out=None):
                     right_value = _unicode_scalar_value(right)
                     if not stringdtype_unicode_valid(right_value):
                         raise TypeError('Invalid unicode code point found')
@@ -425,12 +836,16 @@ def _overload_equal(left, right, invert):
 
                 return impl
 
-            def impl(left, right):
+            unicode_rows = stringdtype_rows(_stringdtype_equal_unicode_rows)
+            utf8_rows = stringdtype_rows(_stringdtype_equal_utf8_rows)
+            na_rows = stringdtype_rows(_stringdtype_equal_unicode_na_rows)
+
+            def impl(left, right, out=None):
                 right_value = _unicode_scalar_value(right)
                 if not stringdtype_unicode_valid(right_value):
                     raise TypeError('Invalid unicode code point found')
                 right_parts = stringdtype_unicode_parts(right_value)
-                result = np.empty(left.size, np.bool_)
+                result = bool_result(out, left.size)
                 if left.size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(left)
@@ -438,47 +853,19 @@ def _overload_equal(left, right, invert):
                 step = _stringdtype_step(left)
                 if use_na:
                     left_na = stringdtype_na_name(left)
-                    for i in range(left.size):
-                        index = i * step
-                        if invert:
-                            result[i] = stringdtype_not_equal_unicode_na_data(
-                                data, index, allocator, left_na_kind, left_na[0],
-                                left_na[1], right_value, right_parts[0],
-                                right_parts[1], False)
-                        else:
-                            result[i] = stringdtype_equal_unicode_na_data(
-                                data, index, allocator, left_na_kind, left_na[0],
-                                left_na[1], right_value, right_parts[0],
-                                right_parts[1], False)
+                    na_rows(result, 0, left.size, data, step, allocator,
+                            left_na_kind, left_na[0], left_na[1], right_value,
+                            right_parts[0], right_parts[1], invert)
                 elif right_parts[1] > _PACKED_STRING_SIZE:
                     right_span = stringdtype_unicode_utf8_span(
                         right_value, right_parts[0], right_parts[1])
-                    if invert:
-                        for i in range(left.size):
-                            index = i * step
-                            result[i] = not stringdtype_equal_utf8_data(
-                                data, index, allocator, right_span[0],
-                                right_span[1])
-                    else:
-                        for i in range(left.size):
-                            index = i * step
-                            result[i] = stringdtype_equal_utf8_data(
-                                data, index, allocator, right_span[0],
-                                right_span[1])
+                    utf8_rows(result, 0, left.size, data, step, allocator,
+                              right_span[0], right_span[1], invert)
                     stringdtype_free_utf8_span(right_span[0], right_span[2])
                 else:
-                    if invert:
-                        for i in range(left.size):
-                            index = i * step
-                            result[i] = not stringdtype_equal_unicode_data(
-                                data, index, allocator, right_value,
-                                right_parts[0], right_parts[1])
-                    else:
-                        for i in range(left.size):
-                            index = i * step
-                            result[i] = stringdtype_equal_unicode_data(
-                                data, index, allocator, right_value,
-                                right_parts[0], right_parts[1])
+                    unicode_rows(result, 0, left.size, data, step, allocator,
+                                 right_value, right_parts[0], right_parts[1],
+                                 invert)
                 stringdtype_release_allocator(allocator)
                 return result
 
@@ -488,7 +875,7 @@ def _overload_equal(left, right, invert):
             _validate_stringdtype_array(right)
             right_na_kind = _stringdtype_na_kind(right)
             if right.ndim == 0:
-                def impl(left, right):
+                def impl(left, right, out=None):
                     left_value = _unicode_scalar_value(left)
                     if not stringdtype_unicode_valid(left_value):
                         raise TypeError('Invalid unicode code point found')
@@ -526,12 +913,12 @@ def _overload_equal(left, right, invert):
 
                 return impl
 
-            def impl(left, right):
+            def impl(left, right, out=None):
                 left_value = _unicode_scalar_value(left)
                 if not stringdtype_unicode_valid(left_value):
                     raise TypeError('Invalid unicode code point found')
                 left_parts = stringdtype_unicode_parts(left_value)
-                result = np.empty(right.size, np.bool_)
+                result = bool_result(out, right.size)
                 if right.size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(right)
@@ -591,12 +978,9 @@ def _overload_equal(left, right, invert):
             left_scalar = left.ndim == 0
             left_na_kind = _stringdtype_na_kind(left)
 
-            def impl(left, right):
-                if not left_scalar and left.size != right.size:
-                    raise ValueError('shape mismatch: objects cannot be '
-                                     'broadcast to a single shape')
-                size = right.size if left_scalar else left.size
-                result = np.empty(size, np.bool_)
+            def impl(left, right, out=None):
+                size = _broadcast_size(left, right)
+                result = bool_result(out, size)
                 if size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(left)
@@ -607,7 +991,7 @@ def _overload_equal(left, right, invert):
                 if use_na:
                     for i in range(size):
                         left_index = 0 if left_scalar else i * step
-                        right_value = _unicode_scalar_value(right[i])
+                        right_value = _unicode_scalar_value(_broadcast_item(right, i))
                         if not stringdtype_unicode_valid(right_value):
                             stringdtype_release_allocator(allocator)
                             raise TypeError('Invalid unicode code point found')
@@ -627,7 +1011,7 @@ def _overload_equal(left, right, invert):
                 elif invert:
                     for i in range(size):
                         left_index = 0 if left_scalar else i * step
-                        right_value = _unicode_scalar_value(right[i])
+                        right_value = _unicode_scalar_value(_broadcast_item(right, i))
                         if not stringdtype_unicode_valid(right_value):
                             stringdtype_release_allocator(allocator)
                             raise TypeError('Invalid unicode code point found')
@@ -638,7 +1022,7 @@ def _overload_equal(left, right, invert):
                 else:
                     for i in range(size):
                         left_index = 0 if left_scalar else i * step
-                        right_value = _unicode_scalar_value(right[i])
+                        right_value = _unicode_scalar_value(_broadcast_item(right, i))
                         if not stringdtype_unicode_valid(right_value):
                             stringdtype_release_allocator(allocator)
                             raise TypeError('Invalid unicode code point found')
@@ -657,12 +1041,9 @@ def _overload_equal(left, right, invert):
             right_scalar = right.ndim == 0
             right_na_kind = _stringdtype_na_kind(right)
 
-            def impl(left, right):
-                if not right_scalar and left.size != right.size:
-                    raise ValueError('shape mismatch: objects cannot be '
-                                     'broadcast to a single shape')
-                size = left.size
-                result = np.empty(size, np.bool_)
+            def impl(left, right, out=None):
+                size = _broadcast_size(left, right)
+                result = bool_result(out, size)
                 if size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(right)
@@ -673,7 +1054,7 @@ def _overload_equal(left, right, invert):
                 if use_na:
                     for i in range(size):
                         right_index = 0 if right_scalar else i * step
-                        left_value = _unicode_scalar_value(left[i])
+                        left_value = _unicode_scalar_value(_broadcast_item(left, i))
                         if not stringdtype_unicode_valid(left_value):
                             stringdtype_release_allocator(allocator)
                             raise TypeError('Invalid unicode code point found')
@@ -693,7 +1074,7 @@ def _overload_equal(left, right, invert):
                 elif invert:
                     for i in range(size):
                         right_index = 0 if right_scalar else i * step
-                        left_value = _unicode_scalar_value(left[i])
+                        left_value = _unicode_scalar_value(_broadcast_item(left, i))
                         if not stringdtype_unicode_valid(left_value):
                             stringdtype_release_allocator(allocator)
                             raise TypeError('Invalid unicode code point found')
@@ -704,7 +1085,7 @@ def _overload_equal(left, right, invert):
                 else:
                     for i in range(size):
                         right_index = 0 if right_scalar else i * step
-                        left_value = _unicode_scalar_value(left[i])
+                        left_value = _unicode_scalar_value(_broadcast_item(left, i))
                         if not stringdtype_unicode_valid(left_value):
                             stringdtype_release_allocator(allocator)
                             raise TypeError('Invalid unicode code point found')
@@ -720,13 +1101,13 @@ def _overload_equal(left, right, invert):
         if left_stringdtype and _is_none(right):
             _validate_stringdtype_array(left)
             if left.ndim == 0:
-                def impl(left, right):
+                def impl(left, right, out=None):
                     return True if invert else False
 
                 return impl
 
-            def impl(left, right):
-                result = np.empty(left.size, np.bool_)
+            def impl(left, right, out=None):
+                result = bool_result(out, left.size)
                 for i in range(left.size):
                     result[i] = True if invert else False
                 return result
@@ -736,13 +1117,13 @@ def _overload_equal(left, right, invert):
         if _is_none(left) and right_stringdtype:
             _validate_stringdtype_array(right)
             if right.ndim == 0:
-                def impl(left, right):
+                def impl(left, right, out=None):
                     return True if invert else False
 
                 return impl
 
-            def impl(left, right):
-                result = np.empty(right.size, np.bool_)
+            def impl(left, right, out=None):
+                result = bool_result(out, right.size)
                 for i in range(right.size):
                     result[i] = True if invert else False
                 return result
@@ -758,7 +1139,7 @@ def _overload_equal(left, right, invert):
         right_na_kind = _stringdtype_na_kind(right)
 
         if left.ndim == 0 and right.ndim == 0:
-            def impl(left, right):
+            def impl(left, right, out=None):
                 allocators = stringdtype_acquire_allocators(left, right)
                 if use_na:
                     left_na = stringdtype_na_name(left)
@@ -790,61 +1171,31 @@ def _overload_equal(left, right, invert):
 
         left_scalar = left.ndim == 0
         right_scalar = right.ndim == 0
+        pair_rows = stringdtype_rows(_stringdtype_equal_pair_rows)
+        na_pair_rows = stringdtype_rows(_stringdtype_equal_na_pair_rows)
 
-        def impl(left, right):
-            if not left_scalar and not right_scalar and left.size != right.size:
-                raise ValueError('shape mismatch: objects cannot be '
-                                 'broadcast to a single shape')
-            size = right.size if left_scalar else left.size
-            result = np.empty(size, np.bool_)
+        def impl(left, right, out=None):
+            size = _broadcast_size(left, right)
+            result = bool_result(out, size)
             if size == 0:
                 return result
             allocators = stringdtype_acquire_allocators(left, right)
-            left_allocator = allocators[0]
-            right_allocator = allocators[1]
             left_data = stringdtype_data_ptr(left)
             right_data = stringdtype_data_ptr(right)
-            left_step = 1 if left_scalar else _stringdtype_step(left)
-            right_step = 1 if right_scalar else _stringdtype_step(right)
+            left_step = 0 if left_scalar else _stringdtype_step(left)
+            right_step = 0 if right_scalar else _stringdtype_step(right)
             if use_na:
                 left_na = stringdtype_na_name(left)
                 right_na = stringdtype_na_name(right)
-            if use_na:
-                for i in range(size):
-                    left_index = 0 if left_scalar else i * left_step
-                    right_index = 0 if right_scalar else i * right_step
-                    if invert:
-                        result[i] = stringdtype_not_equal_na_data(
-                            left_data, left_index,
-                            left_allocator, left_na_kind, left_na[0],
-                            left_na[1], right_data,
-                            right_index, right_allocator,
-                            right_na_kind, right_na[0], right_na[1],
-                        )
-                    else:
-                        result[i] = stringdtype_equal_na_data(
-                            left_data, left_index,
-                            left_allocator, left_na_kind, left_na[0],
-                            left_na[1], right_data,
-                            right_index, right_allocator,
-                            right_na_kind, right_na[0], right_na[1],
-                        )
-            elif invert:
-                for i in range(size):
-                    left_index = 0 if left_scalar else i * left_step
-                    right_index = 0 if right_scalar else i * right_step
-                    result[i] = not stringdtype_equal_data(
-                        left_data, left_index, left_allocator,
-                        right_data, right_index, right_allocator,
-                    )
+                na_pair_rows(result, 0, size, left_data, left_step,
+                             allocators[0], left_na_kind, left_na[0],
+                             left_na[1], right_data, right_step,
+                             allocators[1], right_na_kind, right_na[0],
+                             right_na[1], invert)
             else:
-                for i in range(size):
-                    left_index = 0 if left_scalar else i * left_step
-                    right_index = 0 if right_scalar else i * right_step
-                    result[i] = stringdtype_equal_data(
-                        left_data, left_index, left_allocator,
-                        right_data, right_index, right_allocator,
-                    )
+                pair_rows(result, 0, size, left_data, left_step,
+                          allocators[0], right_data, right_step,
+                          allocators[1], invert)
             stringdtype_release_allocators(allocators)
             return result
 
@@ -854,23 +1205,23 @@ def _overload_equal(left, right, invert):
     right_bytes_array = _is_bytes_array(right)
     if left_bytes_array and right_bytes_array \
             and left.ndim == right.ndim == 1:
-        def impl(left, right):
-            return _bytes_equal_array_array(left, right, invert)
+        def impl(left, right, out=None):
+            return _bytes_equal_array_array(left, right, invert, out)
         return impl
     if left_bytes_array and left.ndim == 1 and _is_bytes_scalar(right):
-        def impl(left, right):
-            return _bytes_equal_array_scalar(left, right, invert)
+        def impl(left, right, out=None):
+            return _bytes_equal_array_scalar(left, right, invert, out)
         return impl
     if right_bytes_array and right.ndim == 1 and _is_bytes_scalar(left):
-        def impl(left, right):
-            return _bytes_equal_array_scalar(right, left, invert)
+        def impl(left, right, out=None):
+            return _bytes_equal_array_scalar(right, left, invert, out)
         return impl
 
     registered = try_register_pair(left, right)
     if registered is None:
         if _has_string_operand(left, right):
             return None
-        return _numpy_fallback('not_equal' if invert else 'equal')
+        return _numpy_fallback('not_equal' if invert else 'equal', out)
 
     if invert:
         kernel = equal_kernel(left, right, not_equal, not_equal_sub32_bytes,
@@ -883,14 +1234,17 @@ def _overload_equal(left, right, invert):
                           kernel, False)
 
 
-def _overload_order(left, right, op):
+def _overload_order(left, right, op, out):
     left_stringdtype = is_stringdtype_array_type(left)
     right_stringdtype = is_stringdtype_array_type(right)
+    if left_stringdtype or right_stringdtype \
+            or _has_string_operand(left, right):
+        ensure_out(out, types.boolean, left, right)
     if left_stringdtype or right_stringdtype:
         use_na = _has_stringdtype_na(left, right)
         if use_na and left_stringdtype and right_stringdtype:
             if not _compatible_stringdtype_na(left, right):
-                def impl(left, right):
+                def impl(left, right, out=None):
                     raise TypeError(
                         'Cannot find a compatible null string value')
 
@@ -909,7 +1263,7 @@ def _overload_order(left, right, op):
             _validate_stringdtype_array(left)
             left_na_kind = _stringdtype_na_kind(left)
             if left.ndim == 0:
-                def impl(left, right):
+                def impl(left, right, out=None):
                     right_value = _unicode_scalar_value(right)
                     if not stringdtype_unicode_valid(right_value):
                         raise TypeError('Invalid unicode code point found')
@@ -940,52 +1294,40 @@ def _overload_order(left, right, op):
 
                 return impl
 
-            def impl(left, right):
+            unicode_rows = stringdtype_rows(_stringdtype_order_unicode_rows)
+            utf8_rows = stringdtype_rows(_stringdtype_order_utf8_rows)
+            na_rows = stringdtype_rows(_stringdtype_order_unicode_na_rows)
+
+            def impl(left, right, out=None):
                 right_value = _unicode_scalar_value(right)
                 if not stringdtype_unicode_valid(right_value):
                     raise TypeError('Invalid unicode code point found')
                 right_parts = stringdtype_unicode_parts(right_value)
-                result = np.empty(left.size, np.bool_)
+                result = bool_result(out, left.size)
                 if left.size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(left)
                 data = stringdtype_data_ptr(left)
                 step = _stringdtype_step(left)
-                bad_order = False
+                status = 0
                 if use_na:
                     left_na = stringdtype_na_name(left)
-                    for i in range(left.size):
-                        index = i * step
-                        cmp_result = stringdtype_compare_unicode_na_data(
-                            data, index, allocator, left_na_kind, left_na[0],
-                            left_na[1], right_value, right_parts[0],
-                            right_parts[1], False)
-                        if cmp_result == STRINGDTYPE_ORDER_ERROR:
-                            bad_order = True
-                            break
-                        if cmp_result == STRINGDTYPE_ORDER_FALSE:
-                            result[i] = False
-                        else:
-                            result[i] = _order_result(cmp_result, op_code)
+                    status = na_rows(result, 0, left.size, data, step,
+                                     allocator, left_na_kind, left_na[0],
+                                     left_na[1], right_value, right_parts[0],
+                                     right_parts[1], op_code)
                 elif right_parts[1] > _PACKED_STRING_SIZE:
                     right_span = stringdtype_unicode_utf8_span(
                         right_value, right_parts[0], right_parts[1])
-                    for i in range(left.size):
-                        index = i * step
-                        cmp_result = stringdtype_compare_utf8_data(
-                            data, index, allocator, right_span[0],
-                            right_span[1])
-                        result[i] = _order_result(cmp_result, op_code)
+                    utf8_rows(result, 0, left.size, data, step, allocator,
+                              right_span[0], right_span[1], op_code)
                     stringdtype_free_utf8_span(right_span[0], right_span[2])
                 else:
-                    for i in range(left.size):
-                        index = i * step
-                        cmp_result = stringdtype_compare_unicode_data(
-                            data, index, allocator, right_value,
-                            right_parts[0], right_parts[1])
-                        result[i] = _order_result(cmp_result, op_code)
+                    unicode_rows(result, 0, left.size, data, step, allocator,
+                                 right_value, right_parts[0], right_parts[1],
+                                 op_code)
                 stringdtype_release_allocator(allocator)
-                if use_na and bad_order:
+                if use_na and status != 0:
                     raise ValueError(
                         'StringDType ordering is not supported for this null '
                         'value')
@@ -997,7 +1339,7 @@ def _overload_order(left, right, op):
             _validate_stringdtype_array(right)
             right_na_kind = _stringdtype_na_kind(right)
             if right.ndim == 0:
-                def impl(left, right):
+                def impl(left, right, out=None):
                     left_value = _unicode_scalar_value(left)
                     if not stringdtype_unicode_valid(left_value):
                         raise TypeError('Invalid unicode code point found')
@@ -1030,12 +1372,12 @@ def _overload_order(left, right, op):
 
                 return impl
 
-            def impl(left, right):
+            def impl(left, right, out=None):
                 left_value = _unicode_scalar_value(left)
                 if not stringdtype_unicode_valid(left_value):
                     raise TypeError('Invalid unicode code point found')
                 left_parts = stringdtype_unicode_parts(left_value)
-                result = np.empty(right.size, np.bool_)
+                result = bool_result(out, right.size)
                 if right.size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(right)
@@ -1084,12 +1426,9 @@ def _overload_order(left, right, op):
             left_scalar = left.ndim == 0
             left_na_kind = _stringdtype_na_kind(left)
 
-            def impl(left, right):
-                if not left_scalar and left.size != right.size:
-                    raise ValueError('shape mismatch: objects cannot be '
-                                     'broadcast to a single shape')
-                size = right.size if left_scalar else left.size
-                result = np.empty(size, np.bool_)
+            def impl(left, right, out=None):
+                size = _broadcast_size(left, right)
+                result = bool_result(out, size)
                 if size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(left)
@@ -1100,7 +1439,7 @@ def _overload_order(left, right, op):
                     left_na = stringdtype_na_name(left)
                 for i in range(size):
                     left_index = 0 if left_scalar else i * step
-                    right_value = _unicode_scalar_value(right[i])
+                    right_value = _unicode_scalar_value(_broadcast_item(right, i))
                     if not stringdtype_unicode_valid(right_value):
                         stringdtype_release_allocator(allocator)
                         raise TypeError('Invalid unicode code point found')
@@ -1138,12 +1477,9 @@ def _overload_order(left, right, op):
             right_scalar = right.ndim == 0
             right_na_kind = _stringdtype_na_kind(right)
 
-            def impl(left, right):
-                if not right_scalar and left.size != right.size:
-                    raise ValueError('shape mismatch: objects cannot be '
-                                     'broadcast to a single shape')
-                size = left.size
-                result = np.empty(size, np.bool_)
+            def impl(left, right, out=None):
+                size = _broadcast_size(left, right)
+                result = bool_result(out, size)
                 if size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(right)
@@ -1154,7 +1490,7 @@ def _overload_order(left, right, op):
                     right_na = stringdtype_na_name(right)
                 for i in range(size):
                     right_index = 0 if right_scalar else i * step
-                    left_value = _unicode_scalar_value(left[i])
+                    left_value = _unicode_scalar_value(_broadcast_item(left, i))
                     if not stringdtype_unicode_valid(left_value):
                         stringdtype_release_allocator(allocator)
                         raise TypeError('Invalid unicode code point found')
@@ -1194,7 +1530,7 @@ def _overload_order(left, right, op):
         right_na_kind = _stringdtype_na_kind(right)
 
         if left.ndim == 0 and right.ndim == 0:
-            def impl(left, right):
+            def impl(left, right, out=None):
                 allocators = stringdtype_acquire_allocators(left, right)
                 if use_na:
                     left_na = stringdtype_na_name(left)
@@ -1218,51 +1554,35 @@ def _overload_order(left, right, op):
 
         left_scalar = left.ndim == 0
         right_scalar = right.ndim == 0
+        pair_rows = stringdtype_rows(_stringdtype_order_pair_rows)
+        na_pair_rows = stringdtype_rows(_stringdtype_order_na_pair_rows)
 
-        def impl(left, right):
-            if not left_scalar and not right_scalar and left.size != right.size:
-                raise ValueError('shape mismatch: objects cannot be '
-                                 'broadcast to a single shape')
-            size = right.size if left_scalar else left.size
-            result = np.empty(size, np.bool_)
+        def impl(left, right, out=None):
+            size = _broadcast_size(left, right)
+            result = bool_result(out, size)
             if size == 0:
                 return result
             allocators = stringdtype_acquire_allocators(left, right)
-            left_allocator = allocators[0]
-            right_allocator = allocators[1]
             left_data = stringdtype_data_ptr(left)
             right_data = stringdtype_data_ptr(right)
-            left_step = 1 if left_scalar else _stringdtype_step(left)
-            right_step = 1 if right_scalar else _stringdtype_step(right)
-            bad_order = False
+            left_step = 0 if left_scalar else _stringdtype_step(left)
+            right_step = 0 if right_scalar else _stringdtype_step(right)
+            status = 0
             if use_na:
                 left_na = stringdtype_na_name(left)
                 right_na = stringdtype_na_name(right)
-            for i in range(size):
-                left_index = 0 if left_scalar else i * left_step
-                right_index = 0 if right_scalar else i * right_step
-                if use_na:
-                    cmp_result = stringdtype_compare_na_data(
-                        left_data, left_index, left_allocator,
-                        left_na_kind, left_na[0], left_na[1],
-                        right_data, right_index, right_allocator,
-                        right_na_kind, right_na[0], right_na[1],
-                    )
-                    if cmp_result == STRINGDTYPE_ORDER_ERROR:
-                        bad_order = True
-                        break
-                    if cmp_result == STRINGDTYPE_ORDER_FALSE:
-                        result[i] = False
-                    else:
-                        result[i] = _order_result(cmp_result, op_code)
-                else:
-                    cmp_result = stringdtype_compare_data(
-                        left_data, left_index, left_allocator,
-                        right_data, right_index, right_allocator,
-                    )
-                    result[i] = _order_result(cmp_result, op_code)
+                status = na_pair_rows(result, 0, size, left_data, left_step,
+                                      allocators[0], left_na_kind,
+                                      left_na[0], left_na[1], right_data,
+                                      right_step, allocators[1],
+                                      right_na_kind, right_na[0],
+                                      right_na[1], op_code)
+            else:
+                pair_rows(result, 0, size, left_data, left_step,
+                          allocators[0], right_data, right_step,
+                          allocators[1], op_code)
             stringdtype_release_allocators(allocators)
-            if use_na and bad_order:
+            if use_na and status != 0:
                 raise ValueError(
                     'StringDType ordering is not supported for this null value')
             return result
@@ -1273,33 +1593,34 @@ def _overload_order(left, right, op):
     if registered is None:
         if _has_string_operand(left, right):
             return None
-        return _numpy_fallback(op)
+        return _numpy_fallback(op, out)
 
     register_left, register_right, left_dim, right_dim = registered
     return order_dispatch(register_left, register_right, left_dim, right_dim,
                           greater, greater_equal, op, False)
 
 
-def _overload_affix(value, pattern, start, end, suffix):
+def _overload_affix(value, pattern, start, end, suffix, out):
     value_stringdtype = is_stringdtype_array_type(value)
     pattern_stringdtype = is_stringdtype_array_type(pattern)
     if value_stringdtype or pattern_stringdtype:
         use_na = _has_stringdtype_na(value, pattern)
         if use_na and value_stringdtype and pattern_stringdtype:
             if not _compatible_stringdtype_na(value, pattern):
-                def impl(value, pattern, start=0, end=None):
+                def impl(value, pattern, start=0, end=None, out=None):
                     raise TypeError(
                         'Cannot find a compatible null string value')
 
                 return impl
 
         s, e = ensure_slice(start, end)
+        ensure_out(out, types.boolean, value, pattern)
 
         if value_stringdtype and _is_unicode_scalar_like(pattern):
             _validate_stringdtype_array(value)
             value_na_kind = _stringdtype_na_kind(value)
             if value.ndim == 0:
-                def impl(value, pattern, start=0, end=None):
+                def impl(value, pattern, start=0, end=None, out=None):
                     pattern_value = _unicode_scalar_value(pattern)
                     if not stringdtype_unicode_valid(pattern_value):
                         raise TypeError('Invalid unicode code point found')
@@ -1339,55 +1660,45 @@ def _overload_affix(value, pattern, start, end, suffix):
 
                 return impl
 
-            def impl(value, pattern, start=0, end=None):
+            unicode_rows = stringdtype_rows(_stringdtype_affix_unicode_rows)
+            utf8_rows = stringdtype_rows(_stringdtype_affix_utf8_rows)
+            na_rows = stringdtype_rows(_stringdtype_affix_unicode_na_rows)
+
+            def impl(value, pattern, start=0, end=None, out=None):
                 pattern_value = _unicode_scalar_value(pattern)
                 if not stringdtype_unicode_valid(pattern_value):
                     raise TypeError('Invalid unicode code point found')
                 pattern_parts = stringdtype_unicode_parts(pattern_value)
                 start = start or s
                 end = e if end is None else end
-                result = np.empty(value.size, np.bool_)
+                result = bool_result(out, value.size)
                 if value.size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(value)
                 data = stringdtype_data_ptr(value)
                 step = _stringdtype_step(value)
-                bad_null = False
+                status = 0
                 if use_na:
                     value_na = stringdtype_na_name(value)
-                    for i in range(value.size):
-                        index = i * step
-                        found = stringdtype_endswith_unicode_na_data(
-                            data, index, allocator, value_na_kind, value_na[0],
-                            value_na[1], pattern_value, pattern_parts[0],
-                            pattern_parts[1], start, end) if suffix \
-                            else stringdtype_startswith_unicode_na_data(
-                                data, index, allocator, value_na_kind,
-                                value_na[0], value_na[1], pattern_value,
-                                pattern_parts[0], pattern_parts[1], start, end)
-                        if found == STRINGDTYPE_BOOL_ERROR:
-                            bad_null = True
-                            break
-                        result[i] = found == STRINGDTYPE_BOOL_TRUE
+                    status = na_rows(result, 0, value.size, data, step,
+                                     allocator, value_na_kind, value_na[0],
+                                     value_na[1], pattern_value,
+                                     pattern_parts[0], pattern_parts[1],
+                                     start, end, suffix)
                 elif pattern_parts[1] > _PACKED_STRING_SIZE:
                     pattern_span = stringdtype_unicode_utf8_span(
                         pattern_value, pattern_parts[0], pattern_parts[1])
-                    for i in range(value.size):
-                        index = i * step
-                        result[i] = _stringdtype_utf8_affix(
-                            data, index, allocator, pattern_span[0],
-                            pattern_span[1], start, end, suffix)
+                    utf8_rows(result, 0, value.size, data, step, allocator,
+                              pattern_span[0], pattern_span[1], start, end,
+                              suffix)
                     stringdtype_free_utf8_span(pattern_span[0],
                                                pattern_span[2])
                 else:
-                    for i in range(value.size):
-                        index = i * step
-                        result[i] = _stringdtype_unicode_affix(
-                            data, index, allocator, pattern_value,
-                            pattern_parts[0], pattern_parts[1], start, end,
-                            suffix)
+                    unicode_rows(result, 0, value.size, data, step,
+                                 allocator, pattern_value, pattern_parts[0],
+                                 pattern_parts[1], start, end, suffix)
                 stringdtype_release_allocator(allocator)
-                if use_na and bad_null:
+                if use_na and status != 0:
                     raise ValueError(
                         'StringDType operation is not supported for this null '
                         'value')
@@ -1404,7 +1715,7 @@ def _overload_affix(value, pattern, start, end, suffix):
             _validate_stringdtype_array(pattern)
             pattern_na_kind = _stringdtype_na_kind(pattern)
             if pattern.ndim == 0:
-                def impl(value, pattern, start=0, end=None):
+                def impl(value, pattern, start=0, end=None, out=None):
                     value_value = _unicode_scalar_value(value)
                     if not stringdtype_unicode_valid(value_value):
                         raise TypeError('Invalid unicode code point found')
@@ -1441,14 +1752,14 @@ def _overload_affix(value, pattern, start, end, suffix):
 
                 return impl
 
-            def impl(value, pattern, start=0, end=None):
+            def impl(value, pattern, start=0, end=None, out=None):
                 value_value = _unicode_scalar_value(value)
                 if not stringdtype_unicode_valid(value_value):
                     raise TypeError('Invalid unicode code point found')
                 value_parts = stringdtype_unicode_parts(value_value)
                 start = start or s
                 end = e if end is None else end
-                result = np.empty(pattern.size, np.bool_)
+                result = bool_result(out, pattern.size)
                 if pattern.size == 0:
                     return result
                 value_span = stringdtype_unicode_utf8_span(
@@ -1499,14 +1810,11 @@ def _overload_affix(value, pattern, start, end, suffix):
             value_scalar = value.ndim == 0
             value_na_kind = _stringdtype_na_kind(value)
 
-            def impl(value, pattern, start=0, end=None):
+            def impl(value, pattern, start=0, end=None, out=None):
                 start = start or s
                 end = e if end is None else end
-                if not value_scalar and value.size != pattern.size:
-                    raise ValueError('shape mismatch: objects cannot be '
-                                     'broadcast to a single shape')
-                size = pattern.size if value_scalar else value.size
-                result = np.empty(size, np.bool_)
+                size = _broadcast_size(value, pattern)
+                result = bool_result(out, size)
                 if size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(value)
@@ -1517,7 +1825,7 @@ def _overload_affix(value, pattern, start, end, suffix):
                     value_na = stringdtype_na_name(value)
                 for i in range(size):
                     value_index = 0 if value_scalar else i * step
-                    pattern_value = _unicode_scalar_value(pattern[i])
+                    pattern_value = _unicode_scalar_value(_broadcast_item(pattern, i))
                     if not stringdtype_unicode_valid(pattern_value):
                         stringdtype_release_allocator(allocator)
                         raise TypeError('Invalid unicode code point found')
@@ -1558,14 +1866,11 @@ def _overload_affix(value, pattern, start, end, suffix):
             pattern_scalar = pattern.ndim == 0
             pattern_na_kind = _stringdtype_na_kind(pattern)
 
-            def impl(value, pattern, start=0, end=None):
+            def impl(value, pattern, start=0, end=None, out=None):
                 start = start or s
                 end = e if end is None else end
-                if not pattern_scalar and value.size != pattern.size:
-                    raise ValueError('shape mismatch: objects cannot be '
-                                     'broadcast to a single shape')
-                size = value.size
-                result = np.empty(size, np.bool_)
+                size = _broadcast_size(value, pattern)
+                result = bool_result(out, size)
                 if size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(pattern)
@@ -1576,7 +1881,7 @@ def _overload_affix(value, pattern, start, end, suffix):
                     pattern_na = stringdtype_na_name(pattern)
                 for i in range(size):
                     pattern_index = 0 if pattern_scalar else i * step
-                    value_value = _unicode_scalar_value(value[i])
+                    value_value = _unicode_scalar_value(_broadcast_item(value, i))
                     if not stringdtype_unicode_valid(value_value):
                         stringdtype_release_allocator(allocator)
                         raise TypeError('Invalid unicode code point found')
@@ -1627,7 +1932,7 @@ def _overload_affix(value, pattern, start, end, suffix):
         pattern_empty_null = value_na_kind == 0
 
         if value.ndim == 0 and pattern.ndim == 0:
-            def impl(value, pattern, start=0, end=None):
+            def impl(value, pattern, start=0, end=None, out=None):
                 start = start or s
                 end = e if end is None else end
                 allocators = stringdtype_acquire_allocators(value, pattern)
@@ -1668,15 +1973,11 @@ def _overload_affix(value, pattern, start, end, suffix):
         value_scalar = value.ndim == 0
         pattern_scalar = pattern.ndim == 0
 
-        def impl(value, pattern, start=0, end=None):
+        def impl(value, pattern, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            if not value_scalar and not pattern_scalar \
-                    and value.size != pattern.size:
-                raise ValueError('shape mismatch: objects cannot be '
-                                 'broadcast to a single shape')
-            size = pattern.size if value_scalar else value.size
-            result = np.empty(size, np.bool_)
+            size = _broadcast_size(value, pattern)
+            result = bool_result(out, size)
             if size == 0:
                 return result
             allocators = stringdtype_acquire_allocators(value, pattern)
@@ -1733,24 +2034,25 @@ def _overload_affix(value, pattern, start, end, suffix):
         return impl
 
     if suffix:
-        return ov_char_endswith(value, pattern, start, end)
-    return ov_char_startswith(value, pattern, start, end)
+        return ov_char_endswith(value, pattern, start, end, out)
+    return ov_char_startswith(value, pattern, start, end, out)
 
 
-def _overload_search(value, pattern, start, end, op):
+def _overload_search(value, pattern, start, end, op, out):
     value_stringdtype = is_stringdtype_array_type(value)
     pattern_stringdtype = is_stringdtype_array_type(pattern)
     if value_stringdtype or pattern_stringdtype:
         use_na = _has_stringdtype_na(value, pattern)
         if use_na and value_stringdtype and pattern_stringdtype:
             if not _compatible_stringdtype_na(value, pattern):
-                def impl(value, pattern, start=0, end=None):
+                def impl(value, pattern, start=0, end=None, out=None):
                     raise TypeError(
                         'Cannot find a compatible null string value')
 
                 return impl
 
         s, e = ensure_slice(start, end)
+        ensure_out(out, types.int64, value, pattern)
         forward = op == 'find' or op == 'index'
         reverse = op == 'rfind' or op == 'rindex'
         raise_not_found = op == 'index' or op == 'rindex'
@@ -1760,7 +2062,7 @@ def _overload_search(value, pattern, start, end, op):
             _validate_stringdtype_array(value)
             value_na_kind = _stringdtype_na_kind(value)
             if value.ndim == 0:
-                def impl(value, pattern, start=0, end=None):
+                def impl(value, pattern, start=0, end=None, out=None):
                     pattern_value = _unicode_scalar_value(pattern)
                     if not stringdtype_unicode_valid(pattern_value):
                         raise TypeError('Invalid unicode code point found')
@@ -1805,81 +2107,51 @@ def _overload_search(value, pattern, start, end, op):
 
                 return impl
 
-            def impl(value, pattern, start=0, end=None):
+            unicode_rows = stringdtype_rows(_stringdtype_search_unicode_rows)
+            utf8_rows = stringdtype_rows(_stringdtype_search_utf8_rows)
+            na_rows = stringdtype_rows(_stringdtype_search_unicode_na_rows)
+
+            def impl(value, pattern, start=0, end=None, out=None):
                 pattern_value = _unicode_scalar_value(pattern)
                 if not stringdtype_unicode_valid(pattern_value):
                     raise TypeError('Invalid unicode code point found')
                 pattern_parts = stringdtype_unicode_parts(pattern_value)
                 start = start or s
                 end = e if end is None else end
-                result = np.empty(value.size, np.int64)
+                result = int_result(out, value.size)
                 if value.size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(value)
                 data = stringdtype_data_ptr(value)
                 step = _stringdtype_step(value)
-                not_found = False
-                bad_null = False
                 if use_na:
                     value_na = stringdtype_na_name(value)
-                    for i in range(value.size):
-                        index = i * step
-                        if forward:
-                            found = stringdtype_find_unicode_na_data(
-                                data, index, allocator, value_na_kind,
-                                value_na[0],
-                                value_na[1], pattern_value, pattern_parts[0],
-                                pattern_parts[1], start, end)
-                        elif reverse:
-                            found = stringdtype_rfind_unicode_na_data(
-                                data, index, allocator, value_na_kind,
-                                value_na[0],
-                                value_na[1], pattern_value, pattern_parts[0],
-                                pattern_parts[1], start, end)
-                        else:
-                            found = stringdtype_count_unicode_na_data(
-                                data, index, allocator, value_na_kind,
-                                value_na[0],
-                                value_na[1], pattern_value, pattern_parts[0],
-                                pattern_parts[1], start, end)
-                        if found == STRINGDTYPE_SEARCH_ERROR:
-                            bad_null = True
-                            break
-                        if raise_not_found and found < 0:
-                            not_found = True
-                            break
-                        result[i] = found
+                    status = na_rows(result, 0, value.size, data, step,
+                                     allocator, value_na_kind, value_na[0],
+                                     value_na[1], pattern_value,
+                                     pattern_parts[0], pattern_parts[1],
+                                     start, end, search_op, raise_not_found)
                 elif pattern_parts[1] > _PACKED_STRING_SIZE:
                     pattern_span = stringdtype_unicode_utf8_span(
                         pattern_value, pattern_parts[0], pattern_parts[1])
-                    for i in range(value.size):
-                        index = i * step
-                        found = _stringdtype_utf8_search(
-                            data, index, allocator, pattern_span[0],
-                            pattern_span[1], start, end, search_op)
-                        if raise_not_found and found < 0:
-                            not_found = True
-                            break
-                        result[i] = found
+                    status = utf8_rows(result, 0, value.size, data, step,
+                                       allocator, pattern_span[0],
+                                       pattern_span[1], start, end,
+                                       search_op, raise_not_found)
                     stringdtype_free_utf8_span(pattern_span[0],
                                                pattern_span[2])
                 else:
-                    for i in range(value.size):
-                        index = i * step
-                        found = _stringdtype_unicode_search(
-                            data, index, allocator, pattern_value,
-                            pattern_parts[0], pattern_parts[1], start, end,
-                            search_op)
-                        if raise_not_found and found < 0:
-                            not_found = True
-                            break
-                        result[i] = found
+                    status = unicode_rows(result, 0, value.size, data, step,
+                                          allocator, pattern_value,
+                                          pattern_parts[0], pattern_parts[1],
+                                          start, end, search_op,
+                                          raise_not_found)
                 stringdtype_release_allocator(allocator)
-                if use_na and bad_null:
+                if use_na and status == _ROW_BAD_NULL:
                     raise ValueError(
                         'StringDType operation is not supported for this null '
                         'value')
-                if not_found:
+                if status == _ROW_NOT_FOUND:
                     raise ValueError('substring not found')
                 return result
 
@@ -1893,7 +2165,7 @@ def _overload_search(value, pattern, start, end, op):
             _validate_stringdtype_array(pattern)
             pattern_na_kind = _stringdtype_na_kind(pattern)
             if pattern.ndim == 0:
-                def impl(value, pattern, start=0, end=None):
+                def impl(value, pattern, start=0, end=None, out=None):
                     value_value = _unicode_scalar_value(value)
                     if not stringdtype_unicode_valid(value_value):
                         raise TypeError('Invalid unicode code point found')
@@ -1940,14 +2212,14 @@ def _overload_search(value, pattern, start, end, op):
 
                 return impl
 
-            def impl(value, pattern, start=0, end=None):
+            def impl(value, pattern, start=0, end=None, out=None):
                 value_value = _unicode_scalar_value(value)
                 if not stringdtype_unicode_valid(value_value):
                     raise TypeError('Invalid unicode code point found')
                 value_parts = stringdtype_unicode_parts(value_value)
                 start = start or s
                 end = e if end is None else end
-                result = np.empty(pattern.size, np.int64)
+                result = int_result(out, pattern.size)
                 if pattern.size == 0:
                     return result
                 value_span = stringdtype_unicode_utf8_span(
@@ -2016,14 +2288,11 @@ def _overload_search(value, pattern, start, end, op):
             value_scalar = value.ndim == 0
             value_na_kind = _stringdtype_na_kind(value)
 
-            def impl(value, pattern, start=0, end=None):
+            def impl(value, pattern, start=0, end=None, out=None):
                 start = start or s
                 end = e if end is None else end
-                if not value_scalar and value.size != pattern.size:
-                    raise ValueError('shape mismatch: objects cannot be '
-                                     'broadcast to a single shape')
-                size = pattern.size if value_scalar else value.size
-                result = np.empty(size, np.int64)
+                size = _broadcast_size(value, pattern)
+                result = int_result(out, size)
                 if size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(value)
@@ -2035,7 +2304,7 @@ def _overload_search(value, pattern, start, end, op):
                     value_na = stringdtype_na_name(value)
                 for i in range(size):
                     value_index = 0 if value_scalar else i * step
-                    pattern_value = _unicode_scalar_value(pattern[i])
+                    pattern_value = _unicode_scalar_value(_broadcast_item(pattern, i))
                     if not stringdtype_unicode_valid(pattern_value):
                         stringdtype_release_allocator(allocator)
                         raise TypeError('Invalid unicode code point found')
@@ -2089,14 +2358,11 @@ def _overload_search(value, pattern, start, end, op):
             pattern_scalar = pattern.ndim == 0
             pattern_na_kind = _stringdtype_na_kind(pattern)
 
-            def impl(value, pattern, start=0, end=None):
+            def impl(value, pattern, start=0, end=None, out=None):
                 start = start or s
                 end = e if end is None else end
-                if not pattern_scalar and value.size != pattern.size:
-                    raise ValueError('shape mismatch: objects cannot be '
-                                     'broadcast to a single shape')
-                size = value.size
-                result = np.empty(size, np.int64)
+                size = _broadcast_size(value, pattern)
+                result = int_result(out, size)
                 if size == 0:
                     return result
                 allocator = stringdtype_acquire_allocator(pattern)
@@ -2108,7 +2374,7 @@ def _overload_search(value, pattern, start, end, op):
                     pattern_na = stringdtype_na_name(pattern)
                 for i in range(size):
                     pattern_index = 0 if pattern_scalar else i * step
-                    value_value = _unicode_scalar_value(value[i])
+                    value_value = _unicode_scalar_value(_broadcast_item(value, i))
                     if not stringdtype_unicode_valid(value_value):
                         stringdtype_release_allocator(allocator)
                         raise TypeError('Invalid unicode code point found')
@@ -2173,7 +2439,7 @@ def _overload_search(value, pattern, start, end, op):
         pattern_empty_null = value_na_kind == 0
 
         if value.ndim == 0 and pattern.ndim == 0:
-            def impl(value, pattern, start=0, end=None):
+            def impl(value, pattern, start=0, end=None, out=None):
                 start = start or s
                 end = e if end is None else end
                 allocators = stringdtype_acquire_allocators(value, pattern)
@@ -2226,15 +2492,11 @@ def _overload_search(value, pattern, start, end, op):
         value_scalar = value.ndim == 0
         pattern_scalar = pattern.ndim == 0
 
-        def impl(value, pattern, start=0, end=None):
+        def impl(value, pattern, start=0, end=None, out=None):
             start = start or s
             end = e if end is None else end
-            if not value_scalar and not pattern_scalar \
-                    and value.size != pattern.size:
-                raise ValueError('shape mismatch: objects cannot be '
-                                 'broadcast to a single shape')
-            size = pattern.size if value_scalar else value.size
-            result = np.empty(size, np.int64)
+            size = _broadcast_size(value, pattern)
+            result = int_result(out, size)
             if size == 0:
                 return result
             allocators = stringdtype_acquire_allocators(value, pattern)
@@ -2311,14 +2573,14 @@ def _overload_search(value, pattern, start, end, op):
         return impl
 
     if op == 'find':
-        return ov_char_find(value, pattern, start, end)
+        return ov_char_find(value, pattern, start, end, out)
     if op == 'rfind':
-        return ov_char_rfind(value, pattern, start, end)
+        return ov_char_rfind(value, pattern, start, end, out)
     if op == 'index':
-        return ov_char_index(value, pattern, start, end)
+        return ov_char_index(value, pattern, start, end, out)
     if op == 'rindex':
-        return ov_char_rindex(value, pattern, start, end)
-    return ov_char_count(value, pattern, start, end)
+        return ov_char_rindex(value, pattern, start, end, out)
+    return ov_char_count(value, pattern, start, end, out)
 
 
 _CHAR_PREDICATE_OVERLOADS = {
@@ -2334,16 +2596,17 @@ _CHAR_PREDICATE_OVERLOADS = {
 }
 
 
-def _overload_predicate(value, op):
+def _overload_predicate(value, op, out):
     if not is_stringdtype_array_type(value):
-        return _CHAR_PREDICATE_OVERLOADS[op](value)
+        return _CHAR_PREDICATE_OVERLOADS[op](value, out)
 
     _validate_stringdtype_array(value)
+    ensure_out(out, types.boolean, value)
     na_kind = value.dtype.na_kind
 
     if value.ndim == 0:
         if na_kind == 0:
-            def impl(value):
+            def impl(value, out=None):
                 allocator = stringdtype_acquire_allocator(value)
                 data = stringdtype_data_ptr(value)
                 if op == 'isalpha':
@@ -2369,7 +2632,7 @@ def _overload_predicate(value, op):
 
             return impl
 
-        def impl(value):
+        def impl(value, out=None):
             allocator = stringdtype_acquire_allocator(value)
             data = stringdtype_data_ptr(value)
             na_name = stringdtype_na_name(value)
@@ -2409,60 +2672,22 @@ def _overload_predicate(value, op):
 
         return impl
 
+    op_code = _PREDICATE_CODES[op]
     if na_kind != 0:
-        def impl(value):
-            result = np.empty(value.size, np.bool_)
+        na_rows = stringdtype_rows(_stringdtype_predicate_na_rows)
+
+        def impl(value, out=None):
+            result = bool_result(out, value.size)
             if value.size == 0:
                 return result
             allocator = stringdtype_acquire_allocator(value)
             data = stringdtype_data_ptr(value)
             step = _stringdtype_step(value)
             na_name = stringdtype_na_name(value)
-            null_string = False
-            for i in range(value.size):
-                index = i * step
-                if op == 'isalpha':
-                    predicate = stringdtype_isalpha_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                elif op == 'isalnum':
-                    predicate = stringdtype_isalnum_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                elif op == 'isdecimal':
-                    predicate = stringdtype_isdecimal_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                elif op == 'isdigit':
-                    predicate = stringdtype_isdigit_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                elif op == 'isnumeric':
-                    predicate = stringdtype_isnumeric_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                elif op == 'isspace':
-                    predicate = stringdtype_isspace_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                elif op == 'islower':
-                    predicate = stringdtype_islower_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                elif op == 'isupper':
-                    predicate = stringdtype_isupper_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                else:
-                    predicate = stringdtype_istitle_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                if predicate < 0:
-                    null_string = True
-                    predicate = 0
-                result[i] = bool(predicate)
+            status = na_rows(result, 0, value.size, data, step, allocator,
+                             na_kind, na_name[0], na_name[1], op_code)
             stringdtype_release_allocator(allocator)
-            if null_string:
+            if status != 0:
                 raise ValueError(
                     f'Cannot use the {op} function with a null that is '
                     'not a nan-like value')
@@ -2470,107 +2695,274 @@ def _overload_predicate(value, op):
 
         return impl
 
-    def impl(value):
-        result = np.empty(value.size, np.bool_)
+    rows = stringdtype_rows(_stringdtype_predicate_rows)
+
+    def impl(value, out=None):
+        result = bool_result(out, value.size)
         if value.size == 0:
             return result
         allocator = stringdtype_acquire_allocator(value)
-        data = stringdtype_data_ptr(value)
-        step = _stringdtype_step(value)
-        for i in range(value.size):
-            index = i * step
-            if op == 'isalpha':
-                result[i] = stringdtype_isalpha_data(data, index, allocator)
-            elif op == 'isalnum':
-                result[i] = stringdtype_isalnum_data(data, index, allocator)
-            elif op == 'isdecimal':
-                result[i] = stringdtype_isdecimal_data(data, index, allocator)
-            elif op == 'isdigit':
-                result[i] = stringdtype_isdigit_data(data, index, allocator)
-            elif op == 'isnumeric':
-                result[i] = stringdtype_isnumeric_data(data, index, allocator)
-            elif op == 'isspace':
-                result[i] = stringdtype_isspace_data(data, index, allocator)
-            elif op == 'islower':
-                result[i] = stringdtype_islower_data(data, index, allocator)
-            elif op == 'isupper':
-                result[i] = stringdtype_isupper_data(data, index, allocator)
-            else:
-                result[i] = stringdtype_istitle_data(data, index, allocator)
+        rows(result, 0, value.size, stringdtype_data_ptr(value),
+             _stringdtype_step(value), allocator, op_code)
         stringdtype_release_allocator(allocator)
         return result
 
     return impl
 
 
+def _validate_masked(value):
+    strings, valid = value.types
+    if not is_stringdtype_array_type(strings) or strings.ndim != 1 \
+            or not isinstance(valid, types.Array) or valid.ndim != 1 \
+            or valid.dtype != types.uint8:
+        raise NumbaTypeError('MaskedStrings must hold a one-dimensional '
+                             'StringDType array and a uint8 bitmap')
+    return strings
+
+
+def _masked_scan(unicode_kernel, utf8_kernel, dtype):
+    """Return a function running a pattern kernel over the valid rows.
+
+    ``scan(masked, pattern, out, *args)`` converts the ``str`` pattern once,
+    passes it to ``unicode_kernel``, or as UTF-8 to ``utf8_kernel`` when it
+    does not fit a packet, and returns the results with the bitmap.
+    """
+    unicode_rows = stringdtype_rows(masked_rows(unicode_kernel))
+    utf8_rows = stringdtype_rows(masked_rows(utf8_kernel))
+    result_for = bool_result if dtype == types.boolean else int_result
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def scan(masked, pattern, out, *args):
+        values, valid = masked
+        pattern_value = _unicode_scalar_value(pattern)
+        if not stringdtype_unicode_valid(pattern_value):
+            raise TypeError('Invalid unicode code point found')
+        pattern_parts = stringdtype_unicode_parts(pattern_value)
+        if valid.size < (values.size + 7) // 8:
+            raise ValueError('the valid bitmap is shorter than the strings')
+        result = result_for(out, values.size)
+        if values.size == 0:
+            return result, valid
+        allocator = stringdtype_acquire_allocator(values)
+        data = stringdtype_data_ptr(values)
+        step = _stringdtype_step(values)
+        if pattern_parts[1] > _PACKED_STRING_SIZE:
+            pattern_span = stringdtype_unicode_utf8_span(
+                pattern_value, pattern_parts[0], pattern_parts[1])
+            status = utf8_rows(result, 0, values.size, valid, data, step,
+                               allocator, pattern_span[0], pattern_span[1],
+                               *args)
+            stringdtype_free_utf8_span(pattern_span[0], pattern_span[2])
+        else:
+            status = unicode_rows(result, 0, values.size, valid, data, step,
+                                  allocator, pattern_value, pattern_parts[0],
+                                  pattern_parts[1], *args)
+        stringdtype_release_allocator(allocator)
+        if status == _ROW_NOT_FOUND:
+            raise ValueError('substring not found')
+        return result, valid
+    return scan
+
+
+def _masked_rows_scan(kernel, dtype):
+    """Return ``scan(masked, out, *args)`` for a kernel without a pattern."""
+    rows = stringdtype_rows(masked_rows(kernel))
+    result_for = bool_result if dtype == types.boolean else int_result
+
+    @register_jitable(**OVERLOAD_JIT_OPTIONS)
+    def scan(masked, out, *args):
+        values, valid = masked
+        if valid.size < (values.size + 7) // 8:
+            raise ValueError('the valid bitmap is shorter than the strings')
+        result = result_for(out, values.size)
+        if values.size == 0:
+            return result, valid
+        allocator = stringdtype_acquire_allocator(values)
+        status = rows(result, 0, values.size, valid,
+                      stringdtype_data_ptr(values), _stringdtype_step(values),
+                      allocator, *args)
+        stringdtype_release_allocator(allocator)
+        if status == _ROW_BAD_NULL:
+            raise ValueError('the valid bitmap marks a null string as valid')
+        return result, valid
+    return scan
+
+
+_ORDER_CODES = {'greater': 0, 'greater_equal': 1, 'less': 2, 'less_equal': 3}
+
+
+def _masked_impl(op, values):
+    """Build the implementation of an overload for a masked operand."""
+    if op == 'str_len' or op in _PREDICATE_CODES:
+        masked, out = values
+        _validate_masked(masked)
+        if op == 'str_len':
+            ensure_out(out, types.int64, masked.types[0])
+            scan = _masked_rows_scan(_stringdtype_str_len_rows, types.int64)
+
+            def impl(value, out=None):
+                return scan(value, out)
+            return impl
+
+        ensure_out(out, types.boolean, masked.types[0])
+        scan = _masked_rows_scan(_stringdtype_predicate_rows, types.boolean)
+        op_code = _PREDICATE_CODES[op]
+
+        def impl(value, out=None):
+            return scan(value, out, op_code)
+        return impl
+
+    if op in ('equal', 'not_equal') or op in _ORDER_CODES:
+        left, right, out = values
+        if is_masked(left) and _is_unicode_scalar_like(right):
+            masked, flipped = left, False
+        elif _is_unicode_scalar_like(left) and is_masked(right):
+            masked, flipped = right, True
+        else:
+            raise NumbaTypeError(f'{op} compares MaskedStrings only with a '
+                                 'str scalar')
+        _validate_masked(masked)
+        ensure_out(out, types.boolean, masked.types[0])
+        if op in _ORDER_CODES:
+            scan = _masked_scan(_stringdtype_order_unicode_rows,
+                                _stringdtype_order_utf8_rows, types.boolean)
+            # The kernels put the strings on the left of the operator.
+            op_code = (_ORDER_CODES[op] + 2 * flipped) % 4
+        else:
+            scan = _masked_scan(_stringdtype_equal_unicode_rows,
+                                _stringdtype_equal_utf8_rows, types.boolean)
+            op_code = op == 'not_equal'
+        if flipped:
+            def impl(left, right, out=None):
+                return scan(right, left, out, op_code)
+        else:
+            def impl(left, right, out=None):
+                return scan(left, right, out, op_code)
+        return impl
+
+    masked, pattern, start, end, out = values
+    if not is_masked(masked) or not _is_unicode_scalar_like(pattern):
+        raise NumbaTypeError(f'{op} searches MaskedStrings only for a str '
+                             'scalar')
+    _validate_masked(masked)
+    s, e = ensure_slice(start, end)
+    if op in ('startswith', 'endswith'):
+        ensure_out(out, types.boolean, masked.types[0])
+        scan = _masked_scan(_stringdtype_affix_unicode_rows,
+                            _stringdtype_affix_utf8_rows, types.boolean)
+        suffix = op == 'endswith'
+
+        def impl(value, pattern, start=0, end=None, out=None):
+            return scan(value, pattern, out, start or s,
+                        e if end is None else end, suffix)
+        return impl
+
+    ensure_out(out, types.int64, masked.types[0])
+    scan = _masked_scan(_stringdtype_search_unicode_rows,
+                        _stringdtype_search_utf8_rows, types.int64)
+    search_op = 0 if op in ('find', 'index') \
+        else 1 if op in ('rfind', 'rindex') else 2
+    raise_not_found = op in ('index', 'rindex')
+
+    def impl(value, pattern, start=0, end=None, out=None):
+        return scan(value, pattern, out, start or s,
+                    e if end is None else end, search_op, raise_not_found)
+    return impl
+
+
+def masked_overload(op):
+    """Accept ``MaskedStrings`` operands in an ``np.strings`` overload.
+
+    Only the strings set in the bitmap are loaded, through the kernels of
+    StringDType arrays without an ``na_object``, so no row resolves its
+    null value. The overload returns ``(result, valid)``; null rows hold a
+    zero result. Comparisons and searches need a ``str`` scalar other
+    operand.
+    """
+    def decorate(overload_function):
+        parameters = signature(overload_function)
+        n_operands = 1 if len(parameters.parameters) == 2 else 2
+
+        @wraps(overload_function)
+        def wrapper(*args, **kwargs):
+            bound = parameters.bind(*args, **kwargs)
+            bound.apply_defaults()
+            values = list(bound.arguments.values())
+            if any(is_masked(value) for value in values[:n_operands]):
+                return _masked_impl(op, values)
+            return overload_function(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
 if _STRINGS is not None:
-    def _strings_count(value, sub, start=0, end=None):
+    def _strings_count(value, sub, start=0, end=None, out=None):
         return _STRINGS.count(value, sub, start, end)
 
-    def _strings_equal(left, right):
+    def _strings_equal(left, right, out=None):
         return _STRINGS.equal(left, right)
 
-    def _strings_find(value, sub, start=0, end=None):
+    def _strings_find(value, sub, start=0, end=None, out=None):
         return _STRINGS.find(value, sub, start, end)
 
-    def _strings_index(value, sub, start=0, end=None):
+    def _strings_index(value, sub, start=0, end=None, out=None):
         return _STRINGS.index(value, sub, start, end)
 
-    def _strings_not_equal(left, right):
+    def _strings_not_equal(left, right, out=None):
         return _STRINGS.not_equal(left, right)
 
-    def _strings_greater_equal(left, right):
+    def _strings_greater_equal(left, right, out=None):
         return _STRINGS.greater_equal(left, right)
 
-    def _strings_greater(left, right):
+    def _strings_greater(left, right, out=None):
         return _STRINGS.greater(left, right)
 
-    def _strings_less(left, right):
+    def _strings_less(left, right, out=None):
         return _STRINGS.less(left, right)
 
-    def _strings_less_equal(left, right):
+    def _strings_less_equal(left, right, out=None):
         return _STRINGS.less_equal(left, right)
 
-    def _strings_rfind(value, sub, start=0, end=None):
+    def _strings_rfind(value, sub, start=0, end=None, out=None):
         return _STRINGS.rfind(value, sub, start, end)
 
-    def _strings_rindex(value, sub, start=0, end=None):
+    def _strings_rindex(value, sub, start=0, end=None, out=None):
         return _STRINGS.rindex(value, sub, start, end)
 
-    def _strings_endswith(value, suffix, start=0, end=None):
+    def _strings_endswith(value, suffix, start=0, end=None, out=None):
         return _STRINGS.endswith(value, suffix, start, end)
 
-    def _strings_startswith(value, prefix, start=0, end=None):
+    def _strings_startswith(value, prefix, start=0, end=None, out=None):
         return _STRINGS.startswith(value, prefix, start, end)
 
-    def _strings_str_len(value):
+    def _strings_str_len(value, out=None):
         return _STRINGS.str_len(value)
 
-    def _strings_isalpha(value):
+    def _strings_isalpha(value, out=None):
         return _STRINGS.isalpha(value)
 
-    def _strings_isalnum(value):
+    def _strings_isalnum(value, out=None):
         return _STRINGS.isalnum(value)
 
-    def _strings_isdecimal(value):
+    def _strings_isdecimal(value, out=None):
         return _STRINGS.isdecimal(value)
 
-    def _strings_isdigit(value):
+    def _strings_isdigit(value, out=None):
         return _STRINGS.isdigit(value)
 
-    def _strings_islower(value):
+    def _strings_islower(value, out=None):
         return _STRINGS.islower(value)
 
-    def _strings_isnumeric(value):
+    def _strings_isnumeric(value, out=None):
         return _STRINGS.isnumeric(value)
 
-    def _strings_isspace(value):
+    def _strings_isspace(value, out=None):
         return _STRINGS.isspace(value)
 
-    def _strings_istitle(value):
+    def _strings_istitle(value, out=None):
         return _STRINGS.istitle(value)
 
-    def _strings_isupper(value):
+    def _strings_isupper(value, out=None):
         return _STRINGS.isupper(value)
 
     _STRINGS_FUNCTIONS = {
@@ -2610,68 +3002,117 @@ if _STRINGS is not None:
                 return self.context.resolve_value_type(function)
 
     @overload(_strings_equal, **OPTIONS)
-    def ov_strings_equal(left, right):
-        return _overload_equal(left, right, False)
+    @masked_overload('equal')
+    @encoded_overload(_strings_equal, types.boolean)
+    @indexed_overload(_strings_equal)
+    @nd_overload(_strings_equal, types.boolean)
+    def ov_strings_equal(left, right, out=None):
+        return _overload_equal(left, right, False, out)
 
     @overload(_strings_count, **OPTIONS)
-    def ov_strings_count(value, sub, start=0, end=None):
-        return _overload_search(value, sub, start, end, 'count')
+    @masked_overload('count')
+    @encoded_overload(_strings_count, types.int64)
+    @nd_overload(_strings_count, types.int64)
+    def ov_strings_count(value, sub, start=0, end=None, out=None):
+        return _overload_search(value, sub, start, end, 'count', out)
 
     @overload(_strings_find, **OPTIONS)
-    def ov_strings_find(value, sub, start=0, end=None):
-        return _overload_search(value, sub, start, end, 'find')
+    @masked_overload('find')
+    @encoded_overload(_strings_find, types.int64)
+    @nd_overload(_strings_find, types.int64)
+    def ov_strings_find(value, sub, start=0, end=None, out=None):
+        return _overload_search(value, sub, start, end, 'find', out)
 
     @overload(_strings_index, **OPTIONS)
-    def ov_strings_index(value, sub, start=0, end=None):
-        return _overload_search(value, sub, start, end, 'index')
+    @masked_overload('index')
+    @encoded_overload(_strings_index, types.int64)
+    @nd_overload(_strings_index, types.int64)
+    def ov_strings_index(value, sub, start=0, end=None, out=None):
+        return _overload_search(value, sub, start, end, 'index', out)
 
     @overload(_strings_not_equal, **OPTIONS)
-    def ov_strings_not_equal(left, right):
-        return _overload_equal(left, right, True)
+    @masked_overload('not_equal')
+    @encoded_overload(_strings_not_equal, types.boolean)
+    @indexed_overload(_strings_not_equal)
+    @nd_overload(_strings_not_equal, types.boolean)
+    def ov_strings_not_equal(left, right, out=None):
+        return _overload_equal(left, right, True, out)
 
     @overload(_strings_greater_equal, **OPTIONS)
-    def ov_strings_greater_equal(left, right):
-        return _overload_order(left, right, 'greater_equal')
+    @masked_overload('greater_equal')
+    @encoded_overload(_strings_greater_equal, types.boolean)
+    @indexed_overload(_strings_greater_equal)
+    @nd_overload(_strings_greater_equal, types.boolean)
+    def ov_strings_greater_equal(left, right, out=None):
+        return _overload_order(left, right, 'greater_equal', out)
 
     @overload(_strings_greater, **OPTIONS)
-    def ov_strings_greater(left, right):
-        return _overload_order(left, right, 'greater')
+    @masked_overload('greater')
+    @encoded_overload(_strings_greater, types.boolean)
+    @indexed_overload(_strings_greater)
+    @nd_overload(_strings_greater, types.boolean)
+    def ov_strings_greater(left, right, out=None):
+        return _overload_order(left, right, 'greater', out)
 
     @overload(_strings_less, **OPTIONS)
-    def ov_strings_less(left, right):
-        return _overload_order(left, right, 'less')
+    @masked_overload('less')
+    @encoded_overload(_strings_less, types.boolean)
+    @indexed_overload(_strings_less)
+    @nd_overload(_strings_less, types.boolean)
+    def ov_strings_less(left, right, out=None):
+        return _overload_order(left, right, 'less', out)
 
     @overload(_strings_less_equal, **OPTIONS)
-    def ov_strings_less_equal(left, right):
-        return _overload_order(left, right, 'less_equal')
+    @masked_overload('less_equal')
+    @encoded_overload(_strings_less_equal, types.boolean)
+    @indexed_overload(_strings_less_equal)
+    @nd_overload(_strings_less_equal, types.boolean)
+    def ov_strings_less_equal(left, right, out=None):
+        return _overload_order(left, right, 'less_equal', out)
 
     @overload(_strings_rfind, **OPTIONS)
-    def ov_strings_rfind(value, sub, start=0, end=None):
-        return _overload_search(value, sub, start, end, 'rfind')
+    @masked_overload('rfind')
+    @encoded_overload(_strings_rfind, types.int64)
+    @nd_overload(_strings_rfind, types.int64)
+    def ov_strings_rfind(value, sub, start=0, end=None, out=None):
+        return _overload_search(value, sub, start, end, 'rfind', out)
 
     @overload(_strings_rindex, **OPTIONS)
-    def ov_strings_rindex(value, sub, start=0, end=None):
-        return _overload_search(value, sub, start, end, 'rindex')
+    @masked_overload('rindex')
+    @encoded_overload(_strings_rindex, types.int64)
+    @nd_overload(_strings_rindex, types.int64)
+    def ov_strings_rindex(value, sub, start=0, end=None, out=None):
+        return _overload_search(value, sub, start, end, 'rindex', out)
 
     @overload(_strings_endswith, **OPTIONS)
-    def ov_strings_endswith(value, suffix, start=0, end=None):
-        return _overload_affix(value, suffix, start, end, True)
+    @masked_overload('endswith')
+    @encoded_overload(_strings_endswith, types.boolean)
+    @nd_overload(_strings_endswith, types.boolean)
+    def ov_strings_endswith(value, suffix, start=0, end=None, out=None):
+        return _overload_affix(value, suffix, start, end, True, out)
 
     @overload(_strings_startswith, **OPTIONS)
-    def ov_strings_startswith(value, prefix, start=0, end=None):
-        return _overload_affix(value, prefix, start, end, False)
+    @masked_overload('startswith')
+    @encoded_overload(_strings_startswith, types.boolean)
+    @nd_overload(_strings_startswith, types.boolean)
+    def ov_strings_startswith(value, prefix, start=0, end=None, out=None):
+        return _overload_affix(value, prefix, start, end, False, out)
 
     @overload(_strings_str_len, **OPTIONS)
-    def ov_strings_str_len(value):
+    @masked_overload('str_len')
+    @encoded_overload(_strings_str_len, types.int64)
+    @nd_overload(_strings_str_len, types.int64)
+    def ov_strings_str_len(value, out=None):
         if not is_stringdtype_array_type(value):
-            return ov_char_str_len(value)
+            return ov_char_str_len(value, out)
 
         _validate_stringdtype_array(value)
+        ensure_out(out, types.int64, value)
         na_kind = value.dtype.na_kind
 
         if value.ndim == 0:
             if na_kind == 0:
-                def impl(value):
+                def impl(value, out=None):
                     allocator = stringdtype_acquire_allocator(value)
                     length = stringdtype_codepoint_len_data(
                         stringdtype_data_ptr(value), 0, allocator)
@@ -2683,7 +3124,7 @@ if _STRINGS is not None:
 
                 return impl
 
-            def impl(value):
+            def impl(value, out=None):
                 allocator = stringdtype_acquire_allocator(value)
                 na_name = stringdtype_na_name(value)
                 length = stringdtype_codepoint_len_na_data(
@@ -2697,82 +3138,97 @@ if _STRINGS is not None:
             return impl
 
         if na_kind != 0:
-            def impl(value):
-                result = np.empty(value.size, np.int64)
+            na_rows = stringdtype_rows(_stringdtype_str_len_na_rows)
+
+            def impl(value, out=None):
+                result = int_result(out, value.size)
                 allocator = stringdtype_acquire_allocator(value)
                 data = stringdtype_data_ptr(value)
                 step = _stringdtype_step(value)
                 na_name = stringdtype_na_name(value)
-                null_string = False
-                for i in range(value.size):
-                    index = i * step
-                    length = stringdtype_codepoint_len_na_data(
-                        data, index, allocator, na_kind, na_name[0],
-                        na_name[1])
-                    if length < 0:
-                        null_string = True
-                        length = 0
-                    result[i] = length
+                status = na_rows(result, 0, value.size, data, step,
+                                 allocator, na_kind, na_name[0], na_name[1])
                 stringdtype_release_allocator(allocator)
-                if null_string:
+                if status != 0:
                     raise ValueError(
                         'The length of a null string is undefined')
                 return result
 
             return impl
 
-        def impl(value):
-            result = np.empty(value.size, np.int64)
+        rows = stringdtype_rows(_stringdtype_str_len_rows)
+
+        def impl(value, out=None):
+            result = int_result(out, value.size)
             allocator = stringdtype_acquire_allocator(value)
-            data = stringdtype_data_ptr(value)
-            step = _stringdtype_step(value)
-            null_string = False
-            for i in range(value.size):
-                length = stringdtype_codepoint_len_data(
-                    data, i * step, allocator)
-                if length < 0:
-                    null_string = True
-                    length = 0
-                result[i] = length
+            status = rows(result, 0, value.size, stringdtype_data_ptr(value),
+                          _stringdtype_step(value), allocator)
             stringdtype_release_allocator(allocator)
-            if null_string:
+            if status != 0:
                 raise ValueError('The length of a null string is undefined')
             return result
 
         return impl
 
     @overload(_strings_isalpha, **OPTIONS)
-    def ov_strings_isalpha(value):
-        return _overload_predicate(value, 'isalpha')
+    @masked_overload('isalpha')
+    @encoded_overload(_strings_isalpha, types.boolean)
+    @nd_overload(_strings_isalpha, types.boolean)
+    def ov_strings_isalpha(value, out=None):
+        return _overload_predicate(value, 'isalpha', out)
 
     @overload(_strings_isalnum, **OPTIONS)
-    def ov_strings_isalnum(value):
-        return _overload_predicate(value, 'isalnum')
+    @masked_overload('isalnum')
+    @encoded_overload(_strings_isalnum, types.boolean)
+    @nd_overload(_strings_isalnum, types.boolean)
+    def ov_strings_isalnum(value, out=None):
+        return _overload_predicate(value, 'isalnum', out)
 
     @overload(_strings_isdecimal, **OPTIONS)
-    def ov_strings_isdecimal(value):
-        return _overload_predicate(value, 'isdecimal')
+    @masked_overload('isdecimal')
+    @encoded_overload(_strings_isdecimal, types.boolean)
+    @nd_overload(_strings_isdecimal, types.boolean)
+    def ov_strings_isdecimal(value, out=None):
+        return _overload_predicate(value, 'isdecimal', out)
 
     @overload(_strings_isdigit, **OPTIONS)
-    def ov_strings_isdigit(value):
-        return _overload_predicate(value, 'isdigit')
+    @masked_overload('isdigit')
+    @encoded_overload(_strings_isdigit, types.boolean)
+    @nd_overload(_strings_isdigit, types.boolean)
+    def ov_strings_isdigit(value, out=None):
+        return _overload_predicate(value, 'isdigit', out)
 
     @overload(_strings_islower, **OPTIONS)
-    def ov_strings_islower(value):
-        return _overload_predicate(value, 'islower')
+    @masked_overload('islower')
+    @encoded_overload(_strings_islower, types.boolean)
+    @nd_overload(_strings_islower, types.boolean)
+    def ov_strings_islower(value, out=None):
+        return _overload_predicate(value, 'islower', out)
 
     @overload(_strings_isnumeric, **OPTIONS)
-    def ov_strings_isnumeric(value):
-        return _overload_predicate(value, 'isnumeric')
+    @masked_overload('isnumeric')
+    @encoded_overload(_strings_isnumeric, types.boolean)
+    @nd_overload(_strings_isnumeric, types.boolean)
+    def ov_strings_isnumeric(value, out=None):
+        return _overload_predicate(value, 'isnumeric', out)
 
     @overload(_strings_isspace, **OPTIONS)
-    def ov_strings_isspace(value):
-        return _overload_predicate(value, 'isspace')
+    @masked_overload('isspace')
+    @encoded_overload(_strings_isspace, types.boolean)
+    @nd_overload(_strings_isspace, types.boolean)
+    def ov_strings_isspace(value, out=None):
+        return _overload_predicate(value, 'isspace', out)
 
     @overload(_strings_istitle, **OPTIONS)
-    def ov_strings_istitle(value):
-        return _overload_predicate(value, 'istitle')
+    @masked_overload('istitle')
+    @encoded_overload(_strings_istitle, types.boolean)
+    @nd_overload(_strings_istitle, types.boolean)
+    def ov_strings_istitle(value, out=None):
+        return _overload_predicate(value, 'istitle', out)
 
     @overload(_strings_isupper, **OPTIONS)
-    def ov_strings_isupper(value):
-        return _overload_predicate(value, 'isupper')
+    @masked_overload('isupper')
+    @encoded_overload(_strings_isupper, types.boolean)
+    @nd_overload(_strings_isupper, types.boolean)
+    def ov_strings_isupper(value, out=None):
+        return _overload_predicate(value, 'isupper', out)
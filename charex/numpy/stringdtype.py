@@ -2,20 +2,23 @@
 
 import ctypes
 import importlib
+import sys
+from collections import namedtuple
 
 from llvmlite import binding as llvm
 from llvmlite import ir
 from charex.core import JIT_OPTIONS
+from charex.core.unicode_tables import (
+    UNICODE_ALPHA, UNICODE_DECIMAL, UNICODE_DIGIT, UNICODE_LOWER,
+    UNICODE_NUMERIC, UNICODE_SPACE, UNICODE_TITLE, UNICODE_UPPER,
+    unicode_flags,
+)
 from numba.core import cgutils, types
 from numba.core.datamodel import models, register_default
 from numba.core.errors import NumbaValueError
+from numba.core.pythonapi import _boxers
 from numba.core.typing import signature
 from numba.core.typing.typeof import typeof_impl
-from numba.cpython.unicode_support import (
-    _PyUnicode_IsAlpha, _PyUnicode_IsDecimalDigit, _PyUnicode_IsDigit,
-    _PyUnicode_IsLowercase, _PyUnicode_IsNumeric, _PyUnicode_IsSpace,
-    _PyUnicode_IsTitlecase, _PyUnicode_IsUppercase,
-)
 from numba.extending import intrinsic, register_jitable
 from numba.np import numpy_support
 import numpy as np
@@ -23,6 +26,14 @@ import numpy as np
 
 _STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
 _PACKED_STRING_SIZE = 16
+# Flags of a string stored inside its packet, with the size in the low nibble.
+_SHORT_STRING_FLAGS = 0x60
+# Flag of a null, in the top byte of the packet's size word, which NumPy
+# stores second on little-endian and first on big-endian.
+_MISSING_STRING_FLAG = 0x80
+_SIZE_WORD = 1 if sys.byteorder == 'little' else 0
+# The flags byte is only the last byte of the high word on little-endian.
+_INLINE_PACKETS = sys.byteorder == 'little'
 _NA_NONE = 1
 _NA_NAN = 2
 _NA_STRING = 3
@@ -52,6 +63,7 @@ class StringDTypePacket(types.Type):
 stringdtype_packet = StringDTypePacket()
 _UNICODE_PARTS_TYPE = types.UniTuple(types.intp, 2)
 _UTF8_SPAN_TYPE = types.Tuple((types.voidptr, types.intp, types.boolean))
+_STRING_SPAN_TYPE = types.Tuple((types.voidptr, types.intp, types.int32))
 _NA_NAME_TYPE = types.Tuple((types.intp, types.voidptr))
 _UTF8_SLICE_TYPE = types.Tuple((types.intp, types.intp, types.boolean))
 _UTF8_SEARCH_SLICE_TYPE = types.Tuple((
@@ -73,11 +85,11 @@ class _StaticString(ctypes.Structure):
 
 def _native_stringdtype_helper():
     if _STRING_DTYPE is None:
-        return None, 0, 0, 0
+        return None, 0, 0, 0, 0
     try:
         native = importlib.import_module('charex._stringdtype')
         if not native.has_stringdtype_api():
-            return None, 0, 0, 0
+            return None, 0, 0, 0, 0
         library = ctypes.CDLL(native.__file__)
         acquire = library.charex_stringdtype_acquire_allocator
         acquire.argtypes = [ctypes.py_object]
@@ -91,24 +103,35 @@ def _native_stringdtype_helper():
         release_two = library.charex_stringdtype_release_two_allocators
         release_two.argtypes = [ctypes.POINTER(ctypes.c_void_p)]
         release_two.restype = None
+        # Older builds lack the array builder; reading and searching
+        # StringDType arrays works without it.
+        empty_like = getattr(library, 'charex_stringdtype_empty_like', None)
+        if empty_like is not None:
+            empty_like.argtypes = [ctypes.py_object, ctypes.c_ssize_t]
+            empty_like.restype = ctypes.py_object
+            empty_like = ctypes.cast(empty_like, ctypes.c_void_p).value
         return (
             library,
             ctypes.cast(acquire, ctypes.c_void_p).value,
             ctypes.cast(acquire_two, ctypes.c_void_p).value,
             ctypes.cast(release_two, ctypes.c_void_p).value,
+            empty_like or 0,
         )
     except (AttributeError, ImportError, OSError):
-        return None, 0, 0, 0
+        return None, 0, 0, 0, 0
 
 
 # Keep the CDLL object alive for helper symbols used by generated IR.
 _NATIVE_LIBRARY, _NATIVE_ACQUIRE_ADDR, _NATIVE_ACQUIRE_TWO_ADDR, \
-    _NATIVE_RELEASE_TWO_ADDR = _native_stringdtype_helper()
+    _NATIVE_RELEASE_TWO_ADDR, _NATIVE_EMPTY_LIKE_ADDR = \
+    _native_stringdtype_helper()
 
 
 if _STRING_DTYPE is not None:
     _API_SLOTS = _numpy_api_slots()
     llvm.add_symbol('charex_NpyString_load', _API_SLOTS[313])
+    llvm.add_symbol('charex_NpyString_pack', _API_SLOTS[314])
+    llvm.add_symbol('charex_NpyString_pack_null', _API_SLOTS[315])
     llvm.add_symbol('charex_NpyString_release_allocator', _API_SLOTS[318])
     if _NATIVE_ACQUIRE_ADDR:
         llvm.add_symbol('charex_stringdtype_acquire_allocator',
@@ -119,6 +142,9 @@ if _STRING_DTYPE is not None:
     if _NATIVE_RELEASE_TWO_ADDR:
         llvm.add_symbol('charex_stringdtype_release_two_allocators',
                         _NATIVE_RELEASE_TWO_ADDR)
+    if _NATIVE_EMPTY_LIKE_ADDR:
+        llvm.add_symbol('charex_stringdtype_empty_like',
+                        _NATIVE_EMPTY_LIKE_ADDR)
 else:
     _API_SLOTS = None
 
@@ -247,6 +273,24 @@ def _load_string(builder, allocator, packed, intp, byte_ptr):
         builder.extract_value(unpacked, 1)
 
 
+def _pack_string(builder, allocator, packed, buffer, size, intp, byte_ptr):
+    int32 = ir.IntType(32)
+    pack_type = ir.FunctionType(int32, [byte_ptr, byte_ptr, byte_ptr, intp])
+    pack = cgutils.get_or_insert_function(
+        builder.module, pack_type, 'charex_NpyString_pack',
+    )
+    return builder.call(pack, [allocator, packed, buffer, size])
+
+
+def _pack_null_string(builder, allocator, packed, byte_ptr):
+    int32 = ir.IntType(32)
+    pack_type = ir.FunctionType(int32, [byte_ptr, byte_ptr])
+    pack_null = cgutils.get_or_insert_function(
+        builder.module, pack_type, 'charex_NpyString_pack_null',
+    )
+    return builder.call(pack_null, [allocator, packed])
+
+
 def _resolve_string_na(builder, status, size, buffer, na_kind, na_size,
                        na_buffer, int32):
     kind_string = builder.icmp_signed('==', na_kind,
@@ -337,7 +381,7 @@ def _codepoint_count(builder, size, buffer, intp, int8):
 def _stringdtype_isalpha_ord(chr_ord):
     if chr_ord < 128:
         return 65 <= chr_ord <= 90 or 97 <= chr_ord <= 122
-    return bool(_PyUnicode_IsAlpha(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_ALPHA)
 
 
 @register_jitable(**JIT_OPTIONS)
@@ -345,57 +389,56 @@ def _stringdtype_isalnum_ord(chr_ord):
     if chr_ord < 128:
         return 65 <= chr_ord <= 90 or 97 <= chr_ord <= 122 \
             or 48 <= chr_ord <= 57
-    return bool(_PyUnicode_IsAlpha(chr_ord)) \
-        or bool(_PyUnicode_IsNumeric(chr_ord))
+    return bool(unicode_flags(chr_ord) & (UNICODE_ALPHA | UNICODE_NUMERIC))
 
 
 @register_jitable(**JIT_OPTIONS)
 def _stringdtype_isdecimal_ord(chr_ord):
     if chr_ord < 128:
         return 48 <= chr_ord <= 57
-    return bool(_PyUnicode_IsDecimalDigit(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_DECIMAL)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _stringdtype_isdigit_ord(chr_ord):
     if chr_ord < 128:
         return 48 <= chr_ord <= 57
-    return bool(_PyUnicode_IsDigit(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_DIGIT)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _stringdtype_isnumeric_ord(chr_ord):
     if chr_ord < 128:
         return 48 <= chr_ord <= 57
-    return bool(_PyUnicode_IsNumeric(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_NUMERIC)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _stringdtype_isspace_ord(chr_ord):
     if chr_ord < 128:
         return 9 <= chr_ord <= 13 or 28 <= chr_ord <= 32
-    return bool(_PyUnicode_IsSpace(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_SPACE)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _stringdtype_islower_ord(chr_ord):
     if chr_ord < 128:
         return 97 <= chr_ord <= 122
-    return bool(_PyUnicode_IsLowercase(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_LOWER)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _stringdtype_isupper_ord(chr_ord):
     if chr_ord < 128:
         return 65 <= chr_ord <= 90
-    return bool(_PyUnicode_IsUppercase(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_UPPER)
 
 
 @register_jitable(**JIT_OPTIONS)
 def _stringdtype_istitle_ord(chr_ord):
     if chr_ord < 128:
         return False
-    return bool(_PyUnicode_IsTitlecase(chr_ord))
+    return bool(unicode_flags(chr_ord) & UNICODE_TITLE)
 
 
 _SIMPLE_PROPERTY_HELPERS = {
@@ -859,6 +902,106 @@ def _byte_nonzero_highbits(builder, word, int64):
                         high_bits)
 
 
+def _inline_packet(builder, packed, int32, int64):
+    """Read a packed string that NumPy stored inline, without a load call.
+
+    Strings of up to 15 bytes live in the 16-byte packet itself, with the
+    flags and size in its last byte; an all-zero packet is the empty
+    string. Returns ``(inline, size, low, high)`` with the two data words
+    cleared past ``size``. Strings with an embedded NUL are not reported as
+    inline: NumPy stops comparisons at the first NUL, which only the loaded
+    path reproduces.
+    """
+    words = builder.bitcast(packed, int64.as_pointer())
+    low = builder.load(words)
+    low.align = 1
+    high = builder.load(builder.gep(words, [ir.Constant(int32, 1)]))
+    high.align = 1
+    tag = builder.lshr(high, ir.Constant(int64, 56))
+    size = builder.and_(tag, ir.Constant(int64, 0x0f))
+    inline = builder.or_(
+        builder.icmp_unsigned(
+            '==', builder.and_(tag, ir.Constant(int64, 0xf0)),
+            ir.Constant(int64, _SHORT_STRING_FLAGS)),
+        builder.icmp_unsigned('==', tag, ir.Constant(int64, 0)),
+    )
+    bits = builder.shl(size, ir.Constant(int64, 3))
+    one = ir.Constant(int64, 1)
+    low_mask = builder.select(
+        builder.icmp_unsigned('<', size, ir.Constant(int64, 8)),
+        builder.sub(builder.shl(one, bits), one),
+        ir.Constant(int64, -1),
+    )
+    high_bits = builder.select(
+        builder.icmp_unsigned('>', size, ir.Constant(int64, 8)),
+        builder.sub(bits, ir.Constant(int64, 64)),
+        ir.Constant(int64, 0),
+    )
+    high_mask = builder.sub(builder.shl(one, high_bits), one)
+    low = builder.and_(low, low_mask)
+    high = builder.and_(high, high_mask)
+    # Bytes past the size are set so that only NULs inside it are found.
+    nul = builder.or_(
+        _byte_zero_highbits(builder, builder.or_(low, builder.not_(low_mask)),
+                            int64),
+        _byte_zero_highbits(
+            builder, builder.or_(high, builder.not_(high_mask)), int64),
+    )
+    inline = builder.and_(
+        inline, builder.icmp_unsigned('==', nul, ir.Constant(int64, 0)))
+    return inline, size, low, high
+
+
+def _inline_packets_equal(builder, left, right, int32):
+    _, left_size, left_low, left_high = left
+    _, right_size, right_low, right_high = right
+    return builder.and_(
+        builder.icmp_unsigned('==', left_size, right_size),
+        builder.and_(builder.icmp_unsigned('==', left_low, right_low),
+                     builder.icmp_unsigned('==', left_high, right_high)),
+    )
+
+
+def _inline_packets_compare(builder, left, right, int32):
+    # Byte-swapped words order like the bytes; zero padding sorts a prefix
+    # first, and the sizes break ties between NUL-free strings.
+    _, left_size, left_low, left_high = left
+    _, right_size, right_low, right_high = right
+    result = _stringdtype_size_compare(builder, left_size, right_size, int32)
+    for left_word, right_word in ((left_high, right_high),
+                                  (left_low, right_low)):
+        left_key = builder.bswap(left_word)
+        right_key = builder.bswap(right_word)
+        result = builder.select(
+            builder.icmp_unsigned('==', left_key, right_key),
+            result,
+            builder.select(
+                builder.icmp_unsigned('<', left_key, right_key),
+                ir.Constant(int32, -1),
+                ir.Constant(int32, 1),
+            ),
+        )
+    return result
+
+
+def _with_inline_packets(builder, left_packed, right_packed, result_type,
+                         inline, loaded, int32):
+    """Return ``inline`` for two inline packets, else the ``loaded`` path."""
+    if not _INLINE_PACKETS:
+        return loaded()
+    int64 = ir.IntType(64)
+    left = _inline_packet(builder, left_packed, int32, int64)
+    right = _inline_packet(builder, right_packed, int32, int64)
+    result = cgutils.alloca_once(builder, result_type)
+    with builder.if_else(builder.and_(left[0], right[0])) \
+            as (inline_path, loaded_path):
+        with inline_path:
+            builder.store(inline(builder, left, right, int32), result)
+        with loaded_path:
+            builder.store(loaded(), result)
+    return builder.load(result)
+
+
 def _utf8_word8_equal(builder, string_size, string_buffer, scalar_data,
                       scalar_size, intp, int8, int32):
     int1 = ir.IntType(1)
@@ -1832,6 +1975,262 @@ def stringdtype_data_ptr(typingctx, array):
     return sig, codegen
 
 
+@intrinsic
+def stringdtype_na_kind(typingctx, array):
+    if not is_stringdtype_array_type(array):
+        return None
+
+    sig = signature(types.int32, array)
+
+    def codegen(context, builder, signature, args):
+        return ir.Constant(ir.IntType(32), signature.args[0].dtype.na_kind)
+
+    return sig, codegen
+
+
+@intrinsic
+def stringdtype_empty_like(typingctx, like, size):
+    """Return a new 1-D StringDType array of ``size`` empty strings.
+
+    It has the options of ``like`` but its own descriptor and allocator, so
+    packing it never takes the lock of ``like``. Creating it takes the GIL:
+    call it before acquiring any allocator, as a Python thread holding the
+    GIL may be waiting for that allocator's lock.
+    """
+    if not is_stringdtype_array_type(like) \
+            or not isinstance(size, types.Integer):
+        return None
+    if not _NATIVE_EMPTY_LIKE_ADDR:
+        raise NumbaValueError(
+            'building StringDType arrays requires a newer compiled '
+            'charex._stringdtype helper; reinstall charex or run '
+            'build_ext --inplace',
+        )
+    if _BOX_ARRAY is None:
+        raise NumbaValueError(
+            'cannot return StringDType arrays from nopython mode: this Numba '
+            'version does not expose the array boxer charex wraps',
+        )
+
+    sig = signature(types.Array(like.dtype, 1, 'C'), like, types.intp)
+
+    def codegen(context, builder, signature, args):
+        like_value, size_value = args
+
+        intp = context.get_value_type(types.intp)
+        pyapi = context.get_python_api(builder)
+        like_struct = context.make_array(signature.args[0])(
+            context, builder, like_value,
+        )
+        result = context.make_array(signature.return_type)(context, builder)
+        empty_type = ir.FunctionType(pyapi.pyobj, [pyapi.pyobj, intp])
+        empty = cgutils.get_or_insert_function(
+            builder.module, empty_type, 'charex_stringdtype_empty_like',
+        )
+        gil = pyapi.gil_ensure()
+        array = builder.call(empty, [
+            builder.bitcast(like_struct.parent, pyapi.pyobj), size_value,
+        ])
+        failed = cgutils.is_null(builder, array)
+        with builder.if_else(failed) as (error, created):
+            with error:
+                pyapi.err_clear()
+            with created:
+                # The meminfo keeps its own reference to the array.
+                pyapi.nrt_adapt_ndarray_from_python(
+                    array, builder.bitcast(result._getpointer(),
+                                           pyapi.voidptr),
+                )
+                pyapi.decref(array)
+        pyapi.gil_release(gil)
+        with builder.if_then(failed, likely=False):
+            context.call_conv.return_user_exc(
+                builder, MemoryError,
+                ('could not allocate a StringDType array',),
+            )
+        return result._getvalue()
+
+    return sig, codegen
+
+
+@intrinsic
+def stringdtype_pack_data(typingctx, data, index, allocator, utf8, offset,
+                          size):
+    """Pack ``size`` bytes of ``utf8`` from ``offset`` into one packet.
+
+    A string of up to 15 bytes bound for a packet that holds no arena or
+    heap string is written inline, with no pack call. Returns ``-1`` if the
+    allocator fails, else ``0``.
+    """
+    if data != types.voidptr \
+            or not isinstance(index, types.Integer) \
+            or allocator != types.voidptr \
+            or not isinstance(utf8, types.Array) \
+            or utf8.dtype != types.uint8 \
+            or not isinstance(offset, types.Integer) \
+            or not isinstance(size, types.Integer):
+        return None
+
+    sig = signature(types.int32, data, types.intp, allocator, utf8,
+                    types.intp, types.intp)
+
+    def codegen(context, builder, signature, args):
+        data, index_value, allocator, utf8_value, offset, size = args
+
+        int8 = ir.IntType(8)
+        int32 = ir.IntType(32)
+        int64 = ir.IntType(64)
+        intp = context.get_value_type(types.intp)
+        byte_ptr = int8.as_pointer()
+        packed = _packed_string_ptr_from_data(builder, data, index_value, intp)
+        utf8_struct = context.make_array(signature.args[3])(
+            context, builder, utf8_value,
+        )
+        buffer = builder.gep(builder.bitcast(utf8_struct.data, byte_ptr),
+                             [offset])
+
+        if not _INLINE_PACKETS:
+            return _pack_string(builder, allocator, packed, buffer, size,
+                                intp, byte_ptr)
+
+        words = builder.bitcast(packed, int64.as_pointer())
+        high = builder.gep(words, [ir.Constant(int32, 1)])
+        tag = builder.lshr(builder.load(high, align=1),
+                           ir.Constant(int64, 56))
+        unallocated = builder.or_(
+            builder.icmp_unsigned('==', tag, ir.Constant(int64, 0)),
+            builder.icmp_unsigned(
+                '==', builder.and_(tag, ir.Constant(int64, 0xf0)),
+                ir.Constant(int64, _SHORT_STRING_FLAGS)),
+        )
+        short = builder.icmp_unsigned(
+            '<', size, ir.Constant(intp, _PACKED_STRING_SIZE))
+        result = cgutils.alloca_once(builder, int32)
+        with builder.if_else(builder.and_(unallocated, short)) \
+                as (inline_path, pack_path):
+            with inline_path:
+                builder.store(ir.Constant(int64, 0), words, align=1)
+                builder.store(ir.Constant(int64, 0), high, align=1)
+                cgutils.raw_memcpy(builder, packed, buffer, size, 1)
+                # NumPy leaves the empty string an all-zero packet.
+                length = builder.trunc(size, int8)
+                flags = builder.select(
+                    builder.icmp_unsigned('==', length, ir.Constant(int8, 0)),
+                    length,
+                    builder.or_(length, ir.Constant(int8, _SHORT_STRING_FLAGS)),
+                )
+                builder.store(flags, builder.gep(
+                    packed, [ir.Constant(int32, _PACKED_STRING_SIZE - 1)]))
+                builder.store(ir.Constant(int32, 0), result)
+            with pack_path:
+                builder.store(_pack_string(builder, allocator, packed, buffer,
+                                           size, intp, byte_ptr), result)
+        return builder.load(result)
+
+    return sig, codegen
+
+
+@intrinsic
+def stringdtype_pack_null_data(typingctx, data, index, allocator):
+    if data != types.voidptr \
+            or not isinstance(index, types.Integer) \
+            or allocator != types.voidptr:
+        return None
+
+    sig = signature(types.int32, data, types.intp, allocator)
+
+    def codegen(context, builder, signature, args):
+        data, index_value, allocator = args
+
+        intp = context.get_value_type(types.intp)
+        byte_ptr = ir.IntType(8).as_pointer()
+        packed = _packed_string_ptr_from_data(builder, data, index_value, intp)
+        return _pack_null_string(builder, allocator, packed, byte_ptr)
+
+    return sig, codegen
+
+
+@intrinsic
+def stringdtype_copy_data(typingctx, data, index, allocator, source_data,
+                          source_index, source_allocator):
+    """Copy one packed string into an unused packet of another array.
+
+    Inline strings are copied as the whole 16-byte packet, with no load or
+    pack call; nulls are packed as nulls, and arena or heap strings are
+    loaded and packed under the target allocator. Returns ``-1`` if either
+    allocator fails, else ``0``.
+    """
+    if data != types.voidptr \
+            or not isinstance(index, types.Integer) \
+            or allocator != types.voidptr \
+            or source_data != types.voidptr \
+            or not isinstance(source_index, types.Integer) \
+            or source_allocator != types.voidptr:
+        return None
+
+    sig = signature(types.int32, data, types.intp, allocator, source_data,
+                    types.intp, source_allocator)
+
+    def codegen(context, builder, signature, args):
+        data, index_value, allocator, source_data, source_index, \
+            source_allocator = args
+
+        int32 = ir.IntType(32)
+        int64 = ir.IntType(64)
+        intp = context.get_value_type(types.intp)
+        byte_ptr = ir.IntType(8).as_pointer()
+        packed = _packed_string_ptr_from_data(builder, data, index_value, intp)
+        source = _packed_string_ptr_from_data(builder, source_data,
+                                              source_index, intp)
+        words = builder.bitcast(packed, int64.as_pointer())
+        source_words = builder.bitcast(source, int64.as_pointer())
+        low = builder.load(source_words, align=1)
+        high = builder.load(
+            builder.gep(source_words, [ir.Constant(int32, 1)]), align=1)
+        size_word = high if _SIZE_WORD else low
+        tag = builder.lshr(size_word, ir.Constant(int64, 56))
+        if _INLINE_PACKETS:
+            inline = builder.or_(
+                builder.icmp_unsigned('==', tag, ir.Constant(int64, 0)),
+                builder.icmp_unsigned(
+                    '==', builder.and_(tag, ir.Constant(int64, 0xf0)),
+                    ir.Constant(int64, _SHORT_STRING_FLAGS)),
+            )
+        else:
+            inline = cgutils.false_bit
+        null = builder.icmp_unsigned(
+            '!=', builder.and_(tag, ir.Constant(int64, _MISSING_STRING_FLAG)),
+            ir.Constant(int64, 0))
+
+        result = cgutils.alloca_once_value(builder, ir.Constant(int32, 0))
+        with builder.if_else(inline) as (inline_path, other_path):
+            with inline_path:
+                builder.store(low, words, align=1)
+                builder.store(high, builder.gep(words, [ir.Constant(int32, 1)]),
+                              align=1)
+            with other_path:
+                with builder.if_else(null) as (null_path, load_path):
+                    with null_path:
+                        builder.store(_pack_null_string(
+                            builder, allocator, packed, byte_ptr), result)
+                    with load_path:
+                        status, size, buffer = _load_string(
+                            builder, source_allocator, source, intp,
+                            byte_ptr)
+                        loaded = builder.icmp_signed(
+                            '==', status, ir.Constant(int32, 0))
+                        with builder.if_else(loaded) as (pack_path, error):
+                            with pack_path:
+                                builder.store(_pack_string(
+                                    builder, allocator, packed, buffer, size,
+                                    intp, byte_ptr), result)
+                            with error:
+                                builder.store(ir.Constant(int32, -1), result)
+        return builder.load(result)
+
+    return sig, codegen
+
+
 @intrinsic
 def stringdtype_codepoint_len_data(typingctx, data, index, allocator):
     if data != types.voidptr \
@@ -1909,6 +2308,75 @@ def stringdtype_codepoint_len_na_data(
     return sig, codegen
 
 
+@intrinsic
+def stringdtype_span_na_data(
+        typingctx, data, index, allocator, na_kind, na_size, na_buffer):
+    """Return ``(buffer, size, status)`` of one packed string.
+
+    A string ``na_object`` resolves to its name; other nulls keep status 1.
+    """
+    if data != types.voidptr \
+            or not isinstance(index, types.Integer) \
+            or allocator != types.voidptr \
+            or not isinstance(na_kind, types.Integer) \
+            or not isinstance(na_size, types.Integer) \
+            or na_buffer != types.voidptr:
+        return None
+
+    sig = signature(_STRING_SPAN_TYPE, data, types.intp, allocator,
+                    types.int32, types.intp, na_buffer)
+
+    def codegen(context, builder, signature, args):
+        data, index_value, allocator, na_kind, na_size, na_buffer = args
+
+        int8 = ir.IntType(8)
+        int32 = ir.IntType(32)
+        intp = context.get_value_type(types.intp)
+        byte_ptr = int8.as_pointer()
+        packed = _packed_string_ptr_from_data(builder, data, index_value, intp)
+        status, size, buffer = _load_string(builder, allocator, packed, intp,
+                                            byte_ptr)
+        status, size, buffer = _resolve_string_na(
+            builder, status, size, buffer, na_kind, na_size, na_buffer, int32)
+        return context.make_tuple(builder, signature.return_type,
+                                  [buffer, size, status])
+
+    return sig, codegen
+
+
+@intrinsic
+def stringdtype_isnull_data(typingctx, data, index):
+    """Return whether one packed string is null, from its flags alone.
+
+    Only the flags byte of the packet is read: no allocator is needed and
+    the string bytes are never loaded.
+    """
+    if data != types.voidptr or not isinstance(index, types.Integer):
+        return None
+
+    sig = signature(types.boolean, data, types.intp)
+
+    def codegen(context, builder, signature, args):
+        data, index_value = args
+
+        int32 = ir.IntType(32)
+        int64 = ir.IntType(64)
+        intp = context.get_value_type(types.intp)
+        packed = _packed_string_ptr_from_data(builder, data, index_value, intp)
+        words = builder.bitcast(packed, int64.as_pointer())
+        size_word = builder.load(
+            builder.gep(words, [ir.Constant(int32, _SIZE_WORD)]))
+        size_word.align = 1
+        flags = builder.lshr(size_word, ir.Constant(int64, 56))
+        return builder.icmp_unsigned(
+            '!=',
+            builder.and_(flags, ir.Constant(int64, _MISSING_STRING_FLAG)),
+            ir.Constant(int64, 0),
+        )
+
+    return sig, codegen
+
+
 def _stringdtype_predicate_data(typingctx, data, index, allocator, mode):
     if data != types.voidptr \
             or not isinstance(index, types.Integer) \
@@ -2164,31 +2632,37 @@ def stringdtype_equal_data(typingctx, left_data, left_index, left_allocator,
             builder, left_data, left_index_value, intp)
         right_packed = _packed_string_ptr_from_data(
             builder, right_data, right_index_value, intp)
-        left_status, left_size, left_buffer = _load_string(
-            builder, left_allocator, left_packed, intp, byte_ptr)
-        right_status, right_size, right_buffer = _load_string(
-            builder, right_allocator, right_packed, intp, byte_ptr)
 
-        result = cgutils.alloca_once(builder, ir.IntType(1))
-        builder.store(cgutils.false_bit, result)
+        def loaded():
+            left_status, left_size, left_buffer = _load_string(
+                builder, left_allocator, left_packed, intp, byte_ptr)
+            right_status, right_size, right_buffer = _load_string(
+                builder, right_allocator, right_packed, intp, byte_ptr)
 
-        left_valid = builder.icmp_signed(
-            '==', left_status, ir.Constant(int32, 0))
-        right_valid = builder.icmp_signed(
-            '==', right_status, ir.Constant(int32, 0))
-        both_valid = builder.and_(left_valid, right_valid)
-        same_size = builder.icmp_unsigned('==', left_size, right_size)
+            result = cgutils.alloca_once(builder, ir.IntType(1))
+            builder.store(cgutils.false_bit, result)
 
-        with builder.if_then(builder.and_(both_valid, same_size)):
-            builder.store(
-                _stringdtype_binary_equal(
-                    builder, left_size, left_buffer, right_size,
-                    right_buffer, intp, int8, int32,
-                ),
-                result,
-            )
+            left_valid = builder.icmp_signed(
+                '==', left_status, ir.Constant(int32, 0))
+            right_valid = builder.icmp_signed(
+                '==', right_status, ir.Constant(int32, 0))
+            both_valid = builder.and_(left_valid, right_valid)
+            same_size = builder.icmp_unsigned('==', left_size, right_size)
 
-        return builder.load(result)
+            with builder.if_then(builder.and_(both_valid, same_size)):
+                builder.store(
+                    _stringdtype_binary_equal(
+                        builder, left_size, left_buffer, right_size,
+                        right_buffer, intp, int8, int32,
+                    ),
+                    result,
+                )
+
+            return builder.load(result)
+
+        return _with_inline_packets(
+            builder, left_packed, right_packed, ir.IntType(1),
+            _inline_packets_equal, loaded, int32)
 
     return sig, codegen
 
@@ -2219,28 +2693,34 @@ def stringdtype_compare_data(typingctx, left_data, left_index, left_allocator,
             builder, left_data, left_index_value, intp)
         right_packed = _packed_string_ptr_from_data(
             builder, right_data, right_index_value, intp)
-        left_status, left_size, left_buffer = _load_string(
-            builder, left_allocator, left_packed, intp, byte_ptr)
-        right_status, right_size, right_buffer = _load_string(
-            builder, right_allocator, right_packed, intp, byte_ptr)
 
-        result = cgutils.alloca_once(builder, int32)
-        builder.store(ir.Constant(int32, 0), result)
-        left_valid = builder.icmp_signed(
-            '==', left_status, ir.Constant(int32, 0))
-        right_valid = builder.icmp_signed(
-            '==', right_status, ir.Constant(int32, 0))
+        def loaded():
+            left_status, left_size, left_buffer = _load_string(
+                builder, left_allocator, left_packed, intp, byte_ptr)
+            right_status, right_size, right_buffer = _load_string(
+                builder, right_allocator, right_packed, intp, byte_ptr)
 
-        with builder.if_then(builder.and_(left_valid, right_valid)):
-            builder.store(
-                _stringdtype_byte_compare(
-                    builder, left_size, left_buffer, right_size,
-                    right_buffer, intp, int8, int32,
-                ),
-                result,
-            )
+            result = cgutils.alloca_once(builder, int32)
+            builder.store(ir.Constant(int32, 0), result)
+            left_valid = builder.icmp_signed(
+                '==', left_status, ir.Constant(int32, 0))
+            right_valid = builder.icmp_signed(
+                '==', right_status, ir.Constant(int32, 0))
 
-        return builder.load(result)
+            with builder.if_then(builder.and_(left_valid, right_valid)):
+                builder.store(
+                    _stringdtype_byte_compare(
+                        builder, left_size, left_buffer, right_size,
+                        right_buffer, intp, int8, int32,
+                    ),
+                    result,
+                )
+
+            return builder.load(result)
+
+        return _with_inline_packets(
+            builder, left_packed, right_packed, int32,
+            _inline_packets_compare, loaded, int32)
 
     return sig, codegen
 
@@ -2285,53 +2765,64 @@ def _stringdtype_equal_na_data(
             builder, left_data, left_index_value, intp)
         right_packed = _packed_string_ptr_from_data(
             builder, right_data, right_index_value, intp)
-        left_status, left_size, left_buffer = _load_string(
-            builder, left_allocator, left_packed, intp, byte_ptr)
-        right_status, right_size, right_buffer = _load_string(
-            builder, right_allocator, right_packed, intp, byte_ptr)
-
-        left_null = builder.icmp_signed('==', left_status,
-                                        ir.Constant(int32, 1))
-        right_null = builder.icmp_signed('==', right_status,
-                                         ir.Constant(int32, 1))
-        left_nan = builder.icmp_signed('==', left_na_kind,
-                                       ir.Constant(int32, _NA_NAN))
-        right_nan = builder.icmp_signed('==', right_na_kind,
-                                        ir.Constant(int32, _NA_NAN))
-        left_default = builder.icmp_signed('==', left_na_kind,
-                                           ir.Constant(int32, 0))
-        nan_forces_false = builder.or_(
-            builder.and_(left_null, left_nan),
-            builder.and_(builder.and_(right_null, right_nan),
-                         builder.not_(left_default)),
-        )
 
-        result = cgutils.alloca_once(builder, ir.IntType(1))
-        builder.store(cgutils.false_bit, result)
+        def loaded():
+            left_status, left_size, left_buffer = _load_string(
+                builder, left_allocator, left_packed, intp, byte_ptr)
+            right_status, right_size, right_buffer = _load_string(
+                builder, right_allocator, right_packed, intp, byte_ptr)
+
+            left_null = builder.icmp_signed('==', left_status,
+                                            ir.Constant(int32, 1))
+            right_null = builder.icmp_signed('==', right_status,
+                                             ir.Constant(int32, 1))
+            left_nan = builder.icmp_signed('==', left_na_kind,
+                                           ir.Constant(int32, _NA_NAN))
+            right_nan = builder.icmp_signed('==', right_na_kind,
+                                            ir.Constant(int32, _NA_NAN))
+            left_default = builder.icmp_signed('==', left_na_kind,
+                                               ir.Constant(int32, 0))
+            nan_forces_false = builder.or_(
+                builder.and_(left_null, left_nan),
+                builder.and_(builder.and_(right_null, right_nan),
+                             builder.not_(left_default)),
+            )
 
-        with builder.if_then(builder.not_(nan_forces_false)):
-            right_empty = left_default
-            left_status, left_size, left_buffer = _resolve_binary_na_value(
-                builder, left_status, left_size, left_buffer, left_na_kind,
-                left_na_size, left_na_buffer, cgutils.false_bit, int32, intp,
-                int8)
-            right_status, right_size, right_buffer = _resolve_binary_na_value(
-                builder, right_status, right_size, right_buffer,
-                right_na_kind, right_na_size, right_na_buffer,
-                right_empty, int32, intp, int8)
-            left_valid = builder.icmp_signed('==', left_status,
-                                             ir.Constant(int32, 0))
-            right_valid = builder.icmp_signed('==', right_status,
-                                              ir.Constant(int32, 0))
-            with builder.if_then(builder.and_(left_valid, right_valid)):
-                equal_result = _stringdtype_binary_equal(
-                    builder, left_size, left_buffer, right_size,
-                    right_buffer, intp, int8, int32)
-                if invert:
-                    equal_result = builder.not_(equal_result)
-                builder.store(equal_result, result)
+            result = cgutils.alloca_once(builder, ir.IntType(1))
+            builder.store(cgutils.false_bit, result)
 
-        return builder.load(result)
+            with builder.if_then(builder.not_(nan_forces_false)):
+                right_empty = left_default
+                left_status, left_size, left_buffer = \
+                    _resolve_binary_na_value(
+                        builder, left_status, left_size, left_buffer,
+                        left_na_kind, left_na_size, left_na_buffer,
+                        cgutils.false_bit, int32, intp, int8)
+                right_status, right_size, right_buffer = \
+                    _resolve_binary_na_value(
+                        builder, right_status, right_size, right_buffer,
+                        right_na_kind, right_na_size, right_na_buffer,
+                        right_empty, int32, intp, int8)
+                left_valid = builder.icmp_signed('==', left_status,
+                                                 ir.Constant(int32, 0))
+                right_valid = builder.icmp_signed('==', right_status,
+                                                  ir.Constant(int32, 0))
+                with builder.if_then(builder.and_(left_valid, right_valid)):
+                    equal_result = _stringdtype_binary_equal(
+                        builder, left_size, left_buffer, right_size,
+                        right_buffer, intp, int8, int32)
+                    if invert:
+                        equal_result = builder.not_(equal_result)
+                    builder.store(equal_result, result)
+
+            return builder.load(result)
+
+        def inline(builder, left, right, int32):
+            equal = _inline_packets_equal(builder, left, right, int32)
+            return builder.not_(equal) if invert else equal
+
+        return _with_inline_packets(builder, left_packed, right_packed,
+                                    ir.IntType(1), inline, loaded, int32)
 
     return sig, codegen
 
@@ -2398,78 +2889,80 @@ def stringdtype_compare_na_data(
             builder, left_data, left_index_value, intp)
         right_packed = _packed_string_ptr_from_data(
             builder, right_data, right_index_value, intp)
-        left_status, left_size, left_buffer = _load_string(
-            builder, left_allocator, left_packed, intp, byte_ptr)
-        right_status, right_size, right_buffer = _load_string(
-            builder, right_allocator, right_packed, intp, byte_ptr)
-
-        left_null = builder.icmp_signed('==', left_status,
-                                        ir.Constant(int32, 1))
-        right_null = builder.icmp_signed('==', right_status,
-                                         ir.Constant(int32, 1))
-        left_none = builder.icmp_signed('==', left_na_kind,
-                                        ir.Constant(int32, _NA_NONE))
-        right_none = builder.icmp_signed('==', right_na_kind,
-                                         ir.Constant(int32, _NA_NONE))
-        left_nan = builder.icmp_signed('==', left_na_kind,
-                                       ir.Constant(int32, _NA_NAN))
-        right_nan = builder.icmp_signed('==', right_na_kind,
-                                        ir.Constant(int32, _NA_NAN))
-        left_default = builder.icmp_signed('==', left_na_kind,
-                                           ir.Constant(int32, 0))
-        none_error = builder.or_(
-            builder.and_(left_null, left_none),
-            builder.and_(builder.and_(right_null, right_none),
-                         builder.not_(left_default)),
-        )
-        nan_false = builder.or_(
-            builder.and_(left_null, left_nan),
-            builder.and_(builder.and_(right_null, right_nan),
-                         builder.not_(left_default)),
-        )
 
-        result = cgutils.alloca_once(builder, int32)
-        builder.store(ir.Constant(int32, 0), result)
-        with builder.if_else(none_error) as (error, no_error):
-            with error:
-                builder.store(ir.Constant(int32, STRINGDTYPE_ORDER_ERROR),
-                              result)
-            with no_error:
-                with builder.if_else(nan_false) as (false_path, compare_path):
-                    with false_path:
-                        builder.store(
-                            ir.Constant(int32, STRINGDTYPE_ORDER_FALSE),
-                            result,
-                        )
-                    with compare_path:
-                        right_empty = left_default
-                        left_status, left_size, left_buffer = \
-                            _resolve_binary_na_value(
-                                builder, left_status, left_size, left_buffer,
-                                left_na_kind, left_na_size, left_na_buffer,
-                                cgutils.false_bit, int32, intp, int8)
-                        right_status, right_size, right_buffer = \
-                            _resolve_binary_na_value(
-                                builder, right_status, right_size,
-                                right_buffer, right_na_kind, right_na_size,
-                                right_na_buffer, right_empty, int32, intp,
-                                int8)
-                        left_valid = builder.icmp_signed(
-                            '==', left_status, ir.Constant(int32, 0))
-                        right_valid = builder.icmp_signed(
-                            '==', right_status, ir.Constant(int32, 0))
-                        with builder.if_then(builder.and_(left_valid,
-                                                          right_valid)):
-                            builder.store(
-                                _stringdtype_byte_compare_safe(
-                                    builder, left_size, left_buffer,
-                                    right_size, right_buffer, intp, int8,
-                                    int32,
-                                ),
-                                result,
-                            )
+        def loaded():
+            left_status, left_size, left_buffer = _load_string(
+                builder, left_allocator, left_packed, intp, byte_ptr)
+            right_status, right_size, right_buffer = _load_string(
+                builder, right_allocator, right_packed, intp, byte_ptr)
+
+            left_null = builder.icmp_signed('==', left_status,
+                                            ir.Constant(int32, 1))
+            right_null = builder.icmp_signed('==', right_status,
+                                             ir.Constant(int32, 1))
+            left_none = builder.icmp_signed('==', left_na_kind,
+                                            ir.Constant(int32, _NA_NONE))
+            right_none = builder.icmp_signed('==', right_na_kind,
+                                             ir.Constant(int32, _NA_NONE))
+            left_nan = builder.icmp_signed('==', left_na_kind,
+                                           ir.Constant(int32, _NA_NAN))
+            right_nan = builder.icmp_signed('==', right_na_kind,
+                                            ir.Constant(int32, _NA_NAN))
+            left_default = builder.icmp_signed('==', left_na_kind,
+                                               ir.Constant(int32, 0))
+            none_error = builder.or_(
+                builder.and_(left_null, left_none),
+                builder.and_(builder.and_(right_null, right_none),
+                             builder.not_(left_default)),
+            )
+            nan_false = builder.or_(
+                builder.and_(left_null, left_nan),
+                builder.and_(builder.and_(right_null, right_nan),
+                             builder.not_(left_default)),
+            )
 
-        return builder.load(result)
+            right_empty = left_default
+            left_status, left_size, left_buffer = _resolve_binary_na_value(
+                builder, left_status, left_size, left_buffer, left_na_kind,
+                left_na_size, left_na_buffer, cgutils.false_bit, int32, intp,
+                int8)
+            right_status, right_size, right_buffer = \
+                _resolve_binary_na_value(
+                    builder, right_status, right_size, right_buffer,
+                    right_na_kind, right_na_size, right_na_buffer,
+                    right_empty, int32, intp, int8)
+            left_valid = builder.icmp_signed(
+                '==', left_status, ir.Constant(int32, 0))
+            right_valid = builder.icmp_signed(
+                '==', right_status, ir.Constant(int32, 0))
+            compare = builder.and_(
+                builder.and_(left_valid, right_valid),
+                builder.not_(builder.or_(none_error, nan_false)),
+            )
+
+            result = cgutils.alloca_once(builder, int32)
+            builder.store(ir.Constant(int32, 0), result)
+            with builder.if_then(compare):
+                builder.store(
+                    _stringdtype_byte_compare_safe(
+                        builder, left_size, left_buffer, right_size,
+                        right_buffer, intp, int8, int32,
+                    ),
+                    result,
+                )
+            return builder.select(
+                none_error,
+                ir.Constant(int32, STRINGDTYPE_ORDER_ERROR),
+                builder.select(
+                    nan_false,
+                    ir.Constant(int32, STRINGDTYPE_ORDER_FALSE),
+                    builder.load(result),
+                ),
+            )
+
+        return _with_inline_packets(
+            builder, left_packed, right_packed, int32,
+            _inline_packets_compare, loaded, int32)
 
     return sig, codegen
 
@@ -4516,6 +5009,135 @@ def utf8_count_stringdtype_sliced_na_data(
     )
 
 
+StringDTypeBuilder = namedtuple('StringDTypeBuilder',
+                                ['values', 'sizes', 'offsets', 'utf8'])
+StringDTypeBuilder.__doc__ = """A StringDType array being built in nopython mode.
+
+Made by ``stringdtype_reserve``. Row ``i`` is written as UTF-8 into
+``utf8[offsets[i]:offsets[i + 1]]`` and packed into ``values`` by
+``stringdtype_finish``; a negative ``sizes[i]`` makes the row null.
+"""
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_reserve(values, sizes):
+    """Start filling ``values``, a new array from ``stringdtype_empty_like``.
+
+    ``sizes[i]`` is the UTF-8 byte count of row ``i``, or ``-1`` for a null,
+    which needs an ``na_object``. One buffer holds every row's bytes, so
+    the rows are written without an allocator call and packed in one pass.
+    Reserving neither takes the GIL nor locks an allocator, so it may run
+    while the caller holds the allocator of the strings it reads.
+    """
+    n_values = sizes.size
+    if values.size != n_values:
+        raise ValueError('sizes must have one entry per row of the array')
+    offsets = np.empty(n_values + 1, np.intp)
+    offsets[0] = 0
+    for i in range(n_values):
+        size = sizes[i]
+        if size < 0:
+            if stringdtype_na_kind(values) == 0:
+                raise ValueError('null rows need a StringDType with an '
+                                 'na_object')
+            size = 0
+        offsets[i + 1] = offsets[i] + size
+    return StringDTypeBuilder(values, sizes, offsets,
+                              np.empty(offsets[n_values], np.uint8))
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_row(builder, index):
+    """Return the bytes reserved for one row as a writeable view."""
+    return builder.utf8[builder.offsets[index]:builder.offsets[index + 1]]
+
+
+@register_jitable(**JIT_OPTIONS)
+def stringdtype_finish(builder):
+    """Pack every reserved row and return the built StringDType array.
+
+    Strings of up to 15 bytes go into their packets inline; longer ones are
+    copied into the arena under the array's allocator, which is held for
+    the single packing pass only.
+    """
+    values, sizes, offsets, utf8 = builder
+    if values.size == 0:
+        return values
+    allocator = stringdtype_acquire_allocator(values)
+    data = stringdtype_data_ptr(values)
+    status = 0
+    for i in range(values.size):
+        if sizes[i] < 0:
+            status |= stringdtype_pack_null_data(data, i, allocator)
+        else:
+            status |= stringdtype_pack_data(data, i, allocator, utf8,
+                                            offsets[i], sizes[i])
+    stringdtype_release_allocator(allocator)
+    if status:
+        raise MemoryError('could not pack the StringDType strings')
+    return values
+
+
+def _box_stringdtype_array(typ, val, c):
+    # Every StringDType array in nopython mode views a NumPy array, whose
+    # descriptor (and allocator) a returned view keeps.
+    array = c.context.make_array(typ)(c.context, c.builder, value=val)
+    result = cgutils.alloca_once_value(c.builder, c.pyapi.get_null_object())
+    with c.builder.if_else(cgutils.is_null(c.builder, array.parent)) \
+            as (missing, present):
+        with missing:
+            c.pyapi.err_set_string(
+                'PyExc_TypeError',
+                'cannot box a StringDType array without a parent array',
+            )
+        with present:
+            dtype = c.pyapi.object_getattr_string(array.parent, 'dtype')
+            with cgutils.if_likely(c.builder,
+                                   cgutils.is_not_null(c.builder, dtype)):
+                c.builder.store(
+                    c.pyapi.nrt_adapt_ndarray_to_python(typ, val, dtype),
+                    result,
+                )
+                c.pyapi.decref(dtype)
+    c.context.nrt.decref(c.builder, typ, val)
+    return c.builder.load(result)
+
+
+# Numba's boxer for other arrays, which the StringDType boxer falls back to.
+_BOX_ARRAY = None
+
+
+def _install_box():
+    global _BOX_ARRAY
+    if _STRING_DTYPE is None:
+        return
+
+    # Numba registers its boxers when this module is first imported.
+    importlib.import_module('numba.core.boxing')
+    functions = getattr(_boxers, 'functions', None)
+    box_array = _boxers.lookup(types.Array)
+    if not isinstance(functions, dict) \
+            or functions.get(types.Array) is not box_array:
+        # The registry is not the one this was written against: leave it
+        # alone, and let the builders refuse to type.
+        return
+    wrapped = getattr(box_array, '_charex_box_array', None)
+    if wrapped is not None:
+        # Installed already, e.g. by an earlier import of this module.
+        _BOX_ARRAY = wrapped
+        return
+
+    def _stringdtype_box_array(typ, val, c):
+        if isinstance(typ.dtype, StringDTypePacket):
+            return _box_stringdtype_array(typ, val, c)
+        return box_array(typ, val, c)
+
+    _stringdtype_box_array._charex_box_array = box_array
+    # Registering a second boxer for a type raises, so replace the entry.
+    functions[types.Array] = _stringdtype_box_array
+    _BOX_ARRAY = box_array
+
+
 def _install_typeof():
     if _STRING_DTYPE is None:
         return
@@ -4551,3 +5173,4 @@ def _install_typeof():
 
 
 _install_typeof()
+_install_box()
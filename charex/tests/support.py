@@ -2,6 +2,18 @@ import numpy as np
 import pytest
 
 
+def log_records():
+    """Return access-log records whose string fields are strided views."""
+    records = np.zeros(5, dtype=[('host', 'S32'), ('path', 'U128'),
+                                 ('status', 'i4')])
+    records['host'] = [b'api.example.com', b'cdn.example.com ', b'',
+                       b'api.example.com', b'API\x00x']
+    records['path'] = ['/api/v1/items?id=1', '/static/app.js', '',
+                       '/api/v2/items/\u0161 ', '/api\x00/v1']
+    records['status'] = [200, 304, 0, 404, 500]
+    return records
+
+
 def copy_arg(arg):
     if isinstance(arg, np.ndarray):
         return arg.copy()
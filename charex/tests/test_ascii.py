@@ -0,0 +1,97 @@
+"""Tests for charex ASCII detection and the ASCII predicate fast paths."""
+
+import numpy as np
+import pytest
+from numba import njit
+
+import charex
+
+
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+PREDICATES = ('isalpha', 'isalnum', 'isdecimal', 'isdigit', 'isnumeric',
+              'isspace', 'isupper', 'islower', 'istitle')
+BYTES_PREDICATES = ('isalpha', 'isalnum', 'isdigit', 'isspace', 'isupper',
+                    'islower', 'istitle')
+WORDS = ['', 'abc', 'ABC', 'Abc Def', 'abc1', '123', ' \t', '\x1c', 'Ab\x00c',
+         '\x00ab', 'aBc', 'x y', 'Title Case', 'TITLE case', '~', 'éÉ',
+         'ÉCOLE', 'Élan Vital', 'ǅa', '١٢٣', 'a١']
+
+
+@njit(nogil=True, cache=False)
+def jit_isascii(values):
+    return charex.isascii(values)
+
+
+def test_isascii_fixed_width():
+    for dtype in ('U1', 'U3', 'U17', 'S5', 'S16'):
+        for n in (0, 1, 7, 8, 9, 100):
+            values = np.array(['a' * (k % 4) for k in range(n)], dtype=dtype)
+            assert jit_isascii(values)
+            assert charex.isascii(values)
+            if n == 0:
+                continue
+            for row in (0, n // 2, n - 1):
+                broken = values.copy()
+                broken[row] = 'é' if dtype[0] == 'U' else b'\xe9'
+                assert not jit_isascii(broken)
+                assert not jit_isascii(broken[::-1])
+                assert jit_isascii(np.delete(broken, row))
+
+
+def test_isascii_scalars_and_views():
+    assert charex.isascii('abc') and not charex.isascii('abcé')
+    assert charex.isascii(b'abc') and not charex.isascii(b'ab\xff')
+    values = np.array(['abc', 'dé', 'xyz'])
+    assert jit_isascii(values[::2]) and not jit_isascii(values[1::2])
+    records = np.zeros(4, [('id', 'i4'), ('name', 'U3')])
+    records['name'] = ['a', 'b', 'c', 'd']
+    assert jit_isascii(records['name'])
+    records['name'][3] = 'ü'
+    assert not jit_isascii(records['name'])
+    # Code points beyond the Unicode range are not ASCII either.
+    invalid = np.array([0x41, 0x80000000], np.uint32).view('U1')
+    assert not jit_isascii(invalid) and not jit_isascii(invalid[::-1])
+
+
+def test_isascii_follows_writes():
+    values = np.array(['abc', 'def'], 'U3')
+    values.flags.writeable = False
+    assert charex.isascii(values)
+    # Unfreezing, writing and freezing again leaves no stale answer.
+    values.flags.writeable = True
+    values[0] = 'é'
+    values.flags.writeable = False
+    assert not charex.isascii(values)
+    view = values[1:]
+    assert charex.isascii(view)
+    values.flags.writeable = True
+    values[1] = 'dé'
+    assert not charex.isascii(view)
+
+
+@pytest.mark.skipif(STRING_DTYPE is None,
+                    reason='StringDType requires NumPy 2')
+def test_isascii_stringdtype():
+    values = np.array(['abc', '', 'xyz'], dtype=STRING_DTYPE())
+    assert jit_isascii(values)
+    values[1] = 'naïve'
+    assert not jit_isascii(values) and jit_isascii(values[::2])
+    nulls = np.array(['abc', None], dtype=STRING_DTYPE(na_object=None))
+    assert jit_isascii(nulls)
+
+
+@pytest.mark.parametrize('predicate', PREDICATES)
+def test_predicates_mix_ascii_rows(predicate):
+    rng = np.random.default_rng(len(predicate))
+    values = np.array(WORDS, dtype='U12')[rng.integers(0, len(WORDS), 400)]
+    numpy_function = getattr(np.char, predicate)
+    function = njit(lambda v: numpy_function(v))
+    for view in (values, values[::-3]):
+        np.testing.assert_array_equal(function(view),
+                                      numpy_function(view))
+    if predicate in BYTES_PREDICATES:
+        encoded = np.array([value.encode() for value in values.tolist()],
+                           dtype='S12')
+        np.testing.assert_array_equal(function(encoded),
+                                      numpy_function(encoded))
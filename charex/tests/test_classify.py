@@ -0,0 +1,94 @@
+"""Tests for charex single-pass string classification."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+from charex.functions.classify import BYTES_KINDS, KINDS
+
+
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+WORDS = ['', 'abc', 'ABC', 'Abc Def', 'abc1', '123', '١٢٣', ' \t', '\x1c',
+         'ǅa', 'ǅA', 'Ab\x00c', 'éÉ', 'ÉCOLE', 'Title Case', 'aBc', '½',
+         'x y', 'Ⅻ']
+
+
+@njit(nogil=True, cache=False)
+def jit_classify(values):
+    return charex.classify(values), \
+        charex.classify(values, ('istitle', 'isspace', 'isalpha'))
+
+
+def _expected(values, kinds):
+    mask = np.zeros(values.size, np.uint16)
+    for k, kind in enumerate(kinds):
+        mask |= getattr(np.char, kind)(values).astype(np.uint16) << k
+    return mask
+
+
+@pytest.mark.parametrize('n', [0, 1, 300])
+def test_classify_matches_numpy(n):
+    rng = np.random.default_rng(n)
+    values = np.array(WORDS, dtype='U10')[rng.integers(0, len(WORDS), n)]
+    for view in (values, values[::-3]):
+        every, some = jit_classify(view)
+        np.testing.assert_array_equal(every, _expected(view, KINDS))
+        np.testing.assert_array_equal(
+            some, _expected(view, ('istitle', 'isspace', 'isalpha')))
+        np.testing.assert_array_equal(charex.classify(view, ['isdigit']),
+                                      _expected(view, ['isdigit']))
+    encoded = np.array([value.encode()[:10] for value in values.tolist()],
+                       dtype='S10')
+    np.testing.assert_array_equal(charex.classify(encoded, BYTES_KINDS),
+                                  _expected(encoded, BYTES_KINDS))
+    # Bytes values default to the kinds np.char has bytes loops for.
+    np.testing.assert_array_equal(charex.classify(encoded),
+                                  _expected(encoded, BYTES_KINDS))
+    np.testing.assert_array_equal(jit_classify(encoded)[0],
+                                  _expected(encoded, BYTES_KINDS))
+
+
+def test_classify_scalar_and_out():
+    assert charex.classify('Abc', ('istitle', 'isupper', 'isalpha')) == 0b101
+    assert charex.classify(b' \t', ('isspace',)) == 1
+    values = np.array(WORDS, dtype='U10')
+    out = np.empty(values.size, np.uint16)
+    assert charex.classify(values, KINDS, out) is out
+    np.testing.assert_array_equal(out, _expected(values, KINDS))
+    with pytest.raises(ValueError, match='names of string predicates'):
+        charex.classify(values, ('isalpha', 'isfoo'))
+    with pytest.raises(TypingError, match='dtype uint16'):
+        charex.classify(values, KINDS, np.empty(values.size, np.int64))
+
+
+@pytest.mark.parametrize('kinds', [('isdigit', 'isdecimal'), ('isnumeric',)])
+def test_classify_bytes_rejects_unicode_kinds(kinds):
+    # np.char.isdecimal and np.char.isnumeric have no bytes loops.
+    values = np.array([b'123', b'abc'], dtype='S3')
+
+    with pytest.raises(TypeError, match='only available for Unicode'):
+        charex.classify(values, kinds)
+    with pytest.raises(TypeError, match='only available for Unicode'):
+        njit(lambda values: charex.classify(values, ('isnumeric',)))(values)
+
+
+@pytest.mark.skipif(STRING_DTYPE is None,
+                    reason='StringDType requires NumPy 2.x')
+def test_classify_stringdtype():
+    values = np.array(WORDS, dtype='U10')
+    strings = values.astype(STRING_DTYPE())
+    every, some = jit_classify(strings)
+    np.testing.assert_array_equal(every, _expected(values, KINDS))
+    np.testing.assert_array_equal(
+        some, _expected(values, ('istitle', 'isspace', 'isalpha')))
+
+    nan_values = np.array(['Ab', np.nan, '12'],
+                          dtype=STRING_DTYPE(na_object=np.nan))
+    np.testing.assert_array_equal(charex.classify(nan_values, KINDS),
+                                  _expected(nan_values, KINDS))
+    none_values = np.array(['Ab', None], dtype=STRING_DTYPE(na_object=None))
+    with pytest.raises(ValueError, match='nan-like'):
+        charex.classify(none_values)
@@ -2,9 +2,15 @@
 
 import numpy as np
 import pytest
+from numba import njit
 
+from charex.core.string_intrinsics import (
+    register_array_bytes, register_array_bytes_strided,
+    register_array_strings, register_array_strings_strided,
+)
 from charex.tests.definitions import ComparisonOperators
-from charex.tests.support import assert_same, assert_same_view
+from charex.numpy.overloads.definitions import record_layout
+from charex.tests.support import assert_same, assert_same_view, log_records
 
 
 COMPARE_FUNCS = [
@@ -32,6 +38,13 @@ COMPARISON_CASES = [
 ]
 
 
+def _field_view(values, dtype):
+    """Return values as a field at an odd byte offset of a packed record."""
+    records = np.zeros(len(values), dtype=[('tag', 'S3'), ('value', dtype)])
+    records['value'] = values
+    return records['value']
+
+
 STRIDED_COMPARISON_CASES = [
     (
         np.array(['abc ', 'skip', 'abc\x00x', 'skip', 'abd'], dtype='U6')[::2],
@@ -71,6 +84,55 @@ STRIDED_COMPARISON_CASES = [
                  dtype='S6')[::2],
         b'abc',
     ),
+    (
+        _field_view(['abc ', 'abd', '', 'ab'], 'U4'),
+        np.array(['ab', '', 'abd', 'abc'], dtype='U4')[::-1],
+    ),
+    (
+        _field_view([b'abc ', b'abd', b'', b'ab'], 'S4'),
+        np.broadcast_to(np.array([b'abd'], dtype='S4'), (4,)),
+    ),
+    (log_records()['host'], log_records()['host'][::-1]),
+    (log_records()['path'][::-1], '/api/v2/items/\u0161'),
+]
+
+
+_GRID_U = np.array([['abc ', 'abd', ''], ['ab', 'b', 'abc\x00x']], dtype='U6')
+_OTHER_U = np.array([['abc', 'abc', 'a'], ['ab', '', 'abd']], dtype='U6')
+_GRID_S = np.char.encode(_GRID_U)
+_OTHER_S = np.char.encode(_OTHER_U)
+# Taller than wide, so the row walk runs down the columns.
+_TALL_U = np.resize(_GRID_U, (12, 4))
+_TALL_OTHER_U = np.resize(_OTHER_U, (12, 4))
+
+ND_COMPARISON_CASES = [
+    (_GRID_U, _OTHER_U),
+    (_GRID_S, _OTHER_S),
+    (np.asfortranarray(_GRID_U), np.asfortranarray(_OTHER_U)),
+    (_GRID_U, np.asfortranarray(_OTHER_U)),
+    (_GRID_S[:, ::-1], _OTHER_S[:, ::-1]),
+    (_GRID_U.T, 'abc'),
+    (b'ab', _GRID_S),
+    (np.stack([_GRID_U, _OTHER_U]), np.stack([_OTHER_U, _GRID_U])[:, ::-1]),
+    (_GRID_U[:, :0], _OTHER_U[:, :0]),
+    (_TALL_U[:, ::2], _TALL_OTHER_U[:, ::2]),
+    (_TALL_U[::2, 1:2], 'abc'),
+    (_TALL_U.reshape(3, 4, 4)[:, ::2, ::-3],
+     _TALL_OTHER_U.reshape(3, 4, 4)[:, 1::2, ::3]),
+]
+
+BROADCAST_COMPARISON_CASES = [
+    (_GRID_U[:, :1], _OTHER_U[:1]),
+    (_GRID_S[:1], _OTHER_S[:, 1:2]),
+    (_GRID_U, _OTHER_U[0]),
+    (_GRID_S[1], _OTHER_S),
+    (np.asfortranarray(_GRID_U[:, :1]), np.asfortranarray(_OTHER_U[:1])),
+    (_GRID_U[:, None, :], _OTHER_U[:, ::-1]),
+    (_GRID_U[:1, :0], _OTHER_U[:, :1]),
+    (np.array(['abc'], dtype='U4'), _OTHER_U[0]),
+    (np.array([b'ab '], dtype='S3'), _OTHER_S[1]),
+    (_TALL_U[:, :1], _TALL_OTHER_U[:1]),
+    (_TALL_U[:, None, ::2], _TALL_OTHER_U[::3, 1::2]),
 ]
 
 
@@ -89,6 +151,28 @@ def test_comparison_strided_arrays_match_numpy(
     assert_same_view(getattr(ch, impl_name), baseline, left, right)
 
 
+@pytest.mark.parametrize('_, impl_name, baseline', COMPARE_FUNCS)
+@pytest.mark.parametrize('left, right', ND_COMPARISON_CASES)
+def test_comparison_nd_arrays_match_numpy(_, impl_name, baseline, left, right):
+    ch = ComparisonOperators()
+    assert_same_view(getattr(ch, impl_name), baseline, left, right)
+
+
+@pytest.mark.parametrize('_, impl_name, baseline', COMPARE_FUNCS)
+@pytest.mark.parametrize('left, right', BROADCAST_COMPARISON_CASES)
+def test_comparison_broadcast_arrays_match_numpy(
+        _, impl_name, baseline, left, right):
+    ch = ComparisonOperators()
+    assert_same_view(getattr(ch, impl_name), baseline, left, right)
+    assert_same_view(getattr(ch, impl_name), baseline, right, left)
+
+
+def test_comparison_nd_shape_mismatch_raises():
+    ch = ComparisonOperators()
+    with pytest.raises(ValueError, match='shape mismatch'):
+        ch.char_equal(_GRID_U, _GRID_U[:, :2])
+
+
 @pytest.mark.parametrize('_, impl_name, baseline', COMPARE_FUNCS)
 @pytest.mark.parametrize(
     'left, right',
@@ -171,7 +255,9 @@ def test_compare_chararrays_matches_numpy(left, right, cmp, rstrip):
 
 @pytest.mark.parametrize('cmp', ['==', '!=', '>=', '>', '<', '<='])
 @pytest.mark.parametrize('rstrip', [True, False])
-@pytest.mark.parametrize('left, right', STRIDED_COMPARISON_CASES[:6])
+@pytest.mark.parametrize('left, right',
+                         STRIDED_COMPARISON_CASES[:6] + ND_COMPARISON_CASES[:5]
+                         + BROADCAST_COMPARISON_CASES[:4])
 def test_compare_chararrays_strided_arrays_match_numpy(
         left, right, cmp, rstrip):
     ch = ComparisonOperators()
@@ -193,3 +279,73 @@ def test_compare_chararrays_does_not_mutate_inputs():
     assert_same(ch.char_compare_chararrays,
                 np.char.compare_chararrays,
                 values, 'abc', '==', True)
+
+
+@pytest.mark.parametrize('_, impl_name, baseline', COMPARE_FUNCS)
+@pytest.mark.parametrize('kind, width', [('U', 24), ('U', 40),
+                                         ('S', 24), ('S', 40)])
+def test_comparison_rstrips_long_whitespace_runs(_, impl_name, baseline,
+                                                 kind, width):
+    ch = ComparisonOperators()
+    enc = (lambda value: value) if kind == 'U' \
+        else (lambda value: value.encode())
+    rows = ['abc' + ' \t\n\r\f\v'[k % 6] * k for k in range(22)]
+    rows += ['abc' + ' ' * 9 + 'x', ' ' * 20 + 'y', '\x1f' * 8, '!' * 24]
+    left = np.array([enc(row) for row in rows], dtype=f'{kind}{width}')
+    right = np.array([enc(row[::-1]) for row in rows],
+                     dtype=f'{kind}{width}')
+    assert_same(getattr(ch, impl_name), baseline, left, enc('abc'))
+    assert_same(getattr(ch, impl_name), baseline, left, right)
+
+
+def test_rstrip_registration_does_not_copy_arrays():
+    @njit(nogil=True, cache=False)
+    def registered(values, chars):
+        return (register_array_strings(values, True)[0],
+                register_array_bytes(chars, True)[0])
+
+    values = np.array(['abc  ', 'x\t'], dtype='U5')
+    chars = np.array([b'abc  ', b'x\t'], dtype='S5')
+    value_units, char_units = registered(values, chars)
+    assert np.shares_memory(value_units, values)
+    assert np.shares_memory(char_units, chars)
+
+
+def test_strided_registration_does_not_copy_arrays():
+    @njit(nogil=True, cache=False)
+    def registered(values, chars):
+        return (register_array_strings_strided(values, False)[0],
+                register_array_bytes_strided(chars, False)[0])
+
+    values = np.array(['abc', 'de', 'f', 'gh'], dtype='U3')
+    chars = np.array([b'abc', b'de', b'f', b'gh'], dtype='S3')
+    for step in (2, -1, -3):
+        value_units, char_units = registered(values[::step], chars[::step])
+        assert np.shares_memory(value_units, values)
+        assert np.shares_memory(char_units, chars)
+        assert value_units.shape == (values[::step].size, 3)
+
+
+def test_record_field_layout_does_not_copy_arrays():
+    @njit(nogil=True, cache=False)
+    def layouts(paths, hosts):
+        path_units, _, size_path = register_array_strings_strided(paths)
+        host_units, _, size_host = register_array_bytes_strided(hosts)
+        return (record_layout(path_units, size_path),
+                record_layout(host_units, size_host))
+
+    records = log_records()
+    for step in (1, -2):
+        paths, hosts = records['path'][::step], records['host'][::step]
+        (path_units, path_start, path_pitch), \
+            (host_units, host_start, host_pitch) = layouts(paths, hosts)
+        assert np.shares_memory(path_units, records)
+        assert np.shares_memory(host_units, records)
+        assert path_pitch == paths.strides[0] // 4
+        assert host_pitch == hosts.strides[0]
+        for i, (path, host) in enumerate(zip(paths, hosts)):
+            row = path_start + i * path_pitch
+            assert ''.join(map(chr, path_units[row:row + 128])) \
+                .rstrip('\x00') == path
+            row = host_start + i * host_pitch
+            assert bytes(host_units[row:row + 32]).rstrip(b'\x00') == host
@@ -0,0 +1,118 @@
+"""Tests for charex dictionary-encoded string columns."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+STRINGS = getattr(np, 'strings', None)
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+WORDS = np.array(['apple pie', 'banana', '', 'Grape', 'pineapple', '123',
+                  'apple pie'], dtype='U12')
+
+
+def _values(n):
+    rng = np.random.default_rng(n)
+    return WORDS[rng.integers(0, WORDS.size, n)]
+
+
+@njit(nogil=True, cache=False)
+def jit_operations(column, sub):
+    return (np.char.isalpha(column), np.char.isdigit(column),
+            np.char.str_len(column), np.char.count(column, sub),
+            np.char.find(column, sub, 1), np.char.rfind(column, sub, 0, 6),
+            np.char.startswith(column, sub), np.char.endswith(column, sub),
+            np.char.equal(column, sub), np.char.less(sub, column),
+            np.char.greater_equal(column, sub))
+
+
+def _operations(values, sub):
+    return (np.char.isalpha(values), np.char.isdigit(values),
+            np.char.str_len(values), np.char.count(values, sub),
+            np.char.find(values, sub, 1), np.char.rfind(values, sub, 0, 6),
+            np.char.startswith(values, sub), np.char.endswith(values, sub),
+            np.char.equal(values, sub), np.char.less(sub, values),
+            np.char.greater_equal(values, sub))
+
+
+@pytest.mark.parametrize('n', [0, 1, 500])
+@pytest.mark.parametrize('kind', ['U', 'S'])
+def test_encoded_matches_numpy(n, kind):
+    values = _values(n)
+    sub = 'ap'
+    if kind == 'S':
+        values, sub = values.astype('S12'), b'ap'
+    column = charex.encoded(values)
+    assert isinstance(column, charex.EncodedStrings)
+    assert column.codes.dtype == np.int32
+    np.testing.assert_array_equal(column.uniques[column.codes], values)
+    for got, expected in zip(jit_operations(column, sub),
+                             _operations(values, sub)):
+        np.testing.assert_array_equal(got, expected)
+
+
+def test_encoded_array_operand_and_out():
+    values = _values(50)
+    others = _values(51)[1:]
+
+    @njit(cache=False)
+    def run(values, others, out):
+        column = charex.encoded(values)
+        return (np.char.equal(column, others),
+                np.char.find(others, column, 0, None, out))
+
+    out = np.empty(values.size, np.int64)
+    equal, found = run(values, others, out)
+    assert found is out
+    np.testing.assert_array_equal(equal, np.char.equal(values, others))
+    np.testing.assert_array_equal(out, np.char.find(others, values))
+
+
+@pytest.mark.skipif(STRINGS is None, reason='np.strings requires NumPy 2')
+def test_encoded_strings_namespace():
+    @njit(cache=False)
+    def run(column):
+        return (np.strings.isalpha(column), np.strings.less(column, 'b'),
+                np.strings.find(column, 'pp'), np.strings.str_len(column))
+
+    values = _values(100)
+    expected = (STRINGS.isalpha(values), STRINGS.less(values, 'b'),
+                STRINGS.find(values, 'pp'), STRINGS.str_len(values))
+    for got, expected in zip(run(charex.encoded(values)), expected):
+        np.testing.assert_array_equal(got, expected)
+
+
+@pytest.mark.skipif(STRING_DTYPE is None,
+                    reason='StringDType requires NumPy 2.x')
+def test_encoded_stringdtype():
+    @njit(cache=False)
+    def run(column):
+        return (np.strings.isalpha(column), np.strings.find(column, 'pp'),
+                np.strings.equal(column, 'banana'))
+
+    values = _values(100).astype(STRING_DTYPE(na_object='n/a'))
+    column = charex.encoded(values)
+    assert column.uniques.dtype == values.dtype
+    np.testing.assert_array_equal(column.uniques[column.codes], values)
+    expected = (STRINGS.isalpha(values), STRINGS.find(values, 'pp'),
+                STRINGS.equal(values, 'banana'))
+    for got, expected in zip(run(column), expected):
+        np.testing.assert_array_equal(got, expected)
+    with pytest.raises(TypingError, match='scalar other operand'):
+        njit(lambda column, other: np.strings.equal(column, other))(
+            column, values)
+
+    values = values.astype(STRING_DTYPE(na_object=None))
+    values[::7] = None
+    for column in (charex.encoded(values), njit(charex.encoded)(values)):
+        assert column.uniques[column.codes].tolist() == values.tolist()
+        assert column.uniques.tolist().count(None) == 1
+
+
+def test_encoded_rejects_non_1d():
+    with pytest.raises(TypingError, match='one-dimensional'):
+        charex.encoded(np.array([['a', 'b']]))
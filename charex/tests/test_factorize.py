@@ -0,0 +1,77 @@
+"""Tests for charex dictionary encoding."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+WORDS = np.array(['', 'a', 'ab', 'abc', 'é', '中文', '😀', 'a\x00b', 'zz',
+                  'key'] + ['w%d' % i for i in range(3000)], dtype='U5')
+
+
+@njit(nogil=True, cache=False)
+def jit_factorize(values, sort):
+    return charex.factorize(values, sort)
+
+
+def _values(n):
+    rng = np.random.default_rng(n)
+    return WORDS[rng.integers(0, WORDS.size, n)]
+
+
+def _check(values, codes, uniques, sort):
+    assert codes.dtype == np.int32
+    np.testing.assert_array_equal(uniques[codes], values)
+    if sort:
+        expected, inverse = np.unique(values, return_inverse=True)
+        np.testing.assert_array_equal(uniques, expected)
+        np.testing.assert_array_equal(codes, inverse.ravel())
+    else:
+        _, first = np.unique(values, return_index=True)
+        np.testing.assert_array_equal(uniques, values[np.sort(first)])
+
+
+@pytest.mark.parametrize('sort', [False, True])
+@pytest.mark.parametrize('n', [0, 1, 60, 20000])
+def test_factorize_matches_numpy(n, sort):
+    values = _values(n)
+    for view in (values, values[::-2], np.char.encode(values, 'utf8')):
+        _check(view, *jit_factorize(view, sort), sort)
+        _check(view, *charex.factorize(view, sort), sort)
+
+
+def test_factorize_index():
+    values = np.array(['b', 'a', 'b', 'c', 'a'], dtype='U1')
+    codes, first = charex.factorize_index(values)
+    np.testing.assert_array_equal(codes, [0, 1, 0, 2, 1])
+    np.testing.assert_array_equal(first, [0, 1, 3])
+    codes, first = charex.factorize_index(values, sort=True)
+    np.testing.assert_array_equal(codes, [1, 0, 1, 2, 0])
+    np.testing.assert_array_equal(first, [1, 0, 3])
+
+
+@pytest.mark.skipif(STRING_DTYPE is None,
+                    reason='StringDType requires NumPy 2.x')
+@pytest.mark.parametrize('sort', [False, True])
+def test_factorize_stringdtype(sort):
+    values = _values(5000).astype(STRING_DTYPE())
+    _check(values, *charex.factorize(values, sort), sort)
+    _check(values[::-3], *jit_factorize(values[::-3], sort), sort)
+    values = np.array(['b', None, 'a', 'b', None],
+                      dtype=STRING_DTYPE(na_object=None))
+    for codes, uniques in (charex.factorize(values, sort),
+                           jit_factorize(values, sort)):
+        np.testing.assert_array_equal(codes, [1, -1, 0, 1, -1] if sort
+                                      else [0, -1, 1, 0, -1])
+        assert uniques.dtype == values.dtype
+        assert uniques.tolist() == (['a', 'b'] if sort else ['b', 'a'])
+
+
+def test_factorize_rejects_non_1d():
+    with pytest.raises(TypingError, match='one-dimensional'):
+        charex.factorize(WORDS.reshape(-1, 2))
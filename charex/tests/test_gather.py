@@ -0,0 +1,95 @@
+"""Tests for charex StringDType take, compress and concatenate."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+pytestmark = pytest.mark.skipif(STRING_DTYPE is None,
+                                reason='StringDType requires NumPy 2')
+
+WORDS = ['', 'a', 'USD', 'x' * 15, 'y' * 16, 'naïve café', 'z' * 300,
+         'ERROR: disk full']
+
+
+@njit(nogil=True, cache=False)
+def jit_errors(values):
+    # Filter, gather and search without leaving nopython mode.
+    kept = charex.compress(np.strings.str_len(values) > 0, values)
+    joined = charex.concatenate((kept, charex.take(kept, np.arange(2))))
+    return joined, np.strings.startswith(joined, 'ERROR')
+
+
+def string_values(na_object, n_values, seed):
+    rng = np.random.default_rng(seed)
+    picks = rng.integers(0, len(WORDS), n_values)
+    values = np.array([WORDS[k] for k in picks],
+                      dtype=STRING_DTYPE(na_object=na_object))
+    if n_values and na_object is not None:
+        values[rng.random(n_values) < 0.2] = na_object
+    return values
+
+
+def assert_same_strings(result, expected):
+    assert result.dtype == expected.dtype
+    assert result.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize('na_object', [None, 'MISSING'])
+@pytest.mark.parametrize('n_values', [0, 1, 9, 200])
+def test_take_and_compress_match_numpy(na_object, n_values):
+    values = string_values(na_object, n_values, n_values)
+    rng = np.random.default_rng(n_values + 1)
+    for view in (values, values[::-2]):
+        indices = rng.integers(-view.size, view.size, 3 * view.size)
+        assert_same_strings(charex.take(view, indices),
+                            np.take(view, indices))
+        condition = rng.random(view.size) < 0.5
+        assert_same_strings(charex.compress(condition, view),
+                            np.compress(condition, view))
+        assert_same_strings(charex.compress(condition[:view.size // 2], view),
+                            np.compress(condition[:view.size // 2], view))
+
+
+def test_concatenate_matches_numpy():
+    values = string_values(np.nan, 50, 3)
+    parts = (values, values[::-3], values[:0], values[7:8])
+    result = charex.concatenate(parts)
+    expected = np.concatenate(parts)
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(charex.isnull(result),
+                                  charex.isnull(expected))
+    kept = ~charex.isnull(expected)
+    np.testing.assert_array_equal(result[kept], expected[kept])
+    # The copy owns its strings: changing it leaves the sources alone.
+    result[:] = 'q' * 40
+    assert not (values[~charex.isnull(values)] == 'q' * 40).any()
+
+
+def test_gather_chain_in_nopython_mode():
+    values = np.array(['ERROR: x', '', 'ok', 'ERROR: disk full and more',
+                       ''], dtype=STRING_DTYPE())
+    joined, errors = jit_errors(values)
+    assert joined.tolist() == ['ERROR: x', 'ok', 'ERROR: disk full and more',
+                               'ERROR: x', 'ok']
+    np.testing.assert_array_equal(errors, [True, False, True, True, False])
+
+
+def test_gather_errors():
+    values = np.array(['abc', 'def'], dtype=STRING_DTYPE())
+    with pytest.raises(IndexError):
+        charex.take(values, [2])
+    with pytest.raises(ValueError, match='longer'):
+        charex.compress([True, False, True], values)
+    with pytest.raises(ValueError, match='at least one'):
+        charex.concatenate([])
+    with pytest.raises(TypingError):
+        charex.concatenate((values, np.array(['abc'], dtype=STRING_DTYPE(
+            na_object=None))))
+    with pytest.raises(TypingError):
+        charex.take(np.array(['abc']), [0])
@@ -0,0 +1,87 @@
+"""Tests for charex prebuilt length indexes."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+STRINGS = getattr(np, 'strings', None)
+
+VALUES = np.array(['apple pie', 'banana', '', 'applesauce  ', 'grape',
+                   'pineapple'], dtype='U12')
+
+
+@njit(nogil=True, cache=False)
+def jit_searches(index, sub, empty):
+    return (np.char.count(index, sub), np.char.find(index, sub, 1),
+            np.char.rfind(index, sub), np.char.index(index, empty),
+            np.char.rindex(index, empty, 0, -1),
+            np.char.startswith(index, sub),
+            np.char.endswith(index, sub, 0, 5), np.char.str_len(index))
+
+
+@njit(nogil=True, cache=False)
+def jit_unwrapped(index, sub):
+    return (np.char.equal(index, index.values), np.char.less(sub, index),
+            np.char.isalpha(index))
+
+
+def _searches(values, sub, empty):
+    return (np.char.count(values, sub), np.char.find(values, sub, 1),
+            np.char.rfind(values, sub), np.char.index(values, empty),
+            np.char.rindex(values, empty, 0, -1),
+            np.char.startswith(values, sub),
+            np.char.endswith(values, sub, 0, 5), np.char.str_len(values))
+
+
+@pytest.mark.parametrize('values', [VALUES, VALUES[::-2], VALUES.astype('S12')],
+                         ids=['contiguous', 'strided', 'bytes'])
+def test_indexed_matches_numpy(values):
+    sub = b'ap' if values.dtype.kind == 'S' else 'ap'
+    index = charex.indexed(values)
+    assert isinstance(index, charex.IndexedStrings)
+    assert index.values is values
+    np.testing.assert_array_equal(index.lengths, np.char.str_len(values))
+    empty = sub[:0]
+    for got, expected in zip(jit_searches(index, sub, empty),
+                             _searches(values, sub, empty)):
+        np.testing.assert_array_equal(got, expected)
+    expected = (np.char.equal(values, values), np.char.less(sub, values),
+                np.char.isalpha(values))
+    for got, expected in zip(jit_unwrapped(index, sub), expected):
+        np.testing.assert_array_equal(got, expected)
+
+
+def test_indexed_both_operands_and_out():
+    subs = np.array(['pie', 'an', '', 'sauce', 'x', 'apple'], dtype='U5')
+
+    @njit(cache=False)
+    def run(values, subs, out):
+        return np.char.find(charex.indexed(values), charex.indexed(subs),
+                            out=out)
+
+    out = np.empty(VALUES.size, np.int64)
+    assert run(VALUES, subs, out) is out
+    np.testing.assert_array_equal(out, np.char.find(VALUES, subs))
+
+
+@pytest.mark.skipif(STRINGS is None, reason='np.strings requires NumPy 2')
+def test_indexed_strings_namespace():
+    @njit(cache=False)
+    def run(index):
+        return (np.strings.equal(index, 'grape '), np.strings.less(index, 'b'),
+                np.strings.find(index, 'pp'), np.strings.str_len(index))
+
+    index = charex.indexed(VALUES)
+    expected = (STRINGS.equal(VALUES, 'grape '), STRINGS.less(VALUES, 'b'),
+                STRINGS.find(VALUES, 'pp'), STRINGS.str_len(VALUES))
+    for got, expected in zip(run(index), expected):
+        np.testing.assert_array_equal(got, expected)
+
+
+def test_indexed_requires_1d_array():
+    with pytest.raises(TypingError, match='one-dimensional'):
+        charex.indexed(VALUES.reshape(2, 3))
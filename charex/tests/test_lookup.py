@@ -0,0 +1,96 @@
+"""Tests for charex hash-table membership and lookup."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+WORDS = np.array(['', 'a', 'ab', 'abc', 'é', '中文', '😀', 'a\x00b', 'zz',
+                  'key'], dtype='U4')
+CANDIDATES = np.array(['ab', 'é', '', '😀', 'ab', 'nope'], dtype='U4')
+
+
+@njit(nogil=True, cache=False)
+def jit_lookup(values, candidates):
+    return charex.isin(values, candidates), charex.lookup(values, candidates)
+
+
+def _expected_lookup(values, candidates):
+    candidates = candidates.tolist()
+    return np.array([candidates.index(value) if value in candidates else -1
+                     for value in values.tolist()], dtype=np.int64)
+
+
+def _values(n):
+    rng = np.random.default_rng(n)
+    return WORDS[rng.integers(0, WORDS.size, n)]
+
+
+def _check(values, candidates):
+    isin, lookup = jit_lookup(values, candidates)
+    np.testing.assert_array_equal(isin, np.isin(values, candidates))
+    np.testing.assert_array_equal(lookup,
+                                  _expected_lookup(values, candidates))
+    np.testing.assert_array_equal(charex.isin(values, candidates), isin)
+    np.testing.assert_array_equal(charex.lookup(values, candidates), lookup)
+
+
+@pytest.mark.parametrize('n', [0, 1, 200])
+def test_lookup_matches_numpy(n):
+    values = _values(n)
+    _check(values, CANDIDATES)
+    _check(values[::-3], CANDIDATES[::-1])
+    _check(np.char.encode(values, 'utf8'),
+           np.char.encode(CANDIDATES, 'utf8'))
+    _check(values, CANDIDATES[:0])
+
+
+def test_lookup_large_vocabulary_and_out():
+    rng = np.random.default_rng(1)
+    vocabulary = np.array(['id-%d' % value for value in
+                           rng.integers(0, 10 ** 6, 5000)], dtype='U10')
+    values = np.array(['id-%d' % value for value in
+                       rng.integers(0, 10 ** 6, 5000)], dtype='U10')
+    values[::2] = vocabulary[rng.integers(0, vocabulary.size, 2500)]
+    out = np.empty(values.size, np.int64)
+    assert charex.lookup(values, vocabulary, out) is out
+    np.testing.assert_array_equal(out, _expected_lookup(values, vocabulary))
+    assert charex.isin('id-%d' % 7, vocabulary) \
+        == ('id-%d' % 7 in vocabulary.tolist())
+    assert charex.lookup(vocabulary[9], vocabulary) \
+        == vocabulary.tolist().index(vocabulary[9])
+
+
+@pytest.mark.skipif(STRING_DTYPE is None,
+                    reason='StringDType requires NumPy 2.x')
+def test_lookup_stringdtype():
+    values = _values(200)
+    strings = values.astype(STRING_DTYPE())
+    candidates = CANDIDATES.astype(STRING_DTYPE())
+    for left, right in ((strings, candidates), (strings, CANDIDATES),
+                        (values, candidates), (strings[::-2], candidates[1:])):
+        isin, lookup = jit_lookup(left, right)
+        np.testing.assert_array_equal(isin, np.isin(left, right))
+        np.testing.assert_array_equal(
+            lookup, _expected_lookup(left, right.astype(left.dtype)))
+
+
+@pytest.mark.skipif(STRING_DTYPE is None,
+                    reason='StringDType requires NumPy 2.x')
+@pytest.mark.parametrize('na_object', [None, np.nan, 'ab'])
+def test_lookup_stringdtype_nulls(na_object):
+    dtype = STRING_DTYPE(na_object=na_object)
+    values = np.array(['a', na_object, 'ab', 'x'], dtype=dtype)
+    candidates = np.array(['x', na_object, 'ab'], dtype=dtype)
+    np.testing.assert_array_equal(charex.isin(values, candidates),
+                                  np.isin(values, candidates))
+
+
+def test_lookup_rejects_mixed_kinds():
+    with pytest.raises(TypingError, match='both be bytes or both be str'):
+        charex.isin(WORDS, np.char.encode(CANDIDATES, 'utf8'))
@@ -0,0 +1,108 @@
+"""Tests for charex multi-pattern search functions."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+def reference(rows, patterns):
+    """Brute-force first-ending pattern id, overlap count and hit matrix."""
+    first = []
+    counts = []
+    hits = np.zeros((len(rows), len(patterns)), dtype=bool)
+    for i, row in enumerate(rows):
+        best = None
+        total = 0
+        for j, pattern in enumerate(patterns):
+            ends = [k + len(pattern)
+                    for k in range(len(row) - len(pattern) + 1)
+                    if row[k:k + len(pattern)] == pattern]
+            total += len(ends)
+            if ends:
+                hits[i, j] = True
+                if best is None or (ends[0], j) < best:
+                    best = (ends[0], j)
+        first.append(-1 if best is None else best[1])
+        counts.append(total)
+    return np.array(first, dtype=np.int64), np.array(counts, dtype=np.int64), hits
+
+
+@njit(nogil=True, cache=False)
+def jit_find_any(values, patterns):
+    return charex.find_any(values, patterns)
+
+
+@njit(nogil=True, cache=False)
+def jit_count_any(values, patterns):
+    return charex.count_any(values, patterns)
+
+
+@njit(nogil=True, cache=False)
+def jit_contains_any(values, patterns):
+    return charex.contains_any(values, patterns)
+
+
+CASES = [
+    (['he said hers', 'ushers', 'nothing', ''], ['he', 'she', 'his', 'hers']),
+    (['aaaa', 'abab', 'ba'], ['a', 'aa', 'ab', 'aa']),
+    (['abc', ''], ['', 'bc']),
+    (['abc\x00x', 'x\x00'], ['c\x00x', 'x']),
+    (['šaš', 'aša', 'ab'], ['aš', 'š', 'b']),
+    (['abc', 'def'], []),
+    (['alpha beta alpha', 'betalpha', 'gamma'], ['alpha', 'beta', 'lph']),
+]
+
+
+def _trimmed(value):
+    return value.rstrip(b'\x00' if isinstance(value, bytes) else '\x00')
+
+
+def _arrays(rows, patterns, kind):
+    if kind == 'S':
+        rows = [row.replace('š', 'x').encode() for row in rows]
+        patterns = [pattern.replace('š', 'x').encode() for pattern in patterns]
+        return (np.array(rows, dtype='S16'),
+                np.array(patterns, dtype='S8'),
+                rows, patterns)
+    return (np.array(rows, dtype='U16'), np.array(patterns, dtype='U8'),
+            rows, patterns)
+
+
+@pytest.mark.parametrize('kind', ['U', 'S'])
+@pytest.mark.parametrize('rows, patterns', CASES)
+def test_multi_pattern_matches_reference(rows, patterns, kind):
+    values, needles, rows, patterns = _arrays(rows, patterns, kind)
+    first, counts, hits = reference([_trimmed(row) for row in rows],
+                                    [_trimmed(pattern) for pattern in patterns])
+    for implementation in (charex.find_any, jit_find_any):
+        np.testing.assert_array_equal(implementation(values, needles), first)
+    for implementation in (charex.count_any, jit_count_any):
+        np.testing.assert_array_equal(implementation(values, needles), counts)
+    for implementation in (charex.contains_any, jit_contains_any):
+        result = implementation(values, needles)
+        assert result.shape == hits.shape
+        np.testing.assert_array_equal(result, hits)
+
+
+def test_multi_pattern_strided_values():
+    values = np.array(['skip', 'hers', 'skip', 'she'], dtype='U4')[::-2]
+    needles = np.array(['hers', 'he'], dtype='U4')
+    np.testing.assert_array_equal(charex.find_any(values, needles), [1, 1])
+    np.testing.assert_array_equal(charex.count_any(values, needles), [1, 2])
+
+
+def test_multi_pattern_scalar_values():
+    needles = np.array(['bc', 'ab'], dtype='U2')
+    assert charex.find_any('xxabc', needles) == 1
+    assert jit_count_any('xxabc', needles) == 2
+    np.testing.assert_array_equal(charex.contains_any('abx', needles),
+                                  [False, True])
+
+
+def test_multi_pattern_mixed_kinds_rejected():
+    with pytest.raises(TypingError, match='both be bytes or both be str'):
+        charex.find_any(np.array(['abc'], dtype='U3'),
+                        np.array([b'a'], dtype='S1'))
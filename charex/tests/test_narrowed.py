@@ -0,0 +1,117 @@
+"""Tests for charex narrow code unit copies."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+STRINGS = getattr(np, 'strings', None)
+
+VALUES = np.array(['apple pie', 'banana', '', 'applesauce  ', 'grape\t',
+                   'pineapple', 'ápple', 'ze\x00ro'], dtype='U12')
+PATTERNS = ['apple', 'pp', '', 'grape', 'á', 'ā', '€', 'z', 'ze\x00ro']
+
+
+@njit(nogil=True, cache=False)
+def jit_operations(column, sub):
+    return (np.char.equal(column, sub), np.char.not_equal(sub, column),
+            np.char.less(column, sub), np.char.greater_equal(sub, column),
+            np.char.count(column, sub), np.char.find(column, sub, 1),
+            np.char.rfind(column, sub), np.char.startswith(column, sub),
+            np.char.endswith(column, sub, 0, 5), np.char.str_len(column),
+            np.char.isalpha(column))
+
+
+def _operations(values, sub):
+    return (np.char.equal(values, sub), np.char.not_equal(sub, values),
+            np.char.less(values, sub), np.char.greater_equal(sub, values),
+            np.char.count(values, sub), np.char.find(values, sub, 1),
+            np.char.rfind(values, sub), np.char.startswith(values, sub),
+            np.char.endswith(values, sub, 0, 5), np.char.str_len(values),
+            np.char.isalpha(values))
+
+
+@pytest.mark.parametrize('values, dtype', [
+    (VALUES[VALUES != 'ápple'], np.uint8),
+    (VALUES, np.uint8),
+    (np.append(VALUES, 'ÿ'), np.uint16),
+    (np.append(VALUES, 'a\U0001f600'), np.uint32),
+    (VALUES[::-2], np.uint8),
+], ids=['ascii', 'latin-1', 'ucs-2', 'ucs-4', 'strided'])
+def test_narrowed_matches_numpy(values, dtype):
+    column = charex.narrowed(values)
+    assert isinstance(column, charex.NarrowedStrings)
+    assert column.values is values
+    assert column.units.dtype == dtype
+    assert column.units.shape == (values.size, values.itemsize // 4)
+    for sub in PATTERNS:
+        for got, expected in zip(jit_operations(column, sub),
+                                 _operations(values, sub)):
+            np.testing.assert_array_equal(got, expected)
+
+
+def test_narrowed_columns():
+    other = VALUES[::-1].copy()
+
+    @njit(cache=False)
+    def run(left, right, plain):
+        return (np.char.equal(left, right), np.char.less(left, right),
+                np.char.find(left, right), np.char.greater(left, plain))
+
+    expected = (np.char.equal(VALUES, other), np.char.less(VALUES, other),
+                np.char.find(VALUES, other), np.char.greater(VALUES, other))
+    for right in (charex.narrowed(other), charex.narrowed(other, np.uint16)):
+        for got, want in zip(run(charex.narrowed(VALUES), right, other),
+                             expected):
+            np.testing.assert_array_equal(got, want)
+
+
+def test_narrowed_nopython_and_out():
+    @njit(cache=False)
+    def run(values, out):
+        column = charex.narrowed(values, np.uint16)
+        return column.units, np.char.startswith(column, 'app', out=out)
+
+    out = np.empty(VALUES.size, np.bool_)
+    units, result = run(VALUES, out)
+    assert result is out
+    np.testing.assert_array_equal(out, np.char.startswith(VALUES, 'app'))
+    assert units.dtype == np.uint16
+    np.testing.assert_array_equal(units[:, 0],
+                                  [ord(value[:1] or '\0') for value in VALUES])
+
+
+def test_narrowed_errors():
+    with pytest.raises(ValueError, match='do not fit'):
+        charex.narrowed(np.array(['aÿ']), np.uint8)
+    with pytest.raises(ValueError, match='do not fit'):
+        charex.narrowed(np.array(['a€']), np.uint8)
+    with pytest.raises(TypingError, match='one-dimensional unicode'):
+        charex.narrowed(np.array([b'apple']))
+    with pytest.raises(TypingError, match='uint8, uint16 or uint32'):
+        charex.narrowed(VALUES, np.int16)
+
+    @njit(cache=False)
+    def run(values):
+        return charex.narrowed(values)
+
+    with pytest.raises(TypingError, match='needs a dtype'):
+        run(VALUES)
+
+
+@pytest.mark.skipif(STRINGS is None, reason='np.strings requires NumPy 2')
+def test_narrowed_strings_namespace():
+    @njit(cache=False)
+    def run(column):
+        return (np.strings.equal(column, 'grape\t'),
+                np.strings.less(column, 'b'), np.strings.find(column, 'pp'),
+                np.strings.count(column, '€'))
+
+    column = charex.narrowed(VALUES)
+    expected = (STRINGS.equal(VALUES, 'grape\t'), STRINGS.less(VALUES, 'b'),
+                STRINGS.find(VALUES, 'pp'), STRINGS.count(VALUES, '€'))
+    for got, want in zip(run(column), expected):
+        np.testing.assert_array_equal(got, want)
@@ -0,0 +1,124 @@
+"""Tests for charex StringDType null masks."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+pytestmark = pytest.mark.skipif(STRING_DTYPE is None,
+                                reason='StringDType requires NumPy 2')
+
+WORDS = ['USD', '', 'a much longer string kept in the arena', 'é', 'x' * 15,
+         'y' * 16, 'z' * 300]
+
+
+@njit(nogil=True, cache=False)
+def jit_nulls(values):
+    return charex.isnull(values), charex.isnull(values, True), \
+        charex.masked(values).valid
+
+
+@njit(nogil=True, cache=False)
+def jit_masked_compare(masked, sub):
+    return (np.strings.equal(masked, sub), np.strings.not_equal(sub, masked),
+            np.strings.less(masked, sub), np.strings.greater(sub, masked),
+            np.strings.startswith(masked, sub),
+            np.strings.endswith(masked, sub, 1), np.strings.isalpha(masked))
+
+
+@njit(nogil=True, cache=False)
+def jit_masked_search(masked, sub):
+    return (np.strings.find(masked, sub), np.strings.count(masked, 'a'),
+            np.strings.rfind(masked, sub, 0, 20), np.strings.str_len(masked))
+
+
+@njit(nogil=True, cache=False)
+def jit_masked_index(masked, sub):
+    return np.strings.index(masked, sub)
+
+
+def null_values(na_object, n_values, seed):
+    rng = np.random.default_rng(seed)
+    mask = rng.random(n_values) < 0.2
+    words = rng.integers(0, len(WORDS), n_values)
+    values = np.array([na_object if null else WORDS[word]
+                       for null, word in zip(mask, words)],
+                      dtype=STRING_DTYPE(na_object=na_object))
+    return values, mask
+
+
+@pytest.mark.parametrize('na_object', [None, np.nan, 'MISSING'])
+@pytest.mark.parametrize('n_values', [0, 1, 7, 8, 9, 100])
+def test_isnull_matches_mask(na_object, n_values):
+    values, mask = null_values(na_object, n_values, n_values)
+    for view, expected in ((values, mask), (values[::-3], mask[::-3])):
+        bits = np.packbits(expected, bitorder='little')
+        nulls, packed, valid = jit_nulls(view)
+        np.testing.assert_array_equal(nulls, expected)
+        np.testing.assert_array_equal(charex.isnull(view), expected)
+        np.testing.assert_array_equal(packed, bits)
+        np.testing.assert_array_equal(charex.isnull(view, packed=True), bits)
+        np.testing.assert_array_equal(
+            valid, np.packbits(~expected, bitorder='little'))
+        result = charex.masked(view)
+        assert isinstance(result, charex.MaskedStrings)
+        assert result.values is view
+        np.testing.assert_array_equal(result.valid, valid)
+
+
+def test_isnull_overwritten_and_default():
+    values = np.array(['abc', None, 'y' * 40], dtype=STRING_DTYPE(
+        na_object=None))
+    values[0] = None
+    values[1] = 'x' * 40
+    np.testing.assert_array_equal(charex.isnull(values),
+                                  [True, False, False])
+    default = np.array(['abc', '', 'y' * 40], dtype=STRING_DTYPE())
+    assert not charex.isnull(default).any()
+    np.testing.assert_array_equal(charex.masked(default).valid, [0b111])
+
+
+def test_isnull_rejects_fixed_width():
+    with pytest.raises(TypingError):
+        charex.isnull(np.array(['abc']))
+
+
+@pytest.mark.parametrize('na_object', [None, np.nan, 'MISSING'])
+@pytest.mark.parametrize('sub', ['USD', 'a much longer string kept'])
+def test_masked_operations_skip_nulls(na_object, sub):
+    values, mask = null_values(na_object, 100, 5)
+    masked = charex.masked(values)
+    kept = values[~mask].astype(STRING_DTYPE())
+    strings = np.strings
+    expected = (
+        (strings.equal(kept, sub), strings.not_equal(sub, kept),
+         strings.less(kept, sub), strings.greater(sub, kept),
+         strings.startswith(kept, sub), strings.endswith(kept, sub, 1),
+         strings.isalpha(kept)),
+        (strings.find(kept, sub), strings.count(kept, 'a'),
+         strings.rfind(kept, sub, 0, 20), strings.str_len(kept)))
+    results = (jit_masked_compare(masked, sub),
+               jit_masked_search(masked, sub))
+    for group, wants in zip(results, expected):
+        for (result, valid), want in zip(group, wants):
+            np.testing.assert_array_equal(valid, masked.valid)
+            np.testing.assert_array_equal(result[~mask], want)
+            assert not result[mask].any()
+
+
+def test_masked_index_and_errors():
+    values = np.array(['abc', None, 'cab', None], dtype=STRING_DTYPE(
+        na_object=None))
+    masked = charex.masked(values)
+    result, _ = jit_masked_index(masked, 'a')
+    np.testing.assert_array_equal(result, [0, 0, 1, 0])
+    values[2] = 'xyz'
+    with pytest.raises(ValueError, match='substring not found'):
+        jit_masked_index(charex.masked(values), 'a')
+    with pytest.raises(TypingError, match='str scalar'):
+        jit_masked_compare(masked, values)
@@ -0,0 +1,246 @@
+"""Tests for preallocated out= result buffers."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+from charex.core import PARALLEL_OPTIONS
+
+
+@njit(nogil=True, cache=False)
+def char_into(values, other, sub, flags, counts):
+    results = []
+    np.char.equal(values, other, flags)
+    results.append(flags.astype(np.int64))
+    np.char.not_equal(values, other, out=flags)
+    results.append(flags.astype(np.int64))
+    np.char.less_equal(values, other, out=flags)
+    results.append(flags.astype(np.int64))
+    np.char.compare_chararrays(values, other, '>', True, flags)
+    results.append(flags.astype(np.int64))
+    np.char.startswith(values, sub, out=flags)
+    results.append(flags.astype(np.int64))
+    np.char.endswith(values, sub, 1, None, flags)
+    results.append(flags.astype(np.int64))
+    np.char.isalpha(values, out=flags)
+    results.append(flags.astype(np.int64))
+    np.char.islower(values, out=flags)
+    results.append(flags.astype(np.int64))
+    np.char.count(values, sub, out=counts)
+    results.append(counts.copy())
+    np.char.find(values, sub, 0, None, counts)
+    results.append(counts.copy())
+    np.char.rfind(values, sub, out=counts)
+    results.append(counts.copy())
+    np.char.str_len(values, out=counts)
+    results.append(counts.copy())
+    return results
+
+
+def char_reference(values, other, sub):
+    return [
+        np.char.equal(values, other),
+        np.char.not_equal(values, other),
+        np.char.less_equal(values, other),
+        np.char.compare_chararrays(values, other, '>', True),
+        np.char.startswith(values, sub),
+        np.char.endswith(values, sub, 1, None),
+        np.char.isalpha(values),
+        np.char.islower(values),
+        np.char.count(values, sub),
+        np.char.find(values, sub),
+        np.char.rfind(values, sub),
+        np.char.str_len(values),
+    ]
+
+
+ROWS = ['abab', 'ab', '', 'xyzab', 'Ab ab', 'ba']
+OTHER = ['abab', 'abc', '', 'xyz', 'ab', 'b']
+
+
+@pytest.mark.parametrize('kind', ['U', 'S'])
+def test_char_out_matches_numpy(kind):
+    values = np.array(ROWS, dtype=f'{kind}5')
+    other = np.array(OTHER, dtype=f'{kind}5')
+    sub = values.dtype.type('ab').item()
+    flags = np.empty(values.size, np.bool_)
+    counts = np.empty(values.size, np.int64)
+    results = char_into(values, other, sub, flags, counts)
+    for result, expected in zip(results, char_reference(values, other, sub)):
+        np.testing.assert_array_equal(result, expected)
+
+
+def test_out_is_returned_and_written_in_place():
+    @njit(nogil=True, cache=False)
+    def into(values, out):
+        return np.char.find(values, 'b', out=out)
+
+    values = np.array(ROWS, dtype='U5')
+    out = np.full(values.size + 2, 99, np.int64)
+    view = out[1:-1]
+    result = into(values, view)
+    np.testing.assert_array_equal(result, np.char.find(values, 'b'))
+    np.testing.assert_array_equal(out[[0, -1]], [99, 99])
+    assert np.shares_memory(result, out)
+
+
+def test_out_strided_buffer():
+    @njit(nogil=True, cache=False)
+    def into(values, out):
+        return np.char.str_len(values, out=out)
+
+    values = np.array(ROWS, dtype='S5')
+    out = np.zeros(2 * values.size, np.int64)
+    into(values, out[::2])
+    np.testing.assert_array_equal(out[::2], np.char.str_len(values))
+    np.testing.assert_array_equal(out[1::2], 0)
+
+
+@pytest.mark.parametrize('order', ['C', 'F'])
+def test_out_nd_buffer(order):
+    @njit(nogil=True, cache=False)
+    def into(values, flags, counts):
+        np.char.startswith(values, 'ab', out=flags)
+        np.char.count(values, 'ab', out=counts)
+        return flags, counts
+
+    values = np.asarray(np.array(ROWS, dtype='U5').reshape(2, 3), order=order)
+    flags = np.zeros((2, 3), np.bool_, order=order)
+    counts = np.zeros((3, 2), np.int64).T
+    result = into(values, flags, counts)
+    assert result[0] is flags and result[1] is counts
+    np.testing.assert_array_equal(flags, np.char.startswith(values, 'ab'))
+    np.testing.assert_array_equal(counts, np.char.count(values, 'ab'))
+    with pytest.raises(ValueError, match='wrong shape'):
+        into(values, flags, np.zeros((3, 2), np.int64))
+
+
+def test_out_strided_nd_buffer():
+    @njit(nogil=True, cache=False)
+    def into(values, counts, lengths):
+        np.char.count(values, 'ab', out=counts)
+        np.char.str_len(values, out=lengths)
+        return counts, lengths
+
+    values = np.resize(np.array(ROWS, dtype='U5'), (12, 4))[:, ::2]
+    counts = np.zeros((2, 12), np.int64).T
+    lengths = np.zeros((12, 4), np.int64)[:, 1::2]
+    into(values, counts, lengths)
+    np.testing.assert_array_equal(counts, np.char.count(values, 'ab'))
+    np.testing.assert_array_equal(lengths, np.char.str_len(values))
+
+
+def test_out_broadcast_buffer():
+    @njit(nogil=True, cache=False)
+    def into(values, subs, out):
+        return np.char.find(values, subs, out=out)
+
+    values = np.array(ROWS, dtype='U5').reshape(-1, 1)
+    subs = np.array(['a', 'b', 'ab', 'c'], dtype='U2')
+    out = np.empty((values.shape[0], subs.size), np.int64)
+    assert into(values, subs, out) is out
+    np.testing.assert_array_equal(out, np.char.find(values, subs))
+
+
+def test_out_shape_mismatch_raises():
+    @njit(nogil=True, cache=False)
+    def into(values, out):
+        return np.char.equal(values, values, out=out)
+
+    values = np.array(ROWS, dtype='U5')
+    with pytest.raises(ValueError, match='wrong shape'):
+        into(values, np.empty(values.size - 1, np.bool_))
+
+
+@pytest.mark.parametrize('out', [
+    np.empty(6, np.int32),
+    np.empty((6, 1), np.bool_),
+])
+def test_out_type_is_validated(out):
+    @njit(nogil=True, cache=False)
+    def into(values, out):
+        return np.char.isdigit(values, out=out)
+
+    with pytest.raises(TypingError, match='out must'):
+        into(np.array(ROWS, dtype='U5'), out)
+
+
+def test_out_rejected_for_scalar_results():
+    @njit(nogil=True, cache=False)
+    def into(value, out):
+        return np.char.str_len(value, out=out)
+
+    with pytest.raises(TypingError, match='array results'):
+        into('abc', np.empty(1, np.int64))
+
+
+def test_multi_pattern_out():
+    values = np.array(['he said hers', 'ushers', 'nothing'], dtype='U16')
+    patterns = np.array(['he', 'she', 'hers'], dtype='U4')
+    out = np.empty(values.size, np.int64)
+    assert charex.find_any(values, patterns, out=out) is out
+    np.testing.assert_array_equal(out, charex.find_any(values, patterns))
+    charex.count_any(values, patterns, out)
+    np.testing.assert_array_equal(out, charex.count_any(values, patterns))
+
+
+def test_parallel_out():
+    saved = dict(PARALLEL_OPTIONS)
+    charex.set_parallel(True, min_bytes=0)
+    try:
+        @njit(nogil=True, cache=False)
+        def into(values, flags, counts):
+            np.char.greater(values, 'ab', out=flags)
+            np.char.index(values, 'a', out=counts)
+            return flags, counts
+
+        values = np.array(['ab%d' % i for i in range(97)], dtype='U4')
+        flags = np.empty(values.size, np.bool_)
+        counts = np.empty(values.size, np.int64)
+        into(values, flags, counts)
+        np.testing.assert_array_equal(flags, np.char.greater(values, 'ab'))
+        np.testing.assert_array_equal(counts, np.char.index(values, 'a'))
+    finally:
+        PARALLEL_OPTIONS.update(saved)
+
+
+STRINGS = getattr(np, 'strings', None)
+
+
+@pytest.mark.skipif(STRINGS is None,
+                    reason='np.strings is only available on NumPy 2.x')
+def test_strings_stringdtype_out():
+    from numpy.dtypes import StringDType
+
+    @njit(nogil=True, cache=False)
+    def into(values, flags, counts):
+        results = []
+        np.strings.equal(values, 'ab', out=flags)
+        results.append(flags.astype(np.int64))
+        np.strings.less(values, values, out=flags)
+        results.append(flags.astype(np.int64))
+        np.strings.startswith(values, 'a', out=flags)
+        results.append(flags.astype(np.int64))
+        np.strings.isalpha(values, out=flags)
+        results.append(flags.astype(np.int64))
+        np.strings.find(values, 'b', out=counts)
+        results.append(counts.copy())
+        np.strings.str_len(values, out=counts)
+        results.append(counts.copy())
+        return results
+
+    values = np.array(['ab', 'xab', '', 'béab'], dtype=StringDType())
+    flags = np.empty(values.size, np.bool_)
+    counts = np.empty(values.size, np.int64)
+    expected = [
+        np.strings.equal(values, 'ab'),
+        np.strings.less(values, values),
+        np.strings.startswith(values, 'a'),
+        np.strings.isalpha(values),
+        np.strings.find(values, 'b'),
+        np.strings.str_len(values),
+    ]
+    for result, reference in zip(into(values, flags, counts), expected):
+        np.testing.assert_array_equal(result, reference)
@@ -0,0 +1,246 @@
+"""Tests for the chunked parallel execution mode."""
+
+import numpy as np
+import pytest
+from numba import njit
+
+import charex
+from charex.core import PARALLEL_OPTIONS
+from charex.core.string_intrinsics import (
+    register_array_bytes, register_array_strings,
+)
+from charex.numpy.overloads import definitions
+from charex.numpy.overloads.parallel import (
+    found_kernel, row_kernel, stringdtype_rows,
+)
+
+
+STRINGS = getattr(np, 'strings', None)
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+
+@pytest.fixture
+def parallel_mode():
+    saved = dict(PARALLEL_OPTIONS)
+    charex.set_parallel(True, min_bytes=0)
+    try:
+        yield
+    finally:
+        PARALLEL_OPTIONS.update(saved)
+
+
+def test_set_parallel_updates_options():
+    saved = dict(PARALLEL_OPTIONS)
+    try:
+        charex.set_parallel(True, min_bytes=128)
+        assert PARALLEL_OPTIONS == dict(enabled=True, min_bytes=128)
+        charex.set_parallel(False)
+        assert PARALLEL_OPTIONS == dict(enabled=False, min_bytes=128)
+        with pytest.raises(ValueError):
+            charex.set_parallel(True, min_bytes=-1)
+    finally:
+        PARALLEL_OPTIONS.update(saved)
+
+
+def test_row_kernel_is_serial_by_default():
+    assert row_kernel(definitions.count, 2) is definitions.count
+    assert found_kernel(definitions.index, definitions.find) \
+        is definitions.index
+    assert stringdtype_rows(definitions.count) is definitions.count
+
+
+def test_parallel_kernels_match_numpy(parallel_mode):
+    count = row_kernel(definitions.count, 2)
+    equal = row_kernel(definitions.equal, 2)
+    greater = row_kernel(definitions.greater, 2)
+    isalpha = row_kernel(definitions.isalpha)
+    str_len = row_kernel(definitions.str_len_bytes)
+
+    @njit(nogil=True, cache=False)
+    def unicode_ops(values, other, sub):
+        chars = register_array_strings(values, False)
+        other_chars = register_array_strings(other, False)
+        sub_chars = register_array_strings(sub, False)
+        return (count(*chars, *sub_chars, 0, None),
+                count(*chars, *other_chars, 1, -1),
+                equal(*chars, *other_chars, True),
+                greater(*chars, *other_chars, False, True),
+                isalpha(*chars, False))
+
+    @njit(nogil=True, cache=False)
+    def bytes_len(values):
+        return str_len(*register_array_bytes(values, False))
+
+    values = np.array(['abcab%d' % i for i in range(103)], dtype='U8')
+    other = values.copy()
+    other[::3] = 'ab '
+    sub = np.array('ab', dtype='U2')
+    results = unicode_ops(values, other, sub)
+    np.testing.assert_array_equal(results[0], np.char.count(values, 'ab'))
+    np.testing.assert_array_equal(results[1],
+                                  np.char.count(values, other, 1, -1))
+    np.testing.assert_array_equal(results[2], np.char.equal(values, other))
+    np.testing.assert_array_equal(results[3], np.char.greater(values, other))
+    np.testing.assert_array_equal(results[4], np.char.isalpha(values))
+
+    encoded = np.char.encode(values[::-1])
+    np.testing.assert_array_equal(bytes_len(encoded),
+                                  np.char.str_len(encoded))
+
+
+def test_parallel_index_raises_once(parallel_mode):
+    index = found_kernel(definitions.index, definitions.find)
+
+    @njit(nogil=True, cache=False)
+    def index_ab(values, sub):
+        return index(*register_array_strings(values, False),
+                     *register_array_strings(sub, False), 0, None)
+
+    values = np.array(['xab%d' % i for i in range(50)], dtype='U5')
+    sub = np.array('ab', dtype='U2')
+    np.testing.assert_array_equal(index_ab(values, sub),
+                                  np.char.index(values, 'ab'))
+    values[31] = 'zzz'
+    with pytest.raises(ValueError, match='substring not found'):
+        index_ab(values, sub)
+
+
+def test_parallel_overloads_compiled_after_enabling(parallel_mode):
+    @njit(nogil=True, cache=False)
+    def search(values, sub):
+        return np.char.find(values, sub), np.char.isdigit(values)
+
+    values = np.array([b'%d-alpha' % i for i in range(200)], dtype='S29')
+    find, isdigit = search(values, b'alpha')
+    np.testing.assert_array_equal(find, np.char.find(values, b'alpha'))
+    np.testing.assert_array_equal(isdigit, np.char.isdigit(values))
+
+
+def test_parallel_lookup(parallel_mode):
+    @njit(nogil=True, cache=False)
+    def lookup(values, vocabulary):
+        return charex.isin(values, vocabulary), \
+            charex.lookup(values, vocabulary)
+
+    values = np.array(['k%d' % (i % 37) for i in range(300)], dtype='U4')
+    vocabulary = np.array(['k%d' % i for i in range(0, 60, 3)], dtype='U4')
+    isin, found = lookup(values, vocabulary)
+    np.testing.assert_array_equal(isin, np.isin(values, vocabulary))
+    expected = [vocabulary.tolist().index(value)
+                if value in vocabulary.tolist() else -1
+                for value in values.tolist()]
+    np.testing.assert_array_equal(found, expected)
+
+
+def test_parallel_classify(parallel_mode):
+    values = np.array(['Word', 'word', 'WORD', '42', ' ', ''] * 50, dtype='U4')
+    kinds = ('isalpha', 'isdigit', 'isspace', 'isupper', 'islower', 'istitle')
+    expected = np.zeros(values.size, np.uint16)
+    for k, kind in enumerate(kinds):
+        expected |= getattr(np.char, kind)(values).astype(np.uint16) << k
+    np.testing.assert_array_equal(charex.classify(values, kinds), expected)
+
+
+def test_parallel_narrowed(parallel_mode):
+    @njit(nogil=True, cache=False)
+    def run(column):
+        return np.char.equal(column, 'ab'), np.char.find(column, 'b€')
+
+    values = np.array(['ab', 'b€a', 'cab', ''] * 50, dtype='U3')
+    for dtype in (np.uint16, np.uint32):
+        equal, find = run(charex.narrowed(values, dtype))
+        np.testing.assert_array_equal(equal, np.char.equal(values, 'ab'))
+        np.testing.assert_array_equal(find, np.char.find(values, 'b€'))
+
+
+def test_parallel_multi_pattern(parallel_mode):
+    @njit(nogil=True, cache=False)
+    def search(values, patterns):
+        return charex.find_any(values, patterns), \
+            charex.count_any(values, patterns)
+
+    values = np.array(['%d-alpha-beta' % i for i in range(200)], dtype='U16')
+    patterns = np.array(['beta', '7', 'ph'], dtype='U4')
+    find, count = search(values, patterns)
+    ends = [[value.find(pattern) + len(pattern) if pattern in value else 99
+             for pattern in patterns.tolist()] for value in values.tolist()]
+    np.testing.assert_array_equal(find, np.argmin(ends, axis=1))
+    expected = sum(np.char.count(values, pattern)
+                   for pattern in patterns.tolist())
+    np.testing.assert_array_equal(count, expected)
+
+
+@pytest.mark.skipif(STRING_DTYPE is None,
+                    reason='StringDType requires NumPy 2')
+def test_parallel_stringdtype(parallel_mode):
+    @njit(nogil=True, cache=False)
+    def compare(values, other, sub):
+        return (np.strings.equal(values, sub),
+                np.strings.not_equal(values, other),
+                np.strings.less(values, sub),
+                np.strings.greater_equal(values, other),
+                np.strings.startswith(values, sub),
+                np.strings.endswith(values, sub, 1),
+                np.strings.isdigit(values))
+
+    @njit(nogil=True, cache=False)
+    def search(values, sub):
+        return (np.strings.find(values, sub), np.strings.count(values, 'a'),
+                np.strings.str_len(values))
+
+    @njit(nogil=True, cache=False)
+    def index(values, sub):
+        return np.strings.index(values, sub)
+
+    values = np.array(['%d-alpha' % i for i in range(300)], STRING_DTYPE())
+    other = values.copy()
+    other[::3] = 'x'
+    nulls = values.astype(STRING_DTYPE(na_object=np.nan))
+    nulls[::7] = np.nan
+    for sub in ('7-alpha', '1-alpha-' + 'é' * 20):
+        for column in (values, nulls):
+            right = other.astype(column.dtype)
+            expected = (STRINGS.equal(column, sub),
+                        STRINGS.not_equal(column, right),
+                        STRINGS.less(column, sub),
+                        STRINGS.greater_equal(column, right),
+                        STRINGS.startswith(column, sub),
+                        STRINGS.endswith(column, sub, 1),
+                        STRINGS.isdigit(column))
+            for result, want in zip(compare(column, right, sub), expected):
+                np.testing.assert_array_equal(result, want)
+        expected = (STRINGS.find(values, sub), STRINGS.count(values, 'a'),
+                    STRINGS.str_len(values))
+        for result, want in zip(search(values, sub), expected):
+            np.testing.assert_array_equal(result, want)
+
+    # The first failing row decides the error, as in the serial loop.
+    values = np.array(['%d-alpha' % i for i in range(300)],
+                      STRING_DTYPE(na_object=None))
+    np.testing.assert_array_equal(index(values, 'a'),
+                                  STRINGS.index(values, 'a'))
+    values[200] = 'zz'
+    values[250] = None
+    with pytest.raises(ValueError, match='substring not found'):
+        index(values, 'a')
+    values[100] = None
+    with pytest.raises(ValueError, match='null value'):
+        index(values, 'a')
+
+
+@pytest.mark.skipif(STRING_DTYPE is None,
+                    reason='StringDType requires NumPy 2')
+def test_parallel_masked_stringdtype(parallel_mode):
+    @njit(nogil=True, cache=False)
+    def search(masked, sub):
+        return np.strings.find(masked, sub), np.strings.str_len(masked)
+
+    values = np.array(['%d-alpha' % i for i in range(300)],
+                      STRING_DTYPE(na_object=None))
+    values[::7] = None
+    kept = values[1::7]
+    (found, valid), (lengths, _) = search(charex.masked(values), '7-a')
+    np.testing.assert_array_equal(valid, charex.masked(values).valid)
+    np.testing.assert_array_equal(found[1::7], STRINGS.find(kept, '7-a'))
+    np.testing.assert_array_equal(lengths[1::7], STRINGS.str_len(kept))
+    assert not found[::7].any() and not lengths[::7].any()
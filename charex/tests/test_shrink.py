@@ -0,0 +1,60 @@
+"""Tests for charex max_len and width-shrinking copies."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+VALUES = np.array(['apple pie', 'banana', '', 'a\x00b', 'grape  ',
+                   'pineapple' * 3, 'é'], dtype='U40')
+
+
+@njit(nogil=True, cache=False)
+def jit_shrink(values):
+    return charex.max_len(values), charex.shrink(values, 8)
+
+
+@pytest.mark.parametrize('values', [
+    VALUES, VALUES[::-2], VALUES[:0], np.zeros(3, 'U7'),
+    np.array(['abcdefg'] * 3, dtype='U7'),
+    np.array([b'ab', b'abcd\x00', b'x\x00y', b''], dtype='S12'),
+], ids=['contiguous', 'strided', 'empty', 'blank', 'full', 'bytes'])
+def test_shrink_matches_astype(values):
+    longest = np.char.str_len(values).max(initial=0)
+    assert charex.max_len(values) == longest
+    result = charex.shrink(values)
+    expected = values.astype(f'{values.dtype.kind}{max(longest, 1)}')
+    assert result.dtype == expected.dtype
+    np.testing.assert_array_equal(result, expected)
+    assert result.flags.c_contiguous
+    assert not np.shares_memory(result, values)
+    jit_longest, truncated = jit_shrink(values)
+    assert jit_longest == longest
+    expected = values.astype(f'{values.dtype.kind}8')
+    assert truncated.dtype == expected.dtype
+    np.testing.assert_array_equal(truncated, expected)
+
+
+def test_shrink_record_field():
+    records = np.zeros(4, [('id', 'i4'), ('name', 'U16')])
+    records['name'] = ['ab', 'abcde', '', 'abc']
+    assert charex.max_len(records['name']) == 5
+    np.testing.assert_array_equal(charex.shrink(records['name']),
+                                  records['name'].astype('U5'))
+
+
+def test_shrink_errors():
+    with pytest.raises(TypingError, match='one-dimensional fixed-width'):
+        charex.max_len(np.zeros((2, 2), 'U3'))
+    with pytest.raises(ValueError, match='must be positive'):
+        charex.shrink(VALUES, 0)
+
+    @njit(cache=False)
+    def run(values):
+        return charex.shrink(values)
+
+    with pytest.raises(TypingError, match='needs a width'):
+        run(VALUES)
@@ -0,0 +1,117 @@
+"""Tests for charex radix sorting."""
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core.errors import TypingError
+
+import charex
+
+
+WORDS = ['', 'a', 'a ', 'ab', 'b', 'a\x00b', 'ba', 'zz', 'abc   ', 'abc\t',
+         'é', 'ü', '中', '😀x', 'ab\x00']
+
+
+@njit(nogil=True, cache=False)
+def jit_argsort(values, rstrip):
+    return charex.argsort(values, rstrip)
+
+
+def _values(n, kind):
+    rng = np.random.default_rng(n)
+    values = np.array(WORDS, dtype='U6')[rng.integers(0, len(WORDS), n)]
+    if kind == 'S':
+        return np.array([value.encode()[:6] for value in values.tolist()],
+                        dtype='S6')
+    return values
+
+
+def _rstrip_order(values):
+    space = ' \t\n\r\x0b\x0c' if values.dtype.kind == 'U' else b' \t\n\r\x0b\x0c'
+    keys = np.array([value.rstrip(space) for value in values.tolist()],
+                    dtype=values.dtype)
+    return np.argsort(keys, kind='stable')
+
+
+@pytest.mark.parametrize('kind', ['U', 'S'])
+@pytest.mark.parametrize('n', [0, 1, 7, 40, 3000])
+def test_argsort_matches_numpy_stable(n, kind):
+    values = _values(n, kind)
+    for view in (values, values[::-1], values[::3]):
+        expected = np.argsort(view, kind='stable')
+        np.testing.assert_array_equal(charex.argsort(view), expected)
+        np.testing.assert_array_equal(jit_argsort(view, False), expected)
+        np.testing.assert_array_equal(charex.argsort(view, rstrip=True),
+                                      _rstrip_order(view))
+        np.testing.assert_array_equal(charex.sort(view),
+                                      np.sort(view, kind='stable'))
+
+
+def test_argsort_wide_code_points():
+    rng = np.random.default_rng(7)
+    values = np.array([''.join(chr(c) for c in row)
+                       for row in rng.integers(0x20, 0x10FFFF, (2000, 3))
+                       if not any(0xD800 <= c < 0xE000 for c in row)],
+                      dtype='U3')
+    np.testing.assert_array_equal(charex.argsort(values),
+                                  np.argsort(values, kind='stable'))
+
+
+def test_argsort_structured_field():
+    records = np.zeros(500, dtype=[('id', 'i4'), ('key', 'U8')])
+    records['key'] = ['k%d' % (i * 7919 % 97) for i in range(500)]
+    np.testing.assert_array_equal(charex.argsort(records['key']),
+                                  np.argsort(records['key'], kind='stable'))
+
+
+def test_argsort_rejects_non_1d():
+    with pytest.raises(TypingError, match='one-dimensional'):
+        charex.argsort(np.array([['a', 'b']]))
+
+
+PROBES = ['', 'a', 'ab', 'abc', 'abd', 'b', 'a\x00b', 'zz', 'é', '中', 'ÿĀ',
+          'abcdefgh', 'abcdefgi', 'key-0001', 'key-0002x', 'key-']
+
+
+@njit(nogil=True, cache=False)
+def jit_searchsorted(sorted_values, probes, side):
+    return charex.searchsorted(sorted_values, probes, side)
+
+
+@pytest.mark.parametrize('side', ['left', 'right'])
+@pytest.mark.parametrize('table', [
+    WORDS, ['key-%04d' % i for i in range(0, 400, 3)], ['ÿa', 'ÿz', 'ÿÿ'],
+], ids=['mixed', 'shared_prefix', 'latin1'])
+@pytest.mark.parametrize('n_probes', [2, 500])
+def test_searchsorted_matches_numpy(table, side, n_probes):
+    rng = np.random.default_rng(n_probes)
+    table = np.sort(np.array(table, dtype='U10')[
+        rng.integers(0, len(table), 60)])
+    probes = np.array(PROBES, dtype='U10')[
+        rng.integers(0, len(PROBES), n_probes)]
+    for sorted_values, needles in ((table, probes),
+                                   (table, probes[::-3].astype('U4')),
+                                   (np.char.encode(table, 'utf8'),
+                                    np.char.encode(probes, 'utf8'))):
+        expected = np.searchsorted(sorted_values, needles, side)
+        np.testing.assert_array_equal(
+            charex.searchsorted(sorted_values, needles, side), expected)
+        np.testing.assert_array_equal(
+            jit_searchsorted(sorted_values, needles, side), expected)
+    assert charex.searchsorted(table, 'abc', side) \
+        == np.searchsorted(table, 'abc', side)
+
+
+def test_searchsorted_sorter_and_out():
+    values = np.array(['pear', 'apple', 'fig', 'apple', 'kiwi'], dtype='U5')
+    probes = np.array(['apple', 'banana', 'zz', ''], dtype='U6')
+    sorter = charex.argsort(values)
+    out = np.empty(probes.size, np.int64)
+    result = charex.searchsorted(values, probes, 'right', sorter, out)
+    assert result is out
+    np.testing.assert_array_equal(
+        out, np.searchsorted(values, probes, 'right', sorter))
+    with pytest.raises(ValueError, match='sorter.size'):
+        charex.searchsorted(values, probes, 'left', sorter[:2])
+    with pytest.raises(ValueError, match='side'):
+        charex.searchsorted(values, probes, 'middle')
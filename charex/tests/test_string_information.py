@@ -7,7 +7,7 @@ from numba import njit
 from charex.tests.definitions import StringInformation
 from charex.tests.support import (
     assert_same, assert_same_exception, assert_same_view,
-    assert_same_view_outcome,
+    assert_same_view_outcome, log_records,
 )
 
 
@@ -91,6 +91,26 @@ OCCURRENCE_CASES = [
     (np.array(['abc', ''], dtype='U3'), ''),
 ]
 
+LONG_NEEDLE_CASES = [
+    (np.array(['alpha beta alpha beta', 'betabetalpha', 'alph'],
+              dtype='U24'), 'alpha'),
+    (np.array(['aaaaaaaaaa', 'aaabaaaab', ''], dtype='U10'), 'aaaa'),
+    # Every needle unit shares its low byte with the haystack's 'a' units.
+    (np.array(['aaaa\u0161\u0161\u0161a', 'x\u0161\u0161\u0161aaaa\u0161',
+               'aaa\u0161\u0161\u0161\u0161a',
+               '\u0161\u0161\u0161a\u0161\u0161\u0161a'], dtype='U12'),
+     '\u0161\u0161\u0161a'),
+    (np.array(['x\u0161\u0161\u0161aaa', 'aaa\u0161\u0161\u0161'],
+              dtype='U8'), 'aaaa'),
+    (np.array(['alpha beta alpha beta', 'betabetalpha'], dtype='U24'),
+     'alpha', 3, -2),
+    (np.array([b'alpha beta alpha beta', b'betabetalpha', b''],
+              dtype='S24'), b'alpha'),
+    (np.array([b'ab\x00alpha', b'alpha\x00'], dtype='S10'), b'alpha'),
+]
+
+OCCURRENCE_CASES += LONG_NEEDLE_CASES
+
 INDEX_CASES = [
     (np.array(['abcabc', 'bcxxbc'], dtype='U6'), 'bc'),
     (np.array(['ab\x00cd', 'xx\x00cd'], dtype='U6'), 'cd'),
@@ -102,6 +122,8 @@ INDEX_CASES = [
     (np.array([b'abcabc', b'bcxxbc'], dtype='S6'), b'bc'),
     (np.array([b'ab\x00cd', b'xx\x00cd'], dtype='S6'), b'cd'),
     (np.array(['abc', ''], dtype='U3'), ''),
+    (np.array(['alpha beta alpha', 'betalpha'], dtype='U16'), 'alpha'),
+    (np.array([b'alpha beta alpha', b'betalpha'], dtype='S16'), b'alpha'),
 ]
 
 PROPERTY_UNICODE = np.array(
@@ -138,6 +160,9 @@ NONE_START_CASES = [
 ]
 
 
+LOG_RECORDS = log_records()
+
+
 STRIDED_OCCURRENCE_CASES = [
     (
         np.array(['abcabc', 'skip', 'xabc', 'skip', 'abcx'], dtype='U6')[::2],
@@ -177,6 +202,10 @@ STRIDED_OCCURRENCE_CASES = [
                  dtype='S6')[::2],
         b'abc',
     ),
+    (LOG_RECORDS['path'], '/api'),
+    (LOG_RECORDS['host'], b'example'),
+    (LOG_RECORDS['path'][::-2], LOG_RECORDS['path'][::2]),
+    (LOG_RECORDS['host'][::-1], LOG_RECORDS['host']),
 ]
 
 
@@ -191,6 +220,8 @@ STRIDED_PROPERTY_CASES = [
     np.broadcast_to(np.array([b'Alpha'], dtype='S6'), (3,)),
     np.array(['Alpha', 'skip'], dtype='U6')[:0:2],
     np.array([b'Alpha', b'skip'], dtype='S6')[:0:2],
+    LOG_RECORDS['host'],
+    LOG_RECORDS['path'][::-1],
 ]
 
 
@@ -202,6 +233,38 @@ STRIDED_UNICODE_PROPERTY_CASES = [
 ]
 
 
+_GRID = np.array([['abcabc', 'xbc', ''], ['bcbc', 'abc\x00x', 'cab']],
+                 dtype='U6')
+_SUBS = np.array([['bc', 'x', 'a'], ['bc', 'c', 'ab']], dtype='U2')
+
+ND_OCCURRENCE_CASES = [
+    (_GRID, 'bc'),
+    (np.char.encode(_GRID), b'bc'),
+    (_GRID, _SUBS),
+    (np.asfortranarray(_GRID), np.asfortranarray(_SUBS), 1, None),
+    (_GRID[::-1, ::2], _SUBS[::-1, ::2]),
+    (np.char.encode(_GRID).T, b'c', 0, 4),
+    (np.stack([_GRID, _GRID[::-1]]), 'c'),
+]
+
+BROADCAST_OCCURRENCE_CASES = [
+    (_GRID[:, :1], _SUBS[:1]),
+    (np.char.encode(_GRID[:1]), np.char.encode(_SUBS[:, 2:])),
+    (_GRID, _SUBS[1]),
+    (_GRID[0], _SUBS[:, None, :], 1, None),
+    (np.asfortranarray(_GRID[:, :1]), np.asfortranarray(_SUBS[:1]), 0, 3),
+    (np.array(['abcabc'], dtype='U6'), _SUBS[0]),
+]
+
+ND_PROPERTY_CASES = [
+    PROPERTY_UNICODE[:12].reshape(3, 4),
+    np.asfortranarray(PROPERTY_UNICODE[:12].reshape(3, 4)),
+    PROPERTY_BYTES[:6].reshape(2, 3)[:, ::-1],
+    PROPERTY_UNICODE[:12].reshape(2, 3, 2).transpose(1, 0, 2),
+    PROPERTY_BYTES[:0].reshape(0, 3),
+]
+
+
 @pytest.mark.parametrize('_, impl_name, baseline', OCCURRENCE_FUNCS)
 @pytest.mark.parametrize('args', OCCURRENCE_CASES)
 def test_occurrence_matches_numpy(_, impl_name, baseline, args):
@@ -217,6 +280,14 @@ def test_occurrence_strided_arrays_match_numpy(_, impl_name, baseline, args):
     assert_same_view_outcome(getattr(ch, impl_name), baseline, *args)
 
 
+@pytest.mark.parametrize('_, impl_name, baseline',
+                         OCCURRENCE_FUNCS + INDEX_FUNCS)
+@pytest.mark.parametrize('args', ND_OCCURRENCE_CASES)
+def test_occurrence_nd_arrays_match_numpy(_, impl_name, baseline, args):
+    ch = StringInformation()
+    assert_same_view_outcome(getattr(ch, impl_name), baseline, *args)
+
+
 @pytest.mark.parametrize('_, implementation, baseline', DEFAULT_OCCURRENCE_FUNCS)
 def test_occurrence_default_arguments_match_numpy(_, implementation, baseline):
     values = np.array(['abcabc', 'bcxxbc'], dtype='U6')
@@ -259,6 +330,7 @@ def test_index_matches_numpy(_, impl_name, baseline, args):
     [
         (np.array(['abc', 'xx'], dtype='U3'), 'zz'),
         (np.array([b'abc', b'xx'], dtype='S3'), b'zz'),
+        (np.array(['alpha beta', 'beta alph'], dtype='U10'), 'alpha'),
         ('abc', 'zz'),
     ],
 )
@@ -294,6 +366,13 @@ def test_properties_strided_arrays_match_numpy(_, impl_name, baseline, values):
     assert_same_view(getattr(ch, impl_name), baseline, values)
 
 
+@pytest.mark.parametrize('_, impl_name, baseline', PROPERTY_FUNCS)
+@pytest.mark.parametrize('values', ND_PROPERTY_CASES)
+def test_properties_nd_arrays_match_numpy(_, impl_name, baseline, values):
+    ch = StringInformation()
+    assert_same_view(getattr(ch, impl_name), baseline, values)
+
+
 @pytest.mark.parametrize('_, impl_name, baseline', PROPERTY_FUNCS)
 @pytest.mark.parametrize('value', SCALAR_PROPERTIES)
 def test_scalar_properties_match_numpy(_, impl_name, baseline, value):
@@ -650,16 +650,14 @@ def test_stringdtype_unary_readonly_zero_stride_views_match_numpy(
     assert_same_view(getattr(strings, impl_name), baseline, values)
 
 
-@pytest.mark.parametrize('impl_name', [
-    name for name, _ in STRINGDTYPE_PREDICATES
-])
-def test_stringdtype_array_predicates_reject_multidimensional_arrays(
-        impl_name):
+@pytest.mark.parametrize('impl_name, baseline', STRINGDTYPE_PREDICATES)
+def test_stringdtype_array_predicates_multidimensional_arrays_match_numpy(
+        impl_name, baseline):
     strings = StringsInformation()
-    values = stringdtype_array(['a', 'b', 'c', 'd']).reshape(2, 2)
+    values = stringdtype_array(['a', 'B1', '', '١٢', ' ', 'Ab']).reshape(2, 3)
 
-    with pytest.raises(TypingError, match='one-dimensional arrays'):
-        getattr(strings, impl_name)(values)
+    assert_same(getattr(strings, impl_name), baseline, values)
+    assert_same(getattr(strings, impl_name), baseline, values.T)
 
 
 def test_direct_numba_stringdtype_target_behavior():
@@ -1216,6 +1214,34 @@ def test_stringdtype_array_order_matches_numpy(impl_name, baseline):
     assert_same(getattr(strings, impl_name), baseline, right, left)
 
 
+@pytest.mark.parametrize('impl_name, baseline', [
+    ('strings_equal', STRINGS.equal),
+    ('strings_not_equal', STRINGS.not_equal),
+    *STRINGDTYPE_ORDER_COMPARISONS,
+])
+@pytest.mark.parametrize('na_object', [None, np.nan, 'MISSING'])
+def test_stringdtype_array_inline_packets_match_numpy(
+        impl_name, baseline, na_object):
+    dtype = STRING_DTYPE(na_object=na_object)
+    left = np.array([
+        'USD', 'USD', 'EUR', 'GB', '', 'abcdefg', 'abcdefgh', 'abcdefghi',
+        'abcdefghijklmno', 'abcdefghijklmno', 'abcdefghijklmnop', 'ab',
+        'é', 'ÿa', 'z', 'a\x00b', 'a\x00', 'ACTIVE', na_object, 'MISSING',
+    ], dtype=dtype)
+    right = np.array([
+        'USD', 'USE', 'EU', 'GBP', '', 'abcdefh', 'abcdefgg', 'abcdefghh',
+        'abcdefghijklmno', 'abcdefghijklmnp', 'abcdefghijklmnop', 'a' * 40,
+        'e', 'ÿ', 'é', 'a\x00c', 'a', 'ACTIVE', 'x', na_object,
+    ], dtype=dtype)
+    # A reused slot keeps the bytes of its longer previous value.
+    left[0] = 'abcdefghijklmno'
+    left[0] = 'US'
+    implementation = strings_impl(impl_name)
+
+    assert_same_outcome(implementation, baseline, left, right)
+    assert_same_outcome(implementation, baseline, right, left)
+
+
 @pytest.mark.parametrize('impl_name, baseline', STRINGDTYPE_ORDER_COMPARISONS)
 def test_stringdtype_array_order_same_array_matches_numpy(
         impl_name, baseline):
@@ -1335,23 +1361,25 @@ def test_stringdtype_noncontiguous_comparison_mixed_python_str_matches_numpy(
     assert_same_view(getattr(strings, impl_name), baseline, scalar, values)
 
 
-def test_stringdtype_array_equal_rejects_multidimensional_arrays():
+def test_stringdtype_array_equal_multidimensional_arrays_match_numpy():
     strings = StringsComparisonOperators()
     values = stringdtype_array(['a', 'b', 'c', 'd']).reshape(2, 2)
+    other = stringdtype_array(['a', 'x', 'c', '']).reshape(2, 2)
 
-    with pytest.raises(TypingError, match='one-dimensional arrays'):
-        strings.strings_equal(values, values)
+    assert_same(strings.strings_equal, STRINGS.equal, values, other)
+    assert_same(strings.strings_equal, STRINGS.equal, values[:, ::-1], 'b')
 
 
-@pytest.mark.parametrize('impl_name', [
-    name for name, _ in STRINGDTYPE_ORDER_COMPARISONS
-])
-def test_stringdtype_array_order_rejects_multidimensional_arrays(impl_name):
+@pytest.mark.parametrize('impl_name, baseline',
+                         STRINGDTYPE_ORDER_COMPARISONS)
+def test_stringdtype_array_order_multidimensional_arrays_match_numpy(
+        impl_name, baseline):
     strings = StringsComparisonOperators()
     values = stringdtype_array(['a', 'b', 'c', 'd']).reshape(2, 2)
+    other = stringdtype_array(['b', 'b', 'a', 'dd']).reshape(2, 2)
 
-    with pytest.raises(TypingError, match='one-dimensional arrays'):
-        getattr(strings, impl_name)(values, values)
+    assert_same(getattr(strings, impl_name), baseline, values, other)
+    assert_same(getattr(strings, impl_name), baseline, values.T, other.T)
 
 
 @pytest.mark.parametrize('impl_name, baseline', [
@@ -1574,16 +1602,18 @@ def test_stringdtype_noncontiguous_affix_mixed_python_str_matches_numpy(
         getattr(strings, impl_name), baseline, scalar, values)
 
 
-@pytest.mark.parametrize('impl_name', [
-    'strings_startswith',
-    'strings_endswith',
+@pytest.mark.parametrize('impl_name, baseline', [
+    ('strings_startswith', STRINGS.startswith),
+    ('strings_endswith', STRINGS.endswith),
 ])
-def test_stringdtype_array_affix_rejects_multidimensional_arrays(impl_name):
+def test_stringdtype_array_affix_multidimensional_arrays_match_numpy(
+        impl_name, baseline):
     strings = StringsInformation()
-    values = stringdtype_array(['a', 'b', 'c', 'd']).reshape(2, 2)
+    values = stringdtype_array(['ab', 'b', 'cab', '']).reshape(2, 2)
+    patterns = stringdtype_array(['a', 'b', 'ab', 'x']).reshape(2, 2)
 
-    with pytest.raises(TypingError, match='one-dimensional arrays'):
-        getattr(strings, impl_name)(values, values)
+    assert_same(getattr(strings, impl_name), baseline, values, patterns)
+    assert_same(getattr(strings, impl_name), baseline, values[::-1], 'b')
 
 
 @pytest.mark.parametrize('impl_name', [
@@ -1906,19 +1936,40 @@ def test_stringdtype_noncontiguous_search_mixed_python_str_matches_numpy(
         getattr(strings, impl_name), baseline, scalar, values)
 
 
-@pytest.mark.parametrize('impl_name', [
-    'strings_find',
-    'strings_rfind',
-    'strings_count',
-    'strings_index',
-    'strings_rindex',
+@pytest.mark.parametrize('impl_name, baseline', [
+    ('strings_find', STRINGS.find),
+    ('strings_rfind', STRINGS.rfind),
+    ('strings_count', STRINGS.count),
+    ('strings_index', STRINGS.index),
+    ('strings_rindex', STRINGS.rindex),
 ])
-def test_stringdtype_array_search_rejects_multidimensional_arrays(impl_name):
+def test_stringdtype_array_search_multidimensional_arrays_match_numpy(
+        impl_name, baseline):
     strings = StringsInformation()
-    values = stringdtype_array(['a', 'b', 'c', 'd']).reshape(2, 2)
+    values = stringdtype_array(['abab', 'b', 'cab', 'bb']).reshape(2, 2)
+    patterns = stringdtype_array(['ab', 'b', 'a', 'b']).reshape(2, 2)
+
+    assert_same(getattr(strings, impl_name), baseline, values, patterns)
+    assert_same(getattr(strings, impl_name), baseline, values.T, 'b')
+
+
+@pytest.mark.parametrize('impl_name, baseline', [
+    ('strings_equal', STRINGS.equal),
+    ('strings_not_equal', STRINGS.not_equal),
+    *STRINGDTYPE_ORDER_COMPARISONS,
+    *STRINGDTYPE_AFFIX_SEARCH_METHODS,
+])
+def test_stringdtype_broadcast_arrays_match_numpy(impl_name, baseline):
+    values = stringdtype_array(['abab', 'b', 'cab']).reshape(3, 1)
+    patterns = stringdtype_array(['ab', 'b', '', 'cab']).reshape(1, 4)
+    unicode_patterns = np.array(['ab', 'b', '', 'cab'], dtype='U3')
 
-    with pytest.raises(TypingError, match='one-dimensional arrays'):
-        getattr(strings, impl_name)(values, values)
+    assert_same_outcome(strings_impl(impl_name), baseline, values, patterns)
+    assert_same_outcome(strings_impl(impl_name), baseline, patterns, values)
+    assert_same_outcome(strings_impl(impl_name), baseline,
+                        values, unicode_patterns)
+    assert_same_outcome(strings_impl(impl_name), baseline,
+                        values[:1, 0], patterns[0])
 
 
 @pytest.mark.parametrize('impl_name', [
@@ -0,0 +1,165 @@
+"""Tests for building StringDType arrays in nopython mode."""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+
+import numpy as np
+import pytest
+from numba import njit
+from numba.core import types
+from numba.core.errors import TypingError
+from numba.core.pythonapi import _boxers
+
+import charex
+from charex.functions.lookup import stringdtype_span
+from charex.numpy import stringdtype
+from charex.numpy.stringdtype import (
+    stringdtype_acquire_allocator, stringdtype_data_ptr, stringdtype_empty_like,
+    stringdtype_finish, stringdtype_na_kind, stringdtype_na_name,
+    stringdtype_release_allocator, stringdtype_reserve, stringdtype_row,
+)
+
+
+STRING_DTYPE = getattr(getattr(np, 'dtypes', None), 'StringDType', None)
+
+pytestmark = pytest.mark.skipif(STRING_DTYPE is None,
+                                reason='StringDType requires NumPy 2')
+
+WORDS = ['', 'a', 'USD', 'x' * 7, 'y' * 8, 'é' * 4, 'z' * 16, 'naïve café',
+         'w' * 300]
+
+
+@njit(nogil=True, cache=False)
+def jit_doubled(values):
+    # The result is created before the source allocator is acquired, which
+    # then stays held while the result is packed.
+    result = stringdtype_empty_like(values, values.size)
+    na_kind = stringdtype_na_kind(values)
+    na_name = stringdtype_na_name(values)
+    allocator = stringdtype_acquire_allocator(values)
+    data = stringdtype_data_ptr(values)
+    sizes = np.empty(values.size, np.intp)
+    for i in range(values.size):
+        chunk, status = stringdtype_span(data, i, allocator, na_kind,
+                                         na_name)
+        sizes[i] = -1 if status else 2 * chunk.size
+    builder = stringdtype_reserve(result, sizes)
+    for i in range(values.size):
+        chunk, status = stringdtype_span(data, i, allocator, na_kind,
+                                         na_name)
+        if status:
+            continue
+        row = stringdtype_row(builder, i)
+        row[:chunk.size] = chunk
+        row[chunk.size:] = chunk
+    stringdtype_finish(builder)
+    stringdtype_release_allocator(allocator)
+    return result
+
+
+@njit(nogil=True, cache=False)
+def jit_reversed(values):
+    return values[::-1]
+
+
+def doubled(values):
+    return np.array([value if value is None else value + value
+                     for value in values.tolist()], dtype=values.dtype)
+
+
+@pytest.mark.parametrize('na_object', [None, np.nan])
+@pytest.mark.parametrize('n_values', [0, 1, 9, 100])
+def test_builder_matches_python(na_object, n_values):
+    rng = np.random.default_rng(n_values)
+    picks = rng.integers(0, len(WORDS), n_values)
+    values = np.array([WORDS[k] for k in picks],
+                      dtype=STRING_DTYPE(na_object=na_object))
+    if n_values:
+        values[rng.random(n_values) < 0.2] = na_object
+    result = jit_doubled(values)
+    expected = doubled(values)
+    assert result.dtype == values.dtype
+    assert result.dtype is not values.dtype
+    np.testing.assert_array_equal(charex.isnull(result),
+                                  charex.isnull(expected))
+    np.testing.assert_array_equal(result[~charex.isnull(result)],
+                                  expected[~charex.isnull(expected)])
+    # Packed strings are ordinary elements afterwards.
+    result[:] = values
+    np.testing.assert_array_equal(result[~charex.isnull(result)],
+                                  values[~charex.isnull(values)])
+
+
+def test_builder_threads_share_source():
+    values = np.array(WORDS * 50, dtype=STRING_DTYPE())
+    expected = doubled(values)
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(jit_doubled, [values] * 16))
+    for result in results:
+        np.testing.assert_array_equal(result, expected)
+    values[0] = 'q' * 40
+    assert values[0] == 'q' * 40
+
+
+def test_builder_with_gil_holding_writer():
+    # The writer holds the GIL while it waits for the source allocator,
+    # which the kernel holds while it builds the result.
+    values = np.array(WORDS * 200, dtype=STRING_DTYPE())
+    expected = doubled(values)
+    done = threading.Event()
+
+    def write():
+        while not done.is_set():
+            values[-1] = WORDS[-1]
+
+    writer = threading.Thread(target=write, daemon=True)
+    writer.start()
+    try:
+        for _ in range(20):
+            np.testing.assert_array_equal(jit_doubled(values), expected)
+    finally:
+        done.set()
+        writer.join(10)
+    assert not writer.is_alive()
+
+
+def test_builder_rejects_nulls_without_na_object():
+    values = np.array(['abc'], dtype=STRING_DTYPE())
+
+    @njit(cache=False)
+    def null_row(values):
+        return stringdtype_finish(stringdtype_reserve(
+            stringdtype_empty_like(values, 1), np.full(1, -1, np.intp)))
+
+    with pytest.raises(ValueError, match='na_object'):
+        null_row(values)
+
+
+def test_returned_views_keep_dtype():
+    values = np.array(WORDS, dtype=STRING_DTYPE(na_object=None))
+    result = jit_reversed(values)
+    assert result.dtype is values.dtype
+    np.testing.assert_array_equal(result, values[::-1])
+
+
+def test_box_installed_once():
+    box_array = _boxers.lookup(types.Array)
+    stringdtype._install_box()
+    assert _boxers.lookup(types.Array) is box_array
+    assert box_array._charex_box_array is stringdtype._BOX_ARRAY
+    assert not hasattr(stringdtype._BOX_ARRAY, '_charex_box_array')
+    numbers = np.arange(5.0)
+    np.testing.assert_array_equal(njit(cache=False)(lambda a: a[::-1])(numbers),
+                                  numbers[::-1])
+
+
+def test_builder_symbol_is_optional(monkeypatch):
+    monkeypatch.setattr(stringdtype, '_NATIVE_EMPTY_LIKE_ADDR', 0)
+    values = np.array(['abc', 'x' * 40], dtype=STRING_DTYPE())
+    # Reading still types; only building a new array needs the symbol.
+    np.testing.assert_array_equal(
+        njit(cache=False)(lambda a: np.strings.str_len(a))(values), [3, 40])
+    # A size type no other test uses, so the typing is not cached.
+    with pytest.raises(TypingError, match='newer compiled'):
+        njit(cache=False)(lambda a: stringdtype_empty_like(
+            a, np.uint16(1)))(values)
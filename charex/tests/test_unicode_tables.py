@@ -0,0 +1,62 @@
+"""Tests for charex Unicode property tables."""
+
+import numpy as np
+from numba import njit
+
+from charex.core.unicode_tables import UNICODE_CODE_POINTS, unicode_flags
+from charex.numpy import stringdtype
+from charex.numpy.overloads import definitions
+
+
+@njit(nogil=True, cache=False)
+def ord_flags(n):
+    fixed = np.zeros(n, np.uint16)
+    packed = np.zeros(n, np.uint16)
+    for c in range(n):
+        for bit, value in enumerate((
+                definitions._isalpha_ord(c, False),
+                definitions._isalnum_ord(c, False),
+                definitions._isdecimal_ord(c),
+                definitions._isdigit_ord(c, False),
+                definitions._isnumeric_ord(c),
+                definitions._isspace_ord(c, False),
+                definitions._islower_ord(c, False),
+                definitions._isupper_ord(c, False),
+                definitions._istitle_only_ord(c, False))):
+            fixed[c] |= value << bit
+        for bit, value in enumerate((
+                stringdtype._stringdtype_isalpha_ord(c),
+                stringdtype._stringdtype_isalnum_ord(c),
+                stringdtype._stringdtype_isdecimal_ord(c),
+                stringdtype._stringdtype_isdigit_ord(c),
+                stringdtype._stringdtype_isnumeric_ord(c),
+                stringdtype._stringdtype_isspace_ord(c),
+                stringdtype._stringdtype_islower_ord(c),
+                stringdtype._stringdtype_isupper_ord(c),
+                stringdtype._stringdtype_istitle_ord(c))):
+            packed[c] |= value << bit
+    return fixed, packed
+
+
+def test_predicates_match_cpython_for_every_code_point():
+    fixed, packed = ord_flags(UNICODE_CODE_POINTS)
+    expected = np.zeros(UNICODE_CODE_POINTS, np.uint16)
+    for c in range(UNICODE_CODE_POINTS):
+        char = chr(c)
+        upper = char.isupper()
+        expected[c] = (char.isalpha() | char.isalnum() << 1
+                       | char.isdecimal() << 2 | char.isdigit() << 3
+                       | char.isnumeric() << 4 | char.isspace() << 5
+                       | char.islower() << 6 | upper << 7
+                       | (char.istitle() and not upper) << 8)
+    np.testing.assert_array_equal(fixed, expected)
+    np.testing.assert_array_equal(packed, expected)
+
+
+def test_unicode_flags_out_of_range():
+    @njit(cache=False)
+    def flags(values):
+        return [unicode_flags(value) for value in values]
+
+    assert flags(np.array([-1, UNICODE_CODE_POINTS, 2 ** 31 - 1],
+                          np.int32)) == [0, 0, 0]